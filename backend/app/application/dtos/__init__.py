@@ -24,13 +24,35 @@ Autor: Henry Jiménez
 Fecha: 2025-06-16
 """
 
-from .link import LinkCreate, LinkUpdate, LinkRead
+from .link import (
+    LinkCreate,
+    LinkUpdate,
+    LinkRead,
+    LinkSparseRead,
+    LinkPageRead,
+    LinkBatchItemResult,
+    LinkBatchResult,
+    LinkBulkOperation,
+    LinkPurgeJobRead,
+    LinkStatsRead,
+    TagCountRead,
+    SuggestionRead,
+)
 from .user import UserCreate, UserUpdate, UserRead
 
 __all__ = [
     "LinkCreate",
     "LinkUpdate",
     "LinkRead",
+    "LinkSparseRead",
+    "LinkPageRead",
+    "LinkBatchItemResult",
+    "LinkBatchResult",
+    "LinkBulkOperation",
+    "LinkPurgeJobRead",
+    "LinkStatsRead",
+    "TagCountRead",
+    "SuggestionRead",
     "UserCreate",
     "UserUpdate",
     "UserRead",
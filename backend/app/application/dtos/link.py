@@ -10,6 +10,15 @@ Modelos definidos:
 - LinkCreate: Modelo para crear nuevos enlaces (POST).
 - LinkUpdate: Modelo para modificar datos de un enlace existente (PUT).
 - LinkRead: Modelo para representar un enlace al ser leido desde la API (GET).
+- LinkSparseRead: Modelo para representar un enlace leido con proyección de campos (GET ?fields=).
+- LinkPageRead: Modelo para representar una página de enlaces con su cursor siguiente.
+- LinkBatchItemResult: Resultado de una operación masiva para un elemento.
+- LinkBatchResult: Resultado agregado de una operación masiva sobre enlaces.
+- LinkBulkOperation: Operación masiva (eliminar, añadir/quitar tags, reemplazar campos) sobre varios enlaces.
+- LinkPurgeJobRead: Estado de la eliminación en segundo plano de los enlaces de un usuario.
+- LinkStatsRead: Estadísticas agregadas de los enlaces de un usuario.
+- TagCountRead: Número de enlaces de un usuario con un tag.
+- SuggestionRead: Tag o palabra de título sugerida para un prefijo.
 
 Los DTOs permiten desacoplar las estructuras de datos de la lógica de negocio
 y del ORM, promoviendo un diseño limpio y mantenible.
@@ -18,8 +27,8 @@ Autor: Henry Jiménez
 Fecha: 2025-06-16
 """
 
-from typing import Optional
-from pydantic import BaseModel, field_validator
+from typing import Literal, Optional, Union
+from pydantic import BaseModel, Field, field_validator, model_validator
 from datetime import datetime
 
 from app.core import app_validator
@@ -64,4 +73,86 @@ class LinkRead(LinkBase):
     description: str    
     user_id: str
     created_at: datetime
-    tags: list[str]
\ No newline at end of file
+    tags: list[str]
+
+
+class LinkSparseRead(BaseModel):
+    """ Sólo se serializan los campos asignados (usar con exclude_unset). """
+    id: str
+    url: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    user_id: Optional[str] = None
+    created_at: Optional[datetime] = None
+    tags: Optional[list[str]] = None
+
+
+class LinkPageRead(BaseModel):
+    items: list[Union[LinkRead, LinkSparseRead]]
+    next_cursor: Optional[str] = None
+
+
+class LinkBatchItemResult(BaseModel):
+    index: int
+    status: Literal["created", "updated", "deleted", "invalid", "duplicate", "not_found", "forbidden", "failed"]
+    link_id: Optional[str] = None
+    link: Optional[LinkRead] = None
+    error: Optional[str] = None
+
+
+class LinkBatchResult(BaseModel):
+    succeeded: int
+    failed: int
+    results: list[LinkBatchItemResult]
+
+
+class LinkBulkOperation(BaseModel):
+    """
+    Operación a aplicar sobre varios enlaces.
+
+    - delete: elimina los enlaces.
+    - add_tags / remove_tags: añade o quita `tags` conservando los demás.
+    - update: reemplaza los campos indicados en `fields`.
+    """
+    link_ids: list[str] = Field(..., min_length=1)
+    operation: Literal["delete", "add_tags", "remove_tags", "update"]
+    tags: Optional[list[str]] = None
+    fields: Optional[LinkUpdate] = None
+
+    @model_validator(mode="after")
+    def validate_operation(self) -> "LinkBulkOperation":
+        if self.operation in ("add_tags", "remove_tags") and not self.tags:
+            raise ValueError(f"La operación '{self.operation}' requiere 'tags'.")
+        if self.operation == "update" and self.fields is None:
+            raise ValueError("La operación 'update' requiere 'fields'.")
+        return self
+
+
+class LinkPurgeJobRead(BaseModel):
+    user_id: str
+    status: Literal["pending", "running", "completed", "failed"]
+    deleted: int
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+
+class LinkStatsRead(BaseModel):
+    user_id: str
+    link_count: int
+    tag_counts: dict[str, int]
+    links_created_last_7_days: int
+    links_created_last_30_days: int
+    last_activity_at: Optional[datetime] = None
+    reconciled_at: Optional[datetime] = None
+
+
+class TagCountRead(BaseModel):
+    tag: str
+    count: int
+
+
+class SuggestionRead(BaseModel):
+    text: str
+    kind: Literal["tag", "title"]
+    count: int
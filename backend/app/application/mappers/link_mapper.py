@@ -5,8 +5,9 @@ Autor: Henry Jiménez
 Fecha: 2025-06-11
 """
 
-from app.domain.models import Link, NewLink
-from app.application.dtos import LinkRead, LinkCreate, LinkUpdate
+from datetime import datetime
+from app.domain.models import Link, NewLink, PartialLink, LinkPurgeJob, LinkStats
+from app.application.dtos import LinkRead, LinkCreate, LinkUpdate, LinkSparseRead, LinkPurgeJobRead, LinkStatsRead, TagCountRead
 
 class LinkMapper:
     
@@ -45,4 +46,42 @@ class LinkMapper:
             tags=link.tags,
             user_id=link.user_id,
             created_at=link.created_at
-        )
\ No newline at end of file
+        )
+    
+    @staticmethod
+    def partial_entity_to_dto(link: PartialLink) -> LinkSparseRead:
+        """ Mapea un enlace leído con proyección a un DTO de lectura parcial."""
+        return LinkSparseRead(id=link.id, **link.fields)
+    
+    @staticmethod
+    def purge_job_to_dto(job: LinkPurgeJob) -> LinkPurgeJobRead:
+        """ Mapea una tarea de eliminación de enlaces a su DTO de lectura."""
+        return LinkPurgeJobRead(
+            user_id=job.user_id,
+            status=job.status,
+            deleted=job.deleted,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            error=job.error
+        )
+
+    @staticmethod
+    def stats_to_dto(stats: LinkStats, now: datetime) -> LinkStatsRead:
+        """ Mapea las estadísticas de un usuario a su DTO de lectura (actividad relativa a `now`)."""
+        return LinkStatsRead(
+            user_id=stats.user_id,
+            link_count=stats.link_count,
+            tag_counts={item.tag: item.count for item in LinkMapper.tag_counts_to_dto(stats)},
+            links_created_last_7_days=stats.created_since(now, 7),
+            links_created_last_30_days=stats.created_since(now, 30),
+            last_activity_at=stats.last_activity_at,
+            reconciled_at=stats.reconciled_at
+        )
+
+    @staticmethod
+    def tag_counts_to_dto(stats: LinkStats) -> list[TagCountRead]:
+        """ Mapea el histograma de tags de un usuario a una lista ordenada de mayor a menor frecuencia."""
+        return [
+            TagCountRead(tag=tag, count=count)
+            for tag, count in sorted(stats.tag_counts.items(), key=lambda item: (-item[1], item[0]))
+        ]
@@ -13,12 +13,20 @@ Responsabilidades:
 Servicios incluidos:
 - `link_service.py`: operaciones sobre enlaces.
 - `user_service.py`: operaciones sobre usuarios.
+- `link_purge_service.py`: eliminación en segundo plano de los enlaces de un usuario.
+- `link_stats_service.py`: estadísticas de enlaces por usuario, mantenidas de forma incremental.
+- `link_search_service.py`: búsqueda de texto en los enlaces de un usuario (índice invertido).
+- `user_version_service.py`: versiones de los datos de cada usuario, para los ETags de las lecturas.
 
 Autor: Henry Jiménez
 Fecha: 2025-06-11
 """
 
+from .user_version_service import UserVersionService
+from .link_stats_service import LinkStatsService
+from .link_search_service import LinkSearchService
 from .link_service import LinkService
 from .user_service import UserService
+from .link_purge_service import LinkPurgeService
 
-__all__ = ["LinkService", "UserService"]
\ No newline at end of file
+__all__ = ["LinkService", "UserService", "LinkPurgeService", "LinkStatsService", "LinkSearchService", "UserVersionService"]
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""
+Servicio de aplicación para la eliminación en segundo plano de enlaces
+
+Cuando se elimina un usuario, sus enlaces se eliminan en una tarea de
+fondo para que la petición HTTP no espere miles de escrituras. Este
+servicio encola esas tareas, recuerda su progreso y permite consultarlo.
+
+Las tareas se ejecutan en el event loop del proceso que las encola, pero
+su estado se guarda en un repositorio (`IAsyncLinkPurgeJobRepository`):
+cualquier instancia puede consultarlo y no encola una segunda tarea
+mientras otra instancia ejecuta la del mismo usuario. La tarea en curso
+guarda su progreso cada `heartbeat_seconds`; si lleva tres intervalos sin
+hacerlo (su proceso se detuvo), se da por interrumpida y
+`purge_user_links` puede reanudarla desde cualquier instancia.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Set
+from app.domain.models import LinkPurgeJob
+from app.domain.repositories import IAsyncLinkRepository, IAsyncUserRepository, IAsyncLinkPurgeJobRepository
+from app.application.dtos import LinkPurgeJobRead
+from app.application.mappers import LinkMapper
+from app.application.services.link_stats_service import LinkStatsService
+from app.application.services.link_search_service import LinkSearchService
+from app.application.services.user_version_service import UserVersionService, LINKS_SCOPE
+from app.core.exceptions import PermissionException, PurgeJobNotFoundException, PurgeIncompleteException, UserStillExistsException
+from app.core import logger
+
+# Intervalos de progreso sin guardar tras los que una tarea activa se da por interrumpida
+_STALE_HEARTBEATS = 3
+
+
+class LinkPurgeService:
+    def __init__(
+        self,
+        link_repository: IAsyncLinkRepository,
+        user_repository: IAsyncUserRepository,
+        job_repository: IAsyncLinkPurgeJobRepository,
+        page_size: int = 500,
+        max_ops_per_second: int = 500,
+        heartbeat_seconds: float = 30,
+        stats_service: Optional[LinkStatsService] = None,
+        search_service: Optional[LinkSearchService] = None,
+        version_service: Optional[UserVersionService] = None,
+    ):
+        self.link_repository = link_repository
+        self.user_repository = user_repository
+        self.job_repository = job_repository
+        self.page_size = page_size
+        self.max_ops_per_second = max_ops_per_second
+        self.heartbeat_seconds = heartbeat_seconds
+        self.stats_service = stats_service
+        self.search_service = search_service
+        self.version_service = version_service
+        # Tareas en curso en este proceso
+        self._jobs: Dict[str, LinkPurgeJob] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __validate_user_data(self, user_data: dict, user_id: str) -> None:
+        """ Valida que el usuario autenticado coincida con los datos del usuario."""
+        if user_data["uid"] != user_id:
+            raise PermissionException()
+
+    def _is_stale(self, job: LinkPurgeJob) -> bool:
+        """ Indica si una tarea activa dejó de guardar su progreso (su proceso se detuvo)."""
+        last_update = job.updated_at or job.started_at
+        return datetime.now(timezone.utc) - last_update > timedelta(seconds=_STALE_HEARTBEATS * self.heartbeat_seconds)
+
+    async def _save(self, job: LinkPurgeJob) -> None:
+        """
+        Guarda el estado de la tarea. Un error aquí no detiene la eliminación:
+        se registra y el estado se vuelve a guardar en el siguiente intervalo.
+        """
+        try:
+            await self.job_repository.save_job(job)
+        except Exception as e:
+            logger.warning(f"No se pudo guardar el estado de la eliminación de enlaces del usuario {job.user_id}: {e}")
+
+    async def enqueue(self, user_id: str) -> LinkPurgeJob:
+        """
+        Encola la eliminación de los enlaces de un usuario y retorna la tarea.
+
+        Si ya hay una tarea activa para el usuario (en este proceso, o en
+        otra instancia que sigue guardando su progreso) se retorna esa misma.
+        Debe llamarse desde el event loop.
+        """
+        job = self._jobs.get(user_id)
+        if job is not None:
+            return job
+        stored = await self.job_repository.get_job(user_id)
+        job = self._jobs.get(user_id)
+        if job is not None:
+            return job
+        if stored is not None and stored.is_active and not self._is_stale(stored):
+            return stored
+
+        now = datetime.now(timezone.utc)
+        job = LinkPurgeJob(user_id=user_id, started_at=now, updated_at=now)
+        self._jobs[user_id] = job
+        await self._save(job)
+        task =asyncio.create_task(self._run(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        logger.info(f"Eliminación de enlaces encolada para usuario: {user_id}")
+        return job
+
+    async def _run(self, job: LinkPurgeJob) -> None:
+        """ Ejecuta una tarea de eliminación, guarda su progreso y registra su resultado."""
+        job.status = "running"
+        await self._save(job)
+
+        def on_progress(deleted: int) -> None:
+            job.deleted = deleted
+
+        purge: Optional[asyncio.Future] = None
+        try:
+            purge = asyncio.ensure_future(self.link_repository.delete_links_by_user_id(
+                job.user_id, self.page_size, self.max_ops_per_second, on_progress
+            ))
+            while not purge.done():
+                await asyncio.wait({purge}, timeout=self.heartbeat_seconds)
+                if not purge.done():
+                    job.updated_at = datetime.now(timezone.utc)
+                    await self._save(job)
+            job.deleted = purge.result()
+            if self.stats_service is not None:
+                await self.stats_service.forget(job.user_id)
+            if self.search_service is not None:
+                self.search_service.forget(job.user_id)
+            if self.version_service is not None:
+                await self.version_service.bump(job.user_id, LINKS_SCOPE)
+            job.status = "completed"
+            logger.info(f"Enlaces eliminados para usuario {job.user_id}: {job.deleted}")
+        except asyncio.CancelledError:
+            job.status = "failed"
+            job.error = "La eliminación se interrumpió al detener la aplicación."
+            logger.warning(f"Eliminación de enlaces interrumpida para usuario {job.user_id} ({job.deleted} eliminados)")
+            raise
+        except PurgeIncompleteException as e:
+            job.status = "failed"
+            job.deleted = e.deleted
+            job.error = e.detail
+            logger.error(f"Eliminación de enlaces incompleta para usuario {job.user_id}: {e.detail}")
+        except Exception as e:
+            job.status = "failed"
+            job.error = "No se pudieron eliminar todos los enlaces."
+            logger.error(f"Error al eliminar enlaces del usuario {job.user_id} ({job.deleted} eliminados): {e}")
+        finally:
+            if purge is not None and not purge.done():
+                purge.cancel()
+            job.finished_at = job.updated_at = datetime.now(timezone.utc)
+            if self._jobs.get(job.user_id) is job:
+                del self._jobs[job.user_id]
+            await self._save(job)
+
+    async def purge_user_links(self, user_id: str, user_data: dict) -> LinkPurgeJobRead:
+        """ Encola (o reanuda) la eliminación de los enlaces de un usuario ya eliminado."""
+
+        self.__validate_user_data(user_data, user_id)
+        if await self.user_repository.get_user_by_id(user_id):
+            raise UserStillExistsException(user_id)
+        return LinkMapper.purge_job_to_dto(await self.enqueue(user_id))
+
+    async def get_purge_status(self, user_id: str, user_data: dict) -> LinkPurgeJobRead:
+        """ Retorna el estado de la última eliminación de enlaces de un usuario (de este proceso o guardado)."""
+
+        self.__validate_user_data(user_data, user_id)
+        job = self._jobs.get(user_id) or await self.job_repository.get_job(user_id)
+        if job is None:
+            raise PurgeJobNotFoundException(user_id)
+        return LinkMapper.purge_job_to_dto(job)
+
+    async def shutdown(self) -> None:
+        """ Cancela las tareas en curso al detener la aplicación."""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,209 @@
+"""
+Servicio de aplicación para la búsqueda de texto en los enlaces de un usuario
+
+Mantiene, por usuario, dos índices en memoria de sus enlaces:
+
+- Un índice invertido (`InvertedIndex`) del título, la descripción y la
+  URL, de modo que una búsqueda no lea los enlaces del usuario sino sólo
+  los de la página de resultados.
+- Un índice de prefijos (`PrefixIndex`) de los tags y las palabras de los
+  títulos, para sugerir términos mientras el usuario escribe.
+
+- Los índices de un usuario se construyen la primera vez que busca o pide
+  sugerencias, recorriendo sus enlaces con proyección de los campos
+  indexados. Las consultas simultáneas de ese usuario esperan la misma
+  construcción.
+- `LinkService` los actualiza en cada creación, modificación o eliminación
+  de enlaces. Las escrituras que llegan durante la construcción se aplican
+  al terminarla.
+- Los índices se conservan en una caché LRU acotada en usuarios y se
+  reconstruyen al expirar, lo que acota el tiempo que tardan en reflejarse
+  las escrituras hechas por otras instancias.
+- Si se indica `current_version`, cada índice guarda la versión de los
+  enlaces del usuario leída antes de construirlo (o tras aplicar una
+  escritura local) y se reconstruye cuando la versión vigente es otra: las
+  escrituras de otras instancias se reflejan en la siguiente consulta, al
+  coste de una lectura por clave de la versión en cada búsqueda.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.domain.models import Link
+from app.domain.repositories import IAsyncLinkRepository
+from app.core.cache import TTLLRUCache
+from app.core.exceptions import InvalidSearchQueryException
+from app.core.pagination import encode_search_cursor, decode_search_cursor
+from app.core.search import InvertedIndex, PrefixIndex, tokenize
+from app.core import logger
+
+# Campos indexados y su peso en la puntuación
+SEARCH_FIELD_WEIGHTS = {"title": 3.0, "description": 1.0, "url": 1.0}
+# Campos leídos al construir los índices (los de búsqueda más los tags)
+_INDEXED_FIELDS = [*SEARCH_FIELD_WEIGHTS, "tags"]
+# Enlaces indexados entre cesiones del event loop durante una construcción
+_BUILD_YIELD_EVERY = 500
+
+
+@dataclass
+class UserSearchIndex:
+    """ Índices de búsqueda y de sugerencias de los enlaces de un usuario."""
+    text: InvertedIndex = field(default_factory=lambda: InvertedIndex(SEARCH_FIELD_WEIGHTS))
+    prefixes: PrefixIndex = field(default_factory=PrefixIndex)
+    # Versión de los enlaces del usuario que refleja el índice (None sin versiones)
+    version: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def add(self, link_id: str, fields: Dict[str, Any]) -> None:
+        """ Indexa (o reindexa) un enlace a partir de sus campos."""
+        self.text.add(link_id, fields)
+        self.prefixes.add(link_id, [
+            *(("tag", tag) for tag in fields.get("tags") or []),
+            *(("title", word) for word in tokenize(fields.get("title"))),
+        ])
+
+    def remove(self, link_id: str) -> None:
+        self.text.remove(link_id)
+        self.prefixes.remove(link_id)
+
+
+class LinkSearchService:
+    def __init__(
+        self,
+        link_repository: IAsyncLinkRepository,
+        max_users: int = 1000,
+        ttl_seconds: float = 3600,
+        max_query_terms: int = 10,
+        max_suggestions: int = 50,
+        current_version: Optional[Callable[[str], Awaitable[int]]] = None,
+    ):
+        self.link_repository = link_repository
+        self.max_query_terms = max_query_terms
+        self.max_suggestions = max_suggestions
+        self.current_version = current_version
+        self._indexes = TTLLRUCache(max_users, ttl_seconds)
+        self._builds: Dict[str, asyncio.Task] = {}
+        self._pending: Dict[str, List[Callable[[UserSearchIndex], None]]] = {}
+
+    def _new_index(self, version: Optional[int]) -> UserSearchIndex:
+        return UserSearchIndex(prefixes=PrefixIndex(max_results=self.max_suggestions), version=version)
+
+    async def _version(self, user_id: str) -> Optional[int]:
+        return await self.current_version(user_id) if self.current_version is not None else None
+
+    def parse_query(self, query: str) -> List[str]:
+        """ Convierte el texto de una búsqueda en sus términos normalizados y valida su cantidad."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            raise InvalidSearchQueryException("La busqueda debe contener al menos una palabra.")
+        if len(terms) > self.max_query_terms:
+            raise InvalidSearchQueryException(f"La busqueda admite como maximo {self.max_query_terms} palabras.")
+        return terms
+
+    # Mantenimiento del índice
+
+    async def apply_writes(self, user_id: str, written: Sequence[Link] = (), removed: Sequence[str] = ()) -> None:
+        """
+        Refleja en el índice del usuario, si existe, los enlaces creados o
+        modificados y los eliminados, y reserva el cambio para una
+        construcción en curso.
+
+        Se llama tras incrementar la versión de los enlaces, de modo que el
+        índice pasa a la versión vigente y la escritura local no provoca una
+        reconstrucción.
+        """
+        if not written and not removed:
+            return
+
+        def change(index: UserSearchIndex) -> None:
+            for link in written:
+                index.add(link.id, {name: getattr(link, name) for name in _INDEXED_FIELDS})
+            for link_id in removed:
+                index.remove(link_id)
+
+        index = self._indexes.peek(user_id)
+        if index is not None:
+            change(index)
+        pending = self._pending.get(user_id)
+        if pending is not None:
+            pending.append(change)
+        if index is not None and self.current_version is not None:
+            index.version = await self.current_version(user_id)
+
+    def forget(self, user_id: str) -> None:
+        """ Descarta los índices de un usuario (y el resultado de una construcción en curso)."""
+        self._indexes.invalidate(user_id)
+        self._pending.pop(user_id, None)
+
+    async def _build(self, user_id: str, version: Optional[int]) -> UserSearchIndex:
+        """ Construye los índices del usuario recorriendo sus enlaces; `version` es la leída antes de empezar."""
+        logger.info(f"Construyendo índice de búsqueda para usuario: {user_id}")
+        pending: List[Callable[[UserSearchIndex], None]] = []
+        self._pending[user_id] = pending
+        try:
+            index = self._new_index(version)
+            async for link in self.link_repository.stream_links_by_user_id(user_id, _INDEXED_FIELDS):
+                index.add(link.id, link.fields)
+                if len(index) % _BUILD_YIELD_EVERY == 0:
+                    # Tokenizar es trabajo de CPU: se cede el event loop a las demás peticiones
+                    await asyncio.sleep(0)
+            for change in pending:
+                change(index)
+            if self._pending.get(user_id) is pending:
+                self._indexes.set(user_id, index)
+            logger.info(f"Índice de búsqueda construido para usuario {user_id}: {len(index)} enlaces")
+            return index
+        finally:
+            if self._pending.get(user_id) is pending:
+                del self._pending[user_id]
+            if self._builds.get(user_id) is asyncio.current_task():
+                del self._builds[user_id]
+
+    async def _get_index(self, user_id: str) -> UserSearchIndex:
+        version = await self._version(user_id)
+        index = self._indexes.get(user_id)
+        if index is not None and index.version == version:
+            return index
+        build = self._builds.get(user_id)
+        if build is None:
+            if index is not None:
+                logger.info(f"Índice de búsqueda desactualizado para usuario {user_id} (versión {index.version} != {version})")
+            build = asyncio.create_task(self._build(user_id, version))
+            self._builds[user_id] = build
+        return await asyncio.shield(build)
+
+    # Consultas
+
+    async def search(self, user_id: str, terms: List[str], limit: int, cursor: Optional[str] = None) -> Tuple[List[str], Optional[str]]:
+        """
+        Retorna los ids de una página de enlaces del usuario que contienen
+        alguno de los términos, ordenados por relevancia (BM25), y el cursor
+        de la página siguiente (None si es la última).
+        """
+        after = decode_search_cursor(cursor) if cursor else None
+        index = await self._get_index(user_id)
+        hits = index.text.search(terms, limit + 1, after)
+        next_cursor = encode_search_cursor(*hits[limit - 1]) if len(hits) > limit else None
+        return [link_id for _, link_id in hits[:limit]], next_cursor
+
+    async def suggest(
+        self,
+        user_id: str,
+        prefix: str,
+        limit: int,
+        kind: Optional[str] = None,
+        fuzzy: bool = False,
+    ) -> List[Tuple[str, str, int]]:
+        """
+        Retorna hasta `limit` tags o palabras de títulos del usuario (tipo,
+        texto, número de enlaces) que empiezan por `prefix`, de más a menos
+        frecuente; con `fuzzy` tolera un error de escritura en el prefijo.
+        """
+        index = await self._get_index(user_id)
+        return index.prefixes.complete(prefix, limit, kind, fuzzy)
@@ -5,96 +5,652 @@ Este servicio implementa la lógica de negocio para gestionar enlaces
 de un usuario. Maneja operaciones de creación, actualización, consulta
 y eliminación, con validaciones de dominio y control de errores.
 
+Sus métodos son asíncronos y dependen de repositorios asíncronos, de modo
+que cada petición se atiende en el event loop sin ocupar el threadpool.
+
 Autor: Henry Jiménez
 Fecha: 2025-06-11
 """
 
-from typing import List
-from app.domain.models import Link, User
-from app.domain.repositories import ILinkRepository, IUserRepository
-from app.application.dtos import LinkCreate, LinkUpdate, LinkRead
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Union
+from uuid import UUID, uuid5
+from pydantic import ValidationError
+from app.domain.models import Link, NewLink, PartialLink, User, OwnershipCheck, LinkStatsDelta, LINK_PROJECTABLE_FIELDS, LINK_UPDATABLE_FIELDS
+from app.domain.repositories import IAsyncLinkRepository, IAsyncUserRepository, IAsyncLinkUrlRepository
+from app.application.services.link_stats_service import LinkStatsService
+from app.application.services.link_search_service import LinkSearchService
+from app.application.services.user_version_service import UserVersionService, LINKS_SCOPE
+from app.application.dtos import (
+    LinkCreate,
+    LinkUpdate,
+    LinkRead,
+    LinkSparseRead,
+    LinkPageRead,
+    SuggestionRead,
+    LinkBatchItemResult,
+    LinkBatchResult,
+    LinkBulkOperation,
+)
 from app.application.mappers import LinkMapper
-from app.core.exceptions import LinkNotFoundException, UserNotFoundException, PermissionException
+from app.core.exceptions import (
+    LinkNotFoundException,
+    UserNotFoundException,
+    PermissionException,
+    InvalidFieldsException,
+    InvalidTagFilterException,
+    InvalidSearchQueryException,
+    BatchTooLargeException,
+    DuplicateLinkException,
+    IdempotencyKeyReusedException,
+)
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.urls import url_key
 from app.core import logger
 
+# Espacio de nombres (uuid5) de los ids de enlace derivados del usuario y una semilla
+_LINK_ID_NAMESPACE = UUID("9b3c6f2e-4d1a-5e8b-a7c0-3f2d1e6b8a94")
+
+
+def _derive_link_id(user_id: str, kind: str, seed: str) -> str:
+    """ Id determinista de un enlace a partir del usuario y una semilla (clave de URL o de idempotencia)."""
+    return str(uuid5(_LINK_ID_NAMESPACE, f"{kind}:{user_id}:{seed}"))
+
 
 class LinkService:
-    def __init__(self, link_repository: ILinkRepository, user_repository: IUserRepository):
+    def __init__(
+        self,
+        link_repository: IAsyncLinkRepository,
+        user_repository: IAsyncUserRepository,
+        batch_max_items: int = 5000,
+        batch_chunk_size: int = 250,
+        stats_service: Optional[LinkStatsService] = None,
+        tag_filter_max_tags: int = 30,
+        search_service: Optional[LinkSearchService] = None,
+        url_repository: Optional[IAsyncLinkUrlRepository] = None,
+        link_id_mode: Literal["random", "url"] = "random",
+        version_service: Optional[UserVersionService] = None,
+    ):
         self.link_repository = link_repository
         self.user_repository = user_repository
+        self.batch_max_items = batch_max_items
+        self.batch_chunk_size = batch_chunk_size
+        self.stats_service = stats_service
+        self.tag_filter_max_tags = tag_filter_max_tags
+        self.search_service = search_service or LinkSearchService(link_repository)
+        self.url_repository = url_repository
+        self.link_id_mode = link_id_mode
+        self.version_service = version_service
     
     def __validate_user_data(self, user_data: dict, user_id: str) -> None:
         """ Valida que el usuario autenticado coincida con los datos del usuario."""
         if user_data["uid"] != user_id:
             raise PermissionException()
         
-    def _get_user_or_raise(self, user_id: str) -> User:
+    async def _get_user_or_raise(self, user_id: str) -> User:
         """ Metodo privado responsable de obtener el usuario o lanzar una excepcion en caso de no encontrarlo """
-        user = self.user_repository.get_user_by_id(user_id)
+        user = await self.user_repository.get_user_by_id(user_id)
         if not user:
             raise UserNotFoundException(user_id)
         return user
 
-    def _get_link_or_raise(self, link_id: str) -> Link:
-        """ Metodo privado responsable de obtener el link o lanzar una excepcion en caso de no encontrarlo """
-        link = self.link_repository.get_link_by_id(link_id)
-        if not link:
-            raise LinkNotFoundException(link_id)
-        return link
+    async def _record_stats(self, user_id: str, delta: LinkStatsDelta) -> None:
+        """ Actualiza las estadísticas del usuario con la variación de una escritura, si están habilitadas."""
+        if self.stats_service is not None:
+            await self.stats_service.record(user_id, delta)
+
+    async def _bump_version(self, user_id: str) -> None:
+        """ Cambia la versión (y el ETag) de los enlaces del usuario tras una escritura, si está habilitada."""
+        if self.version_service is not None:
+            await self.version_service.bump(user_id, LINKS_SCOPE)
+
+    async def _find_urls(self, user_id: str, url_keys: List[str]) -> Dict[str, str]:
+        """ Retorna el enlace ya registrado para cada URL canónica (vacío si la detección de duplicados está deshabilitada)."""
+        if self.url_repository is None or not url_keys:
+            return {}
+        return await self.url_repository.get_link_ids(user_id, url_keys)
+
+    async def _ensure_key_available(self, user_id: str, url: str, key: str, link_id: Optional[str] = None) -> None:
+        """ Verifica con una lectura puntual que ningún otro enlace del usuario tenga la misma URL canónica."""
+        existing = (await self._find_urls(user_id, [key])).get(key)
+        if existing is not None and existing != link_id:
+            raise DuplicateLinkException(url, existing)
+
+    @staticmethod
+    def _validate_fields(fields: Optional[List[str]]) -> Optional[List[str]]:
+        """ Valida los campos solicitados en una proyección. None significa todos los campos."""
+        if fields is None:
+            return None
+        invalid = [name for name in fields if name not in LINK_PROJECTABLE_FIELDS]
+        if invalid:
+            raise InvalidFieldsException(invalid)
+        return list(dict.fromkeys(fields))
     
-    def _ensure_ownership(self,  user_id: str, link_id: str) -> Link:
-        """ Metodo privado que verifica la pertenencia del link al usuario autenticado """
-        link = self._get_link_or_raise(link_id)
-        if link.user_id != user_id:
-            raise PermissionException()
-        return link
+    def _validate_tags(self, tags: List[str]) -> List[str]:
+        """ Normaliza los tags de un filtro (sin espacios ni repetidos) y valida su cantidad."""
+        tags = list(dict.fromkeys(tag.strip() for tag in tags if tag and tag.strip()))
+        if not tags:
+            raise InvalidTagFilterException("Debe indicarse al menos un tag.")
+        if len(tags) > self.tag_filter_max_tags:
+            raise InvalidTagFilterException(f"El filtro admite como maximo {self.tag_filter_max_tags} tags.")
+        return tags
+    
+    @staticmethod
+    def _to_read_dto(link: Union[Link, PartialLink]) -> Union[LinkRead, LinkSparseRead]:
+        """ Mapea un enlace completo o parcial a su DTO de lectura."""
+        if isinstance(link, PartialLink):
+            return LinkMapper.partial_entity_to_dto(link)
+        return LinkMapper.entity_to_dto(link)
     
-    def get_links_by_user_id(self, user_id: str, user_data: dict) -> List[LinkRead]:
-        """Obtiene todos los enlaces asociados a un usuario."""
+    async def get_links_etag(self, user_id: str, user_data: dict, variant: str = "") -> Optional[str]:
+        """
+        Retorna el ETag de la lista de enlaces del usuario para la variante
+        (parámetros de la lectura) indicada, o None si las versiones están
+        deshabilitadas. No lee los enlaces.
+        """
+        self.__validate_user_data(user_data, user_id)
+        if self.version_service is None:
+            return None
+        return await self.version_service.etag(user_id, LINKS_SCOPE, variant)
+    
+    async def get_links_by_user_id(self, user_id: str, user_data: dict, fields: Optional[List[str]] = None) -> List[Union[LinkRead, LinkSparseRead]]:
+        """
+        Obtiene todos los enlaces asociados a un usuario.
+        
+        Si se indica `fields`, sólo se leen y retornan esos campos (además del id).
+        """
         
         logger.info(f"Obteniendo enlaces para usuario: {user_id}")
         
         self.__validate_user_data(user_data, user_id)
-        self._get_user_or_raise(user_id)       
-        links = self.link_repository.get_links_by_user_id(user_id)
+        fields = self._validate_fields(fields)
+        await self._get_user_or_raise(user_id)       
+        links = await self.link_repository.get_links_by_user_id(user_id, fields)
         
         logger.info(f"Enlaces obtenidos para usuario: {user_id}")
-        return [LinkMapper.entity_to_dto(link) for link in links]
+        return [self._to_read_dto(link) for link in links]
+    
+    async def get_links_by_tags(
+        self,
+        user_id: str,
+        user_data: dict,
+        tags: List[str],
+        match_all: bool = False,
+        fields: Optional[List[str]] = None,
+    ) -> List[Union[LinkRead, LinkSparseRead]]:
+        """
+        Obtiene los enlaces de un usuario que tienen alguno de los tags, o
+        todos ellos con `match_all`.
+        
+        El filtro se resuelve en el repositorio con el índice de tags. Si se
+        exigen todos los tags, se ordenan de menos a más frecuente según el
+        histograma del usuario para que la consulta empiece por el más selectivo.
+        """
+        
+        logger.info(f"Obteniendo enlaces por tags para usuario: {user_id}")
+        
+        self.__validate_user_data(user_data, user_id)
+        fields = self._validate_fields(fields)
+        links = await self._find_links_by_tags(user_id, tags, match_all, fields)
+        
+        return [self._to_read_dto(link) for link in links]
+    
+    async def _find_links_by_tags(self, user_id: str, tags: List[str], match_all: bool, fields: Optional[List[str]]) -> List[Union[Link, PartialLink]]:
+        tags = self._validate_tags(tags)
+        await self._get_user_or_raise(user_id)
+        if match_all and len(tags) > 1 and self.stats_service is not None:
+            tags = await self.stats_service.order_by_frequency(user_id, tags)
+        return await self.link_repository.get_links_by_tags(user_id, tags, match_all, fields)
+    
+    async def get_links_page_by_tags(
+        self,
+        user_id: str,
+        user_data: dict,
+        tags: List[str],
+        match_all: bool,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> LinkPageRead:
+        """
+        Obtiene una página de los enlaces con alguno (o todos) los tags,
+        ordenados por fecha de creación.
+        
+        El filtro se resuelve como en `get_links_by_tags` y la página se toma
+        después de la posición (created_at, id) del cursor, el mismo formato
+        que la paginación sin filtro. Cada página repite la consulta del
+        filtro (servida desde la lista cacheada del usuario si está en caché).
+        """
+        
+        logger.info(f"Obteniendo página de enlaces por tags para usuario: {user_id} (limit={limit})")
+        
+        self.__validate_user_data(user_data, user_id)
+        fields = self._validate_fields(fields)
+        after = decode_cursor(cursor) if cursor else None
+        links = sorted(await self._find_links_by_tags(user_id, tags, match_all, None), key=lambda link: (link.created_at, link.id))
+        if after is not None:
+            links = [link for link in links if (link.created_at, link.id) > after]
+        page = links[:limit]
+        next_cursor = encode_cursor(page[-1].created_at, page[-1].id) if len(links) > limit else None
+        if fields is not None:
+            page = [PartialLink(id=link.id, fields={name: getattr(link, name) for name in fields}) for link in page]
+        
+        return LinkPageRead(
+            items=[self._to_read_dto(link) for link in page],
+            next_cursor=next_cursor
+        )
+    
+    async def search_links(
+        self,
+        user_id: str,
+        user_data: dict,
+        query: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> LinkPageRead:
+        """
+        Busca en el título, la descripción y la URL de los enlaces del usuario.
+        
+        Los resultados se ordenan por relevancia. Sólo se leen del repositorio
+        los enlaces de la página solicitada.
+        """
+        
+        logger.info(f"Buscando enlaces para usuario: {user_id} (limit={limit})")
+        
+        self.__validate_user_data(user_data, user_id)
+        fields = self._validate_fields(fields)
+        terms = self.search_service.parse_query(query)
+        await self._get_user_or_raise(user_id)
+        link_ids, next_cursor = await self.search_service.search(user_id, terms, limit, cursor)
+        found = {
+            link.id: link
+            for link in await self.link_repository.get_links_by_ids(link_ids)
+            if link.user_id == user_id
+        }
+        links = [found[link_id] for link_id in link_ids if link_id in found]
+        if fields is not None:
+            links = [PartialLink(id=link.id, fields={name: getattr(link, name) for name in fields}) for link in links]
+        
+        return LinkPageRead(
+            items=[self._to_read_dto(link) for link in links],
+            next_cursor=next_cursor
+        )
+    
+    async def suggest(
+        self,
+        user_id: str,
+        user_data: dict,
+        prefix: str,
+        limit: int,
+        kind: Optional[str] = None,
+        fuzzy: bool = False,
+    ) -> List[SuggestionRead]:
+        """
+        Sugiere tags y palabras de títulos del usuario que empiezan por `prefix`,
+        de más a menos frecuente. Se resuelve con el índice de prefijos, sin
+        leer enlaces.
+        """
+        
+        self.__validate_user_data(user_data, user_id)
+        prefix = prefix.strip()
+        if not prefix:
+            raise InvalidSearchQueryException("El prefijo no puede estar vacio.")
+        await self._get_user_or_raise(user_id)
+        suggestions = await self.search_service.suggest(user_id, prefix, limit, kind, fuzzy)
+        
+        return [
+            SuggestionRead(text=text, kind=entry_kind, count=count)
+            for entry_kind, text, count in suggestions
+        ]
+    
+    async def stream_links_by_user_id(self, user_id: str, user_data: dict, fields: Optional[List[str]] = None) -> AsyncIterator[Union[LinkRead, LinkSparseRead]]:
+        """
+        Retorna un iterador asíncrono con los enlaces de un usuario.
+        
+        Las validaciones se realizan antes de retornar el iterador, de modo que
+        los errores se reportan con su código HTTP antes de iniciar la respuesta.
+        """
+        
+        logger.info(f"Transmitiendo enlaces para usuario: {user_id}")
+        
+        self.__validate_user_data(user_data, user_id)
+        fields = self._validate_fields(fields)
+        await self._get_user_or_raise(user_id)
+        
+        async def to_dtos() -> AsyncIterator[Union[LinkRead, LinkSparseRead]]:
+            async for link in self.link_repository.stream_links_by_user_id(user_id, fields):
+                yield self._to_read_dto(link)
+        
+        return to_dtos()
     
-    def create_link(self, link_create: LinkCreate, user_id: str, user_data: dict) -> LinkRead:
-        """Crea un nuevo enlace para el usuario autenticado."""
+    async def get_links_page_by_user_id(self, user_id: str, user_data: dict, limit: int, cursor: Optional[str] = None, fields: Optional[List[str]] = None) -> LinkPageRead:
+        """Obtiene una página de enlaces de un usuario, ordenados por fecha de creación."""
+        
+        logger.info(f"Obteniendo página de enlaces para usuario: {user_id} (limit={limit})")
+        
+        self.__validate_user_data(user_data, user_id)
+        fields = self._validate_fields(fields)
+        await self._get_user_or_raise(user_id)
+        page = await self.link_repository.get_links_page(user_id, limit, cursor, fields)
+        
+        return LinkPageRead(
+            items=[self._to_read_dto(link) for link in page.items],
+            next_cursor=page.next_cursor
+        )
+    
+    async def create_link(
+        self,
+        link_create: LinkCreate,
+        user_id: str,
+        user_data: dict,
+        idempotency_key: Optional[str] = None,
+    ) -> LinkRead:
+        """
+        Crea un nuevo enlace para el usuario autenticado.
+        
+        Con `idempotency_key`, o con `link_id_mode="url"`, el id del enlace se
+        deriva del usuario y de esa clave (o de la URL canónica) y se crea con
+        una escritura condicionada: repetir la petición retorna el enlace ya
+        creado en lugar de añadir otro.
+        """
         
         logger.info(f"Creando enlace para usuario: {user_id}")
         self.__validate_user_data(user_data, user_id)
-        self._get_user_or_raise(user_id)              
+        await self._get_user_or_raise(user_id)              
         new_link = LinkMapper.create_entity_from_dto(link_create, user_id)
-        link_create = self.link_repository.create_link(new_link)
+        key = url_key(str(new_link.url))
+        if idempotency_key is not None:
+            new_link.id = _derive_link_id(user_id, "idempotency", idempotency_key)
+        elif self.link_id_mode == "url":
+            new_link.id = _derive_link_id(user_id, "url", key)
+        await self._ensure_key_available(user_id, str(new_link.url), key, new_link.id)
         
-        logger.info(f"Enlace creado ID=%S:",link_create.id)
+        if new_link.id is None:
+            link_create = await self.link_repository.create_link(new_link)
+        else:
+            link_create, created = await self.link_repository.create_link_if_absent(new_link)
+            if not created:
+                if url_key(str(link_create.url)) == key:
+                    logger.info(f"Creación repetida, se retorna el enlace existente ID=%s:", link_create.id)
+                    return LinkMapper.entity_to_dto(link_create)
+                if idempotency_key is not None:
+                    raise IdempotencyKeyReusedException()
+                # El id derivado de la URL lo conserva un enlace cuya URL cambió después: se usa uno aleatorio
+                new_link.id = None
+                link_create = await self.link_repository.create_link(new_link)
+        await self._record_stats(user_id, LinkStatsDelta.between(None, link_create))
+        await self._bump_version(user_id)
+        await self.search_service.apply_writes(user_id, written=[link_create])
+        
+        logger.info(f"Enlace creado ID=%s:", link_create.id)
                     
         return LinkMapper.entity_to_dto(link_create)
 
-    def update_link(self, user_id: str, link_id: str, link_update: LinkUpdate, user_data: dict) -> LinkRead:
-        """Actualiza un enlace existente."""
+    @staticmethod
+    def _format_validation_error(error: ValidationError) -> str:
+        """ Resume los errores de validación de un elemento en una sola línea."""
+        return "; ".join(
+            f"{'.'.join(str(part) for part in err.get('loc', []))}: {err.get('msg')}"
+            for err in error.errors()
+        )
+    
+    async def create_links_batch(self, items: List[Any], user_id: str, user_data: dict) -> LinkBatchResult:
+        """
+        Crea varios enlaces para el usuario autenticado en una sola operación.
+        
+        Cada elemento se valida con `LinkCreate`; los inválidos se reportan sin
+        detener el resto. La existencia del usuario se verifica una sola vez y
+        los enlaces válidos se escriben en lotes atómicos de `batch_chunk_size`.
+        
+        Los elementos con una URL que el usuario ya tiene, o repetida dentro
+        del lote, se reportan como duplicados.
+        """
+        
+        logger.info(f"Creando {len(items)} enlaces en bloque para usuario: {user_id}")
+        self.__validate_user_data(user_data, user_id)
+        if len(items) > self.batch_max_items:
+            raise BatchTooLargeException(self.batch_max_items)
+        await self._get_user_or_raise(user_id)
+        
+        results: List[Optional[LinkBatchItemResult]] = [None] * len(items)
+        pending: List[tuple[int, NewLink]] = []
+        stats_delta = LinkStatsDelta()
+        written: List[Link] = []
+        for index, item in enumerate(items):
+            try:
+                link_create = LinkCreate.model_validate(item)
+            except ValidationError as e:
+                results[index] = LinkBatchItemResult(index=index, status="invalid", error=self._format_validation_error(e))
+                continue
+            pending.append((index, LinkMapper.create_entity_from_dto(link_create, user_id)))
+        
+        if self.url_repository is not None:
+            pending = await self._discard_duplicate_urls(user_id, pending, results)
+        
+        for start in range(0, len(pending), self.batch_chunk_size):
+            chunk = pending[start:start + self.batch_chunk_size]
+            try:
+                created = await self.link_repository.create_links([new_link for _, new_link in chunk])
+            except Exception as e:
+                logger.error(f"Error al escribir lote de {len(chunk)} enlaces para usuario {user_id}: {e}")
+                for index, _ in chunk:
+                    results[index] = LinkBatchItemResult(index=index, status="failed", error="No se pudo guardar el enlace.")
+                continue
+            for (index, _), link in zip(chunk, created):
+                results[index] = LinkBatchItemResult(index=index, status="created", link=LinkMapper.entity_to_dto(link))
+                stats_delta.add(None, link)
+                written.append(link)
+        
+        if not stats_delta.is_empty:
+            await self._record_stats(user_id, stats_delta)
+        if written:
+            await self._bump_version(user_id)
+        await self.search_service.apply_writes(user_id, written=written)
+        succeeded = sum(1 for result in results if result.status == "created")
+        logger.info(f"Enlaces creados en bloque para usuario {user_id}: {succeeded}/{len(items)}")
+        
+        return LinkBatchResult(succeeded=succeeded, failed=len(results) - succeeded, results=results)
+
+    async def _discard_duplicate_urls(
+        self,
+        user_id: str,
+        pending: List[tuple[int, NewLink]],
+        results: List[Optional[LinkBatchItemResult]],
+    ) -> List[tuple[int, NewLink]]:
+        """
+        Reporta como duplicados los elementos de un lote cuya URL ya tiene el
+        usuario o se repite en el lote, y retorna el resto. Las URLs del
+        usuario se consultan en una sola lectura del índice.
+        """
+        keys = [url_key(str(new_link.url)) for _, new_link in pending]
+        registered = await self._find_urls(user_id, list(dict.fromkeys(keys)))
+        seen = set()
+        unique: List[tuple[int, NewLink]] = []
+        for (index, new_link), key in zip(pending, keys):
+            if key in registered:
+                results[index] = LinkBatchItemResult(
+                    index=index,
+                    link_id=registered[key],
+                    status="duplicate",
+                    error=DuplicateLinkException(str(new_link.url), registered[key]).detail,
+                )
+            elif key in seen:
+                results[index] = LinkBatchItemResult(index=index, status="duplicate", error="La URL se repite en el lote.")
+            else:
+                seen.add(key)
+                unique.append((index, new_link))
+        return unique
+
+    @staticmethod
+    def _apply_bulk_operation(link: Link, operation: LinkBulkOperation) -> Link:
+        """ Retorna el enlace con la modificación de una operación masiva aplicada."""
+        if operation.operation == "update":
+            return LinkMapper.update_entity_from_dto(link, operation.fields)
+        current = link.tags or []
+        if operation.operation == "add_tags":
+            tags = current + [tag for tag in dict.fromkeys(operation.tags) if tag not in current]
+        else:
+            tags = [tag for tag in current if tag not in operation.tags]
+        return LinkMapper.update_entity_from_dto(link, LinkUpdate(tags=tags))
+
+    @classmethod
+    def _bulk_changes(cls, link: Link, operation: LinkBulkOperation) -> Dict[str, Any]:
+        """ Campos que una operación masiva cambia sobre el estado actual de un enlace (sólo los distintos)."""
+        updated = cls._apply_bulk_operation(link, operation)
+        return {
+            name: getattr(updated, name)
+            for name in LINK_UPDATABLE_FIELDS
+            if getattr(updated, name) != getattr(link, name)
+        }
+
+    @staticmethod
+    def _ownership_failure(index: int, link_id: str, check: OwnershipCheck) -> LinkBatchItemResult:
+        """ Resultado de un elemento de un lote cuyo enlace no existe o pertenece a otro usuario."""
+        if check == OwnershipCheck.NOT_FOUND:
+            return LinkBatchItemResult(index=index, link_id=link_id, status="not_found", error=LinkNotFoundException(link_id).detail)
+        return LinkBatchItemResult(index=index, link_id=link_id, status="forbidden", error=PermissionException().detail)
+    
+    async def bulk_update_links(self, user_id: str, operation: LinkBulkOperation, user_data: dict) -> LinkBatchResult:
+        """
+        Aplica una operación (eliminar, añadir/quitar tags o reemplazar campos)
+        sobre varios enlaces del usuario autenticado.
+        
+        La existencia y pertenencia de cada enlace la verifica el repositorio
+        en la misma escritura (`update_links_if_owned` o
+        `delete_links_if_owned`); los que no existen o pertenecen a otro
+        usuario se reportan sin detener el resto. Las escrituras se confirman
+        en lotes atómicos de `batch_chunk_size`; en las actualizaciones el
+        repositorio lee cada lote sin caché y sólo escribe los campos que
+        cambian, de modo que una edición concurrente de otro campo no se
+        pierde. Los ids repetidos se procesan una sola vez. Si la operación
+        cambia la URL, sólo puede tomarla el primer enlace solicitado (o el
+        que ya la tiene); el resto de enlaces del usuario se reporta como
+        duplicado sin modificarse.
+        """
+        
+        link_ids = list(dict.fromkeys(operation.link_ids))
+        logger.info(f"Operación '{operation.operation}' en bloque sobre {len(link_ids)} enlaces para usuario: {user_id}")
+        self.__validate_user_data(user_data, user_id)
+        if len(link_ids) > self.batch_max_items:
+            raise BatchTooLargeException(self.batch_max_items)
+        
+        new_url = operation.fields.url if operation.operation == "update" and operation.fields else None
+        keeper: Optional[str] = None
+        if new_url is not None and link_ids and self.url_repository is not None:
+            key = url_key(str(new_url))
+            # Si la URL ya es de un enlace del usuario, lo conserva; si no es de nadie, la toma el primero
+            keeper = (await self._find_urls(user_id, [key])).get(key) or link_ids[0]
+
+        def is_duplicate(link_id: str) -> bool:
+            return keeper is not None and link_id != keeper
+
+        def changes(link: Link) -> Dict[str, Any]:
+            return {} if is_duplicate(link.id) else self._bulk_changes(link, operation)
+        
+        results: List[Optional[LinkBatchItemResult]] = [None] * len(link_ids)
+        is_delete = operation.operation == "delete"
+        stats_delta = LinkStatsDelta()
+        written: List[Link] = []
+        removed: List[Link] = []
+        for start in range(0, len(link_ids), self.batch_chunk_size):
+            chunk = link_ids[start:start + self.batch_chunk_size]
+            try:
+                if is_delete:
+                    outcomes = [
+                        (check, deleted, None)
+                        for check, deleted in await self.link_repository.delete_links_if_owned(user_id, chunk)
+                    ]
+                else:
+                    # El repositorio lee cada enlace (sin caché) y escribe sólo los campos que
+                    # cambian, condicionado a que no se haya modificado desde esa lectura
+                    outcomes = await self.link_repository.update_links_if_owned(user_id, chunk, changes)
+            except Exception as e:
+                logger.error(f"Error al escribir lote de {len(chunk)} enlaces para usuario {user_id}: {e}")
+                for offset, link_id in enumerate(chunk):
+                    results[start + offset] = LinkBatchItemResult(index=start + offset, link_id=link_id, status="failed", error="No se pudo modificar el enlace.")
+                continue
+            for offset, (link_id, (check, previous, updated)) in enumerate(zip(chunk, outcomes)):
+                index = start + offset
+                if check != OwnershipCheck.OK:
+                    results[index] = self._ownership_failure(index, link_id, check)
+                    continue
+                if is_duplicate(link_id):
+                    results[index] = LinkBatchItemResult(
+                        index=index,
+                        link_id=link_id,
+                        status="duplicate",
+                        error=DuplicateLinkException(str(new_url), keeper).detail,
+                    )
+                    continue
+                stats_delta.add(previous, updated)
+                if is_delete:
+                    removed.append(previous)
+                else:
+                    written.append(updated)
+                results[index] = LinkBatchItemResult(
+                    index=index,
+                    link_id=link_id,
+                    status="deleted" if is_delete else "updated",
+                    link=None if is_delete else LinkMapper.entity_to_dto(updated)
+                )
+        
+        if any(result.status in ("updated", "deleted") for result in results):
+            await self._record_stats(user_id, stats_delta)
+            await self._bump_version(user_id)
+        await self.search_service.apply_writes(user_id, written=written, removed=[link.id for link in removed])
+        
+        succeeded = sum(1 for result in results if result.status in ("updated", "deleted"))
+        logger.info(f"Operación '{operation.operation}' en bloque para usuario {user_id}: {succeeded}/{len(link_ids)}")
+        
+        return LinkBatchResult(succeeded=succeeded, failed=len(results) - succeeded, results=results)
+
+    @staticmethod
+    def _raise_for_ownership(check: OwnershipCheck, link_id: str) -> None:
+        """ Traduce el resultado de una modificación condicionada a la excepción correspondiente."""
+        if check == OwnershipCheck.NOT_FOUND:
+            raise LinkNotFoundException(link_id)
+        if check == OwnershipCheck.FORBIDDEN:
+            raise PermissionException()
+
+    async def update_link(self, user_id: str, link_id: str, link_update: LinkUpdate, user_data: dict) -> LinkRead:
+        """
+        Actualiza un enlace existente.
+        
+        La verificación de pertenencia y la escritura se realizan en una sola
+        operación del repositorio, sin lecturas previas: si la URL nueva ya la
+        tiene otro enlace del usuario, el propio repositorio rechaza la
+        escritura con `DuplicateLinkException`.
+        """
         
         logger.info(f"Actualizando Enlace ID=%s:", link_id)
         self.__validate_user_data(user_data, user_id)
-        existing_link = self._ensure_ownership(user_id, link_id)    
-        updated_entity = LinkMapper.update_entity_from_dto(existing_link, link_update)
-        link_update = self.link_repository.update_link(updated_entity)
+        changes = link_update.model_dump(include=set(LINK_UPDATABLE_FIELDS), exclude_none=True)
+        check, previous_link, updated_link = await self.link_repository.update_link_if_owned(link_id, user_id, changes)
+        self._raise_for_ownership(check, link_id)
+        await self._record_stats(user_id, LinkStatsDelta.between(previous_link, updated_link))
+        await self._bump_version(user_id)
+        await self.search_service.apply_writes(user_id, written=[updated_link])
         
         logger.info(f"Enlace actualizado con ID=%s:", link_id)
         
-        return LinkMapper.entity_to_dto(link_update)
+        return LinkMapper.entity_to_dto(updated_link)
 
     
-    def delete_link(self, user_id: str, link_id: str, user_data: dict) -> None:
-        """Elimina un enlace."""
+    async def delete_link(self, user_id: str, link_id: str, user_data: dict) -> None:
+        """
+        Elimina un enlace.
+        
+        La verificación de pertenencia y la eliminación se realizan en una sola
+        operación del repositorio.
+        """
         
         logger.info(f"Eliminando Enlace ID=%s:", link_id)
         
         self.__validate_user_data(user_data, user_id)
-        link = self._ensure_ownership(user_id,link_id)
-        self.link_repository.delete_link(link.id)
+        check, deleted_link = await self.link_repository.delete_link_if_owned(link_id, user_id)
+        self._raise_for_ownership(check, link_id)
+        await self._record_stats(user_id, LinkStatsDelta.between(deleted_link, None))
+        await self._bump_version(user_id)
+        await self.search_service.apply_writes(user_id, removed=[link_id])
         
         logger.info(f"Enlace eliminado con ID=%s:", link_id)
\ No newline at end of file
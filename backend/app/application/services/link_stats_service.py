@@ -0,0 +1,161 @@
+"""
+Servicio de aplicación para las estadísticas de enlaces de un usuario
+
+Las estadísticas (número de enlaces, enlaces por tag y actividad reciente)
+se guardan en un documento por usuario que `LinkService` actualiza con
+incrementos atómicos en cada escritura de enlaces. Consultarlas cuesta
+una lectura, independientemente del número de enlaces.
+
+Como el documento se actualiza después de la escritura del enlace (no en
+la misma transacción), un fallo entre ambas puede desviarlo. La
+reconciliación lo reconstruye recorriendo los enlaces del usuario; se
+ejecuta a demanda y, automáticamente, la primera vez que se consultan las
+estadísticas de un usuario que nunca se han reconstruido (incluido el
+documento que los incrementos crean para un usuario que ya tenía enlaces).
+La reconstrucción sólo se guarda si ningún incremento se aplicó mientras
+recorría los enlaces; si no, se repite.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from datetime import datetime, timezone
+from typing import List, Optional
+from app.domain.models import Link, LinkStats, LinkStatsDelta
+from app.domain.repositories import IAsyncLinkRepository, IAsyncUserRepository, IAsyncLinkStatsRepository
+from app.application.dtos import LinkStatsRead, TagCountRead
+from app.application.mappers import LinkMapper
+from app.core.exceptions import PermissionException, UserNotFoundException
+from app.core import logger
+from app.core.logger import LogRateLimiter
+
+# Intentos de reconstrucción cuando otras escrituras cambian las estadísticas durante el recorrido
+_REBUILD_ATTEMPTS = 3
+
+
+class LinkStatsService:
+    def __init__(
+        self,
+        link_repository: IAsyncLinkRepository,
+        user_repository: IAsyncUserRepository,
+        stats_repository: IAsyncLinkStatsRepository,
+        failure_log_interval_seconds: float = 60,
+    ):
+        self.link_repository = link_repository
+        self.user_repository = user_repository
+        self.stats_repository = stats_repository
+        # Si el repositorio de estadísticas cae, cada escritura de enlaces fallaría al actualizarlas
+        self._failure_log_limiter = LogRateLimiter(failure_log_interval_seconds)
+
+    def __validate_user_data(self, user_data: dict, user_id: str) -> None:
+        """ Valida que el usuario autenticado coincida con los datos del usuario."""
+        if user_data["uid"] != user_id:
+            raise PermissionException()
+
+    async def _ensure_user_exists(self, user_id: str) -> None:
+        if not await self.user_repository.get_user_by_id(user_id):
+            raise UserNotFoundException(user_id)
+
+    async def record(self, user_id: str, delta: LinkStatsDelta) -> None:
+        """
+        Aplica a las estadísticas del usuario la variación de una escritura de enlaces.
+
+        Un error aquí no invalida la escritura ya confirmada: se registra como
+        advertencia (una por intervalo, con el número de fallos omitidos) y la
+        desviación se corrige con la reconciliación.
+        """
+        try:
+            await self.stats_repository.increment_stats(user_id, delta, datetime.now(timezone.utc))
+        except Exception as e:
+            emit, suppressed = self._failure_log_limiter.acquire("record")
+            if not emit:
+                return
+            message = f"No se pudieron actualizar las estadísticas del usuario {user_id}; se corregirán al reconciliarlas: {e}"
+            if suppressed:
+                message = f"{message} ({suppressed} fallos similares omitidos)"
+            logger.warning(message)
+
+    async def record_change(self, user_id: str, before: Optional[Link], after: Optional[Link]) -> None:
+        """ Aplica la variación de pasar un enlace de `before` a `after` (None si no existe)."""
+        await self.record(user_id, LinkStatsDelta.between(before, after))
+
+    async def rebuild(self, user_id: str) -> LinkStats:
+        """
+        Reconstruye y guarda las estadísticas recorriendo todos los enlaces del usuario.
+
+        El guardado se condiciona a la revisión leída antes del recorrido: si
+        un incremento la cambió, la reconstrucción se repite (hasta
+        `_REBUILD_ATTEMPTS` veces) para no descartarlo.
+        """
+        logger.info(f"Reconstruyendo estadísticas de enlaces para usuario: {user_id}")
+        for _ in range(_REBUILD_ATTEMPTS):
+            previous = await self.stats_repository.get_stats(user_id)
+            expected_revision = previous.revision if previous else 0
+            delta = LinkStatsDelta()
+            last_created = None
+            async for link in self.link_repository.stream_links_by_user_id(user_id):
+                delta.add(None, link)
+                if last_created is None or link.created_at > last_created:
+                    last_created = link.created_at
+
+            last_activity_at = max(
+                (moment for moment in (last_created, previous and previous.last_activity_at) if moment),
+                default=None,
+            )
+            stats = LinkStats.from_delta(user_id, delta, last_activity_at, datetime.now(timezone.utc))
+            if await self.stats_repository.save_stats(stats, expected_revision):
+                stats.revision = expected_revision + 1
+                return stats
+            logger.info(f"Las estadísticas del usuario {user_id} cambiaron durante la reconstrucción; se repite")
+
+        logger.warning(f"No se pudieron guardar las estadísticas reconstruidas del usuario {user_id}: cambian continuamente")
+        return stats
+
+    async def forget(self, user_id: str) -> None:
+        """ Elimina las estadísticas de un usuario cuyos enlaces ya se eliminaron."""
+        await self.stats_repository.delete_stats(user_id)
+
+    async def _get_or_rebuild(self, user_id: str) -> LinkStats:
+        stats = await self.stats_repository.get_stats(user_id)
+        if stats is None or stats.reconciled_at is None:
+            stats = await self.rebuild(user_id)
+        return stats
+
+    async def order_by_frequency(self, user_id: str, tags: List[str]) -> List[str]:
+        """
+        Ordena `tags` de menos a más frecuente según el histograma del usuario,
+        para que un filtro que exige todos los tags consulte primero el más
+        selectivo. Si no hay histograma se conserva el orden recibido.
+        """
+        try:
+            stats = await self.stats_repository.get_stats(user_id)
+        except Exception as e:
+            logger.error(f"Error al leer las estadísticas del usuario {user_id}: {e}")
+            return tags
+        if stats is None:
+            return tags
+        return sorted(tags, key=lambda tag: stats.tag_counts.get(tag, 0))
+
+    async def get_stats(self, user_id: str, user_data: dict) -> LinkStatsRead:
+        """ Obtiene las estadísticas de enlaces del usuario autenticado."""
+
+        self.__validate_user_data(user_data, user_id)
+        await self._ensure_user_exists(user_id)
+        stats = await self._get_or_rebuild(user_id)
+        return LinkMapper.stats_to_dto(stats, datetime.now(timezone.utc))
+
+    async def get_tag_counts(self, user_id: str, user_data: dict, limit: Optional[int] = None) -> List[TagCountRead]:
+        """ Obtiene el número de enlaces por tag del usuario autenticado, de mayor a menor."""
+
+        self.__validate_user_data(user_data, user_id)
+        await self._ensure_user_exists(user_id)
+        stats = await self._get_or_rebuild(user_id)
+        return LinkMapper.tag_counts_to_dto(stats)[:limit]
+
+    async def reconcile_stats(self, user_id: str, user_data: dict) -> LinkStatsRead:
+        """ Reconstruye las estadísticas del usuario autenticado a partir de sus enlaces."""
+
+        self.__validate_user_data(user_data, user_id)
+        await self._ensure_user_exists(user_id)
+        stats = await self.rebuild(user_id)
+        return LinkMapper.stats_to_dto(stats, datetime.now(timezone.utc))
@@ -5,74 +5,110 @@ Este servicio implementa la lógica de negocio para gestionar enlaces
 de un usuario. Maneja operaciones de creación, actualización, consulta
 y eliminación, con validaciones de dominio y control de errores.
 
+Sus métodos son asíncronos y dependen de repositorios asíncronos, de modo
+que cada petición se atiende en el event loop sin ocupar el threadpool.
+
 Autor: Henry Jiménez
 Fecha: 2025-06-11
 """
 
+from typing import Optional
 from app.domain.models import User
-from app.domain.repositories import IUserRepository
-from app.application.mappers import UserMapper
-from app.application.dtos import UserCreate, UserUpdate, UserRead
+from app.domain.repositories import IAsyncUserRepository
+from app.application.mappers import UserMapper, LinkMapper
+from app.application.dtos import UserCreate, UserUpdate, UserRead, LinkPurgeJobRead
+from app.application.services.link_purge_service import LinkPurgeService
+from app.application.services.user_version_service import UserVersionService, LINKS_SCOPE, USER_SCOPE
 from app.core.exceptions import UserNotFoundException, PermissionException
 from app.core import logger
 
 
 class UserService:
     
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(
+        self,
+        user_repository: IAsyncUserRepository,
+        link_purge_service: Optional[LinkPurgeService] = None,
+        version_service: Optional[UserVersionService] = None,
+    ):
         self.user_repository = user_repository
+        self.link_purge_service = link_purge_service
+        self.version_service = version_service
         
     def __validate_user_data(self, user_data: dict, user_id: str) -> None:
         """ Valida que el usuario autenticado coincida con los datos del usuario."""
         if user_data["uid"] != user_id:
             raise PermissionException()
     
-    def _get_user_or_raise(self, user_id: str) -> User:
+    async def _get_user_or_raise(self, user_id: str) -> User:
         """ Metodo privado responsable de obtener el usuario o lanzar una excepcion en caso de no encontrarlo """
-        user = self.user_repository.get_user_by_id(user_id)
+        user = await self.user_repository.get_user_by_id(user_id)
         if not user:
             raise UserNotFoundException(user_id)
         return user
 
+    async def _bump_version(self, user_id: str, *scopes: str) -> None:
+        """ Cambia la versión (y el ETag) de los datos del usuario tras una escritura, si está habilitada."""
+        if self.version_service is not None:
+            await self.version_service.bump(user_id, *scopes)
+
+    async def get_user_etag(self, user_id: str, user_data: dict) -> Optional[str]:
+        """ Retorna el ETag del usuario, o None si las versiones están deshabilitadas. No lee el usuario."""
+        self.__validate_user_data(user_data, user_id)
+        if self.version_service is None:
+            return None
+        return await self.version_service.etag(user_id, USER_SCOPE)
     
-    def get_user_by_id(self, user_id: str, user_data: dict) -> UserRead:
+    async def get_user_by_id(self, user_id: str, user_data: dict) -> UserRead:
         """ Retorna la información de un usuario por su ID."""
         
         logger.info(f"Obteniendo información del usuario con ID: {user_id}")
         self.__validate_user_data(user_data, user_id)
-        user = self._get_user_or_raise(user_id)        
+        user = await self._get_user_or_raise(user_id)        
         logger.info(f"Usuario Encontrado")
         
         return UserMapper.entity_to_dto(user)
     
-    def create_user(self, user_create: UserCreate, user_data: dict) -> UserRead:
+    async def create_user(self, user_create: UserCreate, user_data: dict) -> UserRead:
         """ Crea un nuevo usuario en el repositorio."""
         
         logger.info(f"Creando nuevo usuario con ID: {user_create.id}")
         self.__validate_user_data(user_data, user_create.id)
         user = UserMapper.create_entity_from_dto(user_create)
-        user = self.user_repository.create_user(user)
+        user = await self.user_repository.create_user(user)
+        await self._bump_version(user.id, USER_SCOPE)
         logger.info(f"Usuario creado con ID: {user.id}")
         
         return UserMapper.entity_to_dto(user)
 
-    def update_user(self, user_id: str, user_update: UserUpdate, user_data: dict) -> UserRead:
+    async def update_user(self, user_id: str, user_update: UserUpdate, user_data: dict) -> UserRead:
         """ Actualiza un usuario existente en el repositorio."""
         
         logger.info(f"Actualizando usuario con ID: {user_id}")
         self.__validate_user_data(user_data, user_id)
-        user = self._get_user_or_raise(user_id)
+        user = await self._get_user_or_raise(user_id)
         user = UserMapper.update_entity_from_dto(user, user_update)
-        user = self.user_repository.update_user(user)
+        user = await self.user_repository.update_user(user)
+        await self._bump_version(user.id, USER_SCOPE)
         logger.info(f"Usuario actualizado con ID: {user.id}")
         
         return UserMapper.entity_to_dto(user)
     
-    def delete_user(self, user_id: str, user_data: dict) -> None:
-        """ Elimina un usuario existente en el repositorio."""
+    async def delete_user(self, user_id: str, user_data: dict) -> Optional[LinkPurgeJobRead]:
+        """
+        Elimina un usuario existente en el repositorio.
+        
+        Sus enlaces se eliminan en segundo plano; se retorna la tarea de
+        eliminación para consultar su progreso.
+        """
         
         logger.info(f"Eliminando usuario con ID: {user_id}")
         self.__validate_user_data(user_data, user_id)
-        self._get_user_or_raise(user_id)
-        self.user_repository.delete_user(user_id)
-        logger.info(f"Usuario eliminado con ID: {user_id}")
\ No newline at end of file
+        await self._get_user_or_raise(user_id)
+        await self.user_repository.delete_user(user_id)
+        await self._bump_version(user_id, USER_SCOPE, LINKS_SCOPE)
+        logger.info(f"Usuario eliminado con ID: {user_id}")
+        
+        if self.link_purge_service is None:
+            return None
+        return LinkMapper.purge_job_to_dto(await self.link_purge_service.enqueue(user_id))
\ No newline at end of file
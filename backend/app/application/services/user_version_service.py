@@ -0,0 +1,51 @@
+"""
+Servicio de aplicación para las versiones de los datos de cada usuario
+
+Cada usuario tiene un contador por ámbito: `LINKS_SCOPE` (sus enlaces) y
+`USER_SCOPE` (su perfil). `LinkService`, `UserService` y
+`LinkPurgeService` lo incrementan tras cada modificación, y las lecturas
+derivan de él su ETag: responder 304 a un `If-None-Match` vigente cuesta
+una lectura por clave, sin cargar ni serializar los datos.
+
+La versión se lee antes de cargar los datos, por lo que una escritura
+concurrente a lo sumo entrega datos nuevos con el ETag anterior, que el
+cliente revalidará en la siguiente petición.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from app.domain.repositories import IAsyncUserVersionRepository
+from app.core.etag import make_etag
+from app.core import logger
+
+LINKS_SCOPE = "links"
+USER_SCOPE = "user"
+
+
+class UserVersionService:
+    def __init__(self, version_repository: IAsyncUserVersionRepository):
+        self.version_repository = version_repository
+
+    async def bump(self, user_id: str, *scopes: str) -> None:
+        """
+        Incrementa la versión de los ámbitos del usuario tras una modificación.
+        
+        Un error aquí no invalida la escritura ya confirmada: se registra, y
+        los clientes con el ETag anterior lo conservarán hasta la siguiente
+        modificación.
+        """
+        for scope in scopes:
+            try:
+                await self.version_repository.bump_version(user_id, scope)
+            except Exception as e:
+                logger.error(f"Error al incrementar la versión '{scope}' del usuario {user_id}: {e}")
+
+    async def version(self, user_id: str, scope: str) -> int:
+        """ Versión actual del ámbito del usuario."""
+        return await self.version_repository.get_version(user_id, scope)
+
+    async def etag(self, user_id: str, scope: str, variant: str = "") -> str:
+        """ ETag de una lectura del ámbito del usuario; `variant` distingue representaciones (parámetros)."""
+        version = await self.version(user_id, scope)
+        return make_etag(user_id, scope, version, variant)
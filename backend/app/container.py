@@ -0,0 +1,255 @@
+"""
+Contenedor de dependencias de la aplicación
+
+Construye, una sola vez por proceso, los repositorios y servicios a partir
+de `Settings`:
+
+- `REPOSITORY_BACKEND` elige el almacenamiento: "firestore", "memory" o "sql".
+- `USER_CACHE_ENABLED` y `LINK_CACHE_ENABLED` eligen qué decoradores de
+  caché se apilan sobre los repositorios base.
+- `SQL_POOL_SIZE` y `SQL_MAX_OVERFLOW` dimensionan el pool de conexiones y
+  los hilos que ejecutan las consultas bloqueantes.
+
+Todos los servicios reciben las mismas instancias de repositorio, por lo
+que comparten cachés y conexiones. Cambiar de almacenamiento o de capa de
+caché por despliegue sólo requiere cambiar la configuración.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property, lru_cache, partial
+from typing import Callable, List, Optional
+
+from app.application.services import (
+    UserService, LinkService, LinkPurgeService, LinkStatsService, LinkSearchService, UserVersionService,
+)
+from app.application.services.user_version_service import LINKS_SCOPE
+from app.core import settings
+from app.core.settings import Settings
+from app.domain.repositories import (
+    IAsyncLinkRepository, IAsyncUserRepository, IAsyncLinkStatsRepository, IAsyncLinkUrlRepository,
+    IAsyncUserVersionRepository, IAsyncLinkPurgeJobRepository,
+)
+from app.infrastructure.adapters import (
+    AsyncLinkRepositoryAdapter,
+    AsyncUserRepositoryAdapter,
+    AsyncLinkStatsRepositoryAdapter,
+    AsyncLinkUrlRepositoryAdapter,
+    AsyncUserVersionRepositoryAdapter,
+    AsyncLinkPurgeJobRepositoryAdapter,
+)
+from app.infrastructure.cache import CachingUserRepository, CachingLinkRepository
+
+
+@dataclass
+class Storage:
+    """ Repositorios base (sin caché) de un backend de almacenamiento."""
+    links: IAsyncLinkRepository
+    users: IAsyncUserRepository
+    link_stats: IAsyncLinkStatsRepository
+    link_urls: IAsyncLinkUrlRepository
+    versions: IAsyncUserVersionRepository
+    purge_jobs: IAsyncLinkPurgeJobRepository
+
+
+class Container:
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self._on_shutdown: List[Callable[[], None]] = []
+
+    # Almacenamiento
+
+    @cached_property
+    def storage(self) -> Storage:
+        """ Repositorios base de enlaces y usuarios según `REPOSITORY_BACKEND`."""
+        builders = {
+            "firestore": self._firestore_storage,
+            "memory": self._memory_storage,
+            "sql": self._sql_storage,
+        }
+        return builders[self.settings.REPOSITORY_BACKEND]()
+
+    def _firestore_storage(self) -> Storage:
+        # Importación diferida: Firebase sólo se inicializa si se usa Firestore
+        from app.infrastructure.firebase.repositories import (
+            FirebaseAsyncLinkRepository, FirebaseAsyncUserRepository, FirebaseAsyncLinkStatsRepository,
+            FirebaseAsyncLinkUrlRepository, FirebaseAsyncUserVersionRepository, FirebaseAsyncLinkPurgeJobRepository,
+        )
+        return Storage(
+            links=FirebaseAsyncLinkRepository(),
+            users=FirebaseAsyncUserRepository(),
+            link_stats=FirebaseAsyncLinkStatsRepository(),
+            link_urls=FirebaseAsyncLinkUrlRepository(),
+            versions=FirebaseAsyncUserVersionRepository(),
+            purge_jobs=FirebaseAsyncLinkPurgeJobRepository(),
+        )
+
+    def _memory_storage(self) -> Storage:
+        from app.infrastructure.memory import (
+            InMemoryLinkRepository, InMemoryUserRepository, InMemoryLinkStatsRepository, InMemoryLinkUrlRepository,
+            InMemoryUserVersionRepository, InMemoryLinkPurgeJobRepository,
+        )
+        link_urls = InMemoryLinkUrlRepository()
+        return Storage(
+            links=AsyncLinkRepositoryAdapter(InMemoryLinkRepository(link_urls), offload=False),
+            users=AsyncUserRepositoryAdapter(InMemoryUserRepository(), offload=False),
+            link_stats=AsyncLinkStatsRepositoryAdapter(InMemoryLinkStatsRepository(), offload=False),
+            link_urls=AsyncLinkUrlRepositoryAdapter(link_urls, offload=False),
+            versions=AsyncUserVersionRepositoryAdapter(InMemoryUserVersionRepository(), offload=False),
+            purge_jobs=AsyncLinkPurgeJobRepositoryAdapter(
+                InMemoryLinkPurgeJobRepository(self.settings.USER_PURGE_MAX_TRACKED_JOBS), offload=False
+            ),
+        )
+
+    def _sql_storage(self) -> Storage:
+        # Importación diferida: SQLAlchemy sólo es necesario con este backend
+        from app.infrastructure.sql import (
+            SqlLinkRepository, SqlUserRepository, SqlLinkStatsRepository, SqlLinkUrlRepository, SqlUserVersionRepository,
+            SqlLinkPurgeJobRepository, create_sql_engine, create_session_factory, init_schema,
+        )
+        config = self.settings
+        engine = create_sql_engine(
+            config.DATABASE_URL,
+            pool_size=config.SQL_POOL_SIZE,
+            max_overflow=config.SQL_MAX_OVERFLOW,
+            pool_timeout=config.SQL_POOL_TIMEOUT_SECONDS,
+            pool_recycle=config.SQL_POOL_RECYCLE_SECONDS,
+            echo=config.SQL_ECHO,
+        )
+        init_schema(engine)
+        session_factory = create_session_factory(engine)
+        # Un hilo por conexión del pool: ninguna consulta espera un hilo teniendo conexión libre
+        executor = ThreadPoolExecutor(
+            max_workers=config.SQL_POOL_SIZE + config.SQL_MAX_OVERFLOW,
+            thread_name_prefix="sql",
+        )
+        self._on_shutdown.append(lambda: executor.shutdown(wait=False))
+        self._on_shutdown.append(engine.dispose)
+        return Storage(
+            links=AsyncLinkRepositoryAdapter(SqlLinkRepository(session_factory), offload=True, executor=executor),
+            users=AsyncUserRepositoryAdapter(SqlUserRepository(session_factory), offload=True, executor=executor),
+            link_stats=AsyncLinkStatsRepositoryAdapter(SqlLinkStatsRepository(session_factory), offload=True, executor=executor),
+            link_urls=AsyncLinkUrlRepositoryAdapter(SqlLinkUrlRepository(session_factory), offload=True, executor=executor),
+            versions=AsyncUserVersionRepositoryAdapter(SqlUserVersionRepository(session_factory), offload=True, executor=executor),
+            purge_jobs=AsyncLinkPurgeJobRepositoryAdapter(SqlLinkPurgeJobRepository(session_factory), offload=True, executor=executor),
+        )
+
+    # Repositorios con las cachés configuradas
+
+    @cached_property
+    def user_repository(self) -> IAsyncUserRepository:
+        """ Repositorio de usuarios compartido, con caché de usuarios existentes si está habilitada."""
+        user_repository = self.storage.users
+        if not self.settings.USER_CACHE_ENABLED:
+            return user_repository
+        return CachingUserRepository(
+            user_repository,
+            max_size=self.settings.USER_CACHE_MAX_SIZE,
+            ttl_seconds=self.settings.USER_CACHE_TTL_SECONDS,
+        )
+
+    @cached_property
+    def link_repository(self) -> IAsyncLinkRepository:
+        """ Repositorio de enlaces compartido, con caché de lecturas si está habilitada."""
+        link_repository = self.storage.links
+        if not self.settings.LINK_CACHE_ENABLED:
+            return link_repository
+        versions = self.user_version_service
+        return CachingLinkRepository(
+            link_repository,
+            max_size=self.settings.LINK_CACHE_MAX_SIZE,
+            ttl_seconds=self.settings.LINK_CACHE_TTL_SECONDS,
+            max_bytes=self.settings.LINK_CACHE_MAX_BYTES,
+            # Con ETags, la lista de cada usuario sólo se sirve mientras su versión siga vigente
+            current_version=None if versions is None else partial(versions.version, scope=LINKS_SCOPE),
+        )
+
+    # Servicios
+
+    @cached_property
+    def user_version_service(self) -> Optional[UserVersionService]:
+        """ Versiones por usuario para los ETags de las lecturas, si están habilitadas."""
+        if not self.settings.ETAGS_ENABLED:
+            return None
+        return UserVersionService(self.storage.versions)
+
+    @cached_property
+    def link_stats_service(self) -> LinkStatsService:
+        return LinkStatsService(
+            self.link_repository,
+            self.user_repository,
+            self.storage.link_stats,
+            failure_log_interval_seconds=self.settings.LINK_STATS_FAILURE_LOG_INTERVAL_SECONDS,
+        )
+
+    @cached_property
+    def link_search_service(self) -> LinkSearchService:
+        versions = self.user_version_service
+        return LinkSearchService(
+            self.link_repository,
+            max_users=self.settings.SEARCH_INDEX_MAX_USERS,
+            ttl_seconds=self.settings.SEARCH_INDEX_TTL_SECONDS,
+            max_query_terms=self.settings.SEARCH_QUERY_MAX_TERMS,
+            max_suggestions=self.settings.SUGGEST_MAX_RESULTS,
+            # Con versiones, el índice se reconstruye en cuanto otra instancia modifica los enlaces
+            current_version=None if versions is None else partial(versions.version, scope=LINKS_SCOPE),
+        )
+
+    @cached_property
+    def link_purge_service(self) -> LinkPurgeService:
+        return LinkPurgeService(
+            self.link_repository,
+            self.user_repository,
+            self.storage.purge_jobs,
+            page_size=self.settings.USER_PURGE_PAGE_SIZE,
+            max_ops_per_second=self.settings.USER_PURGE_MAX_OPS_PER_SECOND,
+            heartbeat_seconds=self.settings.USER_PURGE_HEARTBEAT_SECONDS,
+            stats_service=self.link_stats_service,
+            search_service=self.link_search_service,
+            version_service=self.user_version_service,
+        )
+
+    @cached_property
+    def user_service(self) -> UserService:
+        return UserService(self.user_repository, self.link_purge_service, version_service=self.user_version_service)
+
+    @cached_property
+    def link_service(self) -> LinkService:
+        return LinkService(
+            self.link_repository,
+            self.user_repository,
+            batch_max_items=self.settings.LINKS_BATCH_MAX_ITEMS,
+            batch_chunk_size=self.settings.LINKS_BATCH_CHUNK_SIZE,
+            stats_service=self.link_stats_service,
+            tag_filter_max_tags=self.settings.LINKS_TAG_FILTER_MAX_TAGS,
+            search_service=self.link_search_service,
+            url_repository=self.storage.link_urls,
+            link_id_mode=self.settings.LINK_ID_MODE,
+            version_service=self.user_version_service,
+        )
+
+    def cache_stats(self) -> dict:
+        """ Contadores de las cachés de repositorios habilitadas."""
+        stats = {}
+        for name, repository in (("users", self.user_repository), ("links", self.link_repository)):
+            if isinstance(repository, (CachingUserRepository, CachingLinkRepository)):
+                stats[name] = repository.stats()
+        return stats
+
+    async def shutdown(self) -> None:
+        """ Cancela las tareas en curso y libera hilos y conexiones de los recursos ya creados."""
+        if "link_purge_service" in self.__dict__:
+            await self.link_purge_service.shutdown()
+        for release in reversed(self._on_shutdown):
+            release()
+        self._on_shutdown.clear()
+
+
+@lru_cache
+def get_container() -> Container:
+    """ Obtiene el contenedor compartido del proceso, construido con la configuración de la aplicación."""
+    return Container(settings)
@@ -0,0 +1,139 @@
+"""
+Caché en memoria con expiración por entrada
+
+Este módulo define una caché LRU acotada en número de entradas (y,
+opcionalmente, en memoria estimada), donde cada entrada tiene su propio
+tiempo de expiración. Es segura para uso concurrente
+entre hilos y expone contadores de aciertos/fallos para monitoreo.
+
+Se utiliza en la aplicación para evitar repetir operaciones costosas
+(por ejemplo, la verificación de tokens de Firebase).
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLLRUCache:
+    """
+    Caché LRU con tiempo de vida (TTL) por entrada.
+
+    Atributos:
+        max_size (int): Número máximo de entradas antes de expulsar la menos usada.
+        default_ttl (float): Tiempo de vida por defecto de una entrada, en segundos.
+        max_bytes (Optional[int]): Presupuesto de memoria; requiere `sizeof` para estimar cada valor.
+        hits (int): Número de lecturas que encontraron una entrada vigente.
+        misses (int): Número de lecturas sin entrada o con entrada expirada.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        default_ttl: float,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size debe ser mayor que cero")
+        if max_bytes is not None and sizeof is None:
+            raise ValueError("max_bytes requiere una función sizeof")
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._sizeof = sizeof
+        self._bytes = 0
+        self._data: "OrderedDict[Hashable, tuple[float, Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """ Retorna el valor asociado a la llave o None si no existe o ha expirado."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """ Igual que `get`, pero sin actualizar el orden LRU ni los contadores."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """ Guarda un valor. El TTL efectivo es el menor entre `ttl` y el TTL por defecto."""
+        ttl = self.default_ttl if ttl is None else min(ttl, self.default_ttl)
+        if ttl <= 0:
+            return
+        size = self._sizeof(value) if self._sizeof else 0
+        with self._lock:
+            self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._data[key] = (time.monotonic() + ttl, value, size)
+            self._bytes += size
+            while len(self._data) > self.max_size or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, (_, _, evicted_size) = self._data.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def _remove(self, key: Hashable) -> None:
+        """ Elimina una entrada y descuenta su tamaño. Requiere tener el lock."""
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def invalidate(self, key: Hashable) -> None:
+        """ Elimina una entrada de la caché si existe."""
+        with self._lock:
+            self._remove(key)
+
+    def invalidate_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """ Elimina las entradas para las que `predicate(llave, valor)` es verdadero. Retorna cuántas eliminó."""
+        with self._lock:
+            keys = [key for key, (_, value, _) in self._data.items() if predicate(key, value)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """ Vacía la caché y reinicia los contadores."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        """ Retorna un resumen de uso de la caché."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
@@ -0,0 +1,60 @@
+"""
+ETags y peticiones condicionales
+
+Funciones para calcular ETags fuertes a partir de la versión de un recurso
+y para resolver la cabecera `If-None-Match`:
+
+- `make_etag` resume en un hash las partes que identifican una
+  representación (usuario, ámbito, versión y parámetros de la lectura).
+- `etag_matches` compara en forma débil, como exige `If-None-Match`
+  (RFC 9110): `W/"x"` y `"x"` coinciden.
+- `not_modified` retorna la respuesta 304 si el ETag del cliente sigue
+  vigente; si no, añade el ETag a la respuesta en curso.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Response, status
+
+# Las respuestas son privadas del usuario y deben revalidarse antes de reutilizarse
+_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """ ETag fuerte (entre comillas) que identifica la combinación de `parts`."""
+    digest = hashlib.sha256("\0".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """ Indica si la cabecera `If-None-Match` incluye el ETag (o es "*")."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    expected = _opaque(etag)
+    return any(_opaque(tag) == expected for tag in if_none_match.split(","))
+
+
+def not_modified(response: Response, etag: Optional[str], if_none_match: Optional[str]) -> Optional[Response]:
+    """
+    Retorna una respuesta 304 (sin cuerpo) si `If-None-Match` incluye el ETag
+    actual; si no, añade el ETag a `response` y retorna None. Sin ETag (la
+    funcionalidad está deshabilitada) no hace nada.
+    """
+    if etag is None:
+        return None
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
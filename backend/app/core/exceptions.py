@@ -28,4 +28,56 @@ class LinkNotFoundException(AppException):
 class PermissionException(AppException):
     """ Excepcion personalizada para el caso de que el usuario no tenga permiso para realizar la operacion """
     def __init__(self):
-        super().__init__(f"El usuario no tiene permiso para realizar esta operacion.", status_code=403)
\ No newline at end of file
+        super().__init__(f"El usuario no tiene permiso para realizar esta operacion.", status_code=403)
+
+class InvalidCursorException(AppException):
+    """ Excepcion personalizada para el caso de que el cursor de paginacion no sea valido """
+    def __init__(self):
+        super().__init__("El cursor de paginacion no es valido.", status_code=400)
+
+class InvalidFieldsException(AppException):
+    """ Excepcion personalizada para el caso de que se soliciten campos inexistentes en una proyeccion """
+    def __init__(self, fields: list[str]):
+        super().__init__(f"Campos no permitidos: {', '.join(fields)}.", status_code=400)
+
+class BatchTooLargeException(AppException):
+    """ Excepcion personalizada para el caso de que una operacion masiva supere el tamaño permitido """
+    def __init__(self, max_items: int):
+        super().__init__(f"La operacion masiva admite como maximo {max_items} elementos.", status_code=413)
+
+class PurgeJobNotFoundException(AppException):
+    """ Excepcion personalizada para el caso de que no exista una tarea de eliminacion de enlaces para el usuario """
+    def __init__(self, user_id: str):
+        super().__init__(f"No existe una eliminacion de enlaces para el usuario con ID {user_id}.", status_code=404)
+
+class PurgeIncompleteException(AppException):
+    """ Excepcion personalizada para el caso de que la eliminacion de los enlaces de un usuario no elimine todos los documentos """
+    def __init__(self, user_id: str, deleted: int, failed: int):
+        self.deleted = deleted
+        self.failed = failed
+        super().__init__(f"No se pudieron eliminar {failed} enlaces del usuario con ID {user_id} ({deleted} eliminados).", status_code=500)
+
+class UserStillExistsException(AppException):
+    """ Excepcion personalizada para el caso de que se intente purgar los enlaces de un usuario que aun existe """
+    def __init__(self, user_id: str):
+        super().__init__(f"El usuario con ID {user_id} aun existe; sus enlaces no pueden purgarse.", status_code=409)
+
+class InvalidTagFilterException(AppException):
+    """ Excepcion personalizada para el caso de que el filtro por tags no sea valido """
+    def __init__(self, detail: str):
+        super().__init__(detail, status_code=400)
+
+class InvalidSearchQueryException(AppException):
+    """ Excepcion personalizada para el caso de que la consulta de busqueda no sea valida """
+    def __init__(self, detail: str):
+        super().__init__(detail, status_code=400)
+
+class DuplicateLinkException(AppException):
+    """ Excepcion personalizada para el caso de que el usuario ya tenga un enlace con la misma URL """
+    def __init__(self, url: str, link_id: str):
+        super().__init__(f"Ya existe un enlace con la URL {url} (ID {link_id}).", status_code=409)
+
+class IdempotencyKeyReusedException(AppException):
+    """ Excepcion personalizada para el caso de que una clave de idempotencia se reutilice con otra URL """
+    def __init__(self):
+        super().__init__("La clave de idempotencia ya se uso para crear un enlace con otra URL.", status_code=422)
@@ -4,11 +4,16 @@ Configuración global de logging
 Este módulo configura un logger estándar reutilizable en toda la aplicación.
 Permite registrar eventos, errores y trazas de ejecución para debugging o monitoreo.
 
+Incluye además `LogRateLimiter`, para limitar la frecuencia de mensajes que
+pueden repetirse masivamente (por ejemplo, rechazos de autenticación).
+
 Autor: Henry Jiménez
 Fecha: 2025-06-11
 """
 
 import logging
+import threading
+import time
 
 logger = logging.getLogger("app_logger")
 logger.setLevel(logging.INFO)
@@ -26,4 +31,35 @@ console_handler.setFormatter(formatter)
 
 # Asociar el handler al logger si no se ha configurado antes
 if not logger.hasHandlers():
-    logger.addHandler(console_handler)
\ No newline at end of file
+    logger.addHandler(console_handler)
+
+
+class LogRateLimiter:
+    """
+    Limita la emisión de mensajes repetidos a uno por intervalo y por llave.
+
+    Los mensajes omitidos se contabilizan para poder informarlos en el
+    siguiente mensaje emitido.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._last_emitted: dict[str, float] = {}
+        self._suppressed: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str) -> tuple[bool, int]:
+        """
+        Indica si se debe emitir un mensaje para `key`.
+
+        Retorna una tupla (emitir, omitidos), donde `omitidos` es el número de
+        mensajes descartados desde la última emisión.
+        """
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_emitted.get(key)
+            if last is not None and now - last < self.interval:
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return False, 0
+            self._last_emitted[key] = now
+            return True, self._suppressed.pop(key, 0)
@@ -0,0 +1,52 @@
+"""
+Cursores de paginación
+
+Funciones para codificar y decodificar los cursores opacos utilizados en la
+paginación de enlaces. Un cursor identifica el último elemento entregado
+mediante su fecha de creación y su identificador (para desempatar enlaces
+creados en el mismo instante). En las búsquedas de texto, la posición es
+la puntuación del último resultado y su identificador.
+
+El cliente debe tratar el cursor como una cadena opaca.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import base64
+import json
+from datetime import datetime
+
+from app.core.exceptions import InvalidCursorException
+
+
+def encode_cursor(created_at: datetime, item_id: str) -> str:
+    """ Codifica la posición (created_at, id) como un cursor opaco."""
+    raw = json.dumps({"c": created_at.isoformat(), "id": item_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """ Decodifica un cursor opaco. Lanza InvalidCursorException si no es válido."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(data["c"]), str(data["id"])
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursorException()
+
+
+def encode_search_cursor(score: float, item_id: str) -> str:
+    """ Codifica la posición (puntuación, id) de un resultado de búsqueda como un cursor opaco."""
+    raw = json.dumps({"s": score, "id": item_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, str]:
+    """ Decodifica un cursor de búsqueda. Lanza InvalidCursorException si no es válido."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded))
+        return float(data["s"]), str(data["id"])
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursorException()
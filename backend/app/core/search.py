@@ -0,0 +1,292 @@
+"""
+Índices para búsqueda de texto y autocompletado
+
+Este módulo define la normalización de texto usada en las búsquedas, un
+índice invertido en memoria con ranking BM25 y un índice de prefijos para
+sugerencias:
+
+- `fold_text` pasa el texto a minúsculas y elimina los acentos
+  ("Canción" y "cancion" son el mismo término).
+- `tokenize` separa el texto normalizado en términos alfanuméricos y
+  descarta palabras vacías frecuentes (español e inglés) y los prefijos
+  de URL ("https", "www").
+- `InvertedIndex` guarda, por término, los documentos que lo contienen
+  con su frecuencia ponderada por campo, y ordena los resultados de una
+  consulta por puntuación BM25.
+- `PrefixIndex` mantiene ordenados los términos (tags, palabras) con su
+  número de documentos para completar un prefijo con búsqueda binaria,
+  opcionalmente tolerando un error de escritura (distancia de edición 1).
+
+Los índices no son seguros para uso concurrente entre hilos: se utiliza desde
+el event loop.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import heapq
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+STOPWORDS = frozenset({
+    # Español
+    "a", "al", "como", "con", "de", "del", "el", "en", "es", "la", "las", "lo",
+    "los", "o", "para", "por", "que", "se", "sin", "su", "sus", "un", "una", "y",
+    # Inglés
+    "an", "and", "are", "for", "in", "is", "of", "on", "or", "the", "to", "with",
+    # URL
+    "http", "https", "www",
+})
+
+
+def fold_text(text: Optional[str]) -> str:
+    """ Normaliza un texto para compararlo: minúsculas y sin acentos ni diacríticos."""
+    text = text or ""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    """ Separa un texto en términos normalizados, sin palabras vacías."""
+    return [token for token in _TOKEN_PATTERN.findall(fold_text(text)) if token not in STOPWORDS]
+
+
+class InvertedIndex:
+    """
+    Índice invertido con ranking BM25 y ponderación por campo.
+
+    La frecuencia de un término en un documento es la suma, por campo, de sus
+    apariciones multiplicadas por el peso del campo (por ejemplo, una palabra
+    del título cuenta más que una de la descripción).
+
+    Atributos:
+        field_weights (Dict[str, float]): Peso de cada campo indexado.
+        k1 (float): Saturación de la frecuencia de término.
+        b (float): Normalización por longitud del documento.
+    """
+
+    def __init__(self, field_weights: Dict[str, float], k1: float = 1.2, b: float = 0.75):
+        self.field_weights = field_weights
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._doc_terms: Dict[str, Tuple[str, ...]] = {}
+        self._doc_length: Dict[str, float] = {}
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._doc_length)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_length
+
+    def add(self, doc_id: str, fields: Dict[str, Optional[str]]) -> None:
+        """ Indexa (o reindexa) un documento a partir del texto de sus campos."""
+        self.remove(doc_id)
+        frequencies: Dict[str, float] = {}
+        for name, weight in self.field_weights.items():
+            for term in tokenize(fields.get(name) or ""):
+                frequencies[term] = frequencies.get(term, 0.0) + weight
+
+        for term, frequency in frequencies.items():
+            self._postings.setdefault(term, {})[doc_id] = frequency
+        length = sum(frequencies.values())
+        self._doc_terms[doc_id] = tuple(frequencies)
+        self._doc_length[doc_id] = length
+        self._total_length += length
+
+    def remove(self, doc_id: str) -> None:
+        """ Retira un documento del índice, si está."""
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._doc_length.pop(doc_id)
+
+    def terms(self) -> Iterable[str]:
+        """ Términos presentes en el índice."""
+        return self._postings.keys()
+
+    def document_frequency(self, term: str) -> int:
+        """ Número de documentos que contienen el término."""
+        return len(self._postings.get(term, ()))
+
+    def search(
+        self,
+        terms: List[str],
+        limit: int,
+        after: Optional[Tuple[float, str]] = None,
+    ) -> List[Tuple[float, str]]:
+        """
+        Retorna hasta `limit` pares (puntuación, id) de los documentos que
+        contienen alguno de los términos, de mayor a menor puntuación (a
+        igual puntuación, por id). Con `after` se retornan sólo los que van
+        después de esa posición (paginación por keyset).
+        """
+        count = len(self._doc_length)
+        if not count:
+            return []
+        average_length = self._total_length / count or 1.0
+        scores: Dict[str, float] = {}
+        for term in dict.fromkeys(terms):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            frequency_in_docs = len(postings)
+            idf = math.log(1 + (count - frequency_in_docs + 0.5) / (frequency_in_docs + 0.5))
+            for doc_id, frequency in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self._doc_length[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        ranked = ((-score, doc_id) for doc_id, score in scores.items())
+        if after is not None:
+            position = (-after[0], after[1])
+            ranked = (entry for entry in ranked if entry > position)
+        return [(-negative, doc_id) for negative, doc_id in heapq.nsmallest(limit, ranked)]
+
+
+# Caracteres con los que se generan las variantes de un prefijo (texto ya normalizado)
+_EDIT_ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789"
+# Mayor carácter posible: cota superior del rango de claves con un prefijo
+_MAX_CHAR = "\U0010ffff"
+
+
+def single_edits(text: str) -> Set[str]:
+    """ Variantes de `text` a distancia de edición 1 (borrado, inserción, sustitución o transposición)."""
+    alphabet = set(_EDIT_ALPHABET) | set(text)
+    splits = [(text[:i], text[i:]) for i in range(len(text) + 1)]
+    variants = {left + right[1:] for left, right in splits if right}
+    variants |= {left + right[1] + right[0] + right[2:] for left, right in splits if len(right) > 1}
+    variants |= {left + char + right[1:] for left, right in splits if right for char in alphabet}
+    variants |= {left + char + right for left, right in splits for char in alphabet}
+    variants.discard(text)
+    return variants
+
+
+class PrefixIndex:
+    """
+    Índice de prefijos de términos agrupados por tipo (por ejemplo "tag" o "title").
+
+    Guarda las claves (término normalizado, tipo, texto original) en una
+    lista ordenada y los términos normalizados en una lista paralela: las
+    claves con un prefijo forman un rango contiguo que se localiza con dos
+    búsquedas binarias sobre los términos. Cada término lleva el número de
+    documentos que lo contienen, que determina el orden de las sugerencias.
+
+    Los prefijos cortos abarcan muchos términos, por lo que su ranking se
+    guarda y sólo se descarta cuando cambia un término con ese prefijo.
+
+    Atributos:
+        max_results (int): Máximo de sugerencias por consulta.
+        cached_prefix_length (int): Longitud máxima de los prefijos cuyo ranking se guarda.
+    """
+
+    def __init__(self, max_results: int = 50, cached_prefix_length: int = 2):
+        self.max_results = max_results
+        self.cached_prefix_length = cached_prefix_length
+        self._keys: List[Tuple[str, str, str]] = []
+        self._folded: List[str] = []
+        self._counts: Dict[Tuple[str, str], int] = {}
+        self._doc_entries: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+        self._ranked: Dict[Tuple[str, Optional[str]], List[Tuple[str, str, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, doc_id: str, entries: Iterable[Tuple[str, str]]) -> None:
+        """ Registra (o reemplaza) los términos (tipo, texto) de un documento."""
+        self.remove(doc_id)
+        entries = tuple(dict.fromkeys(entry for entry in entries if entry[1]))
+        self._doc_entries[doc_id] = entries
+        for entry in entries:
+            self._bump(entry, 1)
+
+    def remove(self, doc_id: str) -> None:
+        """ Retira los términos de un documento, si está."""
+        for entry in self._doc_entries.pop(doc_id, ()):
+            self._bump(entry, -1)
+
+    def _bump(self, entry: Tuple[str, str], amount: int) -> None:
+        kind, text = entry
+        key = (fold_text(text), kind, text)
+        count = self._counts.get(entry, 0) + amount
+        if count > 0:
+            if entry not in self._counts:
+                position = bisect_left(self._keys, key)
+                self._keys.insert(position, key)
+                self._folded.insert(position, key[0])
+            self._counts[entry] = count
+        else:
+            del self._counts[entry]
+            position = bisect_left(self._keys, key)
+            del self._keys[position]
+            del self._folded[position]
+        for length in range(min(len(key[0]), self.cached_prefix_length) + 1):
+            for cached_kind in (None, kind):
+                self._ranked.pop((key[0][:length], cached_kind), None)
+
+    def _range(self, prefix: str) -> Iterator[Tuple[str, str, str]]:
+        """ Claves cuyo término normalizado empieza por `prefix`."""
+        start = bisect_left(self._folded, prefix)
+        end = bisect_left(self._folded, prefix + _MAX_CHAR, start)
+        return iter(self._keys[start:end])
+
+    def _top(self, keys: Iterable[Tuple[str, str, str]], kind: Optional[str]) -> List[Tuple[str, str, int]]:
+        """ Las `max_results` claves con más documentos (a igual número, en orden alfabético)."""
+        candidates = (
+            (-self._counts[(key_kind, text)], folded, key_kind, text)
+            for folded, key_kind, text in keys
+            if kind is None or key_kind == kind
+        )
+        return [
+            (key_kind, text, -negative)
+            for negative, _, key_kind, text in heapq.nsmallest(self.max_results, candidates)
+        ]
+
+    def _complete_exact(self, prefix: str, kind: Optional[str]) -> List[Tuple[str, str, int]]:
+        if len(prefix) > self.cached_prefix_length:
+            return self._top(self._range(prefix), kind)
+        ranked = self._ranked.get((prefix, kind))
+        if ranked is None:
+            ranked = self._ranked[(prefix, kind)] = self._top(self._range(prefix), kind)
+        return ranked
+
+    def complete(
+        self,
+        prefix: str,
+        limit: int,
+        kind: Optional[str] = None,
+        fuzzy: bool = False,
+        fuzzy_min_length: int = 3,
+    ) -> List[Tuple[str, str, int]]:
+        """
+        Retorna hasta `limit` términos (tipo, texto, documentos) que empiezan
+        por `prefix` (sin distinguir mayúsculas ni acentos), de más a menos
+        frecuente. Con `fuzzy`, si faltan resultados se completan con los
+        términos que empiezan por una variante a distancia de edición 1 del
+        prefijo (sólo para prefijos de al menos `fuzzy_min_length` caracteres).
+        """
+        prefix = fold_text(prefix)
+        limit = min(limit, self.max_results)
+        results = self._complete_exact(prefix, kind)[:limit]
+        if not fuzzy or len(results) >= limit or len(prefix) < fuzzy_min_length:
+            return results
+
+        seen = {(key_kind, text) for key_kind, text, _ in results}
+        near: Dict[Tuple[str, str, str], None] = {}
+        for variant in single_edits(prefix):
+            for key in self._range(variant):
+                if (key[1], key[2]) not in seen:
+                    near[key] = None
+        return results + self._top(near, kind)[:limit - len(results)]
@@ -5,10 +5,10 @@ Utiliza pydantic para cargar los valores desde un archivo .env o desde variables
 
 import os
 from pydantic_settings  import BaseSettings
-from pydantic import ConfigDict
+from pydantic import ConfigDict, model_validator
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 
 def get_env_file_path() -> Optional[Path]:
@@ -31,6 +31,93 @@ class Settings(BaseSettings):
 
     FIREBASE_CREDENTIALS_PATH: str = "path/to/credentials.json"    
 
+    # Almacenamiento: "firestore", "sql" (SQLAlchemy) o "memory" (sin Firebase, los datos se pierden al reiniciar)
+    REPOSITORY_BACKEND: Literal["firestore", "sql", "memory"] = "firestore"
+
+    # Base de datos relacional (REPOSITORY_BACKEND="sql") y su pool de conexiones
+    DATABASE_URL: str = "sqlite:///./save_links.db"
+    SQL_POOL_SIZE: int = 5
+    SQL_MAX_OVERFLOW: int = 10
+    SQL_POOL_TIMEOUT_SECONDS: int = 30
+    SQL_POOL_RECYCLE_SECONDS: int = 1800
+    SQL_ECHO: bool = False
+
+    # Caché de ID tokens verificados
+    AUTH_TOKEN_CACHE_MAX_SIZE: int = 10000
+    AUTH_TOKEN_CACHE_TTL_SECONDS: int = 300
+    # Caché negativa de tokens rechazados y registro limitado de rechazos
+    AUTH_NEGATIVE_CACHE_MAX_SIZE: int = 10000
+    AUTH_NEGATIVE_CACHE_TTL_SECONDS: int = 30
+    AUTH_REJECTION_LOG_INTERVAL_SECONDS: int = 60
+    # Hilos dedicados a la verificación de tokens (fuera del event loop)
+    AUTH_VERIFY_MAX_WORKERS: int = 4
+    # Modo de verificación: "firebase" (SDK de firebase_admin), "local" (llaves en memoria) o
+    # "insecure" (sin verificar la firma, para ejecutar sin red; no se admite en producción)
+    AUTH_VERIFY_MODE: Literal["firebase", "local", "insecure"] = "firebase"
+    FIREBASE_PROJECT_ID: str = ""
+    AUTH_KEYS_URL: str = "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+    AUTH_KEYS_REFRESH_MARGIN_SECONDS: int = 300
+
+    # Caché de usuarios existentes (evita leer users/{id} en cada operación sobre enlaces)
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 60
+
+    # Caché de enlaces (por id y lista completa de cada usuario)
+    LINK_CACHE_ENABLED: bool = True
+    LINK_CACHE_MAX_SIZE: int = 10000
+    LINK_CACHE_TTL_SECONDS: int = 60
+    LINK_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+
+    # Ids de enlaces nuevos: "random" (uuid4) o "url" (derivado del usuario y la URL canónica,
+    # de modo que repetir una creación retorne el enlace existente)
+    LINK_ID_MODE: Literal["random", "url"] = "random"
+
+    # ETags en las lecturas de enlaces y usuarios (versión por usuario incrementada en cada escritura)
+    ETAGS_ENABLED: bool = True
+
+    # Compresión de respuestas (gzip, y brotli si el paquete está instalado) negociada con Accept-Encoding
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # Intervalo mínimo entre advertencias por fallos al actualizar las estadísticas de enlaces
+    LINK_STATS_FAILURE_LOG_INTERVAL_SECONDS: int = 60
+
+    # Paginación de enlaces
+    LINKS_PAGE_DEFAULT_LIMIT: int = 50
+    LINKS_PAGE_MAX_LIMIT: int = 500
+
+    # Filtro de enlaces por tag (Firestore admite hasta 30 valores en array_contains_any)
+    LINKS_TAG_FILTER_MAX_TAGS: int = 30
+
+    # Búsqueda de texto (índice invertido en memoria por usuario, reconstruido al expirar o al cambiar la versión de los enlaces)
+    SEARCH_INDEX_MAX_USERS: int = 1000
+    SEARCH_INDEX_TTL_SECONDS: int = 3600
+    SEARCH_QUERY_MAX_TERMS: int = 10
+    # Sugerencias por prefijo (tags y palabras de títulos)
+    SUGGEST_MAX_RESULTS: int = 50
+
+    # Operaciones masivas sobre enlaces (en Firestore cada enlace del lote son dos escrituras: el enlace y su URL)
+    LINKS_BATCH_MAX_ITEMS: int = 5000
+    LINKS_BATCH_CHUNK_SIZE: int = 250
+
+    # Eliminación en segundo plano de los enlaces de un usuario eliminado
+    USER_PURGE_PAGE_SIZE: int = 500
+    USER_PURGE_MAX_OPS_PER_SECOND: int = 500
+    # Tareas conservadas por el backend en memoria (Firestore y SQL guardan una por usuario)
+    USER_PURGE_MAX_TRACKED_JOBS: int = 1000
+    # Cada cuánto guarda su progreso una tarea en curso; sin progreso en 3 intervalos se da por interrumpida
+    USER_PURGE_HEARTBEAT_SECONDS: int = 30
+
+    @model_validator(mode="after")
+    def reject_insecure_auth_in_production(self) -> "Settings":
+        """ Impide arrancar en producción aceptando tokens sin verificar su firma."""
+        if self.AUTH_VERIFY_MODE == "insecure" and self.ENVIRONMENT == "production":
+            raise ValueError('AUTH_VERIFY_MODE="insecure" no se admite con ENVIRONMENT="production".')
+        return self
+
     model_config = ConfigDict(
         env_file=get_env_file_path(),
         env_file_encoding="utf-8"
@@ -0,0 +1,81 @@
+"""
+Normalización de URLs
+
+Funciones para obtener una forma canónica de una URL, de modo que dos
+variantes triviales de la misma dirección se consideren iguales al
+indexarlas o al detectar enlaces duplicados:
+
+- Esquema y host en minúsculas (sin el punto final del host).
+- Sin el puerto por defecto del esquema.
+- Sin barra final en la ruta. El fragmento se conserva: en aplicaciones
+  con rutas en el hash (`#/a`, `#/b`) distingue páginas distintas.
+- Sin parámetros de seguimiento (`utm_*`, `fbclid`, `gclid`, ...) y con
+  el resto de parámetros ordenados.
+
+`url_key` resume la forma canónica en un hash de longitud fija, apto como
+clave o identificador de documento, y `raise_if_url_repeated` detecta URLs
+repetidas dentro de un lote de enlaces.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import hashlib
+from typing import Dict, Iterable, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from app.core.exceptions import DuplicateLinkException
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Parámetros de seguimiento que no cambian el recurso al que apunta la URL
+_TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "gbraid", "wbraid", "msclkid", "yclid", "igshid",
+    "mc_cid", "mc_eid", "_hsenc", "_hsmi", "mkt_tok", "_ga", "_gl",
+})
+_TRACKING_PREFIXES = ("utm_",)
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in _TRACKING_PARAMS or name.startswith(_TRACKING_PREFIXES)
+
+
+def normalize_url(url: str) -> str:
+    """ Retorna la forma canónica de una URL (no valida que sea correcta)."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower().rstrip(".")
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host if port is None or _DEFAULT_PORTS.get(scheme) == port else f"{host}:{port}"
+    if parts.username:
+        credentials = parts.username + (f":{parts.password}" if parts.password else "")
+        netloc = f"{credentials}@{netloc}"
+    path = parts.path.rstrip("/") or "/"
+    params = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(name)
+    )
+    return urlunsplit((scheme, netloc, path, urlencode(params), parts.fragment))
+
+
+def url_key(url: str) -> str:
+    """ Hash (SHA-256, hexadecimal) de la forma canónica de una URL."""
+    return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+
+def raise_if_url_repeated(links: Iterable) -> None:
+    """
+    Lanza `DuplicateLinkException` si dos enlaces (con `id`, `url` y
+    `user_id`) del mismo usuario tienen la misma URL canónica. Los
+    repositorios lo comprueban antes de registrar las URLs de un lote.
+    """
+    owners: Dict[Tuple[str, str], str] = {}
+    for link in links:
+        owner = owners.setdefault((link.user_id, url_key(str(link.url))), link.id)
+        if owner != link.id:
+            raise DuplicateLinkException(str(link.url), owner)
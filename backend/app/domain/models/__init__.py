@@ -12,12 +12,29 @@ a la infraestructura y a la capa de presentación.
 Entidades definidas:
 - Link: representa un recurso virtual.
 - User: representa un usuario del sistema.
+- LinkPurgeJob: representa la eliminación en segundo plano de los enlaces de un usuario.
+- LinkStats / LinkStatsDelta: estadísticas agregadas de los enlaces de un usuario y su variación.
 
 Autor: Henry Jiménez
 Fecha: 2025-06-16
 """
 
 from .user import User
-from .link import Link, NewLink
+from .link import Link, NewLink, LinkPage, PartialLink, OwnershipCheck, LINK_PROJECTABLE_FIELDS, LINK_UPDATABLE_FIELDS
+from .purge_job import LinkPurgeJob
+from .link_stats import LinkStats, LinkStatsDelta, LINK_STATS_ACTIVITY_DAYS
 
-__all__ = ["User", "Link", "NewLink"]
\ No newline at end of file
+__all__ = [
+    "User",
+    "Link",
+    "NewLink",
+    "LinkPage",
+    "PartialLink",
+    "OwnershipCheck",
+    "LINK_PROJECTABLE_FIELDS",
+    "LINK_UPDATABLE_FIELDS",
+    "LinkPurgeJob",
+    "LinkStats",
+    "LinkStatsDelta",
+    "LINK_STATS_ACTIVITY_DAYS",
+]
\ No newline at end of file
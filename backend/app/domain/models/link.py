@@ -13,7 +13,15 @@ Fecha: 2025-06-16
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+# Campos de un enlace que pueden solicitarse en una lectura parcial (proyección).
+# El identificador se incluye siempre.
+LINK_PROJECTABLE_FIELDS = ("url", "title", "description", "created_at", "user_id", "tags")
+
+# Campos de un enlace que pueden modificarse tras su creación.
+LINK_UPDATABLE_FIELDS = ("url", "title", "description", "tags")
 
 @dataclass
 class Link:
@@ -50,13 +58,57 @@ class NewLink:
         description (str): Descripción del enlace.
         user_id (str): Identificador del usuario propietario del enlace.
         tags (List[str]): Lista de etiquetas asociadas al enlace.
+        id (Optional[str]): Identificador a asignar; si es None, el repositorio genera uno aleatorio.
     """
     title: str
     url: str
     user_id: str
     description: Optional[str] = None    
     tags: List[str] = field(default_factory=list)
+    id: Optional[str] = None
 
     def __post_init__(self):
         if not self.title or not self.url or not self.user_id:
-            raise ValueError("title, url and user_id cannot be empty")
\ No newline at end of file
+            raise ValueError("title, url and user_id cannot be empty")
+
+@dataclass
+class PartialLink:
+    """
+    Clase que representa un enlace leído con proyección de campos.
+
+    Atributos:
+        id (str): Identificador único del enlace.
+        fields (Dict[str, Any]): Valores de los campos solicitados, indexados por nombre.
+    """
+    id: str
+    fields: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not self.id:
+            raise ValueError("id cannot be empty")
+
+@dataclass
+class LinkPage:
+    """
+    Clase que representa una página de enlaces obtenida con paginación por cursor.
+
+    Atributos:
+        items (List[Link]): Enlaces de la página, ordenados por fecha de creación
+            (PartialLink si la consulta usó proyección de campos).
+        next_cursor (Optional[str]): Cursor opaco para obtener la siguiente página,
+            o None si no hay más enlaces.
+    """
+    items: List[Link] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+class OwnershipCheck(str, Enum):
+    """
+    Resultado de una modificación condicionada a la pertenencia de un enlace.
+
+    - OK: el enlace existe, pertenece al usuario y se modificó.
+    - NOT_FOUND: el enlace no existe.
+    - FORBIDDEN: el enlace pertenece a otro usuario; no se modificó.
+    """
+    OK = "ok"
+    NOT_FOUND = "not_found"
+    FORBIDDEN = "forbidden"
@@ -0,0 +1,119 @@
+"""
+LinkStats Entity
+
+Este módulo define la entidad de dominio `LinkStats`, con los contadores
+agregados de los enlaces de un usuario, y `LinkStatsDelta`, la variación
+de esos contadores que produce una escritura de enlaces.
+
+Los contadores se mantienen de forma incremental al crear, modificar o
+eliminar enlaces, y pueden reconstruirse acumulando la variación de
+crear todos los enlaces del usuario (`LinkStats.from_delta`).
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from .link import Link
+
+# Días de actividad reciente (enlaces creados por día) que se conservan
+LINK_STATS_ACTIVITY_DAYS = 30
+
+
+def activity_day(moment: datetime) -> str:
+    """ Clave del día (UTC, formato YYYY-MM-DD) con la que se agrupa la actividad."""
+    return moment.date().isoformat() if isinstance(moment, datetime) else str(moment)[:10]
+
+
+@dataclass
+class LinkStatsDelta:
+    """
+    Clase que representa la variación de las estadísticas de un usuario.
+
+    Atributos:
+        link_count (int): Variación del número de enlaces.
+        tag_counts (Dict[str, int]): Variación del número de enlaces por tag.
+        created_per_day (Dict[str, int]): Variación del número de enlaces por día de creación.
+    """
+    link_count: int = 0
+    tag_counts: Dict[str, int] = field(default_factory=dict)
+    created_per_day: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def between(cls, before: Optional[Link], after: Optional[Link]) -> "LinkStatsDelta":
+        """ Variación producida al pasar de `before` a `after` (None si el enlace no existe)."""
+        delta = cls()
+        delta.add(before, after)
+        return delta
+
+    def add(self, before: Optional[Link], after: Optional[Link]) -> None:
+        """ Acumula la variación de pasar de `before` a `after`."""
+        for link, sign in ((before, -1), (after, 1)):
+            if link is None:
+                continue
+            self.link_count += sign
+            self._bump(self.created_per_day, activity_day(link.created_at), sign)
+            for tag in set(link.tags or []):
+                self._bump(self.tag_counts, tag, sign)
+
+    @staticmethod
+    def _bump(counts: Dict[str, int], key: str, amount: int) -> None:
+        value = counts.get(key, 0) + amount
+        if value:
+            counts[key] = value
+        else:
+            counts.pop(key, None)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.link_count and not self.tag_counts and not self.created_per_day
+
+
+@dataclass
+class LinkStats:
+    """
+    Clase que representa las estadísticas de los enlaces de un usuario.
+
+    Atributos:
+        user_id (str): Identificador del usuario.
+        link_count (int): Número de enlaces.
+        tag_counts (Dict[str, int]): Número de enlaces por tag.
+        created_per_day (Dict[str, int]): Número de enlaces por día de creación (YYYY-MM-DD).
+        last_activity_at (datetime): Fecha de la última creación, modificación o eliminación.
+        reconciled_at (datetime): Fecha de la última reconstrucción a partir de los enlaces
+            (None si las estadísticas sólo se han formado con incrementos).
+        revision (int): Número de escrituras aplicadas; 0 si las estadísticas no existen.
+    """
+    user_id: str
+    link_count: int = 0
+    tag_counts: Dict[str, int] = field(default_factory=dict)
+    created_per_day: Dict[str, int] = field(default_factory=dict)
+    last_activity_at: Optional[datetime] = None
+    reconciled_at: Optional[datetime] = None
+    revision: int = 0
+
+    @classmethod
+    def from_delta(cls, user_id: str, delta: LinkStatsDelta, last_activity_at: Optional[datetime], now: datetime) -> "LinkStats":
+        """ Construye las estadísticas a partir de la variación acumulada de todos los enlaces del usuario."""
+        return cls(
+            user_id=user_id,
+            link_count=delta.link_count,
+            tag_counts={tag: count for tag, count in delta.tag_counts.items() if count > 0},
+            created_per_day=recent_days(delta.created_per_day, now),
+            last_activity_at=last_activity_at,
+            reconciled_at=now,
+        )
+
+    def created_since(self, now: datetime, days: int) -> int:
+        """ Número de enlaces creados en los últimos `days` días (incluido el actual)."""
+        since = activity_day(now - timedelta(days=days - 1))
+        return sum(count for day, count in self.created_per_day.items() if day >= since)
+
+
+def recent_days(created_per_day: Dict[str, int], now: datetime) -> Dict[str, int]:
+    """ Descarta los días fuera de la ventana de actividad y los contadores vacíos."""
+    since = activity_day(now - timedelta(days=LINK_STATS_ACTIVITY_DAYS - 1))
+    return {day: count for day, count in created_per_day.items() if day >= since and count > 0}
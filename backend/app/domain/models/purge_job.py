@@ -0,0 +1,41 @@
+"""
+LinkPurgeJob Entity
+
+Este módulo define la entidad de dominio `LinkPurgeJob`, que describe el
+progreso de la eliminación en segundo plano de los enlaces de un usuario
+eliminado.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class LinkPurgeJob:
+    """
+    Clase que representa una tarea de eliminación de los enlaces de un usuario.
+
+    Atributos:
+        user_id (str): Identificador del usuario cuyos enlaces se eliminan.
+        status (str): Estado de la tarea: pending, running, completed o failed.
+        deleted (int): Número de enlaces eliminados hasta el momento.
+        started_at (datetime): Fecha en la que se encoló la tarea.
+        finished_at (datetime): Fecha en la que terminó la tarea, si ya terminó.
+        error (str): Descripción del error si la tarea falló.
+        updated_at (datetime): Último registro de progreso de la instancia que ejecuta la tarea.
+    """
+    user_id: str
+    started_at: datetime
+    status: str = "pending"
+    deleted: int = 0
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ("pending", "running")
@@ -10,6 +10,16 @@ desacoplar los servicios de aplicación de cualquier implementación concreta (c
 Interfaces definidas:
 - ILinkRepository: interfaz para operaciones sobre enlaces.
 - IUserRepository: interfaz para operaciones sobre usuarios.
+- IAsyncLinkRepository: versión asíncrona de ILinkRepository.
+- IAsyncUserRepository: versión asíncrona de IUserRepository.
+- ILinkStatsRepository: interfaz para las estadísticas agregadas de enlaces por usuario.
+- IAsyncLinkStatsRepository: versión asíncrona de ILinkStatsRepository.
+- ILinkUrlRepository: interfaz para el índice de URLs de los enlaces de cada usuario.
+- IAsyncLinkUrlRepository: versión asíncrona de ILinkUrlRepository.
+- IUserVersionRepository: interfaz para las versiones por usuario (ETags de lecturas).
+- IAsyncUserVersionRepository: versión asíncrona de IUserVersionRepository.
+- ILinkPurgeJobRepository: interfaz para el estado de las tareas de eliminación de enlaces.
+- IAsyncLinkPurgeJobRepository: versión asíncrona de ILinkPurgeJobRepository.
 
 Sus implementaciones concretas se encuentran en `infrastructure/repositories/`.
 
@@ -19,5 +29,28 @@ Fecha: 2025-06-16
 
 from .link_repository import ILinkRepository
 from .user_repository import IUserRepository
+from .async_link_repository import IAsyncLinkRepository
+from .async_user_repository import IAsyncUserRepository
+from .link_stats_repository import ILinkStatsRepository
+from .async_link_stats_repository import IAsyncLinkStatsRepository
+from .link_url_repository import ILinkUrlRepository
+from .async_link_url_repository import IAsyncLinkUrlRepository
+from .user_version_repository import IUserVersionRepository
+from .async_user_version_repository import IAsyncUserVersionRepository
+from .link_purge_job_repository import ILinkPurgeJobRepository
+from .async_link_purge_job_repository import IAsyncLinkPurgeJobRepository
 
-__all__ = ["ILinkRepository", "IUserRepository"]
\ No newline at end of file
+__all__ = [
+    "ILinkRepository",
+    "IUserRepository",
+    "IAsyncLinkRepository",
+    "IAsyncUserRepository",
+    "ILinkStatsRepository",
+    "IAsyncLinkStatsRepository",
+    "ILinkUrlRepository",
+    "IAsyncLinkUrlRepository",
+    "IUserVersionRepository",
+    "IAsyncUserVersionRepository",
+    "ILinkPurgeJobRepository",
+    "IAsyncLinkPurgeJobRepository",
+]
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+Interfaz asíncrona del repositorio de tareas de eliminación de enlaces
+
+Versión asíncrona de `ILinkPurgeJobRepository`, utilizada por los servicios
+de aplicación.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.domain.models import LinkPurgeJob
+
+class IAsyncLinkPurgeJobRepository(ABC):
+    """
+    Interfaz asíncrona del repositorio de tareas de eliminación de enlaces.
+    
+    Define los mismos métodos que `ILinkPurgeJobRepository`, pero como corrutinas.
+    """
+
+    @abstractmethod
+    async def get_job(self, user_id: str) -> Optional[LinkPurgeJob]:
+        """Obtiene la última tarea de eliminación de los enlaces del usuario, si existe."""
+        pass
+
+    @abstractmethod
+    async def save_job(self, job: LinkPurgeJob) -> None:
+        """Guarda (o reemplaza) el estado de la tarea de eliminación del usuario."""
+        pass
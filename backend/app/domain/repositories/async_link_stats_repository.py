@@ -0,0 +1,50 @@
+"""
+Interfaz asíncrona del repositorio de LinkStats
+
+Versión asíncrona de `ILinkStatsRepository`, utilizada por los servicios
+de aplicación.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from app.domain.models import LinkStats, LinkStatsDelta
+
+class IAsyncLinkStatsRepository(ABC):
+    """
+    Interfaz asíncrona del repositorio de estadísticas de enlaces.
+    
+    Define los mismos métodos que `ILinkStatsRepository`, pero como corrutinas.
+    """
+
+    @abstractmethod
+    async def get_stats(self, user_id: str) -> Optional[LinkStats]:
+        """Obtiene las estadísticas de un usuario, o None si aún no se han calculado."""
+        pass
+
+    @abstractmethod
+    async def increment_stats(self, user_id: str, delta: LinkStatsDelta, activity_at: datetime) -> None:
+        """
+        Suma `delta` a las estadísticas del usuario de forma atómica, registra
+        `activity_at` como última actividad e incrementa su revisión. Si no
+        existen, se crean con `delta` (sin `reconciled_at`).
+        """
+        pass
+
+    @abstractmethod
+    async def save_stats(self, stats: LinkStats, expected_revision: int) -> bool:
+        """
+        Reemplaza las estadísticas de un usuario (reconstrucción) sólo si su
+        revisión sigue siendo `expected_revision` (0 si no existían), de modo
+        que no se pierdan incrementos aplicados durante la reconstrucción.
+        Retorna False, sin escribir, si la revisión cambió.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_stats(self, user_id: str) -> None:
+        """Elimina las estadísticas de un usuario."""
+        pass
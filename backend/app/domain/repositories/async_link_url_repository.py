@@ -0,0 +1,34 @@
+"""
+Interfaz asíncrona del repositorio de URLs de enlaces
+
+Versión asíncrona de `ILinkUrlRepository`, utilizada por los servicios
+de aplicación.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+class IAsyncLinkUrlRepository(ABC):
+    """
+    Interfaz asíncrona del repositorio de URLs de enlaces.
+    
+    Define los mismos métodos que `ILinkUrlRepository`, pero como corrutinas.
+    """
+
+    @abstractmethod
+    async def get_link_ids(self, user_id: str, url_keys: List[str]) -> Dict[str, str]:
+        """Obtiene el id del enlace registrado para cada clave de URL. Las claves sin enlace se omiten."""
+        pass
+
+    @abstractmethod
+    async def save_urls(self, user_id: str, entries: Dict[str, str]) -> None:
+        """Registra (o reemplaza) el enlace de cada clave de URL (clave -> id del enlace)."""
+        pass
+
+    @abstractmethod
+    async def delete_urls(self, user_id: str, url_keys: List[str]) -> None:
+        """Elimina el registro de las claves de URL indicadas."""
+        pass
@@ -0,0 +1,43 @@
+"""
+Interfaz asíncrona del repositorio de User
+
+Versión asíncrona de `IUserRepository`. Permite que los servicios de aplicación
+y las rutas HTTP se ejecuten completamente en el event loop, sin ocupar un hilo
+del threadpool por cada petición mientras se espera a la base de datos.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from app.domain.models import User
+
+class IAsyncUserRepository(ABC):
+    """
+    Interfaz asíncrona del repositorio de User.
+    
+    Define los mismos métodos que `IUserRepository`, pero como corrutinas.
+    Debe ser implementada por una clase concreta con un cliente asíncrono.
+    """
+
+    @abstractmethod
+    async def create_user(self, user: User) -> User:
+        """Crea un nuevo usuario en el repositorio."""
+        pass
+
+    @abstractmethod
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+        """Obtiene un usuario por su identificador."""
+        pass
+
+    @abstractmethod
+    async def update_user(self, user: User) -> User:
+        """Actualiza un usuario existente."""
+        pass
+    
+    @abstractmethod
+    async def delete_user(self, user_id: str)-> None:
+        """Elimina un usuario por su identificador."""
+        pass
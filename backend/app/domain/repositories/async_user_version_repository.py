@@ -0,0 +1,28 @@
+"""
+Interfaz asíncrona del repositorio de versiones por usuario
+
+Versión asíncrona de `IUserVersionRepository`, utilizada por los servicios
+de aplicación.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from abc import ABC, abstractmethod
+
+class IAsyncUserVersionRepository(ABC):
+    """
+    Interfaz asíncrona del repositorio de versiones por usuario.
+    
+    Define los mismos métodos que `IUserVersionRepository`, pero como corrutinas.
+    """
+
+    @abstractmethod
+    async def get_version(self, user_id: str, scope: str) -> int:
+        """Obtiene la versión actual del ámbito del usuario (0 si nunca se modificó)."""
+        pass
+
+    @abstractmethod
+    async def bump_version(self, user_id: str, scope: str) -> None:
+        """Incrementa de forma atómica la versión del ámbito del usuario."""
+        pass
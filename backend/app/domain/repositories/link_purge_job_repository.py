@@ -0,0 +1,32 @@
+"""
+Interfaz del repositorio de tareas de eliminación de enlaces
+
+Guarda el estado de la última tarea de eliminación de los enlaces de cada
+usuario, de modo que cualquier instancia de la aplicación pueda consultarlo
+y detectar una tarea ya en curso en otra.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.domain.models import LinkPurgeJob
+
+class ILinkPurgeJobRepository(ABC):
+    """
+    Interfaz del repositorio de tareas de eliminación de enlaces.
+    
+    Debe ser implementada por una clase concreta (por ejemplo, usando NoSQL).
+    """
+
+    @abstractmethod
+    def get_job(self, user_id: str) -> Optional[LinkPurgeJob]:
+        """Obtiene la última tarea de eliminación de los enlaces del usuario, si existe."""
+        pass
+
+    @abstractmethod
+    def save_job(self, job: LinkPurgeJob) -> None:
+        """Guarda (o reemplaza) el estado de la tarea de eliminación del usuario."""
+        pass
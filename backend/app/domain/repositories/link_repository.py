@@ -12,8 +12,8 @@ Fecha: 2025-06-16
 """
 
 from abc import ABC, abstractmethod
-from typing import List
-from app.domain.models import Link, NewLink
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from app.domain.models import Link, NewLink, LinkPage, OwnershipCheck
 
 class ILinkRepository(ABC):
     """
@@ -24,6 +24,11 @@ class ILinkRepository(ABC):
     
     Permite desacoplar la lógica de aplicación del mecanismo específico de almacenamiento
     siguiendo los principios de inversión de dependencias y arquitectura hexagonal.
+    
+    Las escrituras mantienen el índice de URLs (`ILinkUrlRepository`) en la
+    misma operación atómica: crear un enlace o cambiar su URL registra su URL
+    canónica, y lanza `DuplicateLinkException` sin escribir nada si otro
+    enlace del usuario ya la tiene; eliminarlo libera la entrada.
     """
 
     @abstractmethod
@@ -32,8 +37,60 @@ class ILinkRepository(ABC):
         pass
 
     @abstractmethod
-    def get_links_by_user_id(self, user_id: str) -> List[Link]:
-        """Obtiene todos los enlaces asociados a un usuario."""
+    def create_link_if_absent(self, link: NewLink) -> Tuple[Link, bool]:
+        """
+        Crea un enlace con el id indicado en `link.id` sólo si no existe otro
+        con ese id, en una escritura condicionada. Retorna el enlace creado y
+        True, o el enlace ya existente y False.
+        """
+        pass
+
+    @abstractmethod
+    def create_links(self, links: List[NewLink]) -> List[Link]:
+        """
+        Crea varios enlaces en una única escritura atómica: se crean todos o ninguno.
+        
+        El llamador es responsable de respetar el tamaño máximo de lote del backend
+        (500 escrituras en Firestore: dos por enlace, con la de su URL).
+        """
+        pass
+
+    @abstractmethod
+    def get_links_by_user_id(self, user_id: str, fields: Optional[List[str]] = None) -> List[Link]:
+        """
+        Obtiene todos los enlaces asociados a un usuario.
+        
+        Si se indica `fields`, sólo se leen esos campos y se retornan instancias de `PartialLink`.
+        """
+        pass
+    
+    @abstractmethod
+    def stream_links_by_user_id(self, user_id: str, fields: Optional[List[str]] = None) -> Iterator[Link]:
+        """
+        Itera los enlaces de un usuario a medida que se leen, sin cargarlos todos en memoria.
+        
+        Si se indica `fields`, sólo se leen esos campos y se retornan instancias de `PartialLink`.
+        """
+        pass
+    
+    @abstractmethod
+    def get_links_page(self, user_id: str, limit: int, cursor: Optional[str] = None, fields: Optional[List[str]] = None) -> LinkPage:
+        """
+        Obtiene una página de enlaces de un usuario, ordenados por fecha de creación.
+
+        `cursor` es el valor `next_cursor` de la página anterior (None para la primera).
+        Si se indica `fields`, los elementos de la página son instancias de `PartialLink`.
+        """
+        pass
+    
+    @abstractmethod
+    def get_links_by_tags(self, user_id: str, tags: List[str], match_all: bool = False, fields: Optional[List[str]] = None) -> List[Link]:
+        """
+        Obtiene los enlaces de un usuario que tienen alguno de los `tags`
+        (o todos, con `match_all=True`).
+        
+        Si se indica `fields`, sólo se leen esos campos y se retornan instancias de `PartialLink`.
+        """
         pass
     
     @abstractmethod
@@ -41,12 +98,84 @@ class ILinkRepository(ABC):
         """Obtiene un enlace por su identificador."""
         pass
 
+    @abstractmethod
+    def get_links_by_ids(self, link_ids: List[str]) -> List[Link]:
+        """Obtiene varios enlaces por sus identificadores en una sola lectura. Los inexistentes se omiten."""
+        pass
+
     @abstractmethod
     def update_link(self, link: Link) -> Link:
         """Actualiza un enlace existente."""
         pass
 
+    @abstractmethod
+    def update_link_if_owned(self, link_id: str, user_id: str, changes: Dict[str, Any]) -> Tuple[OwnershipCheck, Optional[Link], Optional[Link]]:
+        """
+        Aplica `changes` al enlace sólo si existe y pertenece a `user_id`,
+        verificando y escribiendo en una única operación atómica.
+        Retorna el resultado de la verificación, el enlace antes del cambio y
+        el enlace actualizado (ambos None si la verificación falla).
+        """
+        pass
+
+    @abstractmethod
+    def update_links_if_owned(
+        self,
+        user_id: str,
+        link_ids: List[str],
+        apply: Callable[[Link], Dict[str, Any]],
+    ) -> List[Tuple[OwnershipCheck, Optional[Link], Optional[Link]]]:
+        """
+        Actualiza varios enlaces del usuario en una única escritura atómica
+        (máximo 500 en Firestore). Cada enlace se lee de la base de datos (no
+        de una caché) y `apply` retorna, a partir de ese estado, sólo los
+        campos que cambian; la escritura se descarta si el enlace cambió tras
+        la lectura. Retorna, en el orden de `link_ids`, el resultado de la
+        verificación, el enlace anterior y el actualizado de cada uno.
+        """
+        pass
+
     @abstractmethod
     def delete_link(self, link_id: str) -> None:
         """Elimina un enlace por su identificador."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def delete_link_if_owned(self, link_id: str, user_id: str) -> Tuple[OwnershipCheck, Optional[Link]]:
+        """
+        Elimina el enlace sólo si existe y pertenece a `user_id`, en una única operación atómica.
+        Retorna el resultado de la verificación y el enlace eliminado (None si la verificación falla).
+        """
+        pass
+
+    @abstractmethod
+    def delete_links_if_owned(self, user_id: str, link_ids: List[str]) -> List[Tuple[OwnershipCheck, Optional[Link]]]:
+        """
+        Elimina los enlaces de `link_ids` que existen y pertenecen a `user_id`
+        en una única escritura atómica (máximo 500 en Firestore). Retorna, en
+        el orden de `link_ids`, el resultado de la verificación y el enlace
+        eliminado de cada uno (None si la verificación falla).
+        """
+        pass
+
+    @abstractmethod
+    def delete_links(self, link_ids: List[str]) -> None:
+        """Elimina varios enlaces en una única escritura atómica (máximo 500 en Firestore)."""
+        pass
+
+    @abstractmethod
+    def delete_links_by_user_id(
+        self,
+        user_id: str,
+        page_size: int,
+        max_ops_per_second: int,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Elimina todos los enlaces de un usuario por páginas de `page_size`,
+        sin superar `max_ops_per_second` eliminaciones por segundo.
+        
+        `on_progress` recibe el total eliminado tras cada página. Retorna el
+        número de enlaces eliminados.
+        """
+        pass
@@ -0,0 +1,51 @@
+"""
+Interfaz del repositorio de LinkStats
+
+Define cómo se leen y actualizan las estadísticas agregadas de los enlaces
+de cada usuario. Las actualizaciones son incrementos atómicos, de modo que
+escrituras concurrentes de enlaces del mismo usuario no se pisan entre sí.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from app.domain.models import LinkStats, LinkStatsDelta
+
+class ILinkStatsRepository(ABC):
+    """
+    Interfaz del repositorio de estadísticas de enlaces.
+    
+    Debe ser implementada por una clase concreta (por ejemplo, usando NoSQL).
+    """
+
+    @abstractmethod
+    def get_stats(self, user_id: str) -> Optional[LinkStats]:
+        """Obtiene las estadísticas de un usuario, o None si aún no se han calculado."""
+        pass
+
+    @abstractmethod
+    def increment_stats(self, user_id: str, delta: LinkStatsDelta, activity_at: datetime) -> None:
+        """
+        Suma `delta` a las estadísticas del usuario de forma atómica, registra
+        `activity_at` como última actividad e incrementa su revisión. Si no
+        existen, se crean con `delta` (sin `reconciled_at`).
+        """
+        pass
+
+    @abstractmethod
+    def save_stats(self, stats: LinkStats, expected_revision: int) -> bool:
+        """
+        Reemplaza las estadísticas de un usuario (reconstrucción) sólo si su
+        revisión sigue siendo `expected_revision` (0 si no existían), de modo
+        que no se pierdan incrementos aplicados durante la reconstrucción.
+        Retorna False, sin escribir, si la revisión cambió.
+        """
+        pass
+
+    @abstractmethod
+    def delete_stats(self, user_id: str) -> None:
+        """Elimina las estadísticas de un usuario."""
+        pass
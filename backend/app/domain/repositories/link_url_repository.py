@@ -0,0 +1,40 @@
+"""
+Interfaz del repositorio de URLs de enlaces
+
+Define el índice que relaciona, para cada usuario, la URL canónica de sus
+enlaces (resumida con `app.core.urls.url_key`) con el id del enlace. Permite
+saber si un usuario ya guardó una URL con una lectura por clave, sin
+consultar sus enlaces.
+
+El índice lo mantienen los repositorios de enlaces, en la misma escritura
+atómica que cada enlace creado, modificado o eliminado (también al purgar
+los enlaces de un usuario); los servicios sólo lo consultan.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+class ILinkUrlRepository(ABC):
+    """
+    Interfaz del repositorio de URLs de enlaces.
+    
+    Debe ser implementada por una clase concreta (por ejemplo, usando NoSQL).
+    """
+
+    @abstractmethod
+    def get_link_ids(self, user_id: str, url_keys: List[str]) -> Dict[str, str]:
+        """Obtiene el id del enlace registrado para cada clave de URL. Las claves sin enlace se omiten."""
+        pass
+
+    @abstractmethod
+    def save_urls(self, user_id: str, entries: Dict[str, str]) -> None:
+        """Registra (o reemplaza) el enlace de cada clave de URL (clave -> id del enlace)."""
+        pass
+
+    @abstractmethod
+    def delete_urls(self, user_id: str, url_keys: List[str]) -> None:
+        """Elimina el registro de las claves de URL indicadas."""
+        pass
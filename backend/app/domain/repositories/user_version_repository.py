@@ -0,0 +1,29 @@
+"""
+Interfaz del repositorio de versiones por usuario
+
+Define un contador por usuario y ámbito ("links", "user") que se
+incrementa con cada modificación de esos datos. Permite calcular un ETag
+de una lectura con una sola lectura por clave, sin cargar los datos.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from abc import ABC, abstractmethod
+
+class IUserVersionRepository(ABC):
+    """
+    Interfaz del repositorio de versiones por usuario.
+    
+    Debe ser implementada por una clase concreta (por ejemplo, usando NoSQL).
+    """
+
+    @abstractmethod
+    def get_version(self, user_id: str, scope: str) -> int:
+        """Obtiene la versión actual del ámbito del usuario (0 si nunca se modificó)."""
+        pass
+
+    @abstractmethod
+    def bump_version(self, user_id: str, scope: str) -> None:
+        """Incrementa de forma atómica la versión del ámbito del usuario."""
+        pass
@@ -0,0 +1,31 @@
+"""
+Adapters module.
+
+Adaptadores entre las interfaces síncronas y asíncronas de los repositorios.
+
+Actualmente disponibles:
+- AsyncLinkRepositoryAdapter: Expone un ILinkRepository como IAsyncLinkRepository.
+- AsyncUserRepositoryAdapter: Expone un IUserRepository como IAsyncUserRepository.
+- AsyncLinkStatsRepositoryAdapter: Expone un ILinkStatsRepository como IAsyncLinkStatsRepository.
+- AsyncLinkUrlRepositoryAdapter: Expone un ILinkUrlRepository como IAsyncLinkUrlRepository.
+- AsyncUserVersionRepositoryAdapter: Expone un IUserVersionRepository como IAsyncUserVersionRepository.
+- AsyncLinkPurgeJobRepositoryAdapter: Expone un ILinkPurgeJobRepository como IAsyncLinkPurgeJobRepository.
+"""
+
+from .async_repository_adapter import (
+    AsyncLinkRepositoryAdapter,
+    AsyncUserRepositoryAdapter,
+    AsyncLinkStatsRepositoryAdapter,
+    AsyncLinkUrlRepositoryAdapter,
+    AsyncUserVersionRepositoryAdapter,
+    AsyncLinkPurgeJobRepositoryAdapter,
+)
+
+__all__ = [
+    "AsyncLinkRepositoryAdapter",
+    "AsyncUserRepositoryAdapter",
+    "AsyncLinkStatsRepositoryAdapter",
+    "AsyncLinkUrlRepositoryAdapter",
+    "AsyncUserVersionRepositoryAdapter",
+    "AsyncLinkPurgeJobRepositoryAdapter",
+]
@@ -0,0 +1,221 @@
+"""
+Adaptadores de repositorios síncronos a las interfaces asíncronas
+
+Los servicios de aplicación dependen de `IAsyncLinkRepository`,
+`IAsyncUserRepository`, `IAsyncLinkStatsRepository`,
+`IAsyncLinkUrlRepository`, `IAsyncUserVersionRepository` e
+`IAsyncLinkPurgeJobRepository`. Estos adaptadores permiten usar cualquier
+implementación síncrona (`ILinkRepository`, `IUserRepository`,
+`ILinkStatsRepository`, `ILinkUrlRepository`, `IUserVersionRepository`,
+`ILinkPurgeJobRepository`) detrás de ellos.
+
+Con `offload=True` cada llamada se ejecuta en un pool de hilos, para que
+una implementación bloqueante (por ejemplo, SQL) no detenga el event loop.
+Con `offload=False` se llama directamente, lo que conviene para
+implementaciones en memoria cuyo costo es menor que el cambio de hilo.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from datetime import datetime
+from functools import partial
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from app.domain.models import Link, NewLink, LinkPage, OwnershipCheck, User, LinkStats, LinkStatsDelta, LinkPurgeJob
+from app.domain.repositories import (
+    ILinkRepository,
+    IUserRepository,
+    ILinkStatsRepository,
+    ILinkUrlRepository,
+    IUserVersionRepository,
+    ILinkPurgeJobRepository,
+    IAsyncLinkRepository,
+    IAsyncUserRepository,
+    IAsyncLinkStatsRepository,
+    IAsyncLinkUrlRepository,
+    IAsyncUserVersionRepository,
+    IAsyncLinkPurgeJobRepository,
+)
+
+
+class _SyncCaller:
+    """ Ejecuta funciones síncronas en el event loop o en un pool de hilos."""
+
+    def __init__(self, offload: bool, executor: Optional[Executor]):
+        self.offload = offload
+        self.executor = executor
+
+    async def call(self, fn: Callable, *args) -> Any:
+        if not self.offload:
+            return fn(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(fn, *args))
+
+
+class AsyncLinkRepositoryAdapter(IAsyncLinkRepository):
+
+    def __init__(
+        self,
+        repository: ILinkRepository,
+        offload: bool = True,
+        executor: Optional[Executor] = None,
+        stream_chunk_size: int = 200,
+    ):
+        self.repository = repository
+        self.stream_chunk_size = stream_chunk_size
+        self._caller = _SyncCaller(offload, executor)
+
+    async def create_link(self, link: NewLink) -> Link:
+        return await self._caller.call(self.repository.create_link, link)
+
+    async def create_link_if_absent(self, link: NewLink) -> Tuple[Link, bool]:
+        return await self._caller.call(self.repository.create_link_if_absent, link)
+
+    async def create_links(self, links: List[NewLink]) -> List[Link]:
+        return await self._caller.call(self.repository.create_links, links)
+
+    async def get_links_by_user_id(self, user_id: str, fields: Optional[List[str]] = None) -> List[Link]:
+        return await self._caller.call(self.repository.get_links_by_user_id, user_id, fields)
+
+    async def stream_links_by_user_id(self, user_id: str, fields: Optional[List[str]] = None) -> AsyncIterator[Link]:
+        """ Itera el iterador síncrono del repositorio por bloques de `stream_chunk_size`."""
+        iterator = self.repository.stream_links_by_user_id(user_id, fields)
+        while True:
+            chunk = await self._caller.call(lambda: list(islice(iterator, self.stream_chunk_size)))
+            if not chunk:
+                return
+            for link in chunk:
+                yield link
+
+    async def get_links_page(self, user_id: str, limit: int, cursor: Optional[str] = None, fields: Optional[List[str]] = None) -> LinkPage:
+        return await self._caller.call(self.repository.get_links_page, user_id, limit, cursor, fields)
+
+    async def get_links_by_tags(self, user_id: str, tags: List[str], match_all: bool = False, fields: Optional[List[str]] = None) -> List[Link]:
+        return await self._caller.call(self.repository.get_links_by_tags, user_id, tags, match_all, fields)
+
+    async def get_link_by_id(self, link_id: str) -> Optional[Link]:
+        return await self._caller.call(self.repository.get_link_by_id, link_id)
+
+    async def get_links_by_ids(self, link_ids: List[str]) -> List[Link]:
+        return await self._caller.call(self.repository.get_links_by_ids, link_ids)
+
+    async def update_link(self, link: Link) -> Link:
+        return await self._caller.call(self.repository.update_link, link)
+
+    async def update_link_if_owned(self, link_id: str, user_id: str, changes: Dict[str, Any]) -> Tuple[OwnershipCheck, Optional[Link], Optional[Link]]:
+        return await self._caller.call(self.repository.update_link_if_owned, link_id, user_id, changes)
+
+    async def update_links_if_owned(
+        self,
+        user_id: str,
+        link_ids: List[str],
+        apply: Callable[[Link], Dict[str, Any]],
+    ) -> List[Tuple[OwnershipCheck, Optional[Link], Optional[Link]]]:
+        return await self._caller.call(self.repository.update_links_if_owned, user_id, link_ids, apply)
+
+    async def delete_link(self, link_id: str) -> None:
+        return await self._caller.call(self.repository.delete_link, link_id)
+
+    async def delete_link_if_owned(self, link_id: str, user_id: str) -> Tuple[OwnershipCheck, Optional[Link]]:
+        return await self._caller.call(self.repository.delete_link_if_owned, link_id, user_id)
+
+    async def delete_links_if_owned(self, user_id: str, link_ids: List[str]) -> List[Tuple[OwnershipCheck, Optional[Link]]]:
+        return await self._caller.call(self.repository.delete_links_if_owned, user_id, link_ids)
+
+    async def delete_links(self, link_ids: List[str]) -> None:
+        return await self._caller.call(self.repository.delete_links, link_ids)
+
+    async def delete_links_by_user_id(
+        self,
+        user_id: str,
+        page_size: int,
+        max_ops_per_second: int,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        return await self._caller.call(
+            self.repository.delete_links_by_user_id, user_id, page_size, max_ops_per_second, on_progress
+        )
+
+
+class AsyncUserRepositoryAdapter(IAsyncUserRepository):
+
+    def __init__(self, repository: IUserRepository, offload: bool = True, executor: Optional[Executor] = None):
+        self.repository = repository
+        self._caller = _SyncCaller(offload, executor)
+
+    async def create_user(self, user: User) -> User:
+        return await self._caller.call(self.repository.create_user, user)
+
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+        return await self._caller.call(self.repository.get_user_by_id, user_id)
+
+    async def update_user(self, user: User) -> User:
+        return await self._caller.call(self.repository.update_user, user)
+
+    async def delete_user(self, user_id: str) -> None:
+        return await self._caller.call(self.repository.delete_user, user_id)
+
+
+class AsyncLinkStatsRepositoryAdapter(IAsyncLinkStatsRepository):
+
+    def __init__(self, repository: ILinkStatsRepository, offload: bool = True, executor: Optional[Executor] = None):
+        self.repository = repository
+        self._caller = _SyncCaller(offload, executor)
+
+    async def get_stats(self, user_id: str) -> Optional[LinkStats]:
+        return await self._caller.call(self.repository.get_stats, user_id)
+
+    async def increment_stats(self, user_id: str, delta: LinkStatsDelta, activity_at: datetime) -> None:
+        return await self._caller.call(self.repository.increment_stats, user_id, delta, activity_at)
+
+    async def save_stats(self, stats: LinkStats, expected_revision: int) -> bool:
+        return await self._caller.call(self.repository.save_stats, stats, expected_revision)
+
+    async def delete_stats(self, user_id: str) -> None:
+        return await self._caller.call(self.repository.delete_stats, user_id)
+
+
+class AsyncLinkUrlRepositoryAdapter(IAsyncLinkUrlRepository):
+
+    def __init__(self, repository: ILinkUrlRepository, offload: bool = True, executor: Optional[Executor] = None):
+        self.repository = repository
+        self._caller = _SyncCaller(offload, executor)
+
+    async def get_link_ids(self, user_id: str, url_keys: List[str]) -> Dict[str, str]:
+        return await self._caller.call(self.repository.get_link_ids, user_id, url_keys)
+
+    async def save_urls(self, user_id: str, entries: Dict[str, str]) -> None:
+        return await self._caller.call(self.repository.save_urls, user_id, entries)
+
+    async def delete_urls(self, user_id: str, url_keys: List[str]) -> None:
+        return await self._caller.call(self.repository.delete_urls, user_id, url_keys)
+
+
+class AsyncUserVersionRepositoryAdapter(IAsyncUserVersionRepository):
+
+    def __init__(self, repository: IUserVersionRepository, offload: bool = True, executor: Optional[Executor] = None):
+        self.repository = repository
+        self._caller = _SyncCaller(offload, executor)
+
+    async def get_version(self, user_id: str, scope: str) -> int:
+        return await self._caller.call(self.repository.get_version, user_id, scope)
+
+    async def bump_version(self, user_id: str, scope: str) -> None:
+        return await self._caller.call(self.repository.bump_version, user_id, scope)
+
+
+class AsyncLinkPurgeJobRepositoryAdapter(IAsyncLinkPurgeJobRepository):
+
+    def __init__(self, repository: ILinkPurgeJobRepository, offload: bool = True, executor: Optional[Executor] = None):
+        self.repository = repository
+        self._caller = _SyncCaller(offload, executor)
+
+    async def get_job(self, user_id: str) -> Optional[LinkPurgeJob]:
+        return await self._caller.call(self.repository.get_job, user_id)
+
+    async def save_job(self, job: LinkPurgeJob) -> None:
+        return await self._caller.call(self.repository.save_job, job)
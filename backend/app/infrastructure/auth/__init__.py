@@ -0,0 +1,18 @@
+"""
+Auth module.
+
+Componentes de infraestructura para la verificación de tokens de autenticación
+emitidos por Firebase Auth.
+
+Actualmente disponibles:
+- FirebaseTokenVerifier: Verificación de ID tokens con caché de resultados.
+- PublicKeySet: Llaves públicas de firma renovadas en segundo plano.
+- LocalTokenVerifier: Verificación local de ID tokens contra un PublicKeySet.
+- UnverifiedTokenVerifier: Lectura de ID tokens sin verificar su firma (sólo desarrollo).
+"""
+
+from .token_verifier import FirebaseTokenVerifier
+from .key_set import PublicKeySet, LocalTokenVerifier
+from .unverified_token_verifier import UnverifiedTokenVerifier
+
+__all__ = ["FirebaseTokenVerifier", "PublicKeySet", "LocalTokenVerifier", "UnverifiedTokenVerifier"]
@@ -0,0 +1,254 @@
+"""
+Conjunto de llaves públicas para la verificación local de ID tokens
+
+Firebase firma los ID tokens con llaves RSA que Google publica como
+certificados X.509 y rota periódicamente. El SDK de Firebase Admin descarga
+estos certificados de forma perezosa, de modo que la primera petición tras
+una rotación paga la descarga dentro del ciclo de la petición.
+
+Este módulo mantiene las llaves en memoria y las renueva en segundo plano
+antes de que expire su `Cache-Control: max-age`. También permite recibir un
+conjunto de llaves local (sin red), útil para pruebas con tokens auto-firmados.
+
+Componentes:
+- PublicKeySet: almacena y renueva las llaves públicas indexadas por `kid`.
+- LocalTokenVerifier: verifica ID tokens localmente contra un PublicKeySet.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import re
+import threading
+import time
+from typing import Callable, Optional, Union
+
+import jwt
+import requests
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+from firebase_admin.auth import CertificateFetchError, ExpiredIdTokenError, InvalidIdTokenError
+
+from app.core import logger
+
+
+GOOGLE_CERTS_URL = (
+    "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+)
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def load_public_key(value: Union[str, bytes, RSAPublicKey]) -> RSAPublicKey:
+    """ Convierte un certificado X.509 o una llave pública PEM en una llave RSA."""
+    if isinstance(value, RSAPublicKey):
+        return value
+    data = value.encode("utf-8") if isinstance(value, str) else value
+    if b"BEGIN CERTIFICATE" in data:
+        return x509.load_pem_x509_certificate(data).public_key()
+    return serialization.load_pem_public_key(data)
+
+
+class PublicKeySet:
+    """
+    Llaves públicas de firma indexadas por `kid`.
+
+    Si se proporciona `keys`, el conjunto es estático: no se accede a la red
+    ni se inicia la renovación en segundo plano.
+
+    Atributos:
+        certs_url (str): URL de la que se descargan los certificados.
+        refresh_margin (float): Segundos de antelación con la que se renuevan las llaves.
+        retry_interval (float): Segundos de espera tras la primera renovación fallida
+            (se duplica en cada fallo consecutivo, hasta `max_retry_interval`).
+        max_retry_interval (float): Espera máxima entre reintentos de renovación.
+        min_refresh_interval (float): Segundos mínimos entre renovaciones forzadas por un `kid` desconocido.
+    """
+
+    def __init__(
+        self,
+        certs_url: str = GOOGLE_CERTS_URL,
+        keys: Optional[dict] = None,
+        refresh_margin: float = 300,
+        retry_interval: float = 30,
+        max_retry_interval: float = 600,
+        min_refresh_interval: float = 60,
+        fetch_fn: Optional[Callable[[str], requests.Response]] = None,
+    ):
+        self.certs_url = certs_url
+        self.refresh_margin = refresh_margin
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self.min_refresh_interval = min_refresh_interval
+        self._fetch_fn = fetch_fn or (lambda url: requests.get(url, timeout=10))
+        self._static = keys is not None
+        self._keys: dict[str, RSAPublicKey] = {}
+        self._expires_at = float("inf") if self._static else 0.0
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if keys is not None:
+            self._keys = {kid: load_public_key(value) for kid, value in keys.items()}
+
+    @property
+    def expires_at(self) -> float:
+        """ Instante (epoch) en el que expiran las llaves actuales."""
+        return self._expires_at
+
+    def get_key(self, kid: str) -> Optional[RSAPublicKey]:
+        """
+        Retorna la llave asociada a `kid`.
+
+        Si la llave no se conoce (por ejemplo, tras una rotación aún no
+        detectada) o las llaves han expirado, se renuevan de forma síncrona
+        una sola vez antes de responder. Las peticiones que esperaban el lock
+        mientras otra renovaba vuelven a comprobar y usan las llaves nuevas.
+        """
+        key = self._keys.get(kid)
+        if self._static or not self._needs_refresh(key):
+            return key
+        with self._lock:
+            key = self._keys.get(kid)
+            if self._needs_refresh(key):
+                self._refresh_locked()
+                key = self._keys.get(kid)
+        return key
+
+    def _needs_refresh(self, key: Optional[RSAPublicKey]) -> bool:
+        """ Indica si hay que renovar las llaves para resolver una llave (None si el `kid` no se conoce)."""
+        now = time.time()
+        # Un `kid` desconocido sólo fuerza una descarga cada `min_refresh_interval`
+        # segundos, para que tokens con llaves inventadas no generen tráfico de red.
+        return now >= self._expires_at or (key is None and now - self._last_refresh >= self.min_refresh_interval)
+
+    def refresh(self) -> None:
+        """ Descarga los certificados y reemplaza el conjunto de llaves en memoria."""
+        if self._static:
+            return
+        with self._lock:
+            self._refresh_locked()
+
+    def _refresh_locked(self) -> None:
+        """ Implementación de `refresh`. Requiere tener el lock."""
+        self._last_refresh = time.time()
+        try:
+            response = self._fetch_fn(self.certs_url)
+            response.raise_for_status()
+            certs = response.json()
+        except Exception as e:
+            raise CertificateFetchError(f"No se pudieron obtener los certificados de Firebase: {e}", cause=e)
+
+        keys = {kid: load_public_key(cert) for kid, cert in certs.items()}
+        match = _MAX_AGE_PATTERN.search(response.headers.get("Cache-Control", ""))
+        max_age = int(match.group(1)) if match else 3600
+
+        self._keys = keys
+        self._expires_at = time.time() + max_age
+        logger.info(f"Llaves públicas de Firebase renovadas ({len(keys)} llaves, max-age={max_age}s)")
+
+    def next_refresh_delay(self) -> float:
+        """
+        Segundos hasta la próxima renovación en segundo plano: `refresh_margin`
+        antes de la expiración, pero nunca antes de `min_refresh_interval`
+        desde la renovación anterior (si el margen supera el `max-age`, el
+        hilo no debe renovar en un bucle continuo).
+        """
+        now = time.time()
+        refresh_at = max(self._expires_at - self.refresh_margin, self._last_refresh + self.min_refresh_interval)
+        return max(0.0, refresh_at - now)
+
+    def start(self) -> None:
+        """ Inicia la renovación de llaves en segundo plano."""
+        if self._static or self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, name="public-key-set", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """ Detiene la renovación en segundo plano."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _refresh_loop(self) -> None:
+        """
+        Renueva las llaves `refresh_margin` segundos antes de su expiración.
+
+        Cualquier error (descarga, JSON o certificado inválido) se registra y
+        se reintenta con espera exponencial: el hilo no debe terminar, o las
+        renovaciones volverían al camino de las peticiones.
+        """
+        retry_interval = self.retry_interval
+        while not self._stop_event.is_set():
+            if self._stop_event.wait(self.next_refresh_delay()):
+                return
+            try:
+                self.refresh()
+                retry_interval = self.retry_interval
+            except Exception as e:
+                logger.warning(f"Renovación de llaves fallida, reintentando en {retry_interval}s: {e!r}")
+                if self._stop_event.wait(retry_interval):
+                    return
+                retry_interval = min(retry_interval * 2, self.max_retry_interval)
+
+
+class LocalTokenVerifier:
+    """
+    Verifica ID tokens de Firebase localmente (sin llamadas de red en el
+    camino de la petición).
+
+    Aplica las mismas reglas que `firebase_admin.auth.verify_id_token`:
+    firma RS256, `aud` igual al ID del proyecto, `iss` del proyecto,
+    `sub` no vacío y expiración. Lanza las mismas excepciones del SDK.
+    """
+
+    def __init__(self, key_set: PublicKeySet, project_id: str, clock_skew_seconds: int = 0):
+        if not project_id:
+            raise ValueError("project_id no puede estar vacío")
+        self.key_set = key_set
+        self.project_id = project_id
+        self.issuer = f"https://securetoken.google.com/{project_id}"
+        self.clock_skew_seconds = clock_skew_seconds
+
+    def verify(self, token: str) -> dict:
+        """ Verifica el token y retorna sus claims con el campo `uid` añadido."""
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.InvalidTokenError as e:
+            raise InvalidIdTokenError(f"ID token con formato inválido: {e}", cause=e)
+
+        if header.get("alg") != "RS256":
+            raise InvalidIdTokenError(f"Algoritmo de firma no soportado: {header.get('alg')}")
+        kid = header.get("kid")
+        if not kid:
+            raise InvalidIdTokenError("El ID token no contiene el claim 'kid'.")
+
+        key = self.key_set.get_key(kid)
+        if key is None:
+            raise InvalidIdTokenError(f"No existe una llave pública para kid={kid}.")
+
+        try:
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=["RS256"],
+                audience=self.project_id,
+                issuer=self.issuer,
+                leeway=self.clock_skew_seconds,
+                options={"require": ["exp", "iat", "sub"]},
+            )
+        except jwt.ExpiredSignatureError as e:
+            raise ExpiredIdTokenError("El ID token ha expirado.", cause=e)
+        except jwt.InvalidTokenError as e:
+            raise InvalidIdTokenError(f"ID token inválido: {e}", cause=e)
+
+        subject = claims.get("sub")
+        if not isinstance(subject, str) or not subject or len(subject) > 128:
+            raise InvalidIdTokenError("El claim 'sub' del ID token es inválido.")
+
+        claims["uid"] = subject
+        return claims
@@ -0,0 +1,175 @@
+"""
+Verificador de ID tokens de Firebase
+
+Envuelve la verificación de tokens del SDK de Firebase Admin con una caché
+en memoria de tokens ya verificados. Un cliente suele enviar el mismo token
+durante toda su vigencia, por lo que la verificación de firma sólo se
+realiza la primera vez.
+
+Las entradas se indexan por el hash SHA-256 del token (nunca por el token
+en claro) y expiran en el menor de dos instantes: el claim `exp` del token
+o el TTL configurado.
+
+La verificación es bloqueante (descarga de certificados y validación RSA),
+por lo que `verify_async` la ejecuta en un pool de hilos acotado para no
+detener el event loop de uvicorn.
+
+Los tokens rechazados también se recuerdan durante un tiempo corto (caché
+negativa), y antes de cualquier operación criptográfica se aplica una
+validación estructural barata (número de segmentos, algoritmo del header y
+`exp` vencido). Así, un cliente que reintenta con un token inválido no
+vuelve a pagar la verificación completa.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from firebase_admin import auth
+from firebase_admin.auth import ExpiredIdTokenError, InvalidIdTokenError
+
+from app.core.cache import TTLLRUCache
+
+
+class FirebaseTokenVerifier:
+
+    def __init__(
+        self,
+        cache_max_size: int,
+        cache_ttl_seconds: float,
+        max_workers: int = 4,
+        negative_cache_max_size: int = 10000,
+        negative_cache_ttl_seconds: float = 30,
+        verify_fn: Callable[[str], dict] = auth.verify_id_token,
+    ):
+        self.cache = TTLLRUCache(cache_max_size, cache_ttl_seconds)
+        self.negative_cache = TTLLRUCache(negative_cache_max_size, negative_cache_ttl_seconds)
+        self._verify_fn = verify_fn
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="token-verifier"
+        )
+
+    @staticmethod
+    def _token_key(token: str) -> str:
+        """ Retorna la llave de caché asociada a un token."""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def verify(self, token: str) -> dict:
+        """
+        Verifica un ID token y retorna sus claims decodificados.
+
+        Propaga las excepciones del SDK de Firebase (`InvalidIdTokenError`,
+        `ExpiredIdTokenError`, ...) cuando el token no es válido. Sólo se
+        almacenan en caché los tokens verificados correctamente.
+        """
+        key = self._token_key(token)
+        decoded_token = self._lookup(key, token)
+        if decoded_token is not None:
+            return decoded_token
+        return self._verify_and_cache(key, token)
+
+    async def verify_async(self, token: str) -> dict:
+        """
+        Versión asíncrona de `verify`.
+
+        Los aciertos de caché se resuelven directamente en el event loop; sólo
+        la verificación real se delega al pool de hilos.
+        """
+        key = self._token_key(token)
+        decoded_token = self._lookup(key, token)
+        if decoded_token is not None:
+            return decoded_token
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._verify_and_cache, key, token)
+
+    def _lookup(self, key: str, token: str) -> Optional[dict]:
+        """
+        Resuelve el token sin verificar la firma: caché negativa, caché de
+        tokens válidos y validación estructural. Retorna None si hace falta
+        la verificación completa.
+        """
+        rejection = self.negative_cache.get(key)
+        if rejection is not None:
+            raise self._build_error(*rejection)
+
+        decoded_token = self.cache.get(key)
+        if decoded_token is not None:
+            return decoded_token
+
+        try:
+            self._precheck(token)
+        except InvalidIdTokenError as e:
+            self._remember_rejection(key, e)
+            raise
+        return None
+
+    def _verify_and_cache(self, key: str, token: str) -> dict:
+        """ Verifica el token con el SDK y guarda el resultado en caché."""
+        try:
+            decoded_token = self._verify_fn(token)
+        except InvalidIdTokenError as e:
+            self._remember_rejection(key, e)
+            raise
+        remaining = decoded_token.get("exp", 0) - time.time()
+        self.cache.set(key, decoded_token, ttl=remaining)
+        return decoded_token
+
+    def _remember_rejection(self, key: str, error: InvalidIdTokenError) -> None:
+        """ Registra un token rechazado en la caché negativa."""
+        self.negative_cache.set(key, (isinstance(error, ExpiredIdTokenError), str(error)))
+
+    @staticmethod
+    def _build_error(expired: bool, message: str) -> InvalidIdTokenError:
+        """ Reconstruye la excepción de un rechazo almacenado en la caché negativa."""
+        if expired:
+            return ExpiredIdTokenError(message, None)
+        return InvalidIdTokenError(message)
+
+    @staticmethod
+    def _decode_segment(segment: str) -> dict:
+        """ Decodifica un segmento base64url de un JWT como JSON."""
+        padded = segment + "=" * (-len(segment) % 4)
+        value = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(value, dict):
+            raise ValueError("el segmento no es un objeto JSON")
+        return value
+
+    @classmethod
+    def _precheck(cls, token: str) -> None:
+        """
+        Validación estructural del token, sin operaciones criptográficas.
+
+        Rechaza tokens que no tienen tres segmentos, cuyo header no declara
+        RS256 o cuyo claim `exp` ya venció.
+        """
+        segments = token.split(".")
+        if len(segments) != 3:
+            raise InvalidIdTokenError("El ID token debe tener tres segmentos.")
+        try:
+            header = cls._decode_segment(segments[0])
+            payload = cls._decode_segment(segments[1])
+        except (ValueError, TypeError) as e:
+            raise InvalidIdTokenError(f"ID token con formato inválido: {e}", cause=e)
+
+        if header.get("alg") != "RS256":
+            raise InvalidIdTokenError(f"Algoritmo de firma no soportado: {header.get('alg')}")
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)):
+            raise InvalidIdTokenError("El ID token no contiene un claim 'exp' válido.")
+        if exp <= time.time():
+            raise ExpiredIdTokenError("El ID token ha expirado.", None)
+
+    def shutdown(self) -> None:
+        """ Libera los hilos del pool de verificación."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        """ Retorna los contadores de aciertos/fallos de la caché de tokens."""
+        return self.cache.stats()
@@ -0,0 +1,52 @@
+"""
+Lectura de ID tokens sin verificar su firma (sólo desarrollo y benchmarks)
+
+Con `AUTH_VERIFY_MODE="insecure"` la aplicación puede ejecutarse sin red
+ni credenciales de Firebase (por ejemplo, con `REPOSITORY_BACKEND="memory"`
+para pruebas de carga): los claims del token se aceptan tal como vienen,
+comprobando sólo su formato, `exp` y `sub`. Cualquiera puede fabricar un
+token válido para este verificador, por lo que la configuración rechaza
+este modo con `ENVIRONMENT="production"`.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import base64
+import json
+import time
+
+from firebase_admin.auth import ExpiredIdTokenError, InvalidIdTokenError
+
+
+class UnverifiedTokenVerifier:
+    """
+    Decodifica ID tokens sin verificar su firma (el tercer segmento puede
+    ser cualquier texto). Lanza las mismas excepciones del SDK que
+    `LocalTokenVerifier` para tokens mal formados, expirados o sin `sub`.
+    """
+
+    def verify(self, token: str) -> dict:
+        """ Retorna los claims del token con el campo `uid` añadido."""
+        segments = token.split(".")
+        if len(segments) != 3:
+            raise InvalidIdTokenError("El ID token debe tener tres segmentos.")
+        try:
+            payload = segments[1] + "=" * (-len(segments[1]) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(payload))
+        except (ValueError, TypeError) as e:
+            raise InvalidIdTokenError(f"ID token con formato inválido: {e}", cause=e)
+        if not isinstance(claims, dict):
+            raise InvalidIdTokenError("El payload del ID token no es un objeto JSON.")
+
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)):
+            raise InvalidIdTokenError("El ID token no contiene un claim 'exp' válido.")
+        if exp <= time.time():
+            raise ExpiredIdTokenError("El ID token ha expirado.", None)
+        subject = claims.get("sub")
+        if not isinstance(subject, str) or not subject or len(subject) > 128:
+            raise InvalidIdTokenError("El claim 'sub' del ID token es inválido.")
+
+        claims["uid"] = subject
+        return claims
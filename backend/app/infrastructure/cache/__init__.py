@@ -0,0 +1,15 @@
+"""
+Cache module.
+
+Decoradores de repositorios que añaden una caché en memoria delante de
+cualquier implementación de las interfaces del dominio.
+
+Actualmente disponibles:
+- CachingUserRepository: Caché TTL/LRU de usuarios existentes sobre un IAsyncUserRepository.
+- CachingLinkRepository: Caché TTL/LRU (acotada en memoria) de enlaces y listas por usuario sobre un IAsyncLinkRepository.
+"""
+
+from .caching_user_repository import CachingUserRepository
+from .caching_link_repository import CachingLinkRepository
+
+__all__ = ["CachingUserRepository", "CachingLinkRepository"]
@@ -0,0 +1,315 @@
+"""
+Repositorio de enlaces con caché en memoria
+
+Los usuarios recargan su panel constantemente y el frontend vuelve a pedir
+la lista completa de enlaces tras cada edición, por lo que la mayoría de
+las lecturas a Firestore son repetidas. Este decorador envuelve cualquier
+`IAsyncLinkRepository` y guarda en una caché TTL/LRU, acotada en entradas
+y en memoria estimada:
+
+- Cada enlace leído por id (`get_link_by_id`, `get_links_by_ids`).
+- La lista completa de enlaces de cada usuario (`get_links_by_user_id`).
+  Las lecturas con proyección o filtradas por tag se sirven desde esa
+  lista si está en caché.
+
+Las escrituras que pasan por el decorador actualizan en el lugar las
+entradas afectadas (enlace y lista de su usuario) en lugar de descartarlas,
+para que la siguiente recarga del panel siga siendo un acierto. Una
+lectura que se solapa con una escritura del mismo usuario no se guarda,
+evitando cachear datos anteriores a la escritura.
+
+La paginación y el streaming se delegan sin caché. Las escrituras hechas
+por otras instancias pueden tardar hasta `ttl_seconds` en reflejarse,
+salvo en la lista de cada usuario si se indica `current_version`: la lista
+se guarda junto con la versión de los enlaces del usuario leída antes de
+cargarla, y sólo se sirve mientras esa siga siendo la versión vigente. Así
+una respuesta con el ETag de una versión nunca lleva una lista anterior a
+ella (cuesta una lectura por clave de la versión en cada lectura de la lista).
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.cache import TTLLRUCache
+from app.domain.models import Link, NewLink, LinkPage, PartialLink, OwnershipCheck
+from app.domain.repositories import IAsyncLinkRepository
+
+
+def estimate_size(value: Any) -> int:
+    """ Estimación aproximada (en bytes) de la memoria que ocupa un enlace o una lista de enlaces."""
+    if isinstance(value, Link):
+        return (
+            240
+            + len(value.url or "")
+            + len(value.title or "")
+            + len(value.description or "")
+            + sum(56 + len(tag) for tag in value.tags or [])
+        )
+    if isinstance(value, tuple):
+        return 64 + 8 * len(value) + sum(estimate_size(item) for item in value)
+    return 64
+
+
+class CachingLinkRepository(IAsyncLinkRepository):
+
+    def __init__(
+        self,
+        repository: IAsyncLinkRepository,
+        max_size: int,
+        ttl_seconds: float,
+        max_bytes: Optional[int] = None,
+        max_tracked_writers: int = 10000,
+        current_version: Optional[Callable[[str], Awaitable[int]]] = None,
+    ):
+        self.repository = repository
+        self.current_version = current_version
+        self.cache = TTLLRUCache(max_size, ttl_seconds, max_bytes=max_bytes, sizeof=estimate_size)
+        self._max_tracked_writers = max_tracked_writers
+        self._write_counter = 0
+        self._write_floor = 0
+        self._last_write: Dict[str, int] = {}
+
+    @staticmethod
+    def _link_key(link_id: str) -> tuple:
+        return ("link", link_id)
+
+    @staticmethod
+    def _user_key(user_id: str) -> tuple:
+        return ("user", user_id)
+
+    # Control de lecturas solapadas con escrituras
+
+    def _read_started(self) -> int:
+        """ Marca el inicio de una lectura que podría guardarse en caché."""
+        return self._write_counter
+
+    def _can_store(self, user_id: str, started: int) -> bool:
+        """ Indica si ninguna escritura del usuario terminó después de `started`."""
+        return self._last_write.get(user_id, self._write_floor) <= started
+
+    def _mark_written(self, user_id: Optional[str] = None) -> None:
+        """ Registra una escritura de un usuario (o de un usuario desconocido si es None)."""
+        self._write_counter += 1
+        if user_id is None or len(self._last_write) >= self._max_tracked_writers:
+            self._last_write.clear()
+            self._write_floor = self._write_counter
+            return
+        self._last_write[user_id] = self._write_counter
+
+    # Mantenimiento de la lista cacheada de cada usuario
+
+    def _update_user_list(self, user_id: str, update: Callable[[Tuple[Link, ...]], Tuple[Link, ...]]) -> None:
+        """ Aplica `update` a la lista cacheada del usuario, si existe (conserva su versión)."""
+        key = self._user_key(user_id)
+        entry = self.cache.peek(key)
+        if entry is not None:
+            version, links = entry
+            self.cache.set(key, (version, update(links)))
+
+    def _store_written(self, links: List[Link], created: bool = False) -> None:
+        """ Actualiza la caché con enlaces recién creados o modificados."""
+        by_user: Dict[str, Dict[str, Link]] = {}
+        for link in links:
+            self._mark_written(link.user_id)
+            self.cache.set(self._link_key(link.id), link)
+            by_user.setdefault(link.user_id, {})[link.id] = link
+
+        for user_id, changed in by_user.items():
+            if created:
+                self._update_user_list(user_id, lambda cached: cached + tuple(changed.values()))
+            else:
+                self._update_user_list(
+                    user_id, lambda cached: tuple(changed.get(link.id, link) for link in cached)
+                )
+
+    def _forget(self, link_ids: List[str]) -> None:
+        """ Elimina de la caché los enlaces borrados y los retira de las listas de sus usuarios."""
+        removed = set(link_ids)
+        owners = set()
+        unknown = False
+        for link_id in link_ids:
+            link = self.cache.peek(self._link_key(link_id))
+            if link is None:
+                unknown = True
+            else:
+                owners.add(link.user_id)
+            self.cache.invalidate(self._link_key(link_id))
+
+        for user_id in owners:
+            self._mark_written(user_id)
+            self._update_user_list(user_id, lambda cached: tuple(link for link in cached if link.id not in removed))
+
+        if unknown:
+            # Sin el enlace en caché no se conoce su usuario: se descartan las listas que lo contienen
+            self._mark_written()
+            self.cache.invalidate_where(
+                lambda key, value: key[0] == "user" and any(link.id in removed for link in value[1])
+            )
+
+    # Lecturas
+
+    async def _cached_user_list(self, user_id: str) -> Tuple[Optional[int], Optional[Tuple[Link, ...]]]:
+        """
+        Retorna la versión vigente de los enlaces del usuario (None sin
+        `current_version`) y su lista cacheada, o None si no está en caché o
+        se cargó con otra versión.
+        """
+        version = await self.current_version(user_id) if self.current_version is not None else None
+        entry = self.cache.get(self._user_key(user_id))
+        if entry is None or entry[0] != version:
+            return version, None
+        return version, entry[1]
+
+    async def get_links_by_user_id(self, user_id: str, fields: Optional[List[str]] = None) -> List[Link]:
+        """ Obtiene los enlaces de un usuario desde la caché o, si no están, desde el repositorio."""
+        version, links = await self._cached_user_list(user_id)
+        if links is None:
+            if fields is not None:
+                return await self.repository.get_links_by_user_id(user_id, fields)
+            started = self._read_started()
+            links = tuple(await self.repository.get_links_by_user_id(user_id))
+            if self._can_store(user_id, started):
+                self.cache.set(self._user_key(user_id), (version, links))
+
+        return self._project(links, fields)
+
+    @staticmethod
+    def _project(links, fields: Optional[List[str]]) -> List[Link]:
+        if fields is None:
+            return list(links)
+        return [
+            PartialLink(id=link.id, fields={name: getattr(link, name) for name in fields})
+            for link in links
+        ]
+
+    async def get_links_by_tags(self, user_id: str, tags: List[str], match_all: bool = False, fields: Optional[List[str]] = None) -> List[Link]:
+        """ Filtra la lista cacheada del usuario si existe; si no, consulta el repositorio (sin cachear el resultado)."""
+        _, links = await self._cached_user_list(user_id)
+        if links is None:
+            return await self.repository.get_links_by_tags(user_id, tags, match_all, fields)
+        wanted = set(tags)
+        check = wanted.issubset if match_all else (lambda link_tags: not wanted.isdisjoint(link_tags))
+        return self._project((link for link in links if check(set(link.tags or []))), fields)
+
+    def stream_links_by_user_id(self, user_id: str, fields: Optional[List[str]] = None) -> AsyncIterator[Link]:
+        return self.repository.stream_links_by_user_id(user_id, fields)
+
+    async def get_links_page(self, user_id: str, limit: int, cursor: Optional[str] = None, fields: Optional[List[str]] = None) -> LinkPage:
+        return await self.repository.get_links_page(user_id, limit, cursor, fields)
+
+    async def get_link_by_id(self, link_id: str) -> Optional[Link]:
+        """ Obtiene un enlace desde la caché o, si no está, desde el repositorio."""
+        link = self.cache.get(self._link_key(link_id))
+        if link is not None:
+            return link
+        started = self._read_started()
+        link = await self.repository.get_link_by_id(link_id)
+        if link is not None and self._can_store(link.user_id, started):
+            self.cache.set(self._link_key(link_id), link)
+        return link
+
+    async def get_links_by_ids(self, link_ids: List[str]) -> List[Link]:
+        """ Obtiene varios enlaces, consultando al repositorio sólo los que no están en caché."""
+        found: Dict[str, Link] = {}
+        missing = []
+        for link_id in link_ids:
+            link = self.cache.get(self._link_key(link_id))
+            if link is None:
+                missing.append(link_id)
+            else:
+                found[link_id] = link
+
+        if missing:
+            started = self._read_started()
+            for link in await self.repository.get_links_by_ids(missing):
+                found[link.id] = link
+                if self._can_store(link.user_id, started):
+                    self.cache.set(self._link_key(link.id), link)
+
+        return [found[link_id] for link_id in link_ids if link_id in found]
+
+    # Escrituras
+
+    async def create_link(self, link: NewLink) -> Link:
+        created = await self.repository.create_link(link)
+        self._store_written([created], created=True)
+        return created
+
+    async def create_link_if_absent(self, link: NewLink) -> Tuple[Link, bool]:
+        result, created = await self.repository.create_link_if_absent(link)
+        if created:
+            self._store_written([result], created=True)
+        return result, created
+
+    async def create_links(self, links: List[NewLink]) -> List[Link]:
+        created = await self.repository.create_links(links)
+        self._store_written(created, created=True)
+        return created
+
+    async def update_link(self, link: Link) -> Link:
+        updated = await self.repository.update_link(link)
+        self._store_written([updated])
+        return updated
+
+    async def update_link_if_owned(self, link_id: str, user_id: str, changes: Dict[str, Any]) -> Tuple[OwnershipCheck, Optional[Link], Optional[Link]]:
+        check, previous, updated = await self.repository.update_link_if_owned(link_id, user_id, changes)
+        if check == OwnershipCheck.OK:
+            self._store_written([updated])
+        elif check == OwnershipCheck.NOT_FOUND:
+            self._forget([link_id])
+        return check, previous, updated
+
+    async def update_links_if_owned(
+        self,
+        user_id: str,
+        link_ids: List[str],
+        apply: Callable[[Link], Dict[str, Any]],
+    ) -> List[Tuple[OwnershipCheck, Optional[Link], Optional[Link]]]:
+        """ Delega siempre en el repositorio (la lectura no se sirve desde la caché) y actualiza la caché con el resultado."""
+        results = await self.repository.update_links_if_owned(user_id, link_ids, apply)
+        self._store_written([updated for check, _, updated in results if check == OwnershipCheck.OK])
+        missing = [link_id for link_id, (check, _, _) in zip(link_ids, results) if check == OwnershipCheck.NOT_FOUND]
+        if missing:
+            self._forget(missing)
+        return results
+
+    async def delete_link(self, link_id: str) -> None:
+        await self.repository.delete_link(link_id)
+        self._forget([link_id])
+
+    async def delete_link_if_owned(self, link_id: str, user_id: str) -> Tuple[OwnershipCheck, Optional[Link]]:
+        check, deleted = await self.repository.delete_link_if_owned(link_id, user_id)
+        if check != OwnershipCheck.FORBIDDEN:
+            self._forget([link_id])
+        return check, deleted
+
+    async def delete_links_if_owned(self, user_id: str, link_ids: List[str]) -> List[Tuple[OwnershipCheck, Optional[Link]]]:
+        results = await self.repository.delete_links_if_owned(user_id, link_ids)
+        self._forget([link_id for link_id, (check, _) in zip(link_ids, results) if check != OwnershipCheck.FORBIDDEN])
+        return results
+
+    async def delete_links(self, link_ids: List[str]) -> None:
+        await self.repository.delete_links(link_ids)
+        self._forget(link_ids)
+
+    async def delete_links_by_user_id(
+        self,
+        user_id: str,
+        page_size: int,
+        max_ops_per_second: int,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        try:
+            return await self.repository.delete_links_by_user_id(user_id, page_size, max_ops_per_second, on_progress)
+        finally:
+            self._mark_written(user_id)
+            self.cache.invalidate_where(
+                lambda key, value: key == self._user_key(user_id)
+                or (key[0] == "link" and value.user_id == user_id)
+            )
+
+    def stats(self) -> dict:
+        """ Retorna los contadores de aciertos/fallos y la memoria estimada de la caché de enlaces."""
+        return self.cache.stats()
@@ -0,0 +1,64 @@
+"""
+Repositorio de usuarios con caché en memoria
+
+Cada operación sobre enlaces verifica que el usuario exista, lo que
+duplicaba las lecturas de `users/{id}` en los endpoints más usados. Este
+decorador guarda los usuarios leídos en una caché TTL/LRU acotada y la
+mantiene al día con las escrituras que pasan por él.
+
+Sólo se almacenan usuarios existentes: una lectura sin resultado siempre
+consulta al repositorio envuelto, de modo que un usuario recién creado
+por otra instancia se encuentra de inmediato. Una eliminación hecha por
+otra instancia puede tardar hasta `ttl_seconds` en reflejarse.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from typing import Optional
+
+from app.core.cache import TTLLRUCache
+from app.domain.models import User
+from app.domain.repositories import IAsyncUserRepository
+
+
+class CachingUserRepository(IAsyncUserRepository):
+
+    def __init__(self, repository: IAsyncUserRepository, max_size: int, ttl_seconds: float):
+        self.repository = repository
+        self.cache = TTLLRUCache(max_size, ttl_seconds)
+
+    async def create_user(self, user: User) -> User:
+        """ Crea el usuario y lo registra en la caché."""
+        user = await self.repository.create_user(user)
+        self.cache.set(user.id, user)
+        return user
+
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+        """ Obtiene un usuario, consultando el repositorio sólo si no está en caché."""
+        user = self.cache.get(user_id)
+        if user is not None:
+            return user
+        user = await self.repository.get_user_by_id(user_id)
+        if user is not None:
+            self.cache.set(user_id, user)
+        return user
+
+    async def update_user(self, user: User) -> User:
+        """ Actualiza el usuario y reemplaza su entrada en la caché."""
+        user = await self.repository.update_user(user)
+        self.cache.set(user.id, user)
+        return user
+
+    async def delete_user(self, user_id: str) -> None:
+        """ Elimina el usuario y su entrada en la caché."""
+        # Se invalida también al terminar: una lectura concurrente pudo volver a cachearlo
+        self.cache.invalidate(user_id)
+        try:
+            await self.repository.delete_user(user_id)
+        finally:
+            self.cache.invalidate(user_id)
+
+    def stats(self) -> dict:
+        """ Retorna los contadores de aciertos/fallos de la caché de usuarios."""
+        return self.cache.stats()
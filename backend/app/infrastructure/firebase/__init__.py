@@ -6,6 +6,6 @@ Implementación del repositorio para base de datos Firebase
 """
 
 
-from .firebase_config import firebase_client
+from .firebase_config import firebase_client, firebase_async_client
 
-__all__ = ["firebase_client"]
\ No newline at end of file
+__all__ = ["firebase_client", "firebase_async_client"]
\ No newline at end of file
@@ -0,0 +1,134 @@
+"""
+Registro en `link_urls` de las URLs de los enlaces existentes (Firestore)
+
+Tarea única para bases creadas antes del índice de URLs, equivalente al
+relleno que `init_schema` hace en SQL. Recorre la colección `links` por
+páginas, ordenada por fecha de creación, y crea con `create` la entrada de
+cada URL que aún no tiene: si un usuario guardó la misma URL varias veces,
+la conserva el enlace más antiguo. Las entradas ya existentes (incluidas
+las que crean peticiones concurrentes) no se modifican, de modo que puede
+ejecutarse con la aplicación en marcha y repetirse sin efecto.
+
+Antes del relleno se eliminan las entradas obsoletas: las de enlaces que
+ya no existen o cuya clave no coincide con la URL canónica actual del
+enlace (por ejemplo, si cambia la normalización de las URLs). Cada
+entrada se elimina condicionada a no haber cambiado desde su lectura.
+
+Uso (desde el directorio `backend`):
+    python -m app.infrastructure.firebase.backfill_link_urls
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import asyncio
+from typing import Dict, Tuple
+
+from google.api_core.exceptions import AlreadyExists, FailedPrecondition
+from google.cloud.firestore_v1.field_path import FieldPath
+
+from app.core.urls import url_key
+from app.infrastructure.firebase import firebase_async_client
+from app.infrastructure.firebase.repositories.firebase_async_link_url_repository import url_ref, url_entry
+
+# Enlaces leídos por página (y máximo de escrituras por WriteBatch)
+_PAGE_SIZE = 500
+
+
+async def _create_entries(entries: Dict[Tuple[str, str], str]) -> int:
+    """
+    Crea las entradas indicadas ((user_id, url_key) -> id del enlace) en un
+    WriteBatch. Si otra petición creó alguna mientras tanto, el lote se
+    rechaza y se crean una a una, omitiendo las existentes.
+    """
+    batch = firebase_async_client.batch()
+    for (user_id, key), link_id in entries.items():
+        batch.create(url_ref(user_id, key), url_entry(user_id, key, link_id))
+    try:
+        await batch.commit()
+        return len(entries)
+    except AlreadyExists:
+        pass
+    created = 0
+    for (user_id, key), link_id in entries.items():
+        try:
+            await url_ref(user_id, key).create(url_entry(user_id, key, link_id))
+            created += 1
+        except AlreadyExists:
+            continue
+    return created
+
+
+async def prune_link_urls(page_size: int = _PAGE_SIZE) -> int:
+    """ Elimina las entradas de `link_urls` obsoletas y retorna cuántas se eliminaron. """
+    query = (
+        firebase_async_client.collection("link_urls")
+        .order_by(FieldPath.document_id())
+        .limit(page_size)
+    )
+    deleted = 0
+    last = None
+    while True:
+        entries = await (query.start_after(last) if last else query).get()
+        if not entries:
+            return deleted
+        link_refs = [firebase_async_client.collection("links").document(entry.get("link_id")) for entry in entries]
+        links = {link.id: link async for link in firebase_async_client.get_all(link_refs)}
+        for entry in entries:
+            link = links.get(entry.get("link_id"))
+            if link is not None and link.exists and (
+                link.get("user_id") == entry.get("user_id")
+                and url_key(str(link.get("url"))) == entry.get("url_key")
+            ):
+                continue
+            try:
+                await entry.reference.delete(
+                    option=firebase_async_client.write_option(last_update_time=entry.update_time)
+                )
+                deleted += 1
+            except FailedPrecondition:
+                continue
+        last = entries[-1]
+        if len(entries) < page_size:
+            return deleted
+
+
+async def backfill_link_urls(page_size: int = _PAGE_SIZE) -> int:
+    """ Crea las entradas de `link_urls` que faltan y retorna cuántas se crearon. """
+    query = (
+        firebase_async_client.collection("links")
+        .select(["user_id", "url", "created_at"])
+        .order_by("created_at")
+        .order_by(FieldPath.document_id())
+        .limit(page_size)
+    )
+    created = 0
+    last = None
+    while True:
+        links = await (query.start_after(last) if last else query).get()
+        if not links:
+            return created
+        entries: Dict[Tuple[str, str], str] = {}
+        for link in links:
+            entries.setdefault((link.get("user_id"), url_key(str(link.get("url")))), link.id)
+        refs = [url_ref(user_id, key) for user_id, key in entries]
+        existing = {document.id async for document in firebase_async_client.get_all(refs) if document.exists}
+        missing = {
+            entry: link_id
+            for (entry, link_id), ref in zip(entries.items(), refs)
+            if ref.id not in existing
+        }
+        if missing:
+            created += await _create_entries(missing)
+        last = links[-1]
+        if len(links) < page_size:
+            return created
+
+
+async def _main() -> None:
+    print(f"Entradas obsoletas eliminadas de link_urls: {await prune_link_urls()}")
+    print(f"Entradas creadas en link_urls: {await backfill_link_urls()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
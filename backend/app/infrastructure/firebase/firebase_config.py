@@ -5,7 +5,7 @@ proporcionadas en la configuración de la aplicación.
 """
 
 import firebase_admin
-from firebase_admin import credentials, firestore
+from firebase_admin import credentials, firestore, firestore_async
 from app.core import settings
 
 
@@ -18,4 +18,7 @@ else:
     # Esto es una advertencia, la aplicación aún puede iniciar si no se usa Firebase Auth
     print("Advertencia: FIREBASE_CREDENTIALS_PATH no configurado. Firebase Auth no funcionará.")
 
-firebase_client = firestore.client()
\ No newline at end of file
+firebase_client = firestore.client()
+
+# Cliente asíncrono (AsyncClient) utilizado por los repositorios asíncronos
+firebase_async_client = firestore_async.client()
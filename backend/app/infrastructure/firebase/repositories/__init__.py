@@ -2,14 +2,31 @@
 Repositorio Firebase para entidades de dominio
 
 Este módulo inicializa e importa los repositorios implementados
-usando Firebase como backend de persistencia. Cada clase aquí
-implementa una interfaz definida en la capa de dominio.
+usando Firebase como backend de persistencia (cliente asíncrono de
+Firestore). Cada clase aquí implementa una interfaz definida en la capa
+de dominio.
 
 Actualmente disponibles:
-- FirebaseLinkRepository: Implementación de ILinkRepository
+- FirebaseAsyncLinkRepository: Implementación de IAsyncLinkRepository (AsyncClient)
+- FirebaseAsyncUserRepository: Implementación de IAsyncUserRepository (AsyncClient)
+- FirebaseAsyncLinkStatsRepository: Implementación de IAsyncLinkStatsRepository (AsyncClient)
+- FirebaseAsyncLinkUrlRepository: Implementación de IAsyncLinkUrlRepository (AsyncClient)
+- FirebaseAsyncUserVersionRepository: Implementación de IAsyncUserVersionRepository (AsyncClient)
+- FirebaseAsyncLinkPurgeJobRepository: Implementación de IAsyncLinkPurgeJobRepository (AsyncClient)
 """
 
-from .firebase_link_repository import FirebaseLinkRepository
-from .firebase_user_repository import FirebaseUserRepository
+from .firebase_async_link_repository import FirebaseAsyncLinkRepository
+from .firebase_async_user_repository import FirebaseAsyncUserRepository
+from .firebase_async_link_stats_repository import FirebaseAsyncLinkStatsRepository
+from .firebase_async_link_url_repository import FirebaseAsyncLinkUrlRepository
+from .firebase_async_user_version_repository import FirebaseAsyncUserVersionRepository
+from .firebase_async_link_purge_job_repository import FirebaseAsyncLinkPurgeJobRepository
 
-__all__ = ["FirebaseLinkRepository", "FirebaseUserRepository"]
\ No newline at end of file
+__all__ = [
+    "FirebaseAsyncLinkRepository",
+    "FirebaseAsyncUserRepository",
+    "FirebaseAsyncLinkStatsRepository",
+    "FirebaseAsyncLinkUrlRepository",
+    "FirebaseAsyncUserVersionRepository",
+    "FirebaseAsyncLinkPurgeJobRepository",
+]
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+Implementación asíncrona del repositorio de tareas de eliminación de enlaces utilizando Firebase
+
+La tarea de cada usuario es el documento `link_purge_jobs/{user_id}`:
+leerla es una lectura por clave y guardarla un `set` del documento
+completo.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from dataclasses import asdict
+from typing import Optional
+
+from app.domain.models import LinkPurgeJob
+from app.domain.repositories import IAsyncLinkPurgeJobRepository
+from app.infrastructure.firebase import firebase_async_client
+
+class FirebaseAsyncLinkPurgeJobRepository(IAsyncLinkPurgeJobRepository):
+
+    @staticmethod
+    def _ref(user_id: str):
+        return firebase_async_client.collection("link_purge_jobs").document(user_id)
+
+    async def get_job(self, user_id: str) -> Optional[LinkPurgeJob]:
+        """ Obtiene la tarea del usuario. """
+        job_dict = (await self._ref(user_id).get()).to_dict()
+        if not job_dict:
+            return None
+        return LinkPurgeJob(**job_dict)
+
+    async def save_job(self, job: LinkPurgeJob) -> None:
+        """ Guarda la tarea reemplazando el documento del usuario. """
+        await self._ref(job.user_id).set(asdict(job))
@@ -0,0 +1,545 @@
+"""
+Implementación asíncrona de repositorio de enlaces utilizando Firebase
+
+Utiliza el `AsyncClient` de Firestore, de modo que las operaciones no
+bloquean el event loop ni ocupan hilos del threadpool.
+
+Cada escritura de enlaces mantiene el índice `link_urls` en el mismo
+WriteBatch: crear un enlace (o cambiar su URL) crea la entrada de su URL
+canónica con `create`, que falla si otro enlace del usuario ya la tiene,
+y eliminarlo elimina la entrada.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import asyncio
+from app.domain.models import Link, NewLink, LinkPage, PartialLink, OwnershipCheck
+from app.domain.repositories import IAsyncLinkRepository
+from app.infrastructure.firebase import firebase_async_client
+from app.infrastructure.firebase.repositories.firebase_async_link_url_repository import url_ref, url_entry
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.exceptions import DuplicateLinkException, PurgeIncompleteException
+from app.core.urls import raise_if_url_repeated, url_key
+from app.core import logger
+from google.api_core.exceptions import AlreadyExists, FailedPrecondition
+from google.cloud.firestore_v1.field_path import FieldPath
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from dataclasses import replace
+from datetime import datetime, timezone
+from uuid import uuid4
+
+
+# Reintentos de una escritura condicionada cuyo documento cambió tras la lectura
+_PRECONDITION_ATTEMPTS = 3
+
+# Escrituras por WriteBatch (límite de Firestore) y lotes confirmados a la vez durante la purga
+_BATCH_MAX_WRITES = 500
+_PURGE_MAX_CONCURRENT_BATCHES = 4
+
+# Regla 500/50/5: empezar con 500 ops/s y aumentar un 50% cada 5 minutos
+_RAMP_INITIAL_OPS = 500
+_RAMP_STEP_SECONDS = 300
+
+
+class FirebaseAsyncLinkRepository(IAsyncLinkRepository):
+    
+    @staticmethod
+    def _to_entity(link) -> Link:
+        """ Convierte un documento de Firestore en una entidad Link. """
+        return Link(
+            id=link.id,
+            url=link.get("url"),
+            title=link.get("title"),
+            description=link.get("description"),
+            created_at=link.get("created_at"),
+            user_id=link.get("user_id"),
+            tags=link.get("tags")
+        )
+    
+    @classmethod
+    def _to_view(cls, link, fields: Optional[List[str]]):
+        """ Convierte un documento en Link, o en PartialLink si la lectura usó proyección. """
+        if fields is None:
+            return cls._to_entity(link)
+        data = link.to_dict() or {}
+        return PartialLink(id=link.id, fields={name: data.get(name) for name in fields})
+    
+    @staticmethod
+    def _user_links_query(user_id: str, fields: Optional[List[str]] = None):
+        """ Consulta de los enlaces de un usuario, con proyección `select()` si se indican campos. """
+        query = firebase_async_client.collection("links").where("user_id", "==", user_id)
+        if fields is not None:
+            query = query.select(fields)
+        return query
+    
+    async def get_links_by_user_id(self, user_id: str, fields: Optional[List[str]] = None) -> List[Link]:
+        """ Obtiene todos los enlaces asociados a un usuario. """
+        links = await self._user_links_query(user_id, fields).get()
+        return [self._to_view(link, fields) for link in links]
+    
+    async def stream_links_by_user_id(self, user_id: str, fields: Optional[List[str]] = None) -> AsyncIterator[Link]:
+        """ Itera los enlaces de un usuario a medida que llegan desde Firestore. """
+        links = self._user_links_query(user_id, fields).stream()
+        async for link in links:
+            yield self._to_view(link, fields)
+    
+    async def get_links_page(self, user_id: str, limit: int, cursor: Optional[str] = None, fields: Optional[List[str]] = None) -> LinkPage:
+        """
+        Obtiene una página de enlaces de un usuario ordenados por (created_at, id).
+
+        Requiere el índice compuesto `user_id ASC, created_at ASC, __name__ ASC`
+        en la colección `links`. Se solicita un documento adicional para saber
+        si existe una página siguiente sin hacer otra consulta.
+        
+        Con proyección se lee siempre `created_at`, necesario para construir el cursor.
+        """
+        projection = None if fields is None else sorted(set(fields) | {"created_at"})
+        query = (
+            self._user_links_query(user_id, projection)
+            .order_by("created_at")
+            .order_by(FieldPath.document_id())
+        )
+        if cursor:
+            created_at, link_id = decode_cursor(cursor)
+            query = query.start_after({"created_at": created_at, FieldPath.document_id(): link_id})
+        
+        documents = await query.limit(limit + 1).get()
+        items = [self._to_view(link, fields) for link in documents[:limit]]
+        
+        next_cursor = None
+        if len(documents) > limit:
+            last = documents[limit - 1]
+            next_cursor = encode_cursor(last.get("created_at"), last.id)
+        return LinkPage(items=items, next_cursor=next_cursor)
+    
+    async def get_links_by_tags(self, user_id: str, tags: List[str], match_all: bool = False, fields: Optional[List[str]] = None) -> List[Link]:
+        """
+        Obtiene los enlaces de un usuario con alguno o todos los tags indicados.
+        
+        Con `match_all=False` se usa `array_contains_any` (máximo 30 tags).
+        Firestore sólo admite un filtro de arreglo por consulta, por lo que con
+        `match_all=True` se consulta el primer tag con `array_contains` y el
+        resto se verifica al recibir los documentos: conviene que el primero
+        sea el menos frecuente. Ambas consultas usan el índice compuesto
+        `user_id ASC, tags ARRAY`.
+        """
+        required = set(tags[1:]) if match_all else set()
+        projection = None if fields is None else sorted(set(fields) | ({"tags"} if required else set()))
+        query = self._user_links_query(user_id, projection)
+        if match_all:
+            query = query.where("tags", "array_contains", tags[0])
+        else:
+            query = query.where("tags", "array_contains_any", tags)
+        
+        links = await query.get()
+        return [
+            self._to_view(link, fields)
+            for link in links
+            if required.issubset(link.get("tags") or [])
+        ]
+    
+    async def get_link_by_id(self, link_id: str) -> Optional[Link]:
+        """ Obtiene un enlace por su identificador. """
+        link = await firebase_async_client.collection("links").document(link_id).get()
+        if not link.exists:
+            return None
+        return self._to_entity(link)
+    
+    @staticmethod
+    def _build_new_link(link: NewLink) -> tuple[Link, dict]:
+        """ Genera el id y la fecha de creación de un nuevo enlace, junto con su documento. """
+        
+        #Generar ID para el nuevo Enlace (salvo que venga indicado)
+        link_id = link.id or str(uuid4())
+        
+        #Fecha de creación
+        created_at = datetime.now(timezone.utc)
+        
+        link_dict = {
+            "id":link_id,
+            "url":link.url,
+            "title":link.title,
+            "description":link.description,
+            "created_at":created_at,
+            "tags":link.tags,
+            "user_id":link.user_id
+        }
+        
+        new_link = Link(
+            id=link_id,
+            url=link.url,
+            title=link.title,
+            description=link.description,
+            created_at=created_at,
+            user_id=link.user_id,
+            tags=link.tags
+        )
+        return new_link, link_dict
+    
+    @staticmethod
+    def _reserve_url(batch, link: Link) -> None:
+        """ Añade al lote la creación de la entrada de la URL del enlace en `link_urls` (`create`: falla si ya existe). """
+        key = url_key(str(link.url))
+        batch.create(url_ref(link.user_id, key), url_entry(link.user_id, key, link.id))
+    
+    @staticmethod
+    def _release_url(batch, link: Link) -> None:
+        """ Añade al lote la eliminación de la entrada de la URL del enlace en `link_urls`. """
+        batch.delete(url_ref(link.user_id, url_key(str(link.url))))
+    
+    @classmethod
+    def _move_url(cls, batch, previous: Link, updated: Link) -> bool:
+        """ Si la URL canónica cambia, añade al lote la reserva de la nueva y la liberación de la anterior. """
+        if url_key(str(previous.url)) == url_key(str(updated.url)):
+            return False
+        cls._reserve_url(batch, updated)
+        cls._release_url(batch, previous)
+        return True
+    
+    @staticmethod
+    async def _raise_if_url_taken(links: List[Link]) -> None:
+        """ Tras un `AlreadyExists`, lanza `DuplicateLinkException` si otro enlace del usuario ya tiene la URL de alguno. """
+        refs = [url_ref(link.user_id, url_key(str(link.url))) for link in links]
+        owners = {ref.id: link for ref, link in zip(refs, links)}
+        async for document in firebase_async_client.get_all(refs):
+            link = owners[document.id]
+            if document.exists and document.get("link_id") != link.id:
+                raise DuplicateLinkException(str(link.url), document.get("link_id"))
+    
+    async def create_link(self, link: NewLink) -> Link:
+        """ Crea un nuevo enlace en el repositorio, junto con la entrada de su URL. """
+        return (await self.create_links([link]))[0]
+    
+    async def create_link_if_absent(self, link: NewLink) -> Tuple[Link, bool]:
+        """
+        Crea el enlace con `create` (precondición: el documento no existe),
+        en el mismo WriteBatch que la entrada de su URL. Sólo si alguno ya
+        existe se lee el enlace, para retornarlo; si el que existe es la
+        entrada de la URL, se lanza `DuplicateLinkException`.
+        """
+        new_link, link_dict = self._build_new_link(link)
+        batch = firebase_async_client.batch()
+        batch.create(firebase_async_client.collection("links").document(new_link.id), link_dict)
+        self._reserve_url(batch, new_link)
+        try:
+            await batch.commit()
+            return new_link, True
+        except AlreadyExists:
+            existing = await self.get_link_by_id(new_link.id)
+            if existing is not None:
+                return existing, False
+            await self._raise_if_url_taken([new_link])
+            raise
+    
+    async def create_links(self, links: List[NewLink]) -> List[Link]:
+        """
+        Crea varios enlaces, junto con las entradas de sus URLs en `link_urls`,
+        en una única escritura atómica (WriteBatch: dos escrituras por enlace).
+        Si otro enlace del usuario ya tiene alguna de las URLs (por ejemplo,
+        creado por una petición concurrente), no se crea ninguno y se lanza
+        `DuplicateLinkException`.
+        """
+        batch = firebase_async_client.batch()
+        created = []
+        for link in links:
+            new_link, link_dict = self._build_new_link(link)
+            batch.set(firebase_async_client.collection("links").document(new_link.id), link_dict)
+            self._reserve_url(batch, new_link)
+            created.append(new_link)
+        raise_if_url_repeated(created)
+        try:
+            await batch.commit()
+        except AlreadyExists:
+            await self._raise_if_url_taken(created)
+            raise
+        return created
+    
+    async def get_links_by_ids(self, link_ids: List[str]) -> List[Link]:
+        """ Obtiene varios enlaces en una sola lectura (get_all). Los inexistentes se omiten. """
+        if not link_ids:
+            return []
+        refs = [firebase_async_client.collection("links").document(link_id) for link_id in link_ids]
+        return [self._to_entity(link) async for link in firebase_async_client.get_all(refs) if link.exists]
+    
+    async def update_link(self, link: Link) -> Link:
+        """Actualiza un enlace existente. Se asume que su existencia ya fue validada en la capa de servicio."""
+        update_data = {
+            "url": link.url,
+            "title": link.title,
+            "description": link.description,
+            "tags": link.tags
+        }
+
+        await self.update_link_if_owned(link.id, link.user_id, update_data)
+        return link
+    
+    async def update_link_if_owned(self, link_id: str, user_id: str, changes: Dict[str, Any]) -> Tuple[OwnershipCheck, Optional[Link], Optional[Link]]:
+        """
+        Actualiza un enlace sólo si pertenece al usuario.
+        
+        Firestore sólo admite precondiciones de existencia y de `update_time`,
+        por lo que la pertenencia se verifica con una lectura y la escritura se
+        condiciona a que el documento no haya cambiado desde esa lectura. Si
+        cambió (otra petición lo modificó o eliminó), se repite la verificación.
+        Si cambia la URL canónica, el mismo WriteBatch crea la entrada de la
+        nueva en `link_urls` y elimina la de la anterior; si otro enlace del
+        usuario ya tiene la nueva, se lanza `DuplicateLinkException`.
+        
+        En Firestore siguen siendo dos round-trips (lectura y escritura): una
+        transacción no los reduce, porque también lee el documento antes de
+        confirmar. La reducción a una sola operación sólo se obtiene en los
+        repositorios SQL y en memoria; aquí la ganancia es la atomicidad (la
+        escritura no se aplica si el documento cambió tras la verificación).
+        """
+        ref = firebase_async_client.collection("links").document(link_id)
+        for attempt in range(_PRECONDITION_ATTEMPTS):
+            link = await ref.get()
+            if not link.exists:
+                return OwnershipCheck.NOT_FOUND, None, None
+            if link.get("user_id") != user_id:
+                return OwnershipCheck.FORBIDDEN, None, None
+            previous = self._to_entity(link)
+            updated = replace(previous, **changes)
+            if not changes:
+                return OwnershipCheck.OK, previous, updated
+            batch = firebase_async_client.batch()
+            batch.update(ref, changes, option=firebase_async_client.write_option(last_update_time=link.update_time))
+            self._move_url(batch, previous, updated)
+            try:
+                await batch.commit()
+            except FailedPrecondition:
+                if attempt == _PRECONDITION_ATTEMPTS - 1:
+                    raise
+                continue
+            except AlreadyExists:
+                await self._raise_if_url_taken([updated])
+                if attempt == _PRECONDITION_ATTEMPTS - 1:
+                    raise
+                continue
+            return OwnershipCheck.OK, previous, updated
+    
+    async def update_links_if_owned(
+        self,
+        user_id: str,
+        link_ids: List[str],
+        apply: Callable[[Link], Dict[str, Any]],
+    ) -> List[Tuple[OwnershipCheck, Optional[Link], Optional[Link]]]:
+        """
+        Actualiza varios enlaces del usuario en una única escritura atómica
+        (WriteBatch, máximo 500 documentos).
+
+        Los enlaces se leen con `get_all` y cada `update` escribe sólo los
+        campos que cambian, condicionado al `update_time` leído. Si algún
+        enlace cambió entre la lectura y la escritura, el lote completo se
+        rechaza y se repite la lectura. Las URLs que cambian se mueven en
+        `link_urls` en el mismo lote, como en `update_link_if_owned`.
+        """
+        refs = [firebase_async_client.collection("links").document(link_id) for link_id in link_ids]
+        for attempt in range(_PRECONDITION_ATTEMPTS):
+            snapshots = {link.id: link async for link in firebase_async_client.get_all(refs)}
+            batch = firebase_async_client.batch()
+            results = []
+            moved = []
+            for ref in refs:
+                link = snapshots.get(ref.id)
+                if link is None or not link.exists:
+                    results.append((OwnershipCheck.NOT_FOUND, None, None))
+                    continue
+                if link.get("user_id") != user_id:
+                    results.append((OwnershipCheck.FORBIDDEN, None, None))
+                    continue
+                previous = self._to_entity(link)
+                changes = apply(previous)
+                updated = replace(previous, **changes)
+                if changes:
+                    batch.update(ref, changes, option=firebase_async_client.write_option(last_update_time=link.update_time))
+                    if self._move_url(batch, previous, updated):
+                        moved.append(updated)
+                results.append((OwnershipCheck.OK, previous, updated))
+            raise_if_url_repeated(moved)
+            if not len(batch):
+                return results
+            try:
+                await batch.commit()
+            except FailedPrecondition:
+                if attempt == _PRECONDITION_ATTEMPTS - 1:
+                    raise
+                continue
+            except AlreadyExists:
+                await self._raise_if_url_taken(moved)
+                if attempt == _PRECONDITION_ATTEMPTS - 1:
+                    raise
+                continue
+            return results
+
+    async def delete_link(self, link_id: str) -> None:
+        """ Elimina un enlace por su identificador. Se asume que su existencia ya fue validada en la capa de servicio."""
+        await self.delete_links([link_id])
+    
+    async def delete_link_if_owned(self, link_id: str, user_id: str) -> Tuple[OwnershipCheck, Optional[Link]]:
+        """
+        Elimina un enlace sólo si pertenece al usuario.
+        
+        Igual que `update_link_if_owned`, la eliminación se condiciona al
+        `update_time` leído al verificar la pertenencia, y también requiere dos
+        round-trips en Firestore. La entrada de su URL en `link_urls` se
+        elimina en el mismo WriteBatch.
+        """
+        ref = firebase_async_client.collection("links").document(link_id)
+        for attempt in range(_PRECONDITION_ATTEMPTS):
+            link = await ref.get()
+            if not link.exists:
+                return OwnershipCheck.NOT_FOUND, None
+            if link.get("user_id") != user_id:
+                return OwnershipCheck.FORBIDDEN, None
+            deleted = self._to_entity(link)
+            batch = firebase_async_client.batch()
+            batch.delete(ref, option=firebase_async_client.write_option(last_update_time=link.update_time))
+            self._release_url(batch, deleted)
+            try:
+                await batch.commit()
+            except FailedPrecondition:
+                if attempt == _PRECONDITION_ATTEMPTS - 1:
+                    raise
+                continue
+            return OwnershipCheck.OK, deleted
+    
+    async def delete_links_if_owned(self, user_id: str, link_ids: List[str]) -> List[Tuple[OwnershipCheck, Optional[Link]]]:
+        """
+        Elimina los enlaces del usuario, junto con las entradas de sus URLs en
+        `link_urls`, en una única escritura atómica (WriteBatch: dos
+        escrituras por enlace). Los enlaces se leen con `get_all` para
+        verificar su pertenencia y cada eliminación se condiciona al
+        `update_time` leído; si alguno cambió, se repite la lectura.
+        """
+        refs = [firebase_async_client.collection("links").document(link_id) for link_id in link_ids]
+        for attempt in range(_PRECONDITION_ATTEMPTS):
+            snapshots = {link.id: link async for link in firebase_async_client.get_all(refs)}
+            batch = firebase_async_client.batch()
+            results = []
+            for ref in refs:
+                link = snapshots.get(ref.id)
+                if link is None or not link.exists:
+                    results.append((OwnershipCheck.NOT_FOUND, None))
+                    continue
+                if link.get("user_id") != user_id:
+                    results.append((OwnershipCheck.FORBIDDEN, None))
+                    continue
+                deleted = self._to_entity(link)
+                batch.delete(ref, option=firebase_async_client.write_option(last_update_time=link.update_time))
+                self._release_url(batch, deleted)
+                results.append((OwnershipCheck.OK, deleted))
+            if not len(batch):
+                return results
+            try:
+                await batch.commit()
+            except FailedPrecondition:
+                if attempt == _PRECONDITION_ATTEMPTS - 1:
+                    raise
+                continue
+            return results
+
+    async def delete_links(self, link_ids: List[str]) -> None:
+        """
+        Elimina varios enlaces, junto con las entradas de sus URLs en
+        `link_urls`, en una única escritura atómica (WriteBatch: dos
+        escrituras por enlace). Los enlaces se leen antes (`get_all`) para
+        conocer sus URLs y cada eliminación se condiciona al `update_time`
+        leído; si alguno cambió, se repite la lectura.
+        """
+        refs = [firebase_async_client.collection("links").document(link_id) for link_id in link_ids]
+        for attempt in range(_PRECONDITION_ATTEMPTS):
+            batch = firebase_async_client.batch()
+            async for link in firebase_async_client.get_all(refs):
+                if link.exists:
+                    batch.delete(link.reference, option=firebase_async_client.write_option(last_update_time=link.update_time))
+                    self._release_url(batch, self._to_entity(link))
+            if not len(batch):
+                return
+            try:
+                await batch.commit()
+            except FailedPrecondition:
+                if attempt == _PRECONDITION_ATTEMPTS - 1:
+                    raise
+                continue
+            return
+    
+    @staticmethod
+    def _purge_rate(elapsed: float, max_ops_per_second: int) -> float:
+        """ Ritmo permitido (ops/s) tras `elapsed` segundos de purga: regla 500/50/5, sin superar el límite."""
+        return min(max_ops_per_second, _RAMP_INITIAL_OPS * 1.5 ** (elapsed // _RAMP_STEP_SECONDS))
+    
+    @staticmethod
+    async def _commit_deletes(user_id: str, documents: list, semaphore: asyncio.Semaphore) -> None:
+        """ Elimina un grupo de enlaces (máximo 250) y las entradas de sus URLs en un WriteBatch."""
+        async with semaphore:
+            batch = firebase_async_client.batch()
+            for link in documents:
+                batch.delete(link.reference)
+                batch.delete(url_ref(user_id, url_key(link.get("url"))))
+            await batch.commit()
+    
+    async def delete_links_by_user_id(
+        self,
+        user_id: str,
+        page_size: int,
+        max_ops_per_second: int,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Elimina los enlaces de un usuario página a página.
+        
+        Cada página sólo lee la URL de cada enlace (`select(url)`) y continúa
+        después del último documento leído, de modo que no se vuelven a
+        recorrer los documentos ya eliminados. Cada enlace se elimina en el
+        mismo WriteBatch que la entrada de su URL en `link_urls` (hasta 250
+        enlaces por lote, como máximo `_PURGE_MAX_CONCURRENT_BATCHES` a la
+        vez), de modo que un enlace recreado tras la purga conserva su
+        entrada. Entre páginas se espera lo necesario para respetar el ritmo
+        de la regla 500/50/5.
+        
+        Un lote fallido no detiene la purga: sus documentos se cuentan y, al
+        terminar, se lanza `PurgeIncompleteException` para que la tarea quede
+        como fallida (y pueda reanudarse).
+        """
+        query = (
+            firebase_async_client.collection("links")
+            .where("user_id", "==", user_id)
+            .select(["url"])
+            .order_by(FieldPath.document_id())
+            .limit(page_size)
+        )
+        semaphore = asyncio.Semaphore(_PURGE_MAX_CONCURRENT_BATCHES)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deleted = 0
+        failed = 0
+        last = None
+        while True:
+            page_started = loop.time()
+            documents = await (query.start_after(last) if last else query).get()
+            if not documents:
+                break
+            # Dos escrituras por enlace: el enlace y su URL
+            chunk_size = _BATCH_MAX_WRITES // 2
+            chunks = [documents[i:i + chunk_size] for i in range(0, len(documents), chunk_size)]
+            outcomes = await asyncio.gather(
+                *(self._commit_deletes(user_id, chunk, semaphore) for chunk in chunks), return_exceptions=True
+            )
+            for chunk, outcome in zip(chunks, outcomes):
+                if isinstance(outcome, Exception):
+                    failed += len(chunk)
+                    logger.error(f"Error al eliminar {len(chunk)} enlaces del usuario {user_id}: {outcome}")
+                else:
+                    deleted += len(chunk)
+            last = documents[-1]
+            if on_progress:
+                on_progress(deleted)
+            if len(documents) < page_size:
+                break
+            rate = self._purge_rate(loop.time() - started, max_ops_per_second)
+            await asyncio.sleep(max(0.0, len(documents) / rate - (loop.time() - page_started)))
+        if failed:
+            raise PurgeIncompleteException(user_id, deleted, failed)
+        return deleted
@@ -0,0 +1,81 @@
+"""
+Implementación asíncrona del repositorio de estadísticas de enlaces utilizando Firebase
+
+Las estadísticas de cada usuario se guardan en el documento
+`link_stats/{user_id}`. Los contadores se actualizan con transformaciones
+`Increment` del servidor, por lo que cada escritura de enlaces cuesta una
+sola escritura adicional, sin leer el documento y sin transacciones.
+
+El campo `revision` cuenta las escrituras: la reconstrucción reemplaza el
+documento en una transacción sólo si la revisión no cambió mientras
+recorría los enlaces.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from datetime import datetime
+from typing import Optional
+from google.cloud.firestore_v1 import Increment, async_transactional
+from app.domain.models import LinkStats, LinkStatsDelta
+from app.domain.repositories import IAsyncLinkStatsRepository
+from app.infrastructure.firebase import firebase_async_client
+
+class FirebaseAsyncLinkStatsRepository(IAsyncLinkStatsRepository):
+
+    @staticmethod
+    def _to_entity(user_id: str, stats_dict: dict) -> LinkStats:
+        return LinkStats(
+            user_id=user_id,
+            link_count=stats_dict.get("link_count", 0),
+            tag_counts={tag: count for tag, count in (stats_dict.get("tag_counts") or {}).items() if count > 0},
+            created_per_day={day: count for day, count in (stats_dict.get("created_per_day") or {}).items() if count > 0},
+            last_activity_at=stats_dict.get("last_activity_at"),
+            reconciled_at=stats_dict.get("reconciled_at"),
+            revision=stats_dict.get("revision", 0),
+        )
+
+    async def get_stats(self, user_id: str) -> Optional[LinkStats]:
+        """ Obtiene las estadísticas de un usuario (una lectura de documento). """
+        stats_dict = (await firebase_async_client.collection("link_stats").document(user_id).get()).to_dict()
+        if not stats_dict:
+            return None
+        return self._to_entity(user_id, stats_dict)
+
+    async def increment_stats(self, user_id: str, delta: LinkStatsDelta, activity_at: datetime) -> None:
+        """ Aplica la variación con incrementos atómicos del servidor (set con merge). """
+        await firebase_async_client.collection("link_stats").document(user_id).set({
+            "user_id": user_id,
+            "link_count": Increment(delta.link_count),
+            "tag_counts": {tag: Increment(count) for tag, count in delta.tag_counts.items()},
+            "created_per_day": {day: Increment(count) for day, count in delta.created_per_day.items()},
+            "last_activity_at": activity_at,
+            "revision": Increment(1),
+        }, merge=True)
+
+    async def save_stats(self, stats: LinkStats, expected_revision: int) -> bool:
+        """ Reemplaza el documento de estadísticas en una transacción, si su revisión no cambió. """
+        ref = firebase_async_client.collection("link_stats").document(stats.user_id)
+
+        @async_transactional
+        async def replace_if_unchanged(transaction) -> bool:
+            snapshot = await ref.get(transaction=transaction)
+            current = (snapshot.to_dict() or {}).get("revision", 0)
+            if current != expected_revision:
+                return False
+            transaction.set(ref, {
+                "user_id": stats.user_id,
+                "link_count": stats.link_count,
+                "tag_counts": stats.tag_counts,
+                "created_per_day": stats.created_per_day,
+                "last_activity_at": stats.last_activity_at,
+                "reconciled_at": stats.reconciled_at,
+                "revision": expected_revision + 1,
+            })
+            return True
+
+        return await replace_if_unchanged(firebase_async_client.transaction())
+
+    async def delete_stats(self, user_id: str) -> None:
+        """ Elimina el documento de estadísticas del usuario. """
+        await firebase_async_client.collection("link_stats").document(user_id).delete()
@@ -0,0 +1,65 @@
+"""
+Implementación asíncrona del repositorio de URLs de enlaces utilizando Firebase
+
+Cada URL registrada es el documento `link_urls/{user_id}_{url_key}` con el
+id de su enlace. Verificar si un usuario ya guardó una URL cuesta una
+lectura por clave (`get_all` para varias), sin consultar la colección
+`links`.
+
+Los repositorios de enlaces mantienen estos documentos en la misma
+escritura atómica que el enlace: la entrada se crea con `create` (falla
+si otro enlace ya tiene la URL) y se elimina al cambiar la URL o eliminar
+el enlace. Los enlaces creados antes de este índice se registran con
+`python -m app.infrastructure.firebase.backfill_link_urls`.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from typing import Dict, List
+from app.domain.repositories import IAsyncLinkUrlRepository
+from app.infrastructure.firebase import firebase_async_client
+
+# Máximo de operaciones por WriteBatch
+_BATCH_SIZE = 500
+
+
+def url_ref(user_id: str, url_key: str):
+    """ Documento de `link_urls` de una URL canónica del usuario. """
+    return firebase_async_client.collection("link_urls").document(f"{user_id}_{url_key}")
+
+
+def url_entry(user_id: str, url_key: str, link_id: str) -> dict:
+    """ Contenido del documento de `link_urls` de una URL. """
+    return {"user_id": user_id, "url_key": url_key, "link_id": link_id}
+
+
+class FirebaseAsyncLinkUrlRepository(IAsyncLinkUrlRepository):
+
+    async def get_link_ids(self, user_id: str, url_keys: List[str]) -> Dict[str, str]:
+        """ Obtiene el enlace de cada clave con una sola lectura (get_all). """
+        if not url_keys:
+            return {}
+        refs = [url_ref(user_id, url_key) for url_key in dict.fromkeys(url_keys)]
+        return {
+            document.get("url_key"): document.get("link_id")
+            async for document in firebase_async_client.get_all(refs)
+            if document.exists
+        }
+
+    async def save_urls(self, user_id: str, entries: Dict[str, str]) -> None:
+        """ Registra las claves en escrituras atómicas (WriteBatch) de hasta 500 documentos. """
+        items = list(entries.items())
+        for start in range(0, len(items), _BATCH_SIZE):
+            batch = firebase_async_client.batch()
+            for url_key, link_id in items[start:start + _BATCH_SIZE]:
+                batch.set(url_ref(user_id, url_key), url_entry(user_id, url_key, link_id))
+            await batch.commit()
+
+    async def delete_urls(self, user_id: str, url_keys: List[str]) -> None:
+        """ Elimina las claves en escrituras atómicas (WriteBatch) de hasta 500 documentos. """
+        for start in range(0, len(url_keys), _BATCH_SIZE):
+            batch = firebase_async_client.batch()
+            for url_key in url_keys[start:start + _BATCH_SIZE]:
+                batch.delete(url_ref(user_id, url_key))
+            await batch.commit()
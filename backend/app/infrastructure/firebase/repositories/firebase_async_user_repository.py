@@ -0,0 +1,56 @@
+"""
+Implementación asíncrona de repositorio de usuarios utilizando Firebase
+
+Utiliza el `AsyncClient` de Firestore, de modo que las operaciones no
+bloquean el event loop ni ocupan hilos del threadpool.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from typing import Optional
+from app.domain.models import User
+from app.domain.repositories import IAsyncUserRepository
+from app.infrastructure.firebase import firebase_async_client
+
+class FirebaseAsyncUserRepository(IAsyncUserRepository):
+    
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+        """Obtiene un usuario por su identificador."""
+        user_dict = (await firebase_async_client.collection("users").document(user_id).get()).to_dict()
+        if not user_dict:
+            return None
+        return User(
+            id=user_id,
+            email=user_dict.get("email"),
+            username=user_dict.get("username")
+        )
+    
+    async def create_user(self, user: User) -> User:
+        """ Crea un nuevo usuario en el repositorio. """
+        user_dict = {
+            "id": user.id,
+            "email": user.email, 
+            "username": user.username
+        }
+        
+        await firebase_async_client.collection("users").document(user.id).set(user_dict)
+        
+        return user
+    
+    async def update_user(self, user: User) -> User:
+        """ Actualiza un usuario existente. """
+        
+        user_dict = {
+            "id": user.id,
+            "email": user.email, 
+            "username": user.username
+        }
+        
+        await firebase_async_client.collection("users").document(user.id).set(user_dict)
+        
+        return user
+    
+    async def delete_user(self, user_id: str) -> None:
+        """ Elimina un usuario existente en el repositorio. """
+        await firebase_async_client.collection("users").document(user_id).delete()
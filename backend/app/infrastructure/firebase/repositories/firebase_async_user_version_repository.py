@@ -0,0 +1,35 @@
+"""
+Implementación asíncrona del repositorio de versiones por usuario utilizando Firebase
+
+Las versiones de cada usuario son los campos (uno por ámbito) del
+documento `user_versions/{user_id}`. Leer una versión es una lectura de
+ese documento limitada al campo del ámbito, e incrementarla una escritura
+con `Increment` del servidor.
+
+El documento se conserva al eliminar el usuario, de modo que un usuario
+recreado no repita versiones (ni ETags) anteriores.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from google.cloud.firestore_v1 import Increment
+from app.domain.repositories import IAsyncUserVersionRepository
+from app.infrastructure.firebase import firebase_async_client
+
+class FirebaseAsyncUserVersionRepository(IAsyncUserVersionRepository):
+
+    @staticmethod
+    def _ref(user_id: str):
+        return firebase_async_client.collection("user_versions").document(user_id)
+
+    async def get_version(self, user_id: str, scope: str) -> int:
+        """ Obtiene la versión leyendo sólo el campo del ámbito. """
+        document = await self._ref(user_id).get(field_paths=[scope])
+        if not document.exists:
+            return 0
+        return (document.to_dict() or {}).get(scope) or 0
+
+    async def bump_version(self, user_id: str, scope: str) -> None:
+        """ Incrementa la versión en el servidor (Increment), sin leer el documento. """
+        await self._ref(user_id).set({scope: Increment(1)}, merge=True)
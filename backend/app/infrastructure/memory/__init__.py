@@ -0,0 +1,31 @@
+"""
+Memory module.
+
+Implementación de los repositorios en memoria del proceso, sin dependencias
+externas. Útil para pruebas de carga y para ejecutar la aplicación sin
+credenciales de Firebase.
+
+Actualmente disponibles:
+- InMemoryLinkRepository: Implementación de ILinkRepository con índices por usuario, tag y URL.
+- InMemoryUserRepository: Implementación de IUserRepository
+- InMemoryLinkStatsRepository: Implementación de ILinkStatsRepository
+- InMemoryLinkUrlRepository: Implementación de ILinkUrlRepository
+- InMemoryUserVersionRepository: Implementación de IUserVersionRepository
+- InMemoryLinkPurgeJobRepository: Implementación de ILinkPurgeJobRepository
+"""
+
+from .in_memory_link_repository import InMemoryLinkRepository
+from .in_memory_user_repository import InMemoryUserRepository
+from .in_memory_link_stats_repository import InMemoryLinkStatsRepository
+from .in_memory_link_url_repository import InMemoryLinkUrlRepository
+from .in_memory_user_version_repository import InMemoryUserVersionRepository
+from .in_memory_link_purge_job_repository import InMemoryLinkPurgeJobRepository
+
+__all__ = [
+    "InMemoryLinkRepository",
+    "InMemoryUserRepository",
+    "InMemoryLinkStatsRepository",
+    "InMemoryLinkUrlRepository",
+    "InMemoryUserVersionRepository",
+    "InMemoryLinkPurgeJobRepository",
+]
@@ -0,0 +1,42 @@
+"""
+Implementación en memoria del repositorio de tareas de eliminación de enlaces
+
+Un diccionario ordenado de usuario a tarea, protegido por un lock y acotado
+a `max_jobs`: al superarlo se descartan las tareas terminadas guardadas hace más tiempo.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Optional
+
+from app.domain.models import LinkPurgeJob
+from app.domain.repositories import ILinkPurgeJobRepository
+
+
+class InMemoryLinkPurgeJobRepository(ILinkPurgeJobRepository):
+
+    def __init__(self, max_jobs: int = 1000):
+        self.max_jobs = max_jobs
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, LinkPurgeJob]" = OrderedDict()
+
+    def get_job(self, user_id: str) -> Optional[LinkPurgeJob]:
+        """ Obtiene una copia de la tarea del usuario. """
+        with self._lock:
+            job = self._jobs.get(user_id)
+            return replace(job) if job is not None else None
+
+    def save_job(self, job: LinkPurgeJob) -> None:
+        """ Guarda una copia de la tarea y descarta las terminadas menos recientes si se supera `max_jobs`. """
+        with self._lock:
+            self._jobs[job.user_id] = replace(job)
+            self._jobs.move_to_end(job.user_id)
+            for user_id in list(self._jobs):
+                if len(self._jobs) <= self.max_jobs:
+                    return
+                if not self._jobs[user_id].is_active:
+                    del self._jobs[user_id]
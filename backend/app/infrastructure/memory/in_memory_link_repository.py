@@ -0,0 +1,315 @@
+"""
+Implementación en memoria del repositorio de enlaces
+
+Permite ejecutar la aplicación sin Firestore (pruebas de carga, medición
+del costo propio de la capa de servicios, desarrollo sin credenciales).
+Es segura para uso concurrente entre hilos y mantiene índices secundarios
+para que ninguna consulta recorra todos los enlaces:
+
+- user_id -> enlaces del usuario, ordenados por (created_at, id).
+- (user_id, tag) -> ids de enlaces con ese tag.
+- (user_id, URL normalizada) -> ids de enlaces con esa URL.
+
+Con un `InMemoryLinkUrlRepository`, cada escritura registra (o libera) la
+URL canónica del enlace en él bajo el mismo lock, y rechaza con
+`DuplicateLinkException` las que otro enlace del usuario ya tiene.
+
+Los datos se pierden al detener el proceso.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import threading
+from bisect import bisect_right, insort
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from uuid import uuid4
+
+from app.core.exceptions import DuplicateLinkException
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.urls import normalize_url, raise_if_url_repeated, url_key
+from app.domain.models import Link, NewLink, LinkPage, PartialLink, OwnershipCheck
+from app.domain.repositories import ILinkRepository, ILinkUrlRepository
+
+
+class InMemoryLinkRepository(ILinkRepository):
+
+    def __init__(self, url_repository: Optional[ILinkUrlRepository] = None):
+        self._lock = threading.RLock()
+        self._url_repository = url_repository
+        self._links: Dict[str, Link] = {}
+        self._by_user: Dict[str, List[Tuple[datetime, str]]] = {}
+        self._by_tag: Dict[Tuple[str, str], Set[str]] = {}
+        self._by_url: Dict[Tuple[str, str], Set[str]] = {}
+
+    # Índices (requieren tener el lock)
+
+    @staticmethod
+    def _order_key(link: Link) -> Tuple[datetime, str]:
+        return link.created_at, link.id
+
+    def _index(self, link: Link) -> None:
+        insort(self._by_user.setdefault(link.user_id, []), self._order_key(link))
+        for tag in set(link.tags or []):
+            self._by_tag.setdefault((link.user_id, tag), set()).add(link.id)
+        self._by_url.setdefault((link.user_id, normalize_url(link.url)), set()).add(link.id)
+
+    @staticmethod
+    def _discard(index: dict, key: Any, link_id: str) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(link_id)
+            if not ids:
+                del index[key]
+
+    def _unindex(self, link: Link) -> None:
+        ordered = self._by_user.get(link.user_id, [])
+        position = bisect_right(ordered, self._order_key(link)) - 1
+        if position >= 0 and ordered[position] == self._order_key(link):
+            del ordered[position]
+        if not ordered:
+            self._by_user.pop(link.user_id, None)
+        for tag in set(link.tags or []):
+            self._discard(self._by_tag, (link.user_id, tag), link.id)
+        self._discard(self._by_url, (link.user_id, normalize_url(link.url)), link.id)
+
+    def _store(self, link: Link) -> Link:
+        """ Guarda (o reemplaza) un enlace y actualiza los índices."""
+        link = replace(link, tags=list(link.tags or []))
+        previous = self._links.get(link.id)
+        if previous is not None:
+            self._unindex(previous)
+        self._links[link.id] = link
+        self._index(link)
+        return link
+
+    def _remove(self, link_id: str) -> None:
+        link = self._links.pop(link_id, None)
+        if link is not None:
+            self._unindex(link)
+            self._release_url(link)
+
+    def _reserve_urls(self, links: List[Link]) -> None:
+        """
+        Registra la URL canónica de cada enlace en el índice de URLs, o lanza
+        `DuplicateLinkException` sin registrar ninguna si otro enlace del
+        usuario ya la tiene (o se repite entre `links`).
+        """
+        if self._url_repository is None:
+            return
+        raise_if_url_repeated(links)
+        entries = {(link.user_id, url_key(str(link.url))): link for link in links}
+        for (user_id, key), link in entries.items():
+            owner = self._url_repository.get_link_ids(user_id, [key]).get(key)
+            if owner is not None and owner != link.id:
+                raise DuplicateLinkException(str(link.url), owner)
+        for (user_id, key), link in entries.items():
+            self._url_repository.save_urls(user_id, {key: link.id})
+
+    def _release_url(self, link: Link) -> None:
+        """ Elimina del índice de URLs la entrada de la URL del enlace, si es suya."""
+        if self._url_repository is None:
+            return
+        key = url_key(str(link.url))
+        if self._url_repository.get_link_ids(link.user_id, [key]).get(key) == link.id:
+            self._url_repository.delete_urls(link.user_id, [key])
+
+    def _move_urls(self, moved: List[Tuple[Link, Link]]) -> None:
+        """ Registra la nueva URL de los enlaces cuya URL canónica cambia y libera la anterior."""
+        moved = [(previous, updated) for previous, updated in moved if url_key(str(previous.url)) != url_key(str(updated.url))]
+        self._reserve_urls([updated for _, updated in moved])
+        for previous, _ in moved:
+            self._release_url(previous)
+
+    @staticmethod
+    def _to_view(link: Link, fields: Optional[List[str]]):
+        if fields is None:
+            return link
+        return PartialLink(id=link.id, fields={name: getattr(link, name) for name in fields})
+
+    def _user_links(self, user_id: str) -> List[Link]:
+        return [self._links[link_id] for _, link_id in self._by_user.get(user_id, [])]
+
+    # ILinkRepository
+
+    def create_link(self, link: NewLink) -> Link:
+        """ Crea un nuevo enlace en el repositorio. """
+        return self.create_links([link])[0]
+
+    def create_link_if_absent(self, link: NewLink) -> Tuple[Link, bool]:
+        """ Crea el enlace sólo si no existe otro con su id. """
+        with self._lock:
+            existing = self._links.get(link.id) if link.id else None
+            if existing is not None:
+                return existing, False
+            return self.create_link(link), True
+
+    def create_links(self, links: List[NewLink]) -> List[Link]:
+        """ Crea varios enlaces de forma atómica. """
+        created_at = datetime.now(timezone.utc)
+        created = [
+            Link(
+                id=link.id or str(uuid4()),
+                url=link.url,
+                title=link.title,
+                description=link.description,
+                created_at=created_at,
+                user_id=link.user_id,
+                tags=link.tags,
+            )
+            for link in links
+        ]
+        with self._lock:
+            self._reserve_urls(created)
+            return [self._store(link) for link in created]
+
+    def get_links_by_user_id(self, user_id: str, fields: Optional[List[str]] = None) -> List[Link]:
+        """ Obtiene todos los enlaces asociados a un usuario. """
+        with self._lock:
+            return [self._to_view(link, fields) for link in self._user_links(user_id)]
+
+    def stream_links_by_user_id(self, user_id: str, fields: Optional[List[str]] = None) -> Iterator[Link]:
+        """ Itera una copia de los enlaces del usuario tomada al iniciar la iteración. """
+        yield from self.get_links_by_user_id(user_id, fields)
+
+    def get_links_page(self, user_id: str, limit: int, cursor: Optional[str] = None, fields: Optional[List[str]] = None) -> LinkPage:
+        """ Obtiene una página de enlaces de un usuario ordenados por (created_at, id). """
+        with self._lock:
+            ordered = self._by_user.get(user_id, [])
+            start = bisect_right(ordered, decode_cursor(cursor)) if cursor else 0
+            keys = ordered[start:start + limit + 1]
+            items = [self._to_view(self._links[link_id], fields) for _, link_id in keys[:limit]]
+
+        next_cursor = None
+        if len(keys) > limit:
+            next_cursor = encode_cursor(*keys[limit - 1])
+        return LinkPage(items=items, next_cursor=next_cursor)
+
+    def get_link_by_id(self, link_id: str) -> Optional[Link]:
+        """ Obtiene un enlace por su identificador. """
+        with self._lock:
+            return self._links.get(link_id)
+
+    def get_links_by_ids(self, link_ids: List[str]) -> List[Link]:
+        """ Obtiene varios enlaces por sus identificadores. Los inexistentes se omiten. """
+        with self._lock:
+            return [self._links[link_id] for link_id in link_ids if link_id in self._links]
+
+    def get_links_by_tags(self, user_id: str, tags: List[str], match_all: bool = False, fields: Optional[List[str]] = None) -> List[Link]:
+        """ Obtiene los enlaces de un usuario con alguno o todos los tags (unión o intersección del índice por tag). """
+        with self._lock:
+            postings = sorted((self._by_tag.get((user_id, tag), set()) for tag in set(tags)), key=len)
+            if match_all:
+                ids = set(postings[0]).intersection(*postings[1:]) if postings else set()
+            else:
+                ids = set().union(*postings)
+            links = sorted((self._links[link_id] for link_id in ids), key=self._order_key)
+            return [self._to_view(link, fields) for link in links]
+
+    def get_links_by_url(self, user_id: str, url: str) -> List[Link]:
+        """ Obtiene los enlaces de un usuario con la misma URL normalizada (índice por URL). """
+        with self._lock:
+            return [self._links[link_id] for link_id in self._by_url.get((user_id, normalize_url(url)), ())]
+
+    def update_link(self, link: Link) -> Link:
+        """ Actualiza un enlace existente. Conserva el propietario y la fecha de creación. """
+        with self._lock:
+            existing = self._links[link.id]
+            updated = replace(link, user_id=existing.user_id, created_at=existing.created_at)
+            self._move_urls([(existing, updated)])
+            return self._store(updated)
+
+    def update_link_if_owned(self, link_id: str, user_id: str, changes: Dict[str, Any]) -> Tuple[OwnershipCheck, Optional[Link], Optional[Link]]:
+        """ Actualiza un enlace sólo si pertenece al usuario (verificación y escritura bajo el mismo lock). """
+        with self._lock:
+            link = self._links.get(link_id)
+            if link is None:
+                return OwnershipCheck.NOT_FOUND, None, None
+            if link.user_id != user_id:
+                return OwnershipCheck.FORBIDDEN, None, None
+            updated = replace(link, **changes)
+            self._move_urls([(link, updated)])
+            return OwnershipCheck.OK, link, self._store(updated)
+
+    def update_links_if_owned(
+        self,
+        user_id: str,
+        link_ids: List[str],
+        apply: Callable[[Link], Dict[str, Any]],
+    ) -> List[Tuple[OwnershipCheck, Optional[Link], Optional[Link]]]:
+        """ Actualiza varios enlaces del usuario de forma atómica (verificación y escritura bajo el mismo lock). """
+        with self._lock:
+            results = []
+            for link_id in link_ids:
+                link = self._links.get(link_id)
+                if link is None:
+                    results.append((OwnershipCheck.NOT_FOUND, None, None))
+                elif link.user_id != user_id:
+                    results.append((OwnershipCheck.FORBIDDEN, None, None))
+                else:
+                    changes = apply(link)
+                    results.append((OwnershipCheck.OK, link, replace(link, **changes) if changes else link))
+            self._move_urls([(previous, updated) for check, previous, updated in results if check == OwnershipCheck.OK])
+            return [
+                (check, previous, self._store(updated) if updated is not previous else updated)
+                for check, previous, updated in results
+            ]
+
+    def delete_link(self, link_id: str) -> None:
+        """ Elimina un enlace por su identificador. """
+        with self._lock:
+            self._remove(link_id)
+
+    def delete_link_if_owned(self, link_id: str, user_id: str) -> Tuple[OwnershipCheck, Optional[Link]]:
+        """ Elimina un enlace sólo si pertenece al usuario (verificación y escritura bajo el mismo lock). """
+        with self._lock:
+            link = self._links.get(link_id)
+            if link is None:
+                return OwnershipCheck.NOT_FOUND, None
+            if link.user_id != user_id:
+                return OwnershipCheck.FORBIDDEN, None
+            self._remove(link_id)
+            return OwnershipCheck.OK, link
+
+    def delete_links_if_owned(self, user_id: str, link_ids: List[str]) -> List[Tuple[OwnershipCheck, Optional[Link]]]:
+        """ Elimina varios enlaces del usuario de forma atómica (verificación y escritura bajo el mismo lock). """
+        with self._lock:
+            results = []
+            for link_id in link_ids:
+                link = self._links.get(link_id)
+                if link is None:
+                    results.append((OwnershipCheck.NOT_FOUND, None))
+                elif link.user_id != user_id:
+                    results.append((OwnershipCheck.FORBIDDEN, None))
+                else:
+                    self._remove(link_id)
+                    results.append((OwnershipCheck.OK, link))
+            return results
+
+    def delete_links(self, link_ids: List[str]) -> None:
+        """ Elimina varios enlaces de forma atómica. """
+        with self._lock:
+            for link_id in link_ids:
+                self._remove(link_id)
+
+    def delete_links_by_user_id(
+        self,
+        user_id: str,
+        page_size: int,
+        max_ops_per_second: int,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """ Elimina los enlaces de un usuario por páginas (sin límite de ritmo: no hay red). """
+        deleted = 0
+        while True:
+            with self._lock:
+                page = [link_id for _, link_id in self._by_user.get(user_id, [])[:page_size]]
+                for link_id in page:
+                    self._remove(link_id)
+            if not page:
+                return deleted
+            deleted += len(page)
+            if on_progress:
+                on_progress(deleted)
@@ -0,0 +1,63 @@
+"""
+Implementación en memoria del repositorio de estadísticas de enlaces
+
+Complemento de `InMemoryLinkRepository`. Los incrementos se aplican bajo
+un lock, por lo que son atómicos entre hilos.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import threading
+from dataclasses import replace
+from datetime import datetime
+from typing import Dict, Optional
+
+from app.domain.models import LinkStats, LinkStatsDelta
+from app.domain.models.link_stats import recent_days
+from app.domain.repositories import ILinkStatsRepository
+
+
+class InMemoryLinkStatsRepository(ILinkStatsRepository):
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, LinkStats] = {}
+
+    @staticmethod
+    def _copy(stats: LinkStats) -> LinkStats:
+        return replace(stats, tag_counts=dict(stats.tag_counts), created_per_day=dict(stats.created_per_day))
+
+    def get_stats(self, user_id: str) -> Optional[LinkStats]:
+        """ Obtiene una copia de las estadísticas de un usuario. """
+        with self._lock:
+            stats = self._stats.get(user_id)
+            return self._copy(stats) if stats else None
+
+    def increment_stats(self, user_id: str, delta: LinkStatsDelta, activity_at: datetime) -> None:
+        """ Suma la variación a las estadísticas del usuario bajo el lock. """
+        with self._lock:
+            stats = self._stats.setdefault(user_id, LinkStats(user_id=user_id))
+            stats.link_count += delta.link_count
+            for counts, changes in ((stats.tag_counts, delta.tag_counts), (stats.created_per_day, delta.created_per_day)):
+                for key, amount in changes.items():
+                    counts[key] = counts.get(key, 0) + amount
+                    if counts[key] <= 0:
+                        del counts[key]
+            stats.created_per_day = recent_days(stats.created_per_day, activity_at)
+            stats.last_activity_at = activity_at
+            stats.revision += 1
+
+    def save_stats(self, stats: LinkStats, expected_revision: int) -> bool:
+        """ Reemplaza las estadísticas de un usuario si su revisión no cambió (bajo el lock). """
+        with self._lock:
+            current = self._stats.get(stats.user_id)
+            if (current.revision if current else 0) != expected_revision:
+                return False
+            self._stats[stats.user_id] = replace(self._copy(stats), revision=expected_revision + 1)
+            return True
+
+    def delete_stats(self, user_id: str) -> None:
+        """ Elimina las estadísticas de un usuario. """
+        with self._lock:
+            self._stats.pop(user_id, None)
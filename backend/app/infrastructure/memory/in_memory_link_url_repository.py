@@ -0,0 +1,39 @@
+"""
+Implementación en memoria del repositorio de URLs de enlaces
+
+Complemento de `InMemoryLinkRepository`: un diccionario por usuario de
+clave de URL a id de enlace, protegido por un lock.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import threading
+from typing import Dict, List
+
+from app.domain.repositories import ILinkUrlRepository
+
+
+class InMemoryLinkUrlRepository(ILinkUrlRepository):
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._urls: Dict[str, Dict[str, str]] = {}
+
+    def get_link_ids(self, user_id: str, url_keys: List[str]) -> Dict[str, str]:
+        """ Obtiene el enlace de cada clave registrada. """
+        with self._lock:
+            urls = self._urls.get(user_id, {})
+            return {url_key: urls[url_key] for url_key in url_keys if url_key in urls}
+
+    def save_urls(self, user_id: str, entries: Dict[str, str]) -> None:
+        """ Registra el enlace de cada clave. """
+        with self._lock:
+            self._urls.setdefault(user_id, {}).update(entries)
+
+    def delete_urls(self, user_id: str, url_keys: List[str]) -> None:
+        """ Elimina las claves indicadas. """
+        with self._lock:
+            urls = self._urls.get(user_id, {})
+            for url_key in url_keys:
+                urls.pop(url_key, None)
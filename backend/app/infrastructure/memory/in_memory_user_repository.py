@@ -0,0 +1,45 @@
+"""
+Implementación en memoria del repositorio de usuarios
+
+Complemento de `InMemoryLinkRepository` para ejecutar la aplicación sin
+Firestore. Es segura para uso concurrente entre hilos.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import threading
+from dataclasses import replace
+from typing import Dict, Optional
+
+from app.domain.models import User
+from app.domain.repositories import IUserRepository
+
+
+class InMemoryUserRepository(IUserRepository):
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._users: Dict[str, User] = {}
+
+    def get_user_by_id(self, user_id: str) -> Optional[User]:
+        """ Obtiene un usuario por su identificador. """
+        with self._lock:
+            return self._users.get(user_id)
+
+    def create_user(self, user: User) -> User:
+        """ Crea un nuevo usuario en el repositorio. """
+        with self._lock:
+            self._users[user.id] = replace(user)
+        return user
+
+    def update_user(self, user: User) -> User:
+        """ Actualiza un usuario existente. """
+        with self._lock:
+            self._users[user.id] = replace(user)
+        return user
+
+    def delete_user(self, user_id: str) -> None:
+        """ Elimina un usuario existente en el repositorio. """
+        with self._lock:
+            self._users.pop(user_id, None)
@@ -0,0 +1,30 @@
+"""
+Implementación en memoria del repositorio de versiones por usuario
+
+Un diccionario de (usuario, ámbito) a versión, protegido por un lock.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import threading
+from typing import Dict, Tuple
+
+from app.domain.repositories import IUserVersionRepository
+
+
+class InMemoryUserVersionRepository(IUserVersionRepository):
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions: Dict[Tuple[str, str], int] = {}
+
+    def get_version(self, user_id: str, scope: str) -> int:
+        """ Obtiene la versión del ámbito del usuario. """
+        with self._lock:
+            return self._versions.get((user_id, scope), 0)
+
+    def bump_version(self, user_id: str, scope: str) -> None:
+        """ Incrementa la versión del ámbito del usuario. """
+        with self._lock:
+            self._versions[(user_id, scope)] = self._versions.get((user_id, scope), 0) + 1
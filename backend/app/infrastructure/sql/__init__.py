@@ -0,0 +1,39 @@
+"""
+SQL module.
+
+Implementación de los repositorios sobre una base de datos relacional con
+SQLAlchemy (SQLite en modo WAL por defecto).
+
+Actualmente disponibles:
+- SqlLinkRepository: Implementación de ILinkRepository
+- SqlUserRepository: Implementación de IUserRepository
+- SqlLinkStatsRepository: Implementación de ILinkStatsRepository
+- SqlLinkUrlRepository: Implementación de ILinkUrlRepository
+- SqlUserVersionRepository: Implementación de IUserVersionRepository
+- SqlLinkPurgeJobRepository: Implementación de ILinkPurgeJobRepository
+- create_sql_engine: Crea el engine con el pool de conexiones configurado
+- create_session_factory: Crea la fábrica de sesiones
+- init_schema: Crea las tablas e índices
+- rebuild_link_urls: Reconstruye el índice de URLs canónicas
+"""
+
+from .database import create_sql_engine, create_session_factory, init_schema, rebuild_link_urls
+from .sql_link_repository import SqlLinkRepository
+from .sql_user_repository import SqlUserRepository
+from .sql_link_stats_repository import SqlLinkStatsRepository
+from .sql_link_url_repository import SqlLinkUrlRepository
+from .sql_user_version_repository import SqlUserVersionRepository
+from .sql_link_purge_job_repository import SqlLinkPurgeJobRepository
+
+__all__ = [
+    "SqlLinkRepository",
+    "SqlUserRepository",
+    "SqlLinkStatsRepository",
+    "SqlLinkUrlRepository",
+    "SqlUserVersionRepository",
+    "SqlLinkPurgeJobRepository",
+    "create_sql_engine",
+    "create_session_factory",
+    "init_schema",
+    "rebuild_link_urls",
+]
@@ -0,0 +1,130 @@
+"""
+Configuración de la conexión a la base de datos relacional
+
+Crea el engine de SQLAlchemy con un pool de conexiones configurable y,
+para SQLite, aplica en cada conexión los PRAGMA que permiten lecturas
+concurrentes con escrituras (WAL) con un costo de sincronización menor.
+
+Si cambia la forma canónica de las URLs, el índice `link_urls` se
+reconstruye con (desde el directorio `backend`):
+    python -m app.infrastructure.sql.database
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from sqlalchemy import create_engine, delete, event, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.urls import url_key
+
+from .models import Base, LinkModel, LinkTagModel, LinkUrlModel
+
+# PRAGMA aplicados a cada conexión SQLite
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",       # lectores concurrentes con un escritor
+    "PRAGMA synchronous=NORMAL",     # seguro con WAL, evita un fsync por transacción
+    "PRAGMA busy_timeout=5000",      # espera al lock de escritura en lugar de fallar
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def create_sql_engine(
+    url: str,
+    pool_size: int = 5,
+    max_overflow: int = 10,
+    pool_timeout: float = 30,
+    pool_recycle: int = 1800,
+    echo: bool = False,
+) -> Engine:
+    """ Crea el engine de SQLAlchemy con el pool indicado (y WAL si es SQLite)."""
+    if not url.startswith("sqlite"):
+        return create_engine(
+            url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=True,
+            echo=echo,
+        )
+
+    in_memory = url in ("sqlite://", "sqlite:///:memory:")
+    pool_options = (
+        # Una base en memoria sólo existe dentro de su conexión: se comparte una sola
+        {"poolclass": StaticPool}
+        if in_memory
+        else {"pool_size": pool_size, "max_overflow": max_overflow, "pool_timeout": pool_timeout}
+    )
+    engine = create_engine(url, connect_args={"check_same_thread": False}, echo=echo, **pool_options)
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _):
+        cursor = dbapi_connection.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return engine
+
+
+def create_session_factory(engine: Engine) -> sessionmaker:
+    """ Crea la fábrica de sesiones. Los objetos no expiran al confirmar (se convierten a entidades)."""
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+def init_schema(engine: Engine) -> None:
+    """
+    Crea las tablas e índices que no existan. Si `link_tags` o `link_urls`
+    están vacías pero hay enlaces (base creada antes de esos índices), las
+    rellena a partir de la tabla `links`; entre enlaces con la misma URL se
+    registra el más antiguo.
+    """
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        if connection.execute(select(LinkTagModel.link_id).limit(1)).first() is None:
+            rows = [
+                {"link_id": link_id, "tag": tag, "user_id": user_id}
+                for link_id, user_id, tags in connection.execute(select(LinkModel.id, LinkModel.user_id, LinkModel.tags))
+                for tag in dict.fromkeys(tags or [])
+            ]
+            if rows:
+                connection.execute(insert(LinkTagModel), rows)
+
+        if connection.execute(select(LinkUrlModel.link_id).limit(1)).first() is None:
+            _fill_link_urls(connection)
+
+
+def _fill_link_urls(connection) -> None:
+    """ Registra en `link_urls` la URL canónica de cada enlace (la conserva el más antiguo)."""
+    urls = {}
+    links = connection.execute(
+        select(LinkModel.id, LinkModel.user_id, LinkModel.url).order_by(LinkModel.created_at.desc())
+    )
+    for link_id, user_id, url in links:
+        urls[(user_id, url_key(url))] = link_id
+    if urls:
+        connection.execute(insert(LinkUrlModel), [
+            {"user_id": user_id, "url_key": key, "link_id": link_id}
+            for (user_id, key), link_id in urls.items()
+        ])
+
+
+def rebuild_link_urls(engine: Engine) -> None:
+    """
+    Reconstruye `link_urls` en una transacción. Necesario si cambia la forma
+    canónica de las URLs (las claves guardadas dejarían de coincidir).
+    """
+    with engine.begin() as connection:
+        connection.execute(delete(LinkUrlModel))
+        _fill_link_urls(connection)
+
+
+if __name__ == "__main__":
+    from app.core import settings
+
+    rebuild_link_urls(create_sql_engine(settings.DATABASE_URL))
+    print("Índice link_urls reconstruido.")
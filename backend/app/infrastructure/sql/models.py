@@ -0,0 +1,163 @@
+"""
+Modelos de SQLAlchemy del adaptador relacional
+
+Parten de los modelos de `backend_old` (`app/db/models.py`), adaptados a
+las entidades del dominio actual: identificadores de texto (UUID), el
+propietario como `user_id`, tags y la tabla de usuarios.
+
+Índices:
+- `links(user_id, created_at, id)`: listado y paginación por usuario.
+- `links(user_id, url)`: búsqueda de un enlace por URL dentro de un usuario.
+- `link_tags(user_id, tag)`: índice invertido de tags para filtrar enlaces por tag.
+- `link_urls(user_id, url_key)`: enlace de cada URL canónica, para detectar duplicados.
+- `user_versions(user_id, scope)`: versión de los datos de cada usuario, para los ETags.
+- `link_purge_jobs(user_id)`: estado de la eliminación de los enlaces de cada usuario.
+
+Las estadísticas por usuario se guardan como contadores (una fila por
+usuario, tipo y clave) para que cada variación sea un UPSERT atómico.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, JSON, String, TypeDecorator
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+
+
+class UTCDateTime(TypeDecorator):
+    """ Fecha guardada como UTC sin zona horaria (SQLite no la conserva) y leída como UTC."""
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is not None and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
+
+class LinkModel(Base):
+    """
+    Modelo de SQLAlchemy para la tabla 'links'.
+    Representa un enlace con un ID, URL, título, descripción, fecha de creación, propietario y tags.
+    """
+    __tablename__ = "links"
+
+    id = Column(String(36), primary_key=True)
+    url = Column(String, nullable=False)
+    title = Column(String, nullable=False)
+    description = Column(String, nullable=True)
+    created_at = Column(UTCDateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    user_id = Column(String, nullable=False)
+    tags = Column(JSON, nullable=False, default=list)
+
+    __table_args__ = (
+        Index("ix_links_user_id_created_at", "user_id", "created_at", "id"),
+        Index("ix_links_user_id_url", "user_id", "url"),
+    )
+
+    def __repr__(self):
+        return f"<Link(id={self.id}, url={self.url}, title={self.title})>"
+
+
+class LinkTagModel(Base):
+    """
+    Modelo de SQLAlchemy para la tabla 'link_tags'.
+    Una fila por (enlace, tag); se elimina junto con su enlace.
+    """
+    __tablename__ = "link_tags"
+
+    link_id = Column(String(36), ForeignKey("links.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String, primary_key=True)
+    user_id = Column(String, nullable=False)
+
+    __table_args__ = (
+        Index("ix_link_tags_user_id_tag", "user_id", "tag"),
+    )
+
+
+class LinkUrlModel(Base):
+    """
+    Modelo de SQLAlchemy para la tabla 'link_urls'.
+    Enlace de un usuario registrado para una URL canónica (hash en `url_key`); se elimina junto con su enlace.
+    """
+    __tablename__ = "link_urls"
+
+    user_id = Column(String, primary_key=True)
+    url_key = Column(String(64), primary_key=True)
+    link_id = Column(String(36), ForeignKey("links.id", ondelete="CASCADE"), nullable=False)
+
+
+class UserVersionModel(Base):
+    """
+    Modelo de SQLAlchemy para la tabla 'user_versions'.
+    Versión de un ámbito ("links", "user") de los datos de un usuario; se incrementa con cada modificación.
+    """
+    __tablename__ = "user_versions"
+
+    user_id = Column(String, primary_key=True)
+    scope = Column(String(16), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+class LinkPurgeJobModel(Base):
+    """
+    Modelo de SQLAlchemy para la tabla 'link_purge_jobs'.
+    Estado de la última tarea de eliminación de los enlaces de cada usuario.
+    """
+    __tablename__ = "link_purge_jobs"
+
+    user_id = Column(String, primary_key=True)
+    status = Column(String(16), nullable=False)
+    deleted = Column(Integer, nullable=False, default=0)
+    started_at = Column(UTCDateTime, nullable=False)
+    finished_at = Column(UTCDateTime, nullable=True)
+    error = Column(String, nullable=True)
+    updated_at = Column(UTCDateTime, nullable=True)
+
+
+class UserModel(Base):
+    """
+    Modelo de SQLAlchemy para la tabla 'users'.
+    """
+    __tablename__ = "users"
+
+    id = Column(String, primary_key=True)
+    email = Column(String, nullable=False)
+    username = Column(String, nullable=False)
+
+    def __repr__(self):
+        return f"<User(id={self.id}, email={self.email})>"
+
+
+class LinkStatsModel(Base):
+    """
+    Modelo de SQLAlchemy para la tabla 'link_stats'.
+    Fechas de actividad de las estadísticas de un usuario; los contadores están en 'link_stats_counters'.
+    """
+    __tablename__ = "link_stats"
+
+    user_id = Column(String, primary_key=True)
+    last_activity_at = Column(UTCDateTime, nullable=True)
+    reconciled_at = Column(UTCDateTime, nullable=True)
+
+
+class LinkStatsCounterModel(Base):
+    """
+    Modelo de SQLAlchemy para la tabla 'link_stats_counters'.
+    Un contador de las estadísticas de un usuario: `kind` es "links" (clave vacía), "tag" o "day".
+    """
+    __tablename__ = "link_stats_counters"
+
+    user_id = Column(String, primary_key=True)
+    kind = Column(String(8), primary_key=True)
+    key = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,54 @@
+"""
+Implementación de repositorio de tareas de eliminación de enlaces utilizando SQLAlchemy
+
+Cada tarea es una fila de la tabla `link_purge_jobs` con el usuario como
+clave primaria: leerla es una lectura por clave primaria y guardarla un
+`merge` (INSERT o UPDATE) de la fila completa.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from typing import Optional
+
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.models import LinkPurgeJob
+from app.domain.repositories import ILinkPurgeJobRepository
+
+from .models import LinkPurgeJobModel
+
+
+class SqlLinkPurgeJobRepository(ILinkPurgeJobRepository):
+
+    def __init__(self, session_factory: sessionmaker):
+        self._session_factory = session_factory
+
+    def get_job(self, user_id: str) -> Optional[LinkPurgeJob]:
+        """ Obtiene la tarea del usuario por clave primaria. """
+        with self._session_factory() as session:
+            row = session.get(LinkPurgeJobModel, user_id)
+            if row is None:
+                return None
+            return LinkPurgeJob(
+                user_id=row.user_id,
+                started_at=row.started_at,
+                status=row.status,
+                deleted=row.deleted,
+                finished_at=row.finished_at,
+                error=row.error,
+                updated_at=row.updated_at,
+            )
+
+    def save_job(self, job: LinkPurgeJob) -> None:
+        """ Guarda la tarea reemplazando la fila del usuario. """
+        with self._session_factory.begin() as session:
+            session.merge(LinkPurgeJobModel(
+                user_id=job.user_id,
+                status=job.status,
+                deleted=job.deleted,
+                started_at=job.started_at,
+                finished_at=job.finished_at,
+                error=job.error,
+                updated_at=job.updated_at,
+            ))
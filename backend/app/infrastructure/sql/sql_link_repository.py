@@ -0,0 +1,404 @@
+"""
+Implementación de repositorio de enlaces utilizando SQLAlchemy
+
+Pensada para despliegues propios sobre SQLite (modo WAL) u otra base
+relacional, sin costo por documento. Las operaciones usan sentencias de
+SQLAlchemy Core:
+
+- Las creaciones masivas se envían como un único INSERT preparado con
+  múltiples parámetros (executemany).
+- Las eliminaciones condicionadas a la pertenencia son un solo DELETE
+  filtrado por (id, user_id); sólo si no afectan filas se consulta el
+  motivo (inexistente o de otro usuario). Las actualizaciones leen la fila
+  bloqueada y la modifican en la misma transacción.
+- La paginación usa el índice (user_id, created_at, id) con keyset.
+- Los tags se replican en `link_tags` (índice por (user_id, tag)) para
+  filtrar enlaces por tag sin recorrer los del usuario.
+- La URL canónica de cada enlace se registra en `link_urls` en la misma
+  transacción: su clave primaria (user_id, url_key) rechaza la creación (o
+  el cambio de URL) si otro enlace del usuario ya la tiene, y las filas se
+  eliminan junto con el enlace (ON DELETE CASCADE).
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy import and_, delete, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.exceptions import DuplicateLinkException
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.urls import raise_if_url_repeated, url_key
+from app.domain.models import Link, NewLink, LinkPage, PartialLink, OwnershipCheck
+from app.domain.repositories import ILinkRepository
+
+from .models import LinkModel, LinkTagModel, LinkUrlModel
+
+# Columnas de la tabla que corresponden a los campos de la entidad Link
+_COLUMNS = {column.name: column for column in LinkModel.__table__.columns}
+
+
+class SqlLinkRepository(ILinkRepository):
+
+    def __init__(self, session_factory: sessionmaker, stream_batch_size: int = 500):
+        self._session_factory = session_factory
+        self.stream_batch_size = stream_batch_size
+
+    @staticmethod
+    def _to_entity(row) -> Link:
+        """ Convierte una fila de la tabla `links` en una entidad Link. """
+        return Link(
+            id=row.id,
+            url=row.url,
+            title=row.title,
+            description=row.description,
+            created_at=row.created_at,
+            user_id=row.user_id,
+            tags=list(row.tags or []),
+        )
+
+    @classmethod
+    def _to_view(cls, row, fields: Optional[List[str]]):
+        """ Convierte una fila en Link, o en PartialLink si la lectura usó proyección. """
+        if fields is None:
+            return cls._to_entity(row)
+        return PartialLink(id=row.id, fields={name: getattr(row, name) for name in fields})
+
+    @staticmethod
+    def _select(fields: Optional[List[str]]):
+        """ SELECT de todas las columnas o sólo de las solicitadas (más el id). """
+        if fields is None:
+            return select(LinkModel.__table__)
+        return select(LinkModel.id, *(_COLUMNS[name] for name in fields))
+
+    def _user_links_query(self, user_id: str, fields: Optional[List[str]] = None):
+        return (
+            self._select(fields)
+            .where(LinkModel.user_id == user_id)
+            .order_by(LinkModel.created_at, LinkModel.id)
+        )
+
+    @staticmethod
+    def _row_values(link: Link) -> dict:
+        return {
+            "id": link.id,
+            "url": link.url,
+            "title": link.title,
+            "description": link.description,
+            "created_at": link.created_at,
+            "user_id": link.user_id,
+            "tags": list(link.tags or []),
+        }
+
+    @staticmethod
+    def _replace_tags(session, links: List[Link], created: bool = False) -> None:
+        """ Sincroniza las filas de `link_tags` de los enlaces con sus tags actuales."""
+        if not created:
+            session.execute(delete(LinkTagModel).where(LinkTagModel.link_id.in_([link.id for link in links])))
+        rows = [
+            {"link_id": link.id, "tag": tag, "user_id": link.user_id}
+            for link in links
+            for tag in dict.fromkeys(link.tags or [])
+        ]
+        if rows:
+            session.execute(insert(LinkTagModel), rows)
+
+    @staticmethod
+    def _url_values(link: Link) -> dict:
+        return {"user_id": link.user_id, "url_key": url_key(str(link.url)), "link_id": link.id}
+
+    @classmethod
+    def _move_urls(cls, session, moved: List[Tuple[Link, Link]]) -> None:
+        """ Reemplaza en `link_urls` la entrada de la URL anterior de cada enlace por la de la nueva."""
+        for previous, _ in moved:
+            session.execute(delete(LinkUrlModel).where(
+                LinkUrlModel.user_id == previous.user_id,
+                LinkUrlModel.url_key == url_key(str(previous.url)),
+                LinkUrlModel.link_id == previous.id,
+            ))
+        session.execute(insert(LinkUrlModel), [cls._url_values(updated) for _, updated in moved])
+
+    def _raise_if_url_taken(self, links: List[Link]) -> None:
+        """ Tras un IntegrityError, lanza DuplicateLinkException si otro enlace del usuario ya tiene la URL de alguno."""
+        with self._session_factory() as session:
+            for link in links:
+                owner = session.execute(
+                    select(LinkUrlModel.link_id)
+                    .where(LinkUrlModel.user_id == link.user_id, LinkUrlModel.url_key == url_key(str(link.url)))
+                ).scalar()
+                if owner is not None and owner != link.id:
+                    raise DuplicateLinkException(str(link.url), owner)
+
+    # Lecturas
+
+    def get_links_by_user_id(self, user_id: str, fields: Optional[List[str]] = None) -> List[Link]:
+        """ Obtiene todos los enlaces asociados a un usuario. """
+        with self._session_factory() as session:
+            rows = session.execute(self._user_links_query(user_id, fields)).all()
+        return [self._to_view(row, fields) for row in rows]
+
+    def stream_links_by_user_id(self, user_id: str, fields: Optional[List[str]] = None) -> Iterator[Link]:
+        """ Itera los enlaces de un usuario leyéndolos por bloques de `stream_batch_size`. """
+        query = self._user_links_query(user_id, fields).execution_options(yield_per=self.stream_batch_size)
+        with self._session_factory() as session:
+            for row in session.execute(query):
+                yield self._to_view(row, fields)
+
+    def get_links_page(self, user_id: str, limit: int, cursor: Optional[str] = None, fields: Optional[List[str]] = None) -> LinkPage:
+        """ Obtiene una página de enlaces de un usuario ordenados por (created_at, id). """
+        projection = None if fields is None else sorted(set(fields) | {"created_at"})
+        query = self._user_links_query(user_id, projection)
+        if cursor:
+            created_at, link_id = decode_cursor(cursor)
+            query = query.where(or_(
+                LinkModel.created_at > created_at,
+                and_(LinkModel.created_at == created_at, LinkModel.id > link_id),
+            ))
+
+        with self._session_factory() as session:
+            rows = session.execute(query.limit(limit + 1)).all()
+
+        items = [self._to_view(row, fields) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return LinkPage(items=items, next_cursor=next_cursor)
+
+    def get_links_by_tags(self, user_id: str, tags: List[str], match_all: bool = False, fields: Optional[List[str]] = None) -> List[Link]:
+        """ Obtiene los enlaces de un usuario con alguno o todos los tags, usando el índice `link_tags`. """
+        matching = (
+            select(LinkTagModel.link_id)
+            .where(LinkTagModel.user_id == user_id, LinkTagModel.tag.in_(set(tags)))
+            .group_by(LinkTagModel.link_id)
+        )
+        if match_all:
+            matching = matching.having(func.count() == len(set(tags)))
+
+        query = self._user_links_query(user_id, fields).where(LinkModel.id.in_(matching))
+        with self._session_factory() as session:
+            rows = session.execute(query).all()
+        return [self._to_view(row, fields) for row in rows]
+
+    def get_link_by_id(self, link_id: str) -> Optional[Link]:
+        """ Obtiene un enlace por su identificador. """
+        with self._session_factory() as session:
+            row = session.execute(self._select(None).where(LinkModel.id == link_id)).first()
+        return self._to_entity(row) if row else None
+
+    def get_links_by_ids(self, link_ids: List[str]) -> List[Link]:
+        """ Obtiene varios enlaces en una sola consulta. Los inexistentes se omiten. """
+        if not link_ids:
+            return []
+        with self._session_factory() as session:
+            rows = session.execute(self._select(None).where(LinkModel.id.in_(link_ids))).all()
+        return [self._to_entity(row) for row in rows]
+
+    # Escrituras
+
+    def create_link(self, link: NewLink) -> Link:
+        """ Crea un nuevo enlace en el repositorio. """
+        return self.create_links([link])[0]
+
+    def create_link_if_absent(self, link: NewLink) -> Tuple[Link, bool]:
+        """
+        Crea el enlace sólo si no existe otro con su id: la clave primaria
+        rechaza el INSERT y sólo en ese caso se lee el enlace existente.
+        """
+        try:
+            return self.create_link(link), True
+        except (IntegrityError, DuplicateLinkException):
+            existing = self.get_link_by_id(link.id) if link.id else None
+            if existing is None:
+                raise
+            return existing, False
+
+    def create_links(self, links: List[NewLink]) -> List[Link]:
+        """
+        Crea varios enlaces en una transacción con un único INSERT preparado,
+        junto con sus filas de `link_tags` y `link_urls`. Si otro enlace del
+        usuario ya tiene alguna de las URLs, no se crea ninguno y se lanza
+        `DuplicateLinkException`.
+        """
+        created_at = datetime.now(timezone.utc)
+        created = [
+            Link(
+                id=link.id or str(uuid4()),
+                url=link.url,
+                title=link.title,
+                description=link.description,
+                created_at=created_at,
+                user_id=link.user_id,
+                tags=link.tags,
+            )
+            for link in links
+        ]
+        if not created:
+            return created
+        raise_if_url_repeated(created)
+        try:
+            with self._session_factory.begin() as session:
+                session.execute(insert(LinkModel), [self._row_values(link) for link in created])
+                self._replace_tags(session, created, created=True)
+                session.execute(insert(LinkUrlModel), [self._url_values(link) for link in created])
+        except IntegrityError:
+            self._raise_if_url_taken(created)
+            raise
+        return created
+
+    def update_link(self, link: Link) -> Link:
+        """ Actualiza un enlace existente. """
+        self.update_link_if_owned(
+            link.id,
+            link.user_id,
+            {"url": link.url, "title": link.title, "description": link.description, "tags": list(link.tags or [])},
+        )
+        return link
+
+    def update_link_if_owned(self, link_id: str, user_id: str, changes: Dict[str, Any]) -> Tuple[OwnershipCheck, Optional[Link], Optional[Link]]:
+        """
+        Actualiza un enlace sólo si pertenece al usuario. La fila se lee
+        bloqueada (FOR UPDATE; en SQLite la transacción ya serializa las
+        escrituras) para retornar su estado anterior y se actualiza en la
+        misma transacción.
+        """
+        return self.update_links_if_owned(user_id, [link_id], lambda link: changes)[0]
+
+    def update_links_if_owned(
+        self,
+        user_id: str,
+        link_ids: List[str],
+        apply: Callable[[Link], Dict[str, Any]],
+    ) -> List[Tuple[OwnershipCheck, Optional[Link], Optional[Link]]]:
+        """
+        Actualiza varios enlaces del usuario en una transacción. Las filas se
+        leen bloqueadas (FOR UPDATE) y sólo se escriben las columnas que
+        cambian (UPDATE por lotes por clave primaria). Si cambia la URL
+        canónica de un enlace, su fila de `link_urls` se reemplaza en la misma
+        transacción; si otro enlace del usuario ya tiene la nueva, no se
+        actualiza ninguno y se lanza `DuplicateLinkException`.
+        """
+        moved = []
+        try:
+            with self._session_factory.begin() as session:
+                rows = session.execute(
+                    self._select(None).where(LinkModel.id.in_(link_ids)).with_for_update()
+                ).all()
+                current = {row.id: row for row in rows}
+                results = []
+                values = []
+                retagged = []
+                for link_id in link_ids:
+                    row = current.get(link_id)
+                    if row is None:
+                        results.append((OwnershipCheck.NOT_FOUND, None, None))
+                        continue
+                    if row.user_id != user_id:
+                        results.append((OwnershipCheck.FORBIDDEN, None, None))
+                        continue
+                    previous = self._to_entity(row)
+                    changes = apply(previous)
+                    updated = replace(previous, **changes)
+                    if changes:
+                        values.append({"id": link_id, **changes})
+                    if "tags" in changes:
+                        retagged.append(updated)
+                    if url_key(str(previous.url)) != url_key(str(updated.url)):
+                        moved.append((previous, updated))
+                    results.append((OwnershipCheck.OK, previous, updated))
+                if values:
+                    session.execute(update(LinkModel), values)
+                if retagged:
+                    self._replace_tags(session, retagged)
+                if moved:
+                    raise_if_url_repeated([updated for _, updated in moved])
+                    self._move_urls(session, moved)
+                return results
+        except IntegrityError:
+            self._raise_if_url_taken([updated for _, updated in moved])
+            raise
+
+    def delete_link(self, link_id: str) -> None:
+        """ Elimina un enlace por su identificador. """
+        self.delete_links([link_id])
+
+    def delete_link_if_owned(self, link_id: str, user_id: str) -> Tuple[OwnershipCheck, Optional[Link]]:
+        """ Elimina un enlace sólo si pertenece al usuario, con un único DELETE ... RETURNING. """
+        with self._session_factory.begin() as session:
+            row = session.execute(
+                delete(LinkModel)
+                .where(LinkModel.id == link_id, LinkModel.user_id == user_id)
+                .returning(*LinkModel.__table__.columns)
+            ).first()
+            if row is not None:
+                return OwnershipCheck.OK, self._to_entity(row)
+            return self._explain_miss(session, link_id), None
+
+    def delete_links_if_owned(self, user_id: str, link_ids: List[str]) -> List[Tuple[OwnershipCheck, Optional[Link]]]:
+        """
+        Elimina los enlaces del usuario con un único DELETE ... RETURNING; sólo
+        si alguno no se eliminó se consulta en la misma transacción si existe.
+        """
+        if not link_ids:
+            return []
+        with self._session_factory.begin() as session:
+            rows = session.execute(
+                delete(LinkModel)
+                .where(LinkModel.id.in_(link_ids), LinkModel.user_id == user_id)
+                .returning(*LinkModel.__table__.columns)
+            ).all()
+            deleted = {row.id: self._to_entity(row) for row in rows}
+            missed = [link_id for link_id in link_ids if link_id not in deleted]
+            existing = set(session.scalars(select(LinkModel.id).where(LinkModel.id.in_(missed)))) if missed else set()
+            return [
+                (OwnershipCheck.OK, deleted[link_id]) if link_id in deleted
+                else (OwnershipCheck.FORBIDDEN if link_id in existing else OwnershipCheck.NOT_FOUND, None)
+                for link_id in link_ids
+            ]
+
+    def delete_links(self, link_ids: List[str]) -> None:
+        """ Elimina varios enlaces en una transacción. """
+        if link_ids:
+            with self._session_factory.begin() as session:
+                session.execute(delete(LinkModel).where(LinkModel.id.in_(link_ids)))
+
+    def delete_links_by_user_id(
+        self,
+        user_id: str,
+        page_size: int,
+        max_ops_per_second: int,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Elimina los enlaces de un usuario en transacciones de `page_size`
+        filas, esperando entre ellas para no superar `max_ops_per_second`
+        y no retener el lock de escritura de SQLite durante toda la purga.
+        """
+        deleted = 0
+        while True:
+            started = time.monotonic()
+            with self._session_factory.begin() as session:
+                ids = session.execute(
+                    select(LinkModel.id).where(LinkModel.user_id == user_id).limit(page_size)
+                ).scalars().all()
+                if ids:
+                    session.execute(delete(LinkModel).where(LinkModel.id.in_(ids)))
+            if not ids:
+                return deleted
+            deleted += len(ids)
+            if on_progress:
+                on_progress(deleted)
+            time.sleep(max(0.0, len(ids) / max_ops_per_second - (time.monotonic() - started)))
+
+    @staticmethod
+    def _explain_miss(session, link_id: str) -> OwnershipCheck:
+        """ Determina por qué una modificación condicionada no afectó filas. """
+        exists = session.execute(select(LinkModel.id).where(LinkModel.id == link_id)).first()
+        return OwnershipCheck.FORBIDDEN if exists else OwnershipCheck.NOT_FOUND
@@ -0,0 +1,157 @@
+"""
+Implementación de repositorio de estadísticas de enlaces utilizando SQLAlchemy
+
+Cada variación se aplica en una transacción con un UPSERT por lotes
+(`INSERT ... ON CONFLICT DO UPDATE SET count = count + excluded.count`),
+de modo que escrituras concurrentes del mismo usuario se suman sin leer
+previamente los contadores. Soporta SQLite y PostgreSQL.
+
+La revisión de las estadísticas es otro contador (`revision`) que cada
+variación incrementa; la reconstrucción sólo reemplaza los contadores si
+puede avanzar la revisión que leyó antes de recorrer los enlaces.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.models import LinkStats, LinkStatsDelta
+from app.domain.models.link_stats import LINK_STATS_ACTIVITY_DAYS, activity_day
+from app.domain.repositories import ILinkStatsRepository
+
+from .models import LinkStatsModel, LinkStatsCounterModel
+
+# Tipos de contador de la tabla `link_stats_counters`
+_LINKS, _TAG, _DAY, _REVISION = "links", "tag", "day", "revision"
+
+
+class SqlLinkStatsRepository(ILinkStatsRepository):
+
+    def __init__(self, session_factory: sessionmaker):
+        self._session_factory = session_factory
+
+    @staticmethod
+    def _insert(session):
+        """ INSERT con soporte de ON CONFLICT según el dialecto de la conexión."""
+        dialect = session.get_bind().dialect.name
+        return (postgresql if dialect == "postgresql" else sqlite).insert
+
+    @staticmethod
+    def _counter_rows(user_id: str, stats) -> list:
+        rows = [{"user_id": user_id, "kind": _LINKS, "key": "", "count": stats.link_count}]
+        rows += [{"user_id": user_id, "kind": _TAG, "key": tag, "count": count} for tag, count in stats.tag_counts.items()]
+        rows += [{"user_id": user_id, "kind": _DAY, "key": day, "count": count} for day, count in stats.created_per_day.items()]
+        return rows
+
+    def get_stats(self, user_id: str) -> Optional[LinkStats]:
+        """ Obtiene las estadísticas de un usuario (dos consultas por clave primaria). """
+        with self._session_factory() as session:
+            header = session.execute(
+                select(LinkStatsModel.__table__).where(LinkStatsModel.user_id == user_id)
+            ).first()
+            if header is None:
+                return None
+            counters = session.execute(
+                select(LinkStatsCounterModel.kind, LinkStatsCounterModel.key, LinkStatsCounterModel.count)
+                .where(LinkStatsCounterModel.user_id == user_id, LinkStatsCounterModel.count > 0)
+            ).all()
+
+        stats = LinkStats(
+            user_id=user_id,
+            last_activity_at=header.last_activity_at,
+            reconciled_at=header.reconciled_at,
+        )
+        for kind, key, count in counters:
+            if kind == _LINKS:
+                stats.link_count = count
+            elif kind == _REVISION:
+                stats.revision = count
+            elif kind == _TAG:
+                stats.tag_counts[key] = count
+            else:
+                stats.created_per_day[key] = count
+        return stats
+
+    def increment_stats(self, user_id: str, delta: LinkStatsDelta, activity_at: datetime) -> None:
+        """ Suma la variación con un UPSERT por lotes y descarta contadores vacíos o fuera de la ventana. """
+        with self._session_factory.begin() as session:
+            insert = self._insert(session)
+            header = insert(LinkStatsModel).values(user_id=user_id, last_activity_at=activity_at)
+            session.execute(header.on_conflict_do_update(
+                index_elements=[LinkStatsModel.user_id],
+                set_={"last_activity_at": header.excluded.last_activity_at},
+            ))
+
+            counters = insert(LinkStatsCounterModel)
+            session.execute(
+                counters.on_conflict_do_update(
+                    index_elements=[LinkStatsCounterModel.user_id, LinkStatsCounterModel.kind, LinkStatsCounterModel.key],
+                    set_={"count": LinkStatsCounterModel.count + counters.excluded.count},
+                ),
+                self._counter_rows(user_id, delta) + [{"user_id": user_id, "kind": _REVISION, "key": "", "count": 1}],
+            )
+
+            since = activity_day(activity_at - timedelta(days=LINK_STATS_ACTIVITY_DAYS - 1))
+            session.execute(delete(LinkStatsCounterModel).where(
+                LinkStatsCounterModel.user_id == user_id,
+                LinkStatsCounterModel.kind.not_in([_LINKS, _REVISION]),
+                (LinkStatsCounterModel.count <= 0)
+                | ((LinkStatsCounterModel.kind == _DAY) & (LinkStatsCounterModel.key < since)),
+            ))
+
+    def save_stats(self, stats: LinkStats, expected_revision: int) -> bool:
+        """
+        Reemplaza los contadores del usuario en una transacción si su revisión
+        no cambió. La comprobación es la primera escritura (avanzar el contador
+        `revision` desde `expected_revision`, o crearlo si era 0), por lo que
+        toma el bloqueo antes de que otra variación pueda colarse.
+        """
+        revision = LinkStatsCounterModel.__table__
+        with self._session_factory.begin() as session:
+            if expected_revision:
+                claimed = session.execute(
+                    update(revision)
+                    .where(
+                        revision.c.user_id == stats.user_id,
+                        revision.c.kind == _REVISION,
+                        revision.c.count == expected_revision,
+                    )
+                    .values(count=expected_revision + 1)
+                ).rowcount
+            else:
+                claimed = session.execute(
+                    self._insert(session)(revision)
+                    .values(user_id=stats.user_id, kind=_REVISION, key="", count=1)
+                    .on_conflict_do_nothing()
+                ).rowcount
+            if not claimed:
+                return False
+
+            session.execute(delete(LinkStatsCounterModel).where(
+                LinkStatsCounterModel.user_id == stats.user_id,
+                LinkStatsCounterModel.kind != _REVISION,
+            ))
+            session.execute(delete(LinkStatsModel).where(LinkStatsModel.user_id == stats.user_id))
+            session.add(LinkStatsModel(
+                user_id=stats.user_id,
+                last_activity_at=stats.last_activity_at,
+                reconciled_at=stats.reconciled_at,
+            ))
+            session.execute(self._insert(session)(LinkStatsCounterModel), self._counter_rows(stats.user_id, stats))
+            return True
+
+    def delete_stats(self, user_id: str) -> None:
+        """ Elimina las estadísticas de un usuario. """
+        with self._session_factory.begin() as session:
+            self._delete(session, user_id)
+
+    @staticmethod
+    def _delete(session, user_id: str) -> None:
+        session.execute(delete(LinkStatsCounterModel).where(LinkStatsCounterModel.user_id == user_id))
+        session.execute(delete(LinkStatsModel).where(LinkStatsModel.user_id == user_id))
@@ -0,0 +1,66 @@
+"""
+Implementación de repositorio de URLs de enlaces utilizando SQLAlchemy
+
+El índice es la tabla `link_urls` con clave primaria (user_id, url_key):
+verificar si un usuario ya guardó una URL es una lectura por clave
+primaria. Sus filas se eliminan junto con el enlace (ON DELETE CASCADE).
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from typing import Dict, List
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.repositories import ILinkUrlRepository
+
+from .models import LinkUrlModel
+
+
+class SqlLinkUrlRepository(ILinkUrlRepository):
+
+    def __init__(self, session_factory: sessionmaker):
+        self._session_factory = session_factory
+
+    @staticmethod
+    def _insert(session):
+        """ INSERT con soporte de ON CONFLICT según el dialecto de la conexión."""
+        dialect = session.get_bind().dialect.name
+        return (postgresql if dialect == "postgresql" else sqlite).insert
+
+    def get_link_ids(self, user_id: str, url_keys: List[str]) -> Dict[str, str]:
+        """ Obtiene el enlace de cada clave en una consulta por clave primaria. """
+        if not url_keys:
+            return {}
+        with self._session_factory() as session:
+            rows = session.execute(
+                select(LinkUrlModel.url_key, LinkUrlModel.link_id)
+                .where(LinkUrlModel.user_id == user_id, LinkUrlModel.url_key.in_(set(url_keys)))
+            ).all()
+        return {url_key: link_id for url_key, link_id in rows}
+
+    def save_urls(self, user_id: str, entries: Dict[str, str]) -> None:
+        """ Registra las claves con un UPSERT por lotes. """
+        if not entries:
+            return
+        with self._session_factory.begin() as session:
+            statement = self._insert(session)(LinkUrlModel).values([
+                {"user_id": user_id, "url_key": url_key, "link_id": link_id}
+                for url_key, link_id in entries.items()
+            ])
+            session.execute(statement.on_conflict_do_update(
+                index_elements=[LinkUrlModel.user_id, LinkUrlModel.url_key],
+                set_={"link_id": statement.excluded.link_id},
+            ))
+
+    def delete_urls(self, user_id: str, url_keys: List[str]) -> None:
+        """ Elimina las claves indicadas. """
+        if not url_keys:
+            return
+        with self._session_factory.begin() as session:
+            session.execute(
+                delete(LinkUrlModel).where(LinkUrlModel.user_id == user_id, LinkUrlModel.url_key.in_(set(url_keys)))
+            )
@@ -0,0 +1,47 @@
+"""
+Implementación de repositorio de usuarios utilizando SQLAlchemy
+
+Complemento de `SqlLinkRepository` sobre la misma base de datos.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from typing import Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.models import User
+from app.domain.repositories import IUserRepository
+
+from .models import UserModel
+
+
+class SqlUserRepository(IUserRepository):
+
+    def __init__(self, session_factory: sessionmaker):
+        self._session_factory = session_factory
+
+    def get_user_by_id(self, user_id: str) -> Optional[User]:
+        """ Obtiene un usuario por su identificador. """
+        with self._session_factory() as session:
+            row = session.execute(select(UserModel.__table__).where(UserModel.id == user_id)).first()
+        if row is None:
+            return None
+        return User(id=row.id, email=row.email, username=row.username)
+
+    def create_user(self, user: User) -> User:
+        """ Crea un nuevo usuario en el repositorio (o lo reemplaza si ya existe, como `set` en Firestore). """
+        with self._session_factory.begin() as session:
+            session.merge(UserModel(id=user.id, email=user.email, username=user.username))
+        return user
+
+    def update_user(self, user: User) -> User:
+        """ Actualiza un usuario existente. """
+        return self.create_user(user)
+
+    def delete_user(self, user_id: str) -> None:
+        """ Elimina un usuario existente en el repositorio. """
+        with self._session_factory.begin() as session:
+            session.execute(delete(UserModel).where(UserModel.id == user_id))
@@ -0,0 +1,48 @@
+"""
+Implementación de repositorio de versiones por usuario utilizando SQLAlchemy
+
+Las versiones son la tabla `user_versions` con clave primaria
+(user_id, scope): leerlas es una lectura por clave primaria y
+incrementarlas un UPSERT con `version = version + 1`.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.repositories import IUserVersionRepository
+
+from .models import UserVersionModel
+
+
+class SqlUserVersionRepository(IUserVersionRepository):
+
+    def __init__(self, session_factory: sessionmaker):
+        self._session_factory = session_factory
+
+    @staticmethod
+    def _insert(session):
+        """ INSERT con soporte de ON CONFLICT según el dialecto de la conexión."""
+        dialect = session.get_bind().dialect.name
+        return (postgresql if dialect == "postgresql" else sqlite).insert
+
+    def get_version(self, user_id: str, scope: str) -> int:
+        """ Obtiene la versión con una consulta por clave primaria. """
+        with self._session_factory() as session:
+            version = session.execute(
+                select(UserVersionModel.version)
+                .where(UserVersionModel.user_id == user_id, UserVersionModel.scope == scope)
+            ).scalar()
+        return version or 0
+
+    def bump_version(self, user_id: str, scope: str) -> None:
+        """ Incrementa la versión con un UPSERT. """
+        with self._session_factory.begin() as session:
+            statement = self._insert(session)(UserVersionModel).values(user_id=user_id, scope=scope, version=1)
+            session.execute(statement.on_conflict_do_update(
+                index_elements=[UserVersionModel.user_id, UserVersionModel.scope],
+                set_={"version": UserVersionModel.version + 1},
+            ))
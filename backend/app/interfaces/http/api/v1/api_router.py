@@ -10,10 +10,11 @@ Fecha: 2025-06-11
 """
 
 from fastapi import APIRouter
-from app.interfaces.http.api.v1.routes import user_router, link_router
+from app.interfaces.http.api.v1.routes import user_router, link_router, metrics_router
 
 
 api_v1_router = APIRouter(prefix="/api/v1")
 
 api_v1_router.include_router(user_router)
-api_v1_router.include_router(link_router)
\ No newline at end of file
+api_v1_router.include_router(link_router)
+api_v1_router.include_router(metrics_router)
\ No newline at end of file
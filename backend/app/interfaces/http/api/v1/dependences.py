@@ -2,25 +2,78 @@
 Este archivo encapsula la construcción de servicios de aplicación,
 inyectando los repositorios adecuados desde la capa de infraestructura.
 
-Facilita el uso de FastAPI.Depends sin acoplar los routers a Firebase.
+Facilita el uso de FastAPI.Depends sin acoplar los routers a Firebase. Los
+repositorios y servicios se obtienen del contenedor de la aplicación
+(`app.container`), que los construye según la configuración.
 
 Autor: Henry Jimenez
 Fecha: 2025-06-11
 """
+import logging
 from functools import lru_cache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from firebase_admin import auth
 from firebase_admin.auth import InvalidIdTokenError, ExpiredIdTokenError
-from app.application.services import UserService, LinkService
-from app.infrastructure.firebase.repositories import FirebaseUserRepository, FirebaseLinkRepository
-from app.core import logger
+from app.application.services import UserService, LinkService, LinkPurgeService, LinkStatsService
+from app.infrastructure.auth import FirebaseTokenVerifier, PublicKeySet, LocalTokenVerifier, UnverifiedTokenVerifier
+from app.domain.repositories import IAsyncLinkRepository, IAsyncUserRepository
+from app.container import Container, get_container as get_app_container
+from app.core import logger, settings
+from app.core.logger import LogRateLimiter
 
 
 security = HTTPBearer()
 
+# Un cliente que reintenta con un token inválido no debe inundar los logs
+rejection_log_limiter = LogRateLimiter(settings.AUTH_REJECTION_LOG_INTERVAL_SECONDS)
 
-async def get_current_user_uid(token: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+
+def _log_rejection(kind: str, level: int, message: str, **kwargs) -> None:
+    """ Registra un rechazo de autenticación respetando el límite de frecuencia por tipo."""
+    emit, suppressed = rejection_log_limiter.acquire(kind)
+    if not emit:
+        return
+    if suppressed:
+        message = f"{message} ({suppressed} rechazos similares omitidos)"
+    logger.log(level, message, **kwargs)
+
+
+@lru_cache
+def get_public_key_set() -> PublicKeySet:
+    """ Obtiene el conjunto compartido de llaves públicas, con renovación en segundo plano. """
+    key_set = PublicKeySet(
+        certs_url=settings.AUTH_KEYS_URL,
+        refresh_margin=settings.AUTH_KEYS_REFRESH_MARGIN_SECONDS,
+    )
+    key_set.start()
+    return key_set
+
+@lru_cache
+def get_token_verifier() -> FirebaseTokenVerifier:
+    """ Obtiene una instancia compartida del verificador de tokens. """
+    
+    verifier_kwargs = {}
+    if settings.AUTH_VERIFY_MODE == "local":
+        local_verifier = LocalTokenVerifier(get_public_key_set(), settings.FIREBASE_PROJECT_ID)
+        verifier_kwargs["verify_fn"] = local_verifier.verify
+    elif settings.AUTH_VERIFY_MODE == "insecure":
+        logger.warning("AUTH_VERIFY_MODE=insecure: las firmas de los tokens no se verifican (sólo desarrollo)")
+        verifier_kwargs["verify_fn"] = UnverifiedTokenVerifier().verify
+    
+    return FirebaseTokenVerifier(
+        cache_max_size=settings.AUTH_TOKEN_CACHE_MAX_SIZE,
+        cache_ttl_seconds=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+        max_workers=settings.AUTH_VERIFY_MAX_WORKERS,
+        negative_cache_max_size=settings.AUTH_NEGATIVE_CACHE_MAX_SIZE,
+        negative_cache_ttl_seconds=settings.AUTH_NEGATIVE_CACHE_TTL_SECONDS,
+        **verifier_kwargs,
+    )
+
+
+async def get_current_user_uid(
+    token: HTTPAuthorizationCredentials = Depends(security),
+    token_verifier: FirebaseTokenVerifier = Depends(get_token_verifier)
+    ) -> dict:
     """
     Dependencia que verifica un token de Firebase ID y devuelve el UID del usuario.
     Lanza una HTTPException si el token es inválido o ha expirado.
@@ -36,9 +89,10 @@ async def get_current_user_uid(token: HTTPAuthorizationCredentials = Depends(sec
     """
     
     try:
-        # Verifica el token usando el SDK de Firebase Admin
+        # Verifica el token usando el SDK de Firebase Admin (con caché de tokens ya verificados)
         # Si el token es válido, devuelve un diccionario con los datos decodificados.
-        decoded_token = auth.verify_id_token(token.credentials)
+        # La verificación se ejecuta en un pool de hilos para no bloquear el event loop.
+        decoded_token = await token_verifier.verify_async(token.credentials)
         # Extrae el User ID (UID) del token decodificado
         uid = decoded_token['uid']
         email = decoded_token['email']
@@ -46,7 +100,7 @@ async def get_current_user_uid(token: HTTPAuthorizationCredentials = Depends(sec
         return {"uid": uid, "email": email}
     except ExpiredIdTokenError as e:
         # Maneja tokens expirados
-        logger.warning(f"Error: Token de Firebase ha expirado. Detalles: {e}")
+        _log_rejection("expired", logging.WARNING, f"Error: Token de Firebase ha expirado. Detalles: {e}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token de autenticación de Firebase ha expirado. Por favor, inicie sesión de nuevo.",
@@ -54,7 +108,7 @@ async def get_current_user_uid(token: HTTPAuthorizationCredentials = Depends(sec
         )
     except InvalidIdTokenError as e:
         # Maneja tokens inválidos (firmas incorrectas, etc.)
-        logger.error(f"Error: Token de Firebase inválido. Detalles: {e}")
+        _log_rejection("invalid", logging.WARNING, f"Error: Token de Firebase inválido. Detalles: {e}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token de autenticación de Firebase inválido. Acceso denegado.",
@@ -62,29 +116,39 @@ async def get_current_user_uid(token: HTTPAuthorizationCredentials = Depends(sec
         )
     except Exception as e:
         # Captura cualquier otra excepción inesperada durante la verificación
-        logger.critical(f"Error inesperado durante la validación del token de Firebase: {e}", exc_info=True)
+        # El detalle del error sólo se registra en el servidor: no se expone al cliente
+        _log_rejection("unexpected", logging.ERROR, f"Error inesperado durante la validación del token de Firebase: {e!r}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"No se pudo validar el token de Firebase: {e}",
+            detail="No se pudo validar el token de autenticación.",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
 
-@lru_cache
+def get_container() -> Container:
+    """ Obtiene el contenedor de dependencias compartido (repositorios y servicios). """
+    return get_app_container()
+
+def get_user_repository() -> IAsyncUserRepository:
+    """ Obtiene el repositorio de usuarios compartido, con las cachés configuradas. """
+    return get_app_container().user_repository
+
+def get_link_repository() -> IAsyncLinkRepository:
+    """ Obtiene el repositorio de enlaces compartido, con las cachés configuradas. """
+    return get_app_container().link_repository
+
+def get_link_purge_service() -> LinkPurgeService:
+    """ Obtiene la instancia compartida del servicio de eliminación de enlaces en segundo plano. """
+    return get_app_container().link_purge_service
+
+def get_link_stats_service() -> LinkStatsService:
+    """ Obtiene la instancia compartida del servicio de estadísticas de enlaces. """
+    return get_app_container().link_stats_service
+
 def get_user_service() -> UserService:
-    """ Obtiene una instancia del servicio de usuarios. """
-    
-    # TODO: Inyectar dependencias
-    user_repository = FirebaseUserRepository()
-    
-    return UserService(user_repository)
+    """ Obtiene la instancia compartida del servicio de usuarios. """
+    return get_app_container().user_service
 
-@lru_cache
 def get_link_service() -> LinkService:
-    """ Obtiene una instancia del servicio de enlaces. """
-    
-    # TODO: Inyectar dependencias
-    user_repository = FirebaseUserRepository()
-    link_repository = FirebaseLinkRepository()
-    
-    return LinkService(link_repository, user_repository)
\ No newline at end of file
+    """ Obtiene la instancia compartida del servicio de enlaces. """
+    return get_app_container().link_service
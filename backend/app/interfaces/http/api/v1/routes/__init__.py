@@ -12,10 +12,12 @@ Cada módulo contiene:
 Archivos incluidos:
 - `link.py`: CRUD de enlaces.
 - `user.py`: CRUD de usuarios.
+- `metrics.py`: métricas internas (cachés).
 
 Autor: Henry Jiménez
 Fecha: 2025-06-19
 """
 
 from .user import router as user_router
-from .link import router as link_router
\ No newline at end of file
+from .link import router as link_router
+from .metrics import router as metrics_router
\ No newline at end of file
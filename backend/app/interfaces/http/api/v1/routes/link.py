@@ -8,49 +8,229 @@ Autor: Henry Jiménez
 Fecha: 2025-06-19
 """
 
-from fastapi import APIRouter, Depends, status
-from app.interfaces.http.api.v1.dependences import get_link_service, get_current_user_uid
-from app.application.dtos import LinkCreate, LinkUpdate, LinkRead
-from app.application.services import LinkService
+from typing import Any, Literal, Optional, Union
+from urllib.parse import urlencode
+from fastapi import APIRouter, Body, Depends, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from app.interfaces.http.api.v1.dependences import get_link_service, get_link_stats_service, get_current_user_uid
+from app.application.dtos import LinkCreate, LinkUpdate, LinkRead, LinkSparseRead, LinkBatchResult, LinkBulkOperation, TagCountRead, SuggestionRead
+from app.application.services import LinkService, LinkStatsService
+from app.core.etag import not_modified
+from app.core import settings
 
 
 router = APIRouter(tags=["links"])
 
+FIELDS_DESCRIPTION = "Campos a retornar separados por coma (por ejemplo `title,url,tags`). El id se incluye siempre."
+
+
+def parse_fields(fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)) -> Optional[list[str]]:
+    """ Dependencia que convierte el parámetro `fields` en una lista de nombres de campo. """
+    if fields is None:
+        return None
+    names = [name.strip() for name in fields.split(",")]
+    return [name for name in names if name and name != "id"]
+
 
 @router.post("/{user_id}/links", response_model=LinkRead, status_code=status.HTTP_201_CREATED)
-def create_link(
+async def create_link(
     user_id: str,
     link: LinkCreate, 
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias="Idempotency-Key",
+        min_length=1,
+        max_length=255,
+        description="Clave elegida por el cliente: reintentar la creación con la misma clave retorna el enlace ya creado.",
+    ),
     link_service: LinkService = Depends(get_link_service),
     user_data: dict = Depends(get_current_user_uid)
     ):
     """ Endpoint para crear un nuevo enlace. """    
-    return link_service.create_link(link, user_id, user_data)
+    return await link_service.create_link(link, user_id, user_data, idempotency_key)
+
+@router.post("/{user_id}/links:batch", response_model=LinkBatchResult)
+async def create_links_batch(
+    user_id: str,
+    links: list[Any] = Body(..., description="Lista de enlaces con el formato de LinkCreate."),
+    link_service: LinkService = Depends(get_link_service),
+    user_data: dict = Depends(get_current_user_uid)
+    ):
+    """
+    Endpoint para crear varios enlaces en una sola petición.
+    
+    Cada elemento se valida por separado y la respuesta informa el resultado
+    de cada uno según su posición en la lista.
+    """
+    return await link_service.create_links_batch(links, user_id, user_data)
+
+@router.post("/{user_id}/links:bulk", response_model=LinkBatchResult)
+async def bulk_update_links(
+    user_id: str,
+    operation: LinkBulkOperation,
+    link_service: LinkService = Depends(get_link_service),
+    user_data: dict = Depends(get_current_user_uid)
+    ):
+    """
+    Endpoint para eliminar o modificar varios enlaces en una sola petición.
+    
+    La operación (`delete`, `add_tags`, `remove_tags` o `update`) se aplica a
+    cada id de `link_ids`; la respuesta informa el resultado de cada uno.
+    """
+    return await link_service.bulk_update_links(user_id, operation, user_data)
+
+@router.get(
+    "/{user_id}/links",
+    response_model=Union[list[LinkRead], list[LinkSparseRead]],
+    response_model_exclude_unset=True,
+)
+async def get_links_by_user_id(
+    user_id: str,
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=settings.LINKS_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    fields: Optional[list[str]] = Depends(parse_fields),
+    tag: Optional[list[str]] = Query(None, description="Tag a filtrar; puede repetirse (`?tag=a&tag=b`)."),
+    tag_match: Literal["any", "all"] = Query("any", description="`any`: enlaces con alguno de los tags; `all`: con todos."),
+    if_none_match: Optional[str] = Header(None, description="ETag de una respuesta anterior; si sigue vigente se responde 304."),
+    link_service: LinkService = Depends(get_link_service),
+    user_data: dict = Depends(get_current_user_uid)
+    ):
+    """
+    Endpoint para consultar los enlaces de un usuario.
+    
+    Sin `limit` ni `cursor` retorna todos los enlaces. Con alguno de ellos retorna
+    una página ordenada por fecha de creación; el cursor de la página siguiente
+    se envía en la cabecera `X-Next-Cursor` (ausente en la última página).
+    
+    Con `tag` retorna los enlaces con alguno (o todos, según `tag_match`) de
+    los tags indicados, también paginados con `limit`/`cursor`.
+    
+    Con `fields` sólo se leen y retornan los campos indicados.
+    
+    La respuesta lleva un `ETag` que cambia con cualquier escritura en los
+    enlaces del usuario; con `If-None-Match` vigente se responde 304 sin leer
+    los enlaces.
+    """
+    variant = urlencode(sorted(request.query_params.multi_items()))
+    etag = await link_service.get_links_etag(user_id, user_data, variant)
+    unchanged = not_modified(response, etag, if_none_match)
+    if unchanged is not None:
+        return unchanged
+    
+    if limit is None and cursor is None:
+        if tag is not None:
+            return await link_service.get_links_by_tags(user_id, user_data, tag, tag_match == "all", fields)
+        return await link_service.get_links_by_user_id(user_id, user_data, fields)
+    
+    if tag is not None:
+        page = await link_service.get_links_page_by_tags(
+            user_id, user_data, tag, tag_match == "all", limit or settings.LINKS_PAGE_DEFAULT_LIMIT, cursor, fields
+        )
+    else:
+        page = await link_service.get_links_page_by_user_id(
+            user_id, user_data, limit or settings.LINKS_PAGE_DEFAULT_LIMIT, cursor, fields
+        )
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.items
+
+@router.get("/{user_id}/tags", response_model=list[TagCountRead])
+async def get_tag_counts(
+    user_id: str,
+    limit: Optional[int] = Query(None, ge=1),
+    link_stats_service: LinkStatsService = Depends(get_link_stats_service),
+    user_data: dict = Depends(get_current_user_uid)
+    ):
+    """
+    Endpoint para consultar los tags de un usuario con su número de enlaces,
+    de mayor a menor. Se lee del histograma de tags que se mantiene con cada
+    escritura, sin recorrer los enlaces.
+    """
+    return await link_stats_service.get_tag_counts(user_id, user_data, limit)
+
+@router.get(
+    "/{user_id}/links/search",
+    response_model=Union[list[LinkRead], list[LinkSparseRead]],
+    response_model_exclude_unset=True,
+)
+async def search_links(
+    user_id: str,
+    response: Response,
+    q: str = Query(..., min_length=1, description="Palabras a buscar en el título, la descripción y la URL."),
+    limit: int = Query(settings.LINKS_PAGE_DEFAULT_LIMIT, ge=1, le=settings.LINKS_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    fields: Optional[list[str]] = Depends(parse_fields),
+    link_service: LinkService = Depends(get_link_service),
+    user_data: dict = Depends(get_current_user_uid)
+    ):
+    """
+    Endpoint para buscar en los enlaces de un usuario.
+    
+    Retorna los enlaces con alguna de las palabras de `q` (sin distinguir
+    mayúsculas ni acentos), del más al menos relevante. El cursor de la
+    página siguiente se envía en la cabecera `X-Next-Cursor`.
+    """
+    page = await link_service.search_links(user_id, user_data, q, limit, cursor, fields)
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.items
+
+@router.get("/{user_id}/suggest", response_model=list[SuggestionRead])
+async def suggest(
+    user_id: str,
+    prefix: str = Query(..., min_length=1, max_length=100, description="Inicio del tag o de la palabra que se está escribiendo."),
+    limit: int = Query(10, ge=1, le=settings.SUGGEST_MAX_RESULTS),
+    kind: Optional[Literal["tag", "title"]] = Query(None, description="Sugerir sólo tags (`tag`) o sólo palabras de títulos (`title`)."),
+    fuzzy: bool = Query(False, description="Tolerar un error de escritura en el prefijo (desde 3 caracteres)."),
+    link_service: LinkService = Depends(get_link_service),
+    user_data: dict = Depends(get_current_user_uid)
+    ):
+    """
+    Endpoint para autocompletar tags y palabras de títulos de los enlaces de
+    un usuario, de más a menos usados, sin distinguir mayúsculas ni acentos.
+    """
+    return await link_service.suggest(user_id, user_data, prefix, limit, kind, fuzzy)
 
-@router.get("/{user_id}/links", response_model=list[LinkRead])
-def get_links_by_user_id(
+@router.get("/{user_id}/links/stream", response_class=StreamingResponse)
+async def stream_links_by_user_id(
     user_id: str,
+    fields: Optional[list[str]] = Depends(parse_fields),
     link_service: LinkService = Depends(get_link_service),
     user_data: dict = Depends(get_current_user_uid)
     ):
-    """ Endpoint para consultar todos los enlaces de un usuario. """
-    return link_service.get_links_by_user_id(user_id, user_data)
+    """
+    Endpoint para consultar todos los enlaces de un usuario en formato NDJSON.
+    
+    Cada línea es un enlace serializado en JSON y se envía a medida que se lee
+    de la base de datos, por lo que la memoria y el tiempo al primer byte no
+    dependen del número de enlaces del usuario. Con `fields` sólo se leen y
+    envían los campos indicados.
+    """
+    links = await link_service.stream_links_by_user_id(user_id, user_data, fields)
+    
+    async def ndjson():
+        async for link in links:
+            yield link.model_dump_json(exclude_unset=True) + "\n"
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
 
 @router.put("/{user_id}/links/{link_id}", response_model=LinkRead)
-def update_link(
+async def update_link(
     user_id: str, 
     link_id: str, 
     link: LinkUpdate, 
     link_service: LinkService = Depends(get_link_service),
     user_data: dict = Depends(get_current_user_uid)):
     """ Endpoint para actualizar un enlace existente. """
-    return link_service.update_link(user_id, link_id, link, user_data)
+    return await link_service.update_link(user_id, link_id, link, user_data)
 
 @router.delete("/{user_id}/links/{link_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_link(
+async def delete_link(
     user_id: str,
     link_id: str,
     link_service: LinkService = Depends(get_link_service),
     user_data: dict = Depends(get_current_user_uid)):
     """ Endpoint para eliminar un enlace. """
-    link_service.delete_link(user_id, link_id, user_data)
\ No newline at end of file
+    await link_service.delete_link(user_id, link_id, user_data)
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+Rutas HTTP de métricas internas
+
+Expone los contadores de las cachés en memoria de la instancia (tokens
+verificados y, si están habilitadas, usuarios existentes y enlaces) para monitorear su tasa de aciertos.
+Como los tamaños y aciertos reflejan el tráfico, requieren un usuario autenticado.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+from fastapi import APIRouter, Depends
+from app.interfaces.http.api.v1.dependences import get_token_verifier, get_container, get_current_user_uid
+from app.infrastructure.auth import FirebaseTokenVerifier
+from app.container import Container
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/caches")
+async def get_cache_stats(
+    token_verifier: FirebaseTokenVerifier = Depends(get_token_verifier),
+    container: Container = Depends(get_container),
+    user_data: dict = Depends(get_current_user_uid)):
+    """ Endpoint para consultar el tamaño y la tasa de aciertos de las cachés de esta instancia. """
+    return {
+        "auth_tokens": token_verifier.stats(),
+        **container.cache_stats(),
+    }
@@ -2,50 +2,100 @@
 Rutas HTTP para la gestión de usuarios
 
 Define los endpoints REST para crear, actualizar, eliminar y consultar
-usuarios.
+usuarios, y para consultar las estadísticas de sus enlaces.
 
 Autor: Henry Jiménez
 Fecha: 2025-06-19
 """
 
-from fastapi import APIRouter, Depends, status
-from app.interfaces.http.api.v1.dependences import get_user_service, get_current_user_uid
-from app.application.dtos import UserCreate, UserUpdate, UserRead
-from app.application.services import UserService
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Response, status
+from app.interfaces.http.api.v1.dependences import get_user_service, get_link_purge_service, get_link_stats_service, get_current_user_uid
+from app.application.dtos import UserCreate, UserUpdate, UserRead, LinkPurgeJobRead, LinkStatsRead
+from app.application.services import UserService, LinkPurgeService, LinkStatsService
+from app.core.etag import not_modified
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.post("/", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def create_user(
+async def create_user(
     user: UserCreate, 
     user_service: UserService = Depends(get_user_service),
     user_data: dict = Depends(get_current_user_uid)
     ):
     """ Endpoint para crear un nuevo usuario. """
-    return user_service.create_user(user, user_data)
+    return await user_service.create_user(user, user_data)
 
 @router.get("/{user_id}", response_model=UserRead)
-def get_user_by_id(
+async def get_user_by_id(
     user_id: str, 
+    response: Response,
+    if_none_match: Optional[str] = Header(None, description="ETag de una respuesta anterior; si sigue vigente se responde 304."),
     user_service: UserService = Depends(get_user_service),
     user_data: dict = Depends(get_current_user_uid)):
-    """ Endpoint para consultar un usuario por su id. """
-    return user_service.get_user_by_id(user_id, user_data)
+    """
+    Endpoint para consultar un usuario por su id.
+    
+    La respuesta lleva un `ETag`; con `If-None-Match` vigente se responde 304
+    sin leer el usuario.
+    """
+    etag = await user_service.get_user_etag(user_id, user_data)
+    unchanged = not_modified(response, etag, if_none_match)
+    if unchanged is not None:
+        return unchanged
+    return await user_service.get_user_by_id(user_id, user_data)
 
 @router.put("/{user_id}", response_model=UserRead)
-def update_user(
+async def update_user(
     user_id: str, 
     user: UserUpdate, 
     user_service: UserService = Depends(get_user_service),
     user_data: dict = Depends(get_current_user_uid)): 
     """ Endpoint para actualizar un usuario existente. """ 
-    return user_service.update_user(user_id, user, user_data)
+    return await user_service.update_user(user_id, user, user_data)
 
-@router.delete("/{user_id}")
-def delete_user(
+@router.delete("/{user_id}", response_model=Optional[LinkPurgeJobRead], status_code=status.HTTP_202_ACCEPTED)
+async def delete_user(
     user_id: str, 
     user_service: UserService = Depends(get_user_service),
     user_data: dict = Depends(get_current_user_uid)):
-    """ Endpoint para eliminar un usuario existente. """
-    return user_service.delete_user(user_id, user_data)
\ No newline at end of file
+    """
+    Endpoint para eliminar un usuario existente.
+    
+    El usuario se elimina de inmediato y sus enlaces en segundo plano; la
+    respuesta describe la tarea, cuyo progreso se consulta en `/{user_id}/purge`.
+    """
+    return await user_service.delete_user(user_id, user_data)
+
+@router.get("/{user_id}/purge", response_model=LinkPurgeJobRead)
+async def get_purge_status(
+    user_id: str,
+    link_purge_service: LinkPurgeService = Depends(get_link_purge_service),
+    user_data: dict = Depends(get_current_user_uid)):
+    """ Endpoint para consultar el progreso de la eliminación de los enlaces de un usuario eliminado. """
+    return await link_purge_service.get_purge_status(user_id, user_data)
+
+@router.post("/{user_id}/purge", response_model=LinkPurgeJobRead, status_code=status.HTTP_202_ACCEPTED)
+async def purge_user_links(
+    user_id: str,
+    link_purge_service: LinkPurgeService = Depends(get_link_purge_service),
+    user_data: dict = Depends(get_current_user_uid)):
+    """ Endpoint para reanudar la eliminación de los enlaces de un usuario eliminado. """
+    return await link_purge_service.purge_user_links(user_id, user_data)
+
+@router.get("/{user_id}/stats", response_model=LinkStatsRead)
+async def get_link_stats(
+    user_id: str,
+    link_stats_service: LinkStatsService = Depends(get_link_stats_service),
+    user_data: dict = Depends(get_current_user_uid)):
+    """ Endpoint para consultar el número de enlaces, los enlaces por tag y la actividad reciente de un usuario. """
+    return await link_stats_service.get_stats(user_id, user_data)
+
+@router.post("/{user_id}/stats/reconcile", response_model=LinkStatsRead)
+async def reconcile_link_stats(
+    user_id: str,
+    link_stats_service: LinkStatsService = Depends(get_link_stats_service),
+    user_data: dict = Depends(get_current_user_uid)):
+    """ Endpoint para reconstruir las estadísticas de un usuario a partir de todos sus enlaces. """
+    return await link_stats_service.reconcile_stats(user_id, user_data)
@@ -0,0 +1,221 @@
+"""
+Compresión de respuestas HTTP
+
+Middleware ASGI que comprime las respuestas con gzip, o con brotli si el
+paquete `brotli` está instalado, según la cabecera `Accept-Encoding` del
+cliente (se respetan los valores `q`; a igual preferencia se elige brotli).
+
+- Las respuestas completas menores que `minimum_size` se envían sin
+  comprimir: en ellas la compresión cuesta más de lo que ahorra.
+- Las respuestas en streaming (por ejemplo NDJSON) se comprimen a medida
+  que se generan, sin acumularlas en memoria. Tras cada fragmento el
+  compresor se vacía (sync flush), para que el cliente pueda descomprimir
+  y procesar cada fragmento en cuanto llega, en lugar de esperar a que el
+  compresor complete un bloque.
+- Los fragmentos grandes se comprimen en un hilo, para no bloquear el event
+  loop durante la compresión de listas de varios MB.
+- Las respuestas que ya tienen `Content-Encoding`, o sin cuerpo (204, 304),
+  no se modifican. El `ETag` de una respuesta comprimida pasa a ser débil
+  (`W/"..."`): `If-None-Match` lo sigue reconociendo.
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import zlib
+from typing import List, Optional
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli es opcional: sin él sólo se ofrece gzip
+    brotli = None
+
+# Fragmentos a partir de este tamaño se comprimen fuera del event loop
+_OFFLOAD_MIN_SIZE = 64 * 1024
+
+
+class Compressor:
+    """ Compresor incremental de un cuerpo de respuesta."""
+
+    def compress(self, data: bytes) -> bytes:
+        raise NotImplementedError
+
+    def flush(self) -> bytes:
+        """ Emite todo lo comprimido hasta ahora sin terminar el flujo."""
+        raise NotImplementedError
+
+    def finish(self) -> bytes:
+        raise NotImplementedError
+
+
+class GzipCompressor(Compressor):
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor(Compressor):
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def available_encodings() -> List[str]:
+    """ Codificaciones soportadas, de mayor a menor preferencia del servidor."""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def negotiate_encoding(accept_encoding: str, encodings: List[str]) -> Optional[str]:
+    """
+    Elige la codificación de `encodings` con mayor `q` en `Accept-Encoding`
+    (a igual `q`, la primera de `encodings`). Retorna None si el cliente no
+    acepta ninguna.
+    """
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+
+    candidates = [
+        (weights.get(encoding, weights.get("*", 0.0)), -position, encoding)
+        for position, encoding in enumerate(encodings)
+    ]
+    weight, _, encoding = max(candidates)
+    return encoding if weight > 0 else None
+
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI de compresión de respuestas negociada con `Accept-Encoding`.
+
+    Atributos:
+        minimum_size (int): Tamaño mínimo (bytes) de una respuesta completa para comprimirla.
+        gzip_level (int): Nivel de compresión de gzip (1-9).
+        brotli_quality (int): Calidad de compresión de brotli (0-11).
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.encodings = available_encodings()
+
+    def make_compressor(self, encoding: str) -> Compressor:
+        if encoding == "br":
+            return BrotliCompressor(self.brotli_quality)
+        return GzipCompressor(self.gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressionResponder(self, encoding, send).run(scope, receive)
+
+
+class _CompressionResponder:
+    """ Estado de la compresión de una respuesta."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[Compressor] = None
+        self.passthrough = False
+
+    async def run(self, scope: Scope, receive: Receive) -> None:
+        await self.middleware.app(scope, receive, self.on_send)
+
+    async def on_send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Se retiene hasta ver el primer fragmento del cuerpo
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        first = self.compressor is None
+        if first:
+            if not self._should_compress(body, more_body):
+                self.passthrough = True
+                await self.send(self.start_message)
+                await self.send(message)
+                return
+            self.compressor = self.middleware.make_compressor(self.encoding)
+
+        data = await self._compress(body, final=not more_body)
+        if first:
+            self._rewrite_headers(None if more_body else len(data))
+            await self.send(self.start_message)
+        if data or not more_body:
+            await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    def _should_compress(self, body: bytes, more_body: bool) -> bool:
+        headers = Headers(raw=self.start_message["headers"])
+        if "content-encoding" in headers or self.start_message["status"] in (204, 304):
+            return False
+        return more_body or len(body) >= self.middleware.minimum_size
+
+    def _rewrite_headers(self, content_length: Optional[int]) -> None:
+        """ Ajusta las cabeceras al cuerpo comprimido (sin `Content-Length` si se envía en streaming)."""
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    async def _compress(self, body: bytes, final: bool) -> bytes:
+        def compress() -> bytes:
+            if final:
+                return (self.compressor.compress(body) if body else b"") + self.compressor.finish()
+            if not body:
+                return b""
+            return self.compressor.compress(body) + self.compressor.flush()
+
+        if len(body) >= _OFFLOAD_MIN_SIZE:
+            return await anyio.to_thread.run_sync(compress)
+        return compress()
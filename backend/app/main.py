@@ -12,6 +12,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core import settings, logger
 from app.interfaces.http.api.v1 import api_v1_router
+from app.interfaces.http.compression import CompressionMiddleware
+from app.interfaces.http.api.v1.dependences import get_token_verifier, get_public_key_set
+from app.container import get_container
 from app.core.exception_handlers import register_exception_handlers
 
 
@@ -32,14 +35,38 @@ def create_application() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
     
+    #Compresión de respuestas según Accept-Encoding
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MIN_SIZE,
+            gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+            brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        )
+    
     #Registro de rutas
     app.include_router(api_v1_router)
     
     #Registro de manejadores de excepciones
     register_exception_handlers(app)
     
+    #Verificación local de tokens: las llaves se cargan al iniciar la aplicación
+    if settings.AUTH_VERIFY_MODE == "local":
+        app.add_event_handler("startup", get_token_verifier)
+        app.add_event_handler("shutdown", lambda: get_public_key_set().stop())
+    
+    #Liberación del pool de verificación de tokens al detener la aplicación
+    app.add_event_handler("shutdown", lambda: get_token_verifier().shutdown())
+    
+    #Cancelación de las tareas en curso y liberación de conexiones al detener la aplicación
+    async def shutdown_container() -> None:
+        await get_container().shutdown()
+    
+    app.add_event_handler("shutdown", shutdown_container)
+    
     logger.info("Aplicacion Iniciada")
     
     return app
@@ -0,0 +1,110 @@
+"""
+Benchmark de latencia de autenticación bajo carga concurrente
+
+Compara la verificación de tokens ejecutada directamente en el event loop
+(comportamiento anterior de `get_current_user_uid`) contra la verificación
+delegada al pool de hilos de `FirebaseTokenVerifier.verify_async`.
+
+La verificación se simula con una firma RS256 real (PyJWT) más una espera
+bloqueante que representa la descarga de certificados. Cada petición usa
+un token distinto para que la caché no intervenga. Las peticiones llegan a
+una tasa fija y la latencia se mide desde su instante de llegada previsto,
+de modo que incluye el tiempo de espera causado por un event loop bloqueado.
+
+Uso (desde el directorio `backend`):
+    python -m benchmarks.auth_concurrency --requests 500 --rate 300
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.infrastructure.auth import FirebaseTokenVerifier
+
+
+def build_tokens(count: int) -> tuple[list[str], object]:
+    """ Genera `count` tokens RS256 firmados con una llave local."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    exp = int(time.time()) + 3600
+    tokens = [
+        jwt.encode({"uid": f"user-{i}", "email": f"user{i}@example.com", "exp": exp}, private_key, algorithm="RS256")
+        for i in range(count)
+    ]
+    return tokens, private_key.public_key()
+
+
+def make_verify_fn(public_key, io_delay: float):
+    def verify(token: str) -> dict:
+        time.sleep(io_delay)
+        return jwt.decode(token, public_key, algorithms=["RS256"])
+    return verify
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run(tokens: list[str], rate: float, verify) -> list[float]:
+    latencies: list[float] = []
+    start = time.perf_counter()
+
+    async def request(index: int, token: str) -> None:
+        arrival = start + index / rate
+        await asyncio.sleep(max(0.0, arrival - time.perf_counter()))
+        await verify(token)
+        latencies.append((time.perf_counter() - arrival) * 1000)
+
+    await asyncio.gather(*(request(i, token) for i, token in enumerate(tokens)))
+    return latencies
+
+
+def report(name: str, latencies: list[float], elapsed: float) -> None:
+    print(
+        f"{name:<12} p50={percentile(latencies, 50):8.2f}ms "
+        f"p99={percentile(latencies, 99):8.2f}ms "
+        f"mean={statistics.mean(latencies):8.2f}ms "
+        f"throughput={len(latencies) / elapsed:8.1f} req/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--rate", type=float, default=300.0, help="peticiones por segundo")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--io-delay-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    tokens, public_key = build_tokens(args.requests)
+    verify_fn = make_verify_fn(public_key, args.io_delay_ms / 1000)
+
+    # Antes: verificación bloqueante dentro de la corrutina
+    inline = FirebaseTokenVerifier(len(tokens), 300, max_workers=1, verify_fn=verify_fn)
+
+    async def inline_verify(token: str) -> dict:
+        return inline.verify(token)
+
+    start = time.perf_counter()
+    latencies = asyncio.run(run(tokens, args.rate, inline_verify))
+    report("inline", latencies, time.perf_counter() - start)
+    inline.shutdown()
+
+    # Después: verificación en el pool de hilos
+    pooled = FirebaseTokenVerifier(len(tokens), 300, max_workers=args.workers, verify_fn=verify_fn)
+    start = time.perf_counter()
+    latencies = asyncio.run(run(tokens, args.rate, pooled.verify_async))
+    report(f"pool({args.workers})", latencies, time.perf_counter() - start)
+    pooled.shutdown()
+
+
+if __name__ == "__main__":
+    main()
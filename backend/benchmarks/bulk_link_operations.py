@@ -0,0 +1,179 @@
+"""
+Benchmark de operaciones masivas sobre enlaces
+
+Compara el costo de eliminar o etiquetar N enlaces repitiendo las rutas de
+un solo elemento (`delete_link` / `update_link`, una lectura de pertenencia
+y una escritura por enlace) contra `LinkService.bulk_update_links` (por
+lote, una lectura `get_all` que verifica la pertenencia y una escritura
+condicionada).
+
+Firestore no interviene: el repositorio es un diccionario en memoria que
+simula la latencia de red con una espera por cada llamada (round-trip) y
+un costo adicional por documento en las lecturas y escrituras múltiples.
+
+Uso (desde el directorio `backend`):
+    python -m benchmarks.bulk_link_operations --links 2000 --rtt-ms 10
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional
+
+from app.application.dtos import LinkBulkOperation, LinkUpdate
+from app.application.services import LinkService
+from app.domain.models import Link, OwnershipCheck, User
+
+
+class SimulatedLinkRepository:
+    """ Repositorio en memoria con latencia simulada por round-trip y por documento."""
+
+    def __init__(self, rtt: float, per_document: float):
+        self.rtt = rtt
+        self.per_document = per_document
+        self.round_trips = 0
+        self.links: dict[str, Link] = {}
+
+    async def _round_trip(self, documents: int = 1) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(self.rtt + self.per_document * documents)
+
+    def seed(self, user_id: str, count: int) -> List[str]:
+        now = datetime.now(timezone.utc)
+        self.links = {
+            str(i): Link(
+                id=str(i), url=f"https://example.com/{i}", title="title", description="description",
+                created_at=now, user_id=user_id, tags=["a"],
+            )
+            for i in range(count)
+        }
+        return list(self.links)
+
+    async def get_link_by_id(self, link_id: str) -> Optional[Link]:
+        await self._round_trip()
+        return self.links.get(link_id)
+
+    async def get_links_by_ids(self, link_ids: List[str]) -> List[Link]:
+        await self._round_trip(len(link_ids))
+        return [self.links[link_id] for link_id in link_ids if link_id in self.links]
+
+    async def update_link_if_owned(self, link_id: str, user_id: str, changes: Dict[str, Any]):
+        # Firestore: lectura de pertenencia + escritura condicionada
+        await self._round_trip()
+        link = self.links.get(link_id)
+        if link is None:
+            return OwnershipCheck.NOT_FOUND, None, None
+        if link.user_id != user_id:
+            return OwnershipCheck.FORBIDDEN, None, None
+        await self._round_trip()
+        self.links[link_id] = replace(link, **changes)
+        return OwnershipCheck.OK, link, self.links[link_id]
+
+    async def update_links_if_owned(self, user_id: str, link_ids: List[str], apply: Callable[[Link], Dict[str, Any]]):
+        # Firestore: lectura get_all + escritura condicionada del lote
+        await self._round_trip(len(link_ids))
+        results = []
+        for link_id in link_ids:
+            link = self.links.get(link_id)
+            if link is None:
+                results.append((OwnershipCheck.NOT_FOUND, None, None))
+            elif link.user_id != user_id:
+                results.append((OwnershipCheck.FORBIDDEN, None, None))
+            else:
+                self.links[link_id] = replace(link, **apply(link))
+                results.append((OwnershipCheck.OK, link, self.links[link_id]))
+        await self._round_trip(len(link_ids))
+        return results
+
+    async def delete_link_if_owned(self, link_id: str, user_id: str):
+        await self._round_trip()
+        link = self.links.get(link_id)
+        if link is None:
+            return OwnershipCheck.NOT_FOUND, None
+        if link.user_id != user_id:
+            return OwnershipCheck.FORBIDDEN, None
+        await self._round_trip()
+        del self.links[link_id]
+        return OwnershipCheck.OK, link
+
+    async def delete_links_if_owned(self, user_id: str, link_ids: List[str]):
+        # Firestore: lectura get_all + eliminación condicionada del lote
+        await self._round_trip(len(link_ids))
+        results = []
+        for link_id in link_ids:
+            link = self.links.get(link_id)
+            if link is None:
+                results.append((OwnershipCheck.NOT_FOUND, None))
+            elif link.user_id != user_id:
+                results.append((OwnershipCheck.FORBIDDEN, None))
+            else:
+                del self.links[link_id]
+                results.append((OwnershipCheck.OK, link))
+        await self._round_trip(len(link_ids))
+        return results
+
+    async def delete_links(self, link_ids: List[str]) -> None:
+        await self._round_trip(len(link_ids))
+        for link_id in link_ids:
+            self.links.pop(link_id, None)
+
+
+class StaticUserRepository:
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+        return User(id=user_id, email=f"{user_id}@example.com", username=user_id)
+
+
+async def loop_single(service: LinkService, user_id: str, user_data: dict, link_ids: List[str], operation: str) -> None:
+    """ Comportamiento anterior: una petición por enlace."""
+    for link_id in link_ids:
+        if operation == "delete":
+            await service.delete_link(user_id, link_id, user_data)
+        else:
+            # El PUT reemplaza la lista de tags, así que el cliente debe leer la actual.
+            link = await service.link_repository.get_link_by_id(link_id)
+            await service.update_link(user_id, link_id, LinkUpdate(tags=link.tags + ["b"]), user_data)
+
+
+async def bulk(service: LinkService, user_id: str, user_data: dict, link_ids: List[str], operation: str) -> None:
+    """ Una sola operación masiva."""
+    if operation == "delete":
+        request = LinkBulkOperation(link_ids=link_ids, operation="delete")
+    else:
+        request = LinkBulkOperation(link_ids=link_ids, operation="add_tags", tags=["b"])
+    result = await service.bulk_update_links(user_id, request, user_data)
+    assert result.failed == 0
+
+
+def measure(name: str, runner, args, operation: str) -> float:
+    repository = SimulatedLinkRepository(args.rtt_ms / 1000, args.per_document_us / 1_000_000)
+    link_ids = repository.seed("bench", args.links)
+    service = LinkService(repository, StaticUserRepository(), batch_max_items=args.links)
+    user_data = {"uid": "bench"}
+
+    start = time.perf_counter()
+    asyncio.run(runner(service, "bench", user_data, link_ids, operation))
+    elapsed = time.perf_counter() - start
+    print(f"{operation:<9} {name:<7} {elapsed * 1000:10.1f}ms  round-trips={repository.round_trips}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--links", type=int, default=2000)
+    parser.add_argument("--rtt-ms", type=float, default=10.0, help="latencia simulada por round-trip")
+    parser.add_argument("--per-document-us", type=float, default=20.0, help="costo simulado por documento")
+    args = parser.parse_args()
+
+    for operation in ("delete", "add_tags"):
+        single = measure("single", loop_single, args, operation)
+        batched = measure("bulk", bulk, args, operation)
+        print(f"{operation:<9} speedup {single / batched:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Benchmark de búsqueda de texto y sugerencias en los enlaces de un usuario
+
+Mide, para un usuario con N enlaces, el tiempo de construir sus índices y
+la latencia de:
+
+- `LinkService.search_links` (índice invertido con BM25 y lectura de la
+  página de resultados) contra el comportamiento anterior: leer todos los
+  enlaces del usuario y filtrarlos en el cliente.
+- `LinkService.suggest` con prefijos de 1 a 6 caracteres, exactos y con
+  tolerancia a un error de escritura.
+- `LinkService.suggest` intercalado con creaciones de enlaces: cada
+  escritura incrementa la versión de los enlaces y se aplica al índice sin
+  reconstruirlo (el índice se valida contra la versión en cada consulta).
+
+Los enlaces se guardan en `InMemoryLinkRepository`, así que no interviene
+la red: la diferencia es sólo el trabajo de la consulta. Los textos se
+generan con un vocabulario de frecuencia Zipf (unas pocas palabras muy
+frecuentes y muchas raras), como los títulos reales.
+
+Uso (desde el directorio `backend`):
+    python -m benchmarks.link_search --links 100000 --queries 200
+    python -m benchmarks.link_search --links 50000 --scan-queries 0
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import argparse
+import asyncio
+import itertools
+import math
+import random
+import statistics
+import time
+from functools import partial
+from typing import List
+
+from app.application.services import LinkSearchService, LinkService, UserVersionService
+from app.application.services.user_version_service import LINKS_SCOPE
+from app.application.dtos import LinkCreate
+from app.core.search import fold_text
+from app.domain.models import NewLink, User
+from app.infrastructure.adapters import AsyncLinkRepositoryAdapter, AsyncUserVersionRepositoryAdapter
+from app.infrastructure.memory import InMemoryLinkRepository, InMemoryUserVersionRepository
+
+
+class StaticUserRepository:
+    """ Repositorio de usuarios mínimo: todos los usuarios existen."""
+
+    async def get_user_by_id(self, user_id: str) -> User:
+        return User(id=user_id, email=f"{user_id}@example.com", username=user_id)
+
+
+def make_vocabulary(size: int, rng: random.Random) -> List[str]:
+    letters = "abcdefghijklmnopqrstuvwxyzáéíóñ"
+    return ["".join(rng.choice(letters) for _ in range(rng.randint(4, 9))) for _ in range(size)]
+
+
+def seed(repository: InMemoryLinkRepository, user_id: str, count: int, vocabulary: List[str], rng: random.Random) -> None:
+    cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+
+    def words(k: int) -> str:
+        return " ".join(rng.choices(vocabulary, cum_weights=cum_weights, k=k))
+
+    links = [
+        NewLink(
+            url=f"https://{rng.choice(vocabulary)}.com/{'-'.join(rng.choices(vocabulary, cum_weights=cum_weights, k=3))}",
+            title=words(rng.randint(3, 8)),
+            description=words(rng.randint(8, 25)),
+            user_id=user_id,
+            tags=rng.sample(vocabulary[:300], rng.randint(0, 4)),
+        )
+        for _ in range(count)
+    ]
+    for start in range(0, len(links), 5000):
+        repository.create_links(links[start:start + 5000])
+
+
+async def scan(service: LinkService, user_id: str, user_data: dict, query: str, limit: int) -> None:
+    """ Comportamiento anterior: leer todos los enlaces y filtrar por subcadena."""
+    terms = fold_text(query).split()
+    links = await service.get_links_by_user_id(user_id, user_data)
+    matches = []
+    for link in links:
+        text = fold_text(f"{link.title} {link.description} {link.url}")
+        if any(term in text for term in terms):
+            matches.append(link)
+    return matches[:limit]
+
+
+def percentiles(samples: List[float]) -> str:
+    ordered = sorted(samples)
+
+    def at(fraction: float) -> float:
+        return ordered[max(0, math.ceil(len(ordered) * fraction) - 1)] * 1000
+
+    return f"p50={statistics.median(ordered) * 1000:8.2f}ms  p95={at(0.95):8.2f}ms  p99={at(0.99):8.2f}ms"
+
+
+async def run(args) -> None:
+    rng = random.Random(42)
+    vocabulary = make_vocabulary(args.vocabulary, rng)
+    repository = InMemoryLinkRepository()
+    seed(repository, "bench", args.links, vocabulary, rng)
+    link_repository = AsyncLinkRepositoryAdapter(repository, offload=False)
+    version_service = UserVersionService(AsyncUserVersionRepositoryAdapter(InMemoryUserVersionRepository(), offload=False))
+    search_service = LinkSearchService(link_repository, current_version=partial(version_service.version, scope=LINKS_SCOPE))
+    service = LinkService(link_repository, StaticUserRepository(), search_service=search_service, version_service=version_service)
+    user_data = {"uid": "bench"}
+
+    start = time.perf_counter()
+    await search_service._get_index("bench")
+    print(f"build index  {args.links} links  {(time.perf_counter() - start) * 1000:10.1f}ms")
+
+    queries = [" ".join(rng.sample(vocabulary[:2000], rng.randint(1, 3))) for _ in range(args.queries)]
+    indexed = []
+    for query in queries:
+        start = time.perf_counter()
+        await service.search_links("bench", user_data, query, args.limit)
+        indexed.append(time.perf_counter() - start)
+    print(f"search index {percentiles(indexed)}")
+
+    def random_prefix(fuzzy: bool) -> str:
+        word = fold_text(rng.choice(vocabulary))
+        prefix = word[:rng.randint(1, min(6, len(word)))]
+        if fuzzy and len(prefix) >= 3:
+            position = rng.randrange(len(prefix))
+            prefix = prefix[:position] + rng.choice("aeiou") + prefix[position + 1:]
+        return prefix
+
+    for fuzzy in (False, True):
+        latencies = []
+        for _ in range(args.queries):
+            prefix = random_prefix(fuzzy)
+            start = time.perf_counter()
+            await service.suggest("bench", user_data, prefix, 10, fuzzy=fuzzy)
+            latencies.append(time.perf_counter() - start)
+        print(f"suggest {'fuzzy' if fuzzy else 'exact'} {percentiles(latencies)}")
+
+    latencies = []
+    for number in range(args.write_queries):
+        link = LinkCreate(
+            url=f"https://bench.example.com/{number}",
+            title=" ".join(rng.sample(vocabulary[:2000], 4)),
+            description=" ".join(rng.sample(vocabulary[:2000], 8)),
+            tags=rng.sample(vocabulary[:300], 2),
+        )
+        await service.create_link(link, "bench", user_data)
+        prefix = random_prefix(False)
+        start = time.perf_counter()
+        await service.suggest("bench", user_data, prefix, 10)
+        latencies.append(time.perf_counter() - start)
+    if latencies:
+        print(f"suggest after write {percentiles(latencies)}")
+
+    scanned = []
+    for query in queries[:args.scan_queries]:
+        start = time.perf_counter()
+        await scan(service, "bench", user_data, query, args.limit)
+        scanned.append(time.perf_counter() - start)
+    if scanned:
+        print(f"search scan  {percentiles(scanned)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--links", type=int, default=100000)
+    parser.add_argument("--vocabulary", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--scan-queries", type=int, default=3, help="consultas medidas con el recorrido completo")
+    parser.add_argument("--write-queries", type=int, default=200, help="sugerencias medidas tras crear un enlace")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark de compresión de listas de enlaces
+
+Mide, para listas de N enlaces serializadas como las responde la API
+(`GET /{user_id}/links` en JSON y `/links/stream` en NDJSON), los bytes
+enviados y el tiempo de CPU de comprimirlas con los compresores de
+`CompressionMiddleware`: gzip con varios niveles y, si el paquete `brotli`
+está instalado, brotli con varias calidades.
+
+- JSON: el cuerpo completo se comprime en una llamada.
+- NDJSON: cada enlace es un fragmento, como en el streaming; se mide el
+  costo de comprimir fragmento a fragmento.
+
+Los enlaces se generan con URLs, títulos, descripciones y tags de
+longitudes habituales; las palabras siguen una frecuencia Zipf, como los
+textos reales.
+
+Uso (desde el directorio `backend`):
+    python -m benchmarks.response_compression --sizes 10 100 1000 10000
+    python -m benchmarks.response_compression --sizes 5000 --gzip-levels 1 6 --brotli-qualities 4
+
+Autor: Henry Jiménez
+Fecha: 2026-10-18
+"""
+
+import argparse
+import itertools
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Tuple
+
+from pydantic import TypeAdapter
+
+from app.application.dtos import LinkRead
+from app.interfaces.http.compression import BrotliCompressor, Compressor, GzipCompressor, brotli
+
+_LINK_LIST = TypeAdapter(List[LinkRead])
+
+
+def make_links(count: int, rng: random.Random) -> List[LinkRead]:
+    vocabulary = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 10))) for _ in range(5000)]
+    cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+    hosts = [f"{rng.choice(vocabulary)}.{rng.choice(['com', 'org', 'io', 'dev', 'es'])}" for _ in range(200)]
+    now = datetime.now(timezone.utc)
+
+    def words(k: int) -> List[str]:
+        return rng.choices(vocabulary, cum_weights=cum_weights, k=k)
+
+    return [
+        LinkRead(
+            id=str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            url=f"https://{rng.choice(hosts)}/{'-'.join(words(rng.randint(1, 5)))}",
+            title=" ".join(words(rng.randint(3, 9))).capitalize(),
+            description=" ".join(words(rng.randint(8, 30))),
+            user_id="bench-user-4f1c2a",
+            created_at=now - timedelta(seconds=rng.randint(0, 3 * 365 * 86400)),
+            tags=list(dict.fromkeys(rng.choices(vocabulary[:80], k=rng.randint(0, 4)))),
+        )
+        for _ in range(count)
+    ]
+
+
+def compress_chunks(compressor: Compressor, chunks: List[bytes]) -> int:
+    """ Comprime los fragmentos en orden y retorna el total de bytes producidos."""
+    size = sum(len(compressor.compress(chunk)) for chunk in chunks)
+    return size + len(compressor.finish())
+
+
+def measure(make: Callable[[], Compressor], chunks: List[bytes], repeats: int) -> Tuple[int, float]:
+    """ Retorna los bytes comprimidos y la mediana del tiempo de CPU (segundos)."""
+    timings = []
+    size = 0
+    for _ in range(repeats):
+        start = time.process_time()
+        size = compress_chunks(make(), chunks)
+        timings.append(time.process_time() - start)
+    return size, statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--gzip-levels", type=int, nargs="+", default=[1, 6, 9])
+    parser.add_argument("--brotli-qualities", type=int, nargs="+", default=[1, 4, 6, 11])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    codecs = [(f"gzip-{level}", lambda level=level: GzipCompressor(level)) for level in args.gzip_levels]
+    if brotli is not None:
+        codecs += [(f"br-{quality}", lambda quality=quality: BrotliCompressor(quality)) for quality in args.brotli_qualities]
+    else:
+        print("brotli no está instalado: sólo se mide gzip\n")
+
+    rng = random.Random(42)
+    print(f"{'enlaces':>8} {'formato':>7} {'codec':>8} {'original':>11} {'comprimido':>11} {'ratio':>6} {'cpu ms':>9} {'MB/s':>8}")
+    for count in args.sizes:
+        links = make_links(count, rng)
+        payloads = {
+            "json": [_LINK_LIST.dump_json(links)],
+            "ndjson": [link.model_dump_json().encode() + b"\n" for link in links],
+        }
+        for name, chunks in payloads.items():
+            original = sum(len(chunk) for chunk in chunks)
+            print(f"{count:>8} {name:>7} {'-':>8} {original:>11,} {original:>11,} {1:>6.2f} {0:>9.2f} {'-':>8}")
+            for codec, make in codecs:
+                size, seconds = measure(make, chunks, args.repeats)
+                throughput = original / seconds / 1e6 if seconds else float("inf")
+                print(
+                    f"{count:>8} {name:>7} {codec:>8} {original:>11,} {size:>11,} "
+                    f"{original / size:>6.2f} {seconds * 1000:>9.2f} {throughput:>8.1f}"
+                )
+        print()
+
+
+if __name__ == "__main__":
+    main()
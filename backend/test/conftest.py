@@ -0,0 +1,11 @@
+"""
+Configuración común de las pruebas.
+
+Las rutas se prueban con los repositorios en memoria y la verificación de
+tokens del SDK (sin descargar llaves). Las variables se fijan antes de que
+las pruebas importen `app.core.settings`.
+"""
+import os
+
+os.environ["REPOSITORY_BACKEND"] = "memory"
+os.environ["AUTH_VERIFY_MODE"] = "firebase"
@@ -0,0 +1,180 @@
+"""
+Pruebas para la caché de enlaces (CachingLinkRepository).
+"""
+import asyncio
+
+import pytest
+
+from app.domain.models import NewLink, OwnershipCheck
+from app.infrastructure.adapters import AsyncLinkRepositoryAdapter
+from app.infrastructure.cache import CachingLinkRepository
+from app.infrastructure.memory import InMemoryLinkRepository, InMemoryLinkUrlRepository
+
+USER_ID = "cache_user"
+OTHER_USER_ID = "other_user"
+
+
+class CountingLinkRepository(AsyncLinkRepositoryAdapter):
+    """ Repositorio de enlaces que cuenta las lecturas que llegan hasta él."""
+
+    def __init__(self, repository):
+        super().__init__(repository, offload=False)
+        self.reads = 0
+
+    async def get_links_by_user_id(self, user_id, fields=None):
+        self.reads += 1
+        return await super().get_links_by_user_id(user_id, fields)
+
+    async def get_link_by_id(self, link_id):
+        self.reads += 1
+        return await super().get_link_by_id(link_id)
+
+
+@pytest.fixture
+def repositories():
+    """
+    Fixtura con un repositorio en memoria y la caché que lo envuelve.
+    """
+    inner = CountingLinkRepository(InMemoryLinkRepository(InMemoryLinkUrlRepository()))
+    return inner, CachingLinkRepository(inner, max_size=100, ttl_seconds=60)
+
+
+def new_link(url: str, user_id: str = USER_ID, tags=()) -> NewLink:
+    return NewLink(title="Example", url=url, user_id=user_id, tags=list(tags))
+
+
+async def warm(cache: CachingLinkRepository, *links) -> None:
+    """ Carga en caché las listas de ambos usuarios y cada enlace indicado."""
+    await cache.get_links_by_user_id(USER_ID)
+    await cache.get_links_by_user_id(OTHER_USER_ID)
+    for link in links:
+        await cache.get_link_by_id(link.id)
+
+
+def test_update_links_if_owned_refreshes_list_and_item(repositories):
+    """
+    Prueba que una actualización en bloque se refleja en la lista y en el enlace cacheados,
+    sin modificar los enlaces ajenos.
+    """
+    inner, cache = repositories
+
+    async def scenario():
+        own = await cache.create_link(new_link("https://example.com/a"))
+        foreign = await cache.create_link(new_link("https://example.com/b", user_id=OTHER_USER_ID))
+        await warm(cache, own, foreign)
+        reads = inner.reads
+
+        results = await cache.update_links_if_owned(USER_ID, [own.id, foreign.id], lambda link: {"tags": ["python"]})
+
+        assert [check for check, _, _ in results] == [OwnershipCheck.OK, OwnershipCheck.FORBIDDEN]
+        assert (await cache.get_link_by_id(own.id)).tags == ["python"]
+        assert [link.tags for link in await cache.get_links_by_user_id(USER_ID)] == [["python"]]
+        assert (await cache.get_link_by_id(foreign.id)).tags == []
+        assert [link.tags for link in await cache.get_links_by_user_id(OTHER_USER_ID)] == [[]]
+        return inner.reads - reads
+
+    assert asyncio.run(scenario()) == 0
+
+
+def test_update_links_if_owned_forgets_missing_links(repositories):
+    """
+    Prueba que un enlace que el repositorio ya no encuentra se retira de la caché.
+    """
+    inner, cache = repositories
+
+    async def scenario():
+        link = await cache.create_link(new_link("https://example.com/a"))
+        await warm(cache, link)
+        await inner.delete_link(link.id)
+
+        results = await cache.update_links_if_owned(USER_ID, [link.id], lambda link: {"tags": ["python"]})
+
+        assert results == [(OwnershipCheck.NOT_FOUND, None, None)]
+        assert await cache.get_link_by_id(link.id) is None
+        assert await cache.get_links_by_user_id(USER_ID) == []
+
+    asyncio.run(scenario())
+
+
+def test_create_links_extends_cached_list(repositories):
+    """
+    Prueba que los enlaces creados en bloque se agregan a la lista cacheada de su usuario.
+    """
+    inner, cache = repositories
+
+    async def scenario():
+        first = await cache.create_link(new_link("https://example.com/a"))
+        await warm(cache, first)
+        reads = inner.reads
+
+        created = await cache.create_links([new_link("https://example.com/b"), new_link("https://example.com/c")])
+
+        assert [link.id for link in await cache.get_links_by_user_id(USER_ID)] == [first.id] + [link.id for link in created]
+        assert await cache.get_links_by_user_id(OTHER_USER_ID) == []
+        assert await cache.get_link_by_id(created[1].id) == created[1]
+        return inner.reads - reads
+
+    assert asyncio.run(scenario()) == 0
+
+
+def test_delete_links_if_owned_removes_list_and_item(repositories):
+    """
+    Prueba que una eliminación en bloque retira los enlaces propios de la caché y conserva los ajenos.
+    """
+    _, cache = repositories
+
+    async def scenario():
+        own = await cache.create_link(new_link("https://example.com/a"))
+        foreign = await cache.create_link(new_link("https://example.com/b", user_id=OTHER_USER_ID))
+        await warm(cache, own, foreign)
+
+        await cache.delete_links_if_owned(USER_ID, [own.id, foreign.id])
+
+        assert await cache.get_link_by_id(own.id) is None
+        assert await cache.get_links_by_user_id(USER_ID) == []
+        assert await cache.get_links_by_user_id(OTHER_USER_ID) == [foreign]
+
+    asyncio.run(scenario())
+
+
+def test_delete_links_by_user_id_evicts_only_that_user(repositories):
+    """
+    Prueba que la purga de un usuario descarta su lista y sus enlaces cacheados,
+    y que las entradas de otros usuarios siguen sirviéndose desde la caché.
+    """
+    inner, cache = repositories
+
+    async def scenario():
+        own = await cache.create_link(new_link("https://example.com/a"))
+        foreign = await cache.create_link(new_link("https://example.com/b", user_id=OTHER_USER_ID))
+        await warm(cache, own, foreign)
+
+        await cache.delete_links_by_user_id(USER_ID, page_size=10, max_ops_per_second=1000)
+
+        assert await cache.get_link_by_id(own.id) is None
+        assert await cache.get_links_by_user_id(USER_ID) == []
+        reads = inner.reads
+        assert await cache.get_links_by_user_id(OTHER_USER_ID) == [foreign]
+        assert await cache.get_link_by_id(foreign.id) == foreign
+        return inner.reads - reads
+
+    assert asyncio.run(scenario()) == 0
+
+
+def test_cached_list_is_never_served_to_other_user(repositories):
+    """
+    Prueba que la lista cacheada de un usuario no se sirve en las lecturas de otro,
+    ni completas ni filtradas por tag.
+    """
+    _, cache = repositories
+
+    async def scenario():
+        own = await cache.create_link(new_link("https://example.com/a", tags=["python"]))
+        foreign = await cache.create_link(new_link("https://example.com/a", user_id=OTHER_USER_ID, tags=["python"]))
+        await cache.get_links_by_user_id(USER_ID)
+
+        assert await cache.get_links_by_user_id(OTHER_USER_ID) == [foreign]
+        assert await cache.get_links_by_tags(OTHER_USER_ID, ["python"]) == [foreign]
+        assert await cache.get_links_by_tags(USER_ID, ["python"]) == [own]
+
+    asyncio.run(scenario())
@@ -0,0 +1,174 @@
+"""
+Pruebas para la compresión de respuestas (CompressionMiddleware).
+"""
+import asyncio
+import gzip
+import types
+import zlib
+
+import pytest
+
+from app.interfaces.http import compression
+from app.interfaces.http.compression import CompressionMiddleware, negotiate_encoding
+
+
+class FakeBrotliCompressor:
+    """ Sustituto de `brotli.Compressor` que registra las llamadas (brotli es opcional)."""
+
+    calls = []
+
+    def __init__(self, quality: int):
+        self.quality = quality
+
+    def process(self, data: bytes) -> bytes:
+        self.calls.append("process")
+        return b"<" + data + b">"
+
+    def flush(self) -> bytes:
+        self.calls.append("flush")
+        return b"|"
+
+    def finish(self) -> bytes:
+        self.calls.append("finish")
+        return b"."
+
+
+@pytest.fixture
+def fake_brotli(monkeypatch):
+    """
+    Fixtura que simula que el paquete `brotli` está instalado.
+    """
+    FakeBrotliCompressor.calls = []
+    monkeypatch.setattr(compression, "brotli", types.SimpleNamespace(Compressor=FakeBrotliCompressor))
+    return FakeBrotliCompressor
+
+
+def response_app(body: bytes, status: int = 200, headers: list = None):
+    """ Aplicación ASGI que responde `body` de una sola vez."""
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": status, "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            *(headers or []),
+        ]})
+        await send({"type": "http.response.body", "body": body})
+    return app
+
+
+def streaming_app(chunks: list):
+    """ Aplicación ASGI que responde los fragmentos indicados en streaming (NDJSON)."""
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/x-ndjson")]})
+        for chunk in chunks:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+    return app
+
+
+def call(app, accept_encoding: str = None, minimum_size: int = 100) -> tuple:
+    """ Ejecuta una petición a través del middleware; retorna (cabeceras, fragmentos del cuerpo)."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        messages.append(message)
+
+    headers = [(b"accept-encoding", accept_encoding.encode())] if accept_encoding is not None else []
+    middleware = CompressionMiddleware(app, minimum_size=minimum_size)
+    asyncio.run(middleware({"type": "http", "method": "GET", "path": "/", "headers": headers}, receive, send))
+    start = next(message for message in messages if message["type"] == "http.response.start")
+    response_headers = {name.decode(): value.decode() for name, value in start["headers"]}
+    return response_headers, [message["body"] for message in messages if message["type"] == "http.response.body"]
+
+
+@pytest.mark.parametrize("accept_encoding, encodings, expected", [
+    ("gzip, deflate, br", ["br", "gzip"], "br"),
+    ("gzip, deflate, br", ["gzip"], "gzip"),
+    ("gzip;q=1.0, br;q=0.5", ["br", "gzip"], "gzip"),
+    ("br;q=0, gzip", ["br", "gzip"], "gzip"),
+    ("GZIP", ["gzip"], "gzip"),
+    ("*", ["br", "gzip"], "br"),
+    ("*;q=0.5, gzip;q=0", ["br", "gzip"], "br"),
+    ("identity", ["br", "gzip"], None),
+    ("gzip;q=0", ["gzip"], None),
+    ("gzip;q=abc", ["gzip"], None),
+    ("", ["br", "gzip"], None),
+])
+def test_negotiate_encoding(accept_encoding, encodings, expected):
+    """
+    Prueba la elección de la codificación según `Accept-Encoding` y sus valores `q`.
+    """
+    assert negotiate_encoding(accept_encoding, encodings) == expected
+
+
+def test_gzip_response():
+    """
+    Prueba que una respuesta grande se comprime con gzip y se ajustan sus cabeceras.
+    """
+    body = b'{"items": [' + b'"enlace", ' * 200 + b'"fin"]}'
+
+    headers, chunks = call(response_app(body, headers=[(b"etag", b'"abc"')]), "gzip")
+
+    assert headers["content-encoding"] == "gzip"
+    assert headers["vary"] == "Accept-Encoding"
+    assert headers["etag"] == 'W/"abc"'
+    assert int(headers["content-length"]) == len(chunks[0]) < len(body)
+    assert gzip.decompress(b"".join(chunks)) == body
+
+
+@pytest.mark.parametrize("accept_encoding, body, status, extra_headers", [
+    ("gzip", b"{}", 200, []),
+    (None, b"x" * 1000, 200, []),
+    ("identity", b"x" * 1000, 200, []),
+    ("gzip", b"x" * 1000, 200, [(b"content-encoding", b"br")]),
+    ("gzip", b"", 304, []),
+])
+def test_response_not_compressed(accept_encoding, body, status, extra_headers):
+    """
+    Prueba que no se comprimen respuestas pequeñas, sin codificación aceptada, ya codificadas o 304.
+    """
+    headers, chunks = call(response_app(body, status, extra_headers), accept_encoding)
+
+    assert headers.get("content-encoding") == ("br" if extra_headers else None)
+    assert b"".join(chunks) == body
+
+
+def test_brotli_preferred_when_available(fake_brotli):
+    """
+    Prueba que, con brotli instalado, se elige brotli si el cliente lo acepta.
+    """
+    body = b"x" * 1000
+
+    headers, chunks = call(response_app(body), "gzip, br")
+
+    assert headers["content-encoding"] == "br"
+    assert b"".join(chunks) == b"<" + body + b">."
+    assert fake_brotli.calls == ["process", "finish"]
+
+
+def test_streaming_gzip_flushes_each_chunk():
+    """
+    Prueba que cada fragmento de una respuesta en streaming se puede descomprimir en cuanto llega.
+    """
+    lines = [b'{"i": %d}\n' % i for i in range(3)]
+
+    headers, chunks = call(streaming_app(lines), "gzip")
+
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert [decompressor.decompress(chunk) for chunk in chunks] == lines + [b""]
+    assert decompressor.eof
+
+
+def test_streaming_brotli_flushes_each_chunk(fake_brotli):
+    """
+    Prueba que brotli también vacía el compresor tras cada fragmento en streaming.
+    """
+    headers, chunks = call(streaming_app([b"a", b"b"]), "br")
+
+    assert headers["content-encoding"] == "br"
+    assert chunks == [b"<a>|", b"<b>|", b"."]
+    assert fake_brotli.calls == ["process", "flush", "process", "flush", "finish"]
@@ -0,0 +1,71 @@
+"""
+Pruebas para el contenedor de dependencias (selección de almacenamiento y cachés).
+"""
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.container import Container
+from app.core.settings import Settings
+from app.infrastructure.cache import CachingLinkRepository, CachingUserRepository
+from app.infrastructure.memory import InMemoryLinkRepository, InMemoryUserRepository
+from app.infrastructure.sql import SqlLinkRepository, SqlUserRepository
+from app.interfaces.http.api.v1 import dependences
+from app.main import app
+
+
+def make_container(**overrides) -> Container:
+    return Container(Settings(**{"DATABASE_URL": "sqlite://", **overrides}))
+
+
+@pytest.mark.parametrize("backend, link_class, user_class", [
+    ("memory", InMemoryLinkRepository, InMemoryUserRepository),
+    ("sql", SqlLinkRepository, SqlUserRepository),
+])
+def test_backend_selects_repositories(backend, link_class, user_class):
+    """
+    Prueba que `REPOSITORY_BACKEND` elige los repositorios base que envuelven los adaptadores.
+    """
+    container = make_container(REPOSITORY_BACKEND=backend)
+
+    assert isinstance(container.storage.links.repository, link_class)
+    assert isinstance(container.storage.users.repository, user_class)
+    asyncio.run(container.shutdown())
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_cache_flags_stack_decorators(enabled):
+    """
+    Prueba que las cachés se apilan según la configuración y que todos los servicios
+    comparten las mismas instancias de repositorio.
+    """
+    container = make_container(REPOSITORY_BACKEND="memory", USER_CACHE_ENABLED=enabled, LINK_CACHE_ENABLED=enabled)
+
+    assert isinstance(container.user_repository, CachingUserRepository) == enabled
+    assert isinstance(container.link_repository, CachingLinkRepository) == enabled
+    assert container.link_service.link_repository is container.link_repository
+    assert container.link_purge_service.link_repository is container.link_repository
+    assert container.link_stats_service.link_repository is container.link_repository
+    assert container.user_service.user_repository is container.user_repository
+
+
+def test_routes_use_selected_backend(monkeypatch):
+    """
+    Prueba que las rutas usan el almacenamiento del contenedor: con "sql", un enlace creado
+    por la API queda en la base relacional.
+    """
+    container = make_container(REPOSITORY_BACKEND="sql")
+    monkeypatch.setattr(dependences, "get_app_container", lambda: container)
+    app.dependency_overrides[dependences.get_current_user_uid] = lambda: {"uid": "sql_user", "email": "sql_user@example.com"}
+    try:
+        with TestClient(app) as client:
+            client.post("/api/v1/users/", json={"id": "sql_user", "email": "sql_user@example.com", "username": "sql_user"})
+            response = client.post("/api/v1/sql_user/links", json={"url": "https://example.com/a", "title": "Example", "description": "desc"})
+    finally:
+        app.dependency_overrides.pop(dependences.get_current_user_uid, None)
+
+    assert response.status_code == 201
+    stored = container.storage.links.repository.get_link_by_id(response.json()["id"])
+    assert str(stored.url) == "https://example.com/a"
+    asyncio.run(container.shutdown())
@@ -0,0 +1,94 @@
+"""
+Pruebas para el repositorio de enlaces en memoria y sus índices (InMemoryLinkRepository).
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.domain.models import NewLink
+from app.infrastructure.memory import InMemoryLinkRepository, InMemoryLinkUrlRepository
+
+USER_ID = "memory_user"
+
+
+@pytest.fixture
+def repository():
+    """
+    Fixtura con un repositorio de enlaces en memoria con índice de URLs.
+    """
+    return InMemoryLinkRepository(InMemoryLinkUrlRepository())
+
+
+def new_link(url: str, user_id: str = USER_ID, tags=()) -> NewLink:
+    return NewLink(title="Example", url=url, user_id=user_id, tags=list(tags))
+
+
+def all_pages(repository: InMemoryLinkRepository, user_id: str, limit: int) -> list:
+    """ Recorre todas las páginas de enlaces del usuario y retorna sus ids."""
+    link_ids, cursor = [], None
+    while True:
+        page = repository.get_links_page(user_id, limit, cursor)
+        link_ids += [link.id for link in page.items]
+        if page.next_cursor is None:
+            return link_ids
+        cursor = page.next_cursor
+
+
+def test_tag_index_any_and_all(repository):
+    """
+    Prueba que el índice por tag resuelve la unión y la intersección sin incluir enlaces de otros usuarios.
+    """
+    both = repository.create_link(new_link("https://example.com/a", tags=["python", "web"]))
+    python = repository.create_link(new_link("https://example.com/b", tags=["python"]))
+    repository.create_link(new_link("https://example.com/c", user_id="other_user", tags=["python", "web"]))
+
+    assert [link.id for link in repository.get_links_by_tags(USER_ID, ["python", "web"])] == [both.id, python.id]
+    assert [link.id for link in repository.get_links_by_tags(USER_ID, ["python", "web"], match_all=True)] == [both.id]
+    assert repository.get_links_by_tags(USER_ID, ["python", "rust"], match_all=True) == []
+
+
+def test_indexes_follow_updates_and_deletes(repository):
+    """
+    Prueba que los índices por tag y URL se actualizan al modificar un enlace y quedan vacíos al eliminarlo.
+    """
+    link = repository.create_link(new_link("https://example.com/a", tags=["python"]))
+
+    repository.update_link_if_owned(link.id, USER_ID, {"tags": ["web"], "url": "https://example.com/b"})
+
+    assert repository.get_links_by_tags(USER_ID, ["python"]) == []
+    assert [item.id for item in repository.get_links_by_tags(USER_ID, ["web"])] == [link.id]
+    assert repository.get_links_by_url(USER_ID, "https://example.com/a") == []
+    assert [item.id for item in repository.get_links_by_url(USER_ID, "https://EXAMPLE.com/b/?utm_source=x")] == [link.id]
+
+    repository.delete_link(link.id)
+
+    assert repository.get_links_by_user_id(USER_ID) == []
+    assert (repository._by_user, repository._by_tag, repository._by_url) == ({}, {}, {})
+
+
+def test_pages_follow_creation_order(repository):
+    """
+    Prueba que la paginación por cursor recorre los enlaces del usuario en orden de creación, sin repetir ni omitir.
+    """
+    created = [repository.create_link(new_link(f"https://example.com/{number}")) for number in range(7)]
+    repository.create_link(new_link("https://example.com/otro", user_id="other_user"))
+
+    assert all_pages(repository, USER_ID, limit=3) == [link.id for link in created]
+
+
+def test_concurrent_writes_keep_indexes_consistent(repository):
+    """
+    Prueba que creaciones y eliminaciones concurrentes desde varios hilos dejan los índices consistentes.
+    """
+    def create_and_delete(number: int) -> None:
+        link = repository.create_link(new_link(f"https://example.com/{number}", tags=["python"]))
+        if number % 2:
+            repository.delete_link(link.id)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(create_and_delete, range(200)))
+
+    links = repository.get_links_by_user_id(USER_ID)
+    assert len(links) == 100
+    assert sorted(all_pages(repository, USER_ID, limit=7)) == sorted(link.id for link in links)
+    assert len(repository.get_links_by_tags(USER_ID, ["python"])) == 100
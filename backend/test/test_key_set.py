@@ -0,0 +1,183 @@
+"""
+Pruebas para la verificación local de ID tokens (PublicKeySet y LocalTokenVerifier).
+"""
+import threading
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from firebase_admin.auth import ExpiredIdTokenError, InvalidIdTokenError
+
+from app.infrastructure.auth import LocalTokenVerifier, PublicKeySet
+
+PROJECT_ID = "save-links-test"
+
+
+class FakeResponse:
+    """ Respuesta mínima del endpoint de certificados."""
+
+    def __init__(self, certs: dict, max_age: int = 3600):
+        self.certs = certs
+        self.headers = {"Cache-Control": f"public, max-age={max_age}"}
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> dict:
+        return self.certs
+
+
+@pytest.fixture(scope="module")
+def private_key():
+    """ Llave RSA con la que se firman los tokens de prueba."""
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture(scope="module")
+def public_pem(private_key):
+    """ Llave pública en formato PEM, como la recibe PublicKeySet."""
+    return private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode("ascii")
+
+
+@pytest.fixture
+def verifier(public_pem):
+    """ Verificador local con un conjunto estático de una sola llave ("kid-1")."""
+    return LocalTokenVerifier(PublicKeySet(keys={"kid-1": public_pem}), PROJECT_ID)
+
+
+def make_token(private_key, kid: str = "kid-1", **overrides) -> str:
+    """ Firma un ID token con los claims que emitiría Firebase (sobrescribibles)."""
+    now = int(time.time())
+    claims = {
+        "iss": f"https://securetoken.google.com/{PROJECT_ID}",
+        "aud": PROJECT_ID,
+        "sub": "test_user",
+        "email": "test@example.com",
+        "iat": now,
+        "exp": now + 3600,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, private_key, algorithm="RS256", headers={"kid": kid})
+
+
+def test_static_key_set_returns_known_key(public_pem):
+    """
+    Prueba que un conjunto estático resuelve sus llaves sin acceder a la red.
+    """
+    def fetch_fn(url):
+        raise AssertionError("un conjunto estático no debe descargar certificados")
+
+    key_set = PublicKeySet(keys={"kid-1": public_pem}, fetch_fn=fetch_fn)
+
+    assert key_set.get_key("kid-1") is not None
+    assert key_set.get_key("kid-desconocido") is None
+    assert key_set.expires_at == float("inf")
+
+
+def test_verify_valid_token(verifier, private_key):
+    """
+    Prueba que un token firmado con la llave del conjunto se verifica y expone el `uid`.
+    """
+    claims = verifier.verify(make_token(private_key))
+
+    assert claims["uid"] == "test_user"
+    assert claims["email"] == "test@example.com"
+
+
+def test_verify_unknown_kid(verifier, private_key):
+    """
+    Prueba que un token firmado con un `kid` que no está en el conjunto se rechaza.
+    """
+    with pytest.raises(InvalidIdTokenError):
+        verifier.verify(make_token(private_key, kid="kid-desconocido"))
+
+
+def test_verify_wrong_signature(verifier):
+    """
+    Prueba que un token firmado con otra llave (mismo `kid`) se rechaza.
+    """
+    other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    with pytest.raises(InvalidIdTokenError):
+        verifier.verify(make_token(other_key))
+
+
+def test_verify_wrong_audience(verifier, private_key):
+    """
+    Prueba que un token emitido para otro proyecto se rechaza.
+    """
+    with pytest.raises(InvalidIdTokenError):
+        verifier.verify(make_token(private_key, aud="otro-proyecto"))
+
+
+def test_verify_expired_token(verifier, private_key):
+    """
+    Prueba que un token vencido lanza ExpiredIdTokenError.
+    """
+    now = int(time.time())
+
+    with pytest.raises(ExpiredIdTokenError):
+        verifier.verify(make_token(private_key, iat=now - 7200, exp=now - 3600))
+
+
+def test_unknown_kid_refresh_is_rate_limited(public_pem):
+    """
+    Prueba que un `kid` desconocido sólo fuerza una descarga cada `min_refresh_interval` segundos.
+    """
+    fetches = []
+
+    def fetch_fn(url):
+        fetches.append(url)
+        return FakeResponse({"kid-1": public_pem})
+
+    key_set = PublicKeySet(certs_url="https://example.com/certs", min_refresh_interval=60, fetch_fn=fetch_fn)
+
+    assert key_set.get_key("kid-1") is not None
+    assert key_set.get_key("kid-desconocido") is None
+    assert key_set.get_key("kid-desconocido") is None
+    assert fetches == ["https://example.com/certs"]
+
+
+def test_concurrent_expired_lookups_refresh_once(public_pem):
+    """
+    Prueba que varias peticiones con las llaves expiradas esperan una sola descarga
+    en lugar de descargar los certificados una tras otra.
+    """
+    fetches = []
+
+    def fetch_fn(url):
+        fetches.append(url)
+        time.sleep(0.05)
+        return FakeResponse({"kid-1": public_pem})
+
+    key_set = PublicKeySet(certs_url="https://example.com/certs", fetch_fn=fetch_fn)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(key_set.get_key("kid-1"))) for _ in range(5)]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(fetches) == 1
+    assert len(results) == 5 and all(key is not None for key in results)
+
+
+def test_next_refresh_delay_has_minimum(public_pem):
+    """
+    Prueba que la renovación en segundo plano espera al menos `min_refresh_interval`,
+    aunque `refresh_margin` supere el `max-age` de los certificados.
+    """
+    key_set = PublicKeySet(
+        certs_url="https://example.com/certs", refresh_margin=300, min_refresh_interval=60,
+        fetch_fn=lambda url: FakeResponse({"kid-1": public_pem}, max_age=120),
+    )
+
+    assert key_set.next_refresh_delay() == 0.0
+    key_set.refresh()
+
+    assert 59 <= key_set.next_refresh_delay() <= 60
@@ -0,0 +1,114 @@
+"""
+Pruebas para la eliminación en segundo plano de los enlaces de un usuario (LinkPurgeService).
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.application.services import LinkPurgeService
+from app.domain.models import LinkPurgeJob, NewLink
+from app.infrastructure.adapters import AsyncLinkPurgeJobRepositoryAdapter, AsyncLinkRepositoryAdapter, AsyncUserRepositoryAdapter
+from app.infrastructure.memory import InMemoryLinkPurgeJobRepository, InMemoryLinkRepository, InMemoryLinkUrlRepository, InMemoryUserRepository
+from app.infrastructure.sql import SqlLinkPurgeJobRepository, create_session_factory, create_sql_engine, init_schema
+
+USER_ID = "purge_user"
+USER_DATA = {"uid": USER_ID}
+
+
+@pytest.fixture
+def storage():
+    """
+    Fixtura con repositorios en memoria compartidos por varias instancias del servicio.
+    """
+    urls = InMemoryLinkUrlRepository()
+    links = AsyncLinkRepositoryAdapter(InMemoryLinkRepository(urls), offload=False)
+    users = AsyncUserRepositoryAdapter(InMemoryUserRepository(), offload=False)
+    jobs = AsyncLinkPurgeJobRepositoryAdapter(InMemoryLinkPurgeJobRepository(), offload=False)
+    return links, users, jobs
+
+
+def make_service(storage) -> LinkPurgeService:
+    links, users, jobs = storage
+    return LinkPurgeService(links, users, jobs, page_size=2, max_ops_per_second=10000, heartbeat_seconds=1)
+
+
+async def wait_until_finished(service: LinkPurgeService):
+    """ Espera a que la tarea del usuario termine y retorna su estado."""
+    while True:
+        status = await service.get_purge_status(USER_ID, USER_DATA)
+        if status.status not in ("pending", "running"):
+            return status
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.parametrize("backend", ["memory", "sql"])
+def test_purge_job_repository_round_trip(backend):
+    """
+    Prueba que el repositorio de tareas guarda y reemplaza la tarea de cada usuario.
+    """
+    if backend == "sql":
+        engine = create_sql_engine("sqlite://")
+        init_schema(engine)
+        repository = SqlLinkPurgeJobRepository(create_session_factory(engine))
+    else:
+        repository = InMemoryLinkPurgeJobRepository()
+    started_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    assert repository.get_job(USER_ID) is None
+    repository.save_job(LinkPurgeJob(user_id=USER_ID, started_at=started_at, status="running", updated_at=started_at))
+    repository.save_job(LinkPurgeJob(user_id=USER_ID, started_at=started_at, status="completed", deleted=3,
+                                     finished_at=started_at + timedelta(seconds=5), updated_at=started_at))
+
+    job = repository.get_job(USER_ID)
+    assert (job.status, job.deleted, job.started_at, job.finished_at) == ("completed", 3, started_at, started_at + timedelta(seconds=5))
+
+
+def test_status_is_visible_to_other_instances_and_urls_are_released(storage):
+    """
+    Prueba que otra instancia del servicio lee el estado guardado y que, tras la
+    eliminación, las URLs del usuario quedan libres para volver a crearse.
+    """
+    links, _, _ = storage
+
+    async def scenario():
+        for name in "abcde":
+            await links.create_link(NewLink(title="Example", url=f"https://example.com/{name}", user_id=USER_ID))
+
+        await make_service(storage).enqueue(USER_ID)
+        await wait_until_finished(make_service(storage))
+        status = await make_service(storage).get_purge_status(USER_ID, USER_DATA)
+
+        recreated = await links.create_link(NewLink(title="Example", url="https://example.com/a", user_id=USER_ID))
+        return status, recreated
+
+    status, recreated = asyncio.run(scenario())
+
+    assert (status.status, status.deleted) == ("completed", 5)
+    assert recreated.url == "https://example.com/a"
+
+
+def test_active_job_from_other_instance_is_not_duplicated(storage):
+    """
+    Prueba que no se encola una segunda tarea mientras otra instancia guarda su progreso,
+    y que una tarea sin progreso durante tres intervalos se puede reanudar.
+    """
+    links, _, jobs = storage
+    now = datetime.now(timezone.utc)
+
+    async def scenario():
+        await links.create_link(NewLink(title="Example", url="https://example.com/a", user_id=USER_ID))
+        await jobs.save_job(LinkPurgeJob(user_id=USER_ID, started_at=now, status="running", updated_at=now))
+        service = make_service(storage)
+
+        fresh = await service.enqueue(USER_ID)
+        await jobs.save_job(LinkPurgeJob(user_id=USER_ID, started_at=now, status="running", updated_at=now - timedelta(seconds=10)))
+        resumed = await service.enqueue(USER_ID)
+        status = await wait_until_finished(service)
+        return fresh, resumed, status
+
+    fresh, resumed, status = asyncio.run(scenario())
+
+    assert fresh.started_at == now
+    assert resumed.started_at > now
+    assert (status.status, status.deleted) == ("completed", 1)
@@ -0,0 +1,107 @@
+"""
+Pruebas para la caché de índices de búsqueda por usuario (LinkSearchService).
+"""
+import asyncio
+from functools import partial
+
+import pytest
+
+from app.application.services import LinkSearchService, UserVersionService
+from app.application.services.user_version_service import LINKS_SCOPE
+from app.domain.models import NewLink
+from app.infrastructure.adapters import AsyncLinkRepositoryAdapter, AsyncUserVersionRepositoryAdapter
+from app.infrastructure.memory import InMemoryLinkRepository, InMemoryUserVersionRepository
+
+USER_ID = "search_user"
+
+
+class CountingLinkRepository(AsyncLinkRepositoryAdapter):
+    """ Repositorio de enlaces que cuenta los recorridos completos (construcciones de índices)."""
+
+    def __init__(self, repository):
+        super().__init__(repository, offload=False)
+        self.streams = 0
+
+    def stream_links_by_user_id(self, user_id, fields=None):
+        self.streams += 1
+        return super().stream_links_by_user_id(user_id, fields)
+
+
+@pytest.fixture
+def storage():
+    """
+    Fixtura con un repositorio de enlaces, las versiones de los usuarios y un
+    servicio de búsqueda que valida sus índices contra esas versiones.
+    """
+    links = CountingLinkRepository(InMemoryLinkRepository())
+    versions = UserVersionService(AsyncUserVersionRepositoryAdapter(InMemoryUserVersionRepository(), offload=False))
+    service = LinkSearchService(links, current_version=partial(versions.version, scope=LINKS_SCOPE))
+    return links, versions, service
+
+
+def new_link(title: str, url: str, tags=()) -> NewLink:
+    return NewLink(title=title, url=url, user_id=USER_ID, tags=list(tags))
+
+
+async def search_ids(service: LinkSearchService, query: str) -> list:
+    link_ids, _ = await service.search(USER_ID, service.parse_query(query), limit=10)
+    return link_ids
+
+
+def test_write_from_other_instance_rebuilds_index(storage):
+    """
+    Prueba que una escritura que sólo cambia la versión (hecha por otra instancia)
+    se refleja en la siguiente búsqueda.
+    """
+    links, versions, service = storage
+
+    async def scenario():
+        first = await links.create_link(new_link("Tutorial de Python", "https://example.com/a"))
+        assert await search_ids(service, "python") == [first.id]
+
+        second = await links.create_link(new_link("Python avanzado", "https://example.com/b"))
+        await versions.bump(USER_ID, LINKS_SCOPE)
+
+        assert set(await search_ids(service, "python")) == {first.id, second.id}
+        return links.streams
+
+    assert asyncio.run(scenario()) == 2
+
+
+def test_local_write_keeps_index(storage):
+    """
+    Prueba que una escritura local aplicada tras incrementar la versión actualiza
+    el índice sin reconstruirlo.
+    """
+    links, versions, service = storage
+
+    async def scenario():
+        first = await links.create_link(new_link("Tutorial de Python", "https://example.com/a"))
+        await search_ids(service, "python")
+
+        second = await links.create_link(new_link("Python avanzado", "https://example.com/b"))
+        await versions.bump(USER_ID, LINKS_SCOPE)
+        await service.apply_writes(USER_ID, written=[second], removed=[first.id])
+
+        assert await search_ids(service, "python") == [second.id]
+        return links.streams
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_suggest_reflects_write_from_other_instance(storage):
+    """
+    Prueba que las sugerencias por prefijo también se reconstruyen al cambiar la versión de los enlaces.
+    """
+    links, versions, service = storage
+
+    async def scenario():
+        await links.create_link(new_link("Tutorial", "https://example.com/a", tags=["python"]))
+        assert await service.suggest(USER_ID, "py", limit=10, kind="tag") == [("tag", "python", 1)]
+
+        await links.create_link(new_link("Guía", "https://example.com/b", tags=["python", "pytest"]))
+        await versions.bump(USER_ID, LINKS_SCOPE)
+
+        return await service.suggest(USER_ID, "py", limit=10, kind="tag")
+
+    assert asyncio.run(scenario()) == [("tag", "python", 2), ("tag", "pytest", 1)]
@@ -0,0 +1,143 @@
+"""
+Pruebas para las operaciones en bloque sobre enlaces (LinkService.bulk_update_links).
+"""
+import asyncio
+
+import pytest
+
+from app.application.dtos import LinkBulkOperation
+from app.application.services import LinkService
+from app.domain.models import NewLink
+from app.infrastructure.adapters import AsyncLinkRepositoryAdapter, AsyncLinkUrlRepositoryAdapter
+from app.infrastructure.memory import InMemoryLinkRepository, InMemoryLinkUrlRepository
+
+USER_ID = "bulk_user"
+USER_DATA = {"uid": USER_ID}
+
+
+class StaticUserRepository:
+    """ Repositorio de usuarios mínimo: las operaciones en bloque no consultan al usuario."""
+
+    async def get_user_by_id(self, user_id: str):
+        return None
+
+
+class FlakyLinkRepository(AsyncLinkRepositoryAdapter):
+    """ Repositorio de enlaces que falla al escribir los lotes que contienen `failing_id` y cuenta las lecturas por id."""
+
+    def __init__(self, repository, failing_id: str = None):
+        super().__init__(repository, offload=False)
+        self.failing_id = failing_id
+        self.reads = 0
+
+    async def get_links_by_ids(self, link_ids):
+        self.reads += 1
+        return await super().get_links_by_ids(link_ids)
+
+    async def update_links_if_owned(self, user_id, link_ids, apply):
+        if self.failing_id in link_ids:
+            raise RuntimeError("escritura rechazada")
+        return await super().update_links_if_owned(user_id, link_ids, apply)
+
+    async def delete_links_if_owned(self, user_id, link_ids):
+        if self.failing_id in link_ids:
+            raise RuntimeError("escritura rechazada")
+        return await super().delete_links_if_owned(user_id, link_ids)
+
+
+@pytest.fixture
+def repository():
+    """
+    Fixtura con un repositorio de enlaces en memoria con índice de URLs.
+    """
+    urls = InMemoryLinkUrlRepository()
+    return FlakyLinkRepository(InMemoryLinkRepository(urls)), AsyncLinkUrlRepositoryAdapter(urls, offload=False)
+
+
+def make_service(repository, batch_chunk_size: int = 250) -> LinkService:
+    links, urls = repository
+    return LinkService(links, StaticUserRepository(), batch_chunk_size=batch_chunk_size, url_repository=urls)
+
+
+def create(repository, url: str, user_id: str = USER_ID, tags=()):
+    links, _ = repository
+    return asyncio.run(links.create_link(NewLink(title="Example", url=url, description="Ejemplo", user_id=user_id, tags=list(tags))))
+
+
+def run_bulk(service: LinkService, **operation):
+    return asyncio.run(service.bulk_update_links(USER_ID, LinkBulkOperation(**operation), USER_DATA))
+
+
+def test_add_tags_with_mixed_ownership(repository):
+    """
+    Prueba que los enlaces propios se actualizan y los ajenos o inexistentes se reportan,
+    sin leer los enlaces antes de la escritura.
+    """
+    own = create(repository, "https://example.com/a")
+    foreign = create(repository, "https://example.com/b", user_id="other_user")
+    links, _ = repository
+
+    result = run_bulk(make_service(repository), link_ids=[own.id, foreign.id, "missing", own.id], operation="add_tags", tags=["python"])
+
+    assert [item.status for item in result.results] == ["updated", "forbidden", "not_found"]
+    assert (result.succeeded, result.failed) == (1, 2)
+    assert asyncio.run(links.get_link_by_id(own.id)).tags == ["python"]
+    assert asyncio.run(links.get_link_by_id(foreign.id)).tags == []
+    assert links.reads == 0
+
+
+def test_delete_with_mixed_ownership(repository):
+    """
+    Prueba que una eliminación en bloque no elimina enlaces de otro usuario.
+    """
+    own = create(repository, "https://example.com/a")
+    foreign = create(repository, "https://example.com/b", user_id="other_user")
+    links, _ = repository
+
+    result = run_bulk(make_service(repository), link_ids=[foreign.id, own.id, "missing"], operation="delete")
+
+    assert [item.status for item in result.results] == ["forbidden", "deleted", "not_found"]
+    assert asyncio.run(links.get_link_by_id(own.id)) is None
+    assert asyncio.run(links.get_link_by_id(foreign.id)) is not None
+
+
+@pytest.mark.parametrize("operation", [
+    {"operation": "add_tags", "tags": ["python"]},
+    {"operation": "delete"},
+])
+def test_failed_chunk_does_not_stop_the_rest(repository, operation):
+    """
+    Prueba que un lote que falla se reporta como fallido y los demás lotes se aplican.
+    """
+    first, second, third = (create(repository, f"https://example.com/{name}") for name in "abc")
+    links, _ = repository
+    links.failing_id = second.id
+
+    result = run_bulk(make_service(repository, batch_chunk_size=2), link_ids=[first.id, second.id, third.id], **operation)
+
+    succeeded = "deleted" if operation["operation"] == "delete" else "updated"
+    assert [item.status for item in result.results] == ["failed", "failed", succeeded]
+    assert [item.index for item in result.results] == [0, 1, 2]
+    assert (result.succeeded, result.failed) == (1, 2)
+    assert asyncio.run(links.get_link_by_id(first.id)) is not None
+
+
+def test_update_url_only_first_link_takes_it(repository):
+    """
+    Prueba que, al asignar la misma URL a varios enlaces, sólo el primero la toma y los
+    demás enlaces propios se reportan como duplicados sin modificarse.
+    """
+    first, second = (create(repository, f"https://example.com/{name}") for name in "ab")
+    foreign = create(repository, "https://example.com/c", user_id="other_user")
+    links, _ = repository
+
+    result = run_bulk(
+        make_service(repository),
+        link_ids=[first.id, foreign.id, second.id],
+        operation="update",
+        fields={"url": "https://example.com/nuevo"},
+    )
+
+    assert [item.status for item in result.results] == ["updated", "forbidden", "duplicate"]
+    assert asyncio.run(links.get_link_by_id(first.id)).url == "https://example.com/nuevo"
+    assert asyncio.run(links.get_link_by_id(second.id)).url == "https://example.com/b"
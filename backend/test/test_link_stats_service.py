@@ -0,0 +1,130 @@
+"""
+Pruebas para las estadísticas de enlaces por usuario (LinkStatsService).
+"""
+import asyncio
+import logging
+
+import pytest
+
+from app.application.dtos import LinkCreate, LinkUpdate
+from app.application.services import LinkService, LinkStatsService
+from app.domain.models import LinkStatsDelta, NewLink, User
+from app.infrastructure.adapters import AsyncLinkRepositoryAdapter, AsyncLinkStatsRepositoryAdapter, AsyncUserRepositoryAdapter
+from app.infrastructure.memory import InMemoryLinkRepository, InMemoryLinkStatsRepository, InMemoryUserRepository
+
+USER_ID = "stats_user"
+USER_DATA = {"uid": USER_ID}
+
+
+class FlakyStatsRepository(AsyncLinkStatsRepositoryAdapter):
+    """ Repositorio de estadísticas cuyos incrementos fallan mientras `failing` sea verdadero."""
+
+    def __init__(self, repository):
+        super().__init__(repository, offload=False)
+        self.failing = False
+
+    async def increment_stats(self, user_id, delta, activity_at):
+        if self.failing:
+            raise RuntimeError("almacenamiento no disponible")
+        return await super().increment_stats(user_id, delta, activity_at)
+
+
+class WriteDuringStreamLinkRepository(AsyncLinkRepositoryAdapter):
+    """ Repositorio de enlaces que, en el primer recorrido, registra un incremento concurrente."""
+
+    def __init__(self, repository, on_first_stream):
+        super().__init__(repository, offload=False)
+        self.on_first_stream = on_first_stream
+        self.streams = 0
+
+    async def stream_links_by_user_id(self, user_id, fields=None):
+        self.streams += 1
+        if self.streams == 1:
+            await self.on_first_stream()
+        async for link in super().stream_links_by_user_id(user_id, fields):
+            yield link
+
+
+@pytest.fixture
+def storage():
+    """
+    Fixtura con repositorios en memoria, un usuario existente y los servicios de enlaces y estadísticas.
+    """
+    links = AsyncLinkRepositoryAdapter(InMemoryLinkRepository(), offload=False)
+    user_repository = InMemoryUserRepository()
+    user_repository.create_user(User(id=USER_ID, email="stats@example.com", username="stats"))
+    users = AsyncUserRepositoryAdapter(user_repository, offload=False)
+    stats_repository = FlakyStatsRepository(InMemoryLinkStatsRepository())
+    stats_service = LinkStatsService(links, users, stats_repository, failure_log_interval_seconds=60)
+    link_service = LinkService(links, users, stats_service=stats_service)
+    return link_service, stats_service, stats_repository
+
+
+def create(link_service: LinkService, url: str, tags=()):
+    link = LinkCreate(url=url, title="Example", description="Ejemplo", tags=list(tags))
+    return asyncio.run(link_service.create_link(link, USER_ID, USER_DATA))
+
+
+def test_counters_track_create_update_and_delete(storage):
+    """
+    Prueba que los contadores siguen las creaciones, modificaciones y eliminaciones de enlaces.
+    """
+    link_service, _, stats_repository = storage
+
+    first = create(link_service, "https://example.com/a", tags=["python", "web"])
+    create(link_service, "https://example.com/b", tags=["python"])
+    asyncio.run(link_service.update_link(USER_ID, first.id, LinkUpdate(tags=["web", "fastapi"]), USER_DATA))
+    stats = asyncio.run(stats_repository.get_stats(USER_ID))
+    assert (stats.link_count, stats.tag_counts) == (2, {"python": 1, "web": 1, "fastapi": 1})
+
+    asyncio.run(link_service.delete_link(USER_ID, first.id, USER_DATA))
+    stats = asyncio.run(stats_repository.get_stats(USER_ID))
+    assert (stats.link_count, stats.tag_counts) == (1, {"python": 1})
+    assert sum(stats.created_per_day.values()) == 1
+
+
+def test_failed_increment_warns_once_and_reconcile_repairs_drift(storage, caplog):
+    """
+    Prueba que los incrementos fallidos no interrumpen las escrituras, se advierten una vez
+    por intervalo y que la reconciliación corrige la desviación.
+    """
+    link_service, stats_service, stats_repository = storage
+    create(link_service, "https://example.com/a", tags=["python"])
+
+    stats_repository.failing = True
+    with caplog.at_level(logging.INFO, logger="app_logger"):
+        create(link_service, "https://example.com/b", tags=["python"])
+        create(link_service, "https://example.com/c", tags=["web"])
+    stats_repository.failing = False
+
+    warnings = [record for record in caplog.records if "estadísticas" in record.getMessage()]
+    assert [record.levelno for record in warnings] == [logging.WARNING]
+    assert asyncio.run(stats_repository.get_stats(USER_ID)).link_count == 1
+
+    repaired = asyncio.run(stats_service.reconcile_stats(USER_ID, USER_DATA))
+
+    assert repaired.link_count == 3
+    assert asyncio.run(stats_repository.get_stats(USER_ID)).tag_counts == {"python": 2, "web": 1}
+
+
+def test_rebuild_retries_when_revision_changes(storage):
+    """
+    Prueba que una reconstrucción no descarta un incremento aplicado durante el recorrido:
+    el guardado condicionado a la revisión falla y la reconstrucción se repite.
+    """
+    link_service, stats_service, stats_repository = storage
+    links = link_service.link_repository
+
+    async def concurrent_write():
+        created = await links.create_link(NewLink(title="Example", url="https://example.com/b", user_id=USER_ID, tags=["web"]))
+        await stats_service.record(USER_ID, LinkStatsDelta.between(None, created))
+
+    streaming = WriteDuringStreamLinkRepository(links.repository, concurrent_write)
+    rebuilding = LinkStatsService(streaming, link_service.user_repository, stats_repository)
+    create(link_service, "https://example.com/a", tags=["python"])
+
+    stats = asyncio.run(rebuilding.rebuild(USER_ID))
+
+    assert streaming.streams == 2
+    assert (stats.link_count, stats.tag_counts) == (2, {"python": 1, "web": 1})
+    assert asyncio.run(stats_repository.get_stats(USER_ID)).link_count == 2
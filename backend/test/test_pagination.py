@@ -0,0 +1,111 @@
+"""
+Pruebas para los cursores de paginación de enlaces.
+"""
+import base64
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.exceptions import InvalidCursorException
+from app.core.pagination import decode_cursor, decode_search_cursor, encode_cursor, encode_search_cursor
+from app.domain.models import NewLink
+from app.infrastructure.memory import InMemoryLinkRepository
+
+
+def b64(raw: bytes) -> str:
+    """ Codifica bytes como un cursor (base64url sin relleno)."""
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+@pytest.fixture
+def repository():
+    """
+    Fixtura con un repositorio en memoria con 7 enlaces creados en el mismo instante
+    (el orden entre ellos lo decide el id).
+    """
+    repository = InMemoryLinkRepository()
+    repository.create_links([
+        NewLink(title=f"Enlace {i}", url=f"https://example.com/{i}", user_id="test_user")
+        for i in range(7)
+    ])
+    return repository
+
+
+def test_cursor_round_trip():
+    """
+    Prueba que un cursor decodifica la misma posición con la que se codificó.
+    """
+    created_at = datetime(2026, 10, 18, 12, 30, 15, 123456, tzinfo=timezone.utc)
+
+    cursor = encode_cursor(created_at, "link-1")
+
+    assert decode_cursor(cursor) == (created_at, "link-1")
+    assert "=" not in cursor
+
+
+def test_search_cursor_round_trip():
+    """
+    Prueba que un cursor de búsqueda decodifica la misma puntuación e id.
+    """
+    cursor = encode_search_cursor(3.25, "link-1")
+
+    assert decode_search_cursor(cursor) == (3.25, "link-1")
+
+
+@pytest.mark.parametrize("cursor", [
+    "no es base64!",
+    b64(b"no es json"),
+    b64(b'["2026-10-18T12:00:00+00:00", "link-1"]'),
+    b64(b'{"c": "2026-10-18T12:00:00+00:00"}'),
+    b64(b'{"c": "ayer", "id": "link-1"}'),
+    b64(b'{"c": 12, "id": "link-1"}'),
+])
+def test_tampered_cursor_is_rejected(cursor):
+    """
+    Prueba que un cursor alterado o inventado lanza InvalidCursorException (400).
+    """
+    with pytest.raises(InvalidCursorException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize("cursor", [
+    b64(b'{"s": "alta", "id": "link-1"}'),
+    b64(b'{"id": "link-1"}'),
+    encode_cursor(datetime(2026, 10, 18, tzinfo=timezone.utc), "link-1"),
+])
+def test_tampered_search_cursor_is_rejected(cursor):
+    """
+    Prueba que un cursor de búsqueda inválido (o un cursor de listado) se rechaza.
+    """
+    with pytest.raises(InvalidCursorException):
+        decode_search_cursor(cursor)
+
+
+def test_pages_cover_all_links_once(repository):
+    """
+    Prueba que recorrer las páginas con `next_cursor` entrega cada enlace una sola vez y en orden.
+    """
+    seen = []
+    cursor = None
+    while True:
+        page = repository.get_links_page("test_user", limit=3, cursor=cursor)
+        seen.extend(link.id for link in page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    expected = [link.id for link in repository.get_links_by_user_id("test_user")]
+    assert seen == expected
+    assert len(seen) == 7
+
+
+def test_page_with_tampered_cursor_is_rejected(repository):
+    """
+    Prueba que el repositorio rechaza una página pedida con un cursor alterado.
+    """
+    cursor = repository.get_links_page("test_user", limit=3).next_cursor
+
+    with pytest.raises(InvalidCursorException):
+        repository.get_links_page("test_user", limit=3, cursor=cursor[:-4])
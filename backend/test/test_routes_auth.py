@@ -0,0 +1,98 @@
+"""
+Pruebas para la autenticación de las rutas (dependencia get_current_user_uid).
+"""
+import base64
+import json
+import logging
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from firebase_admin.auth import InvalidIdTokenError
+
+from app.core.logger import LogRateLimiter
+from app.main import app
+from app.infrastructure.auth import FirebaseTokenVerifier
+from app.interfaces.http.api.v1 import dependences
+
+
+def make_token(payload: dict) -> str:
+    """ Construye un token con formato JWT válido (la firma la resuelve el verificador simulado)."""
+    def segment(value: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(value).encode("utf-8")).decode("ascii").rstrip("=")
+    return f"{segment({'alg': 'RS256'})}.{segment(payload)}.firma"
+
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    Fixtura con un cliente de pruebas sobre la aplicación (repositorios en memoria).
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def verify_with(monkeypatch):
+    """
+    Fixtura para sustituir la verificación de tokens del SDK por la función indicada.
+    """
+    monkeypatch.setattr(dependences, "rejection_log_limiter", LogRateLimiter(60))
+
+    def install(verify_fn) -> None:
+        verifier = FirebaseTokenVerifier(cache_max_size=10, cache_ttl_seconds=60, verify_fn=verify_fn)
+        app.dependency_overrides[dependences.get_token_verifier] = lambda: verifier
+    yield install
+    app.dependency_overrides.pop(dependences.get_token_verifier, None)
+
+
+@pytest.fixture
+def token():
+    """ Token bien formado que expira dentro de una hora."""
+    return make_token({"sub": "auth_user", "exp": time.time() + 3600})
+
+
+def test_missing_token_is_rejected(client):
+    """
+    Prueba que una ruta protegida exige la cabecera Authorization.
+    """
+    assert client.get("/api/v1/users/auth_user").status_code == 403
+
+
+def test_invalid_token_returns_401(client, verify_with, token):
+    """
+    Prueba que un token rechazado por el SDK responde 401 con WWW-Authenticate.
+    """
+    def verify_fn(value):
+        raise InvalidIdTokenError("firma inválida")
+    verify_with(verify_fn)
+
+    response = client.get("/api/v1/users/auth_user", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
+
+
+def test_unexpected_error_does_not_leak_details(client, verify_with, token, caplog):
+    """
+    Prueba que un error inesperado del verificador responde un 401 genérico y se registra
+    en el servidor como error, una sola vez por intervalo.
+    """
+    def verify_fn(value):
+        raise RuntimeError("detalle interno del servidor")
+    verify_with(verify_fn)
+
+    with caplog.at_level(logging.INFO, logger="app_logger"):
+        responses = [
+            client.get("/api/v1/users/auth_user", headers={"Authorization": f"Bearer {token}"})
+            for _ in range(2)
+        ]
+
+    for response in responses:
+        assert response.status_code == 401
+        assert "detalle interno" not in response.text
+        assert response.json()["detail"] == "No se pudo validar el token de autenticación."
+    records = [record for record in caplog.records if "Error inesperado" in record.getMessage()]
+    assert len(records) == 1
+    assert records[0].levelno == logging.ERROR
+    assert records[0].exc_info is not None
@@ -0,0 +1,128 @@
+"""
+Pruebas para las peticiones condicionales (ETag / If-None-Match) de las rutas de usuarios y enlaces.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.interfaces.http.api.v1.dependences import get_current_user_uid
+
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    Fixtura con un cliente de pruebas sobre la aplicación (repositorios en memoria).
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def login():
+    """
+    Fixtura para simular la autenticación de Firebase como el usuario indicado.
+    """
+    def authenticate(uid: str) -> None:
+        app.dependency_overrides[get_current_user_uid] = lambda: {"uid": uid, "email": f"{uid}@example.com"}
+    yield authenticate
+    app.dependency_overrides.pop(get_current_user_uid, None)
+
+
+def create_user(client: TestClient, uid: str) -> None:
+    response = client.post("/api/v1/users/", json={"id": uid, "email": f"{uid}@example.com", "username": uid})
+    assert response.status_code == 201
+
+
+def create_link(client: TestClient, uid: str, url: str) -> dict:
+    response = client.post(f"/api/v1/{uid}/links", json={"url": url, "title": "Example", "description": "desc", "tags": ["python"]})
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_get_user_returns_304_if_none_match(client, login):
+    """
+    Prueba que un usuario sin cambios responde 304 sin cuerpo al repetir su ETag.
+    """
+    login("etag_user_1")
+    create_user(client, "etag_user_1")
+
+    response = client.get("/api/v1/users/etag_user_1")
+    etag = response.headers["etag"]
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    response = client.get("/api/v1/users/etag_user_1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    # Comparación débil y listas de ETags
+    response = client.get("/api/v1/users/etag_user_1", headers={"If-None-Match": f'"otro", W/{etag}'})
+    assert response.status_code == 304
+
+
+def test_user_update_changes_etag(client, login):
+    """
+    Prueba que modificar el usuario invalida el ETag anterior.
+    """
+    login("etag_user_2")
+    create_user(client, "etag_user_2")
+    etag = client.get("/api/v1/users/etag_user_2").headers["etag"]
+
+    client.put("/api/v1/users/etag_user_2", json={"username": "renombrado"})
+
+    response = client.get("/api/v1/users/etag_user_2", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["username"] == "renombrado"
+    assert response.headers["etag"] != etag
+
+
+def test_get_links_returns_304_if_none_match(client, login):
+    """
+    Prueba que la lista de enlaces sin cambios responde 304 y que cada parámetro de lectura tiene su ETag.
+    """
+    login("etag_user_3")
+    create_user(client, "etag_user_3")
+    create_link(client, "etag_user_3", "https://example.com/1")
+
+    etag = client.get("/api/v1/etag_user_3/links").headers["etag"]
+
+    assert client.get("/api/v1/etag_user_3/links", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/api/v1/etag_user_3/links", headers={"If-None-Match": "*"}).status_code == 304
+    assert client.get("/api/v1/etag_user_3/links?fields=title", headers={"If-None-Match": etag}).status_code == 200
+
+
+@pytest.mark.parametrize("operation", ["create", "update", "delete"])
+def test_link_writes_change_links_etag(client, login, operation):
+    """
+    Prueba que crear, modificar o eliminar un enlace invalida el ETag de la lista.
+    """
+    uid = f"etag_user_{operation}"
+    login(uid)
+    create_user(client, uid)
+    link = create_link(client, uid, "https://example.com/1")
+    etag = client.get(f"/api/v1/{uid}/links").headers["etag"]
+
+    if operation == "create":
+        create_link(client, uid, "https://example.com/2")
+    elif operation == "update":
+        assert client.put(f"/api/v1/{uid}/links/{link['id']}", json={"title": "Nuevo"}).status_code == 200
+    else:
+        assert client.delete(f"/api/v1/{uid}/links/{link['id']}").status_code == 204
+
+    assert client.get(f"/api/v1/{uid}/links", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_etag_does_not_bypass_ownership(client, login):
+    """
+    Prueba que un ETag vigente no permite a otro usuario leer (ni confirmar) la lista de enlaces.
+    """
+    login("etag_owner")
+    create_user(client, "etag_owner")
+    create_link(client, "etag_owner", "https://example.com/1")
+    etag = client.get("/api/v1/etag_owner/links").headers["etag"]
+
+    login("etag_intruder")
+    response = client.get("/api/v1/etag_owner/links", headers={"If-None-Match": etag})
+    assert response.status_code == 403
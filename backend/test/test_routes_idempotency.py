@@ -0,0 +1,156 @@
+"""
+Pruebas para la creación idempotente de enlaces (cabecera Idempotency-Key y LINK_ID_MODE="url").
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.services import LinkService
+from app.container import get_container
+from app.main import app
+from app.interfaces.http.api.v1.dependences import get_current_user_uid, get_link_service
+
+
+class StaleUrlRepository:
+    """ Índice de URLs que no ve las escrituras aún no confirmadas de otra petición (lectura desactualizada)."""
+
+    async def get_link_ids(self, user_id, url_keys):
+        return {}
+
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    Fixtura con un cliente de pruebas sobre la aplicación (repositorios en memoria).
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def login():
+    """
+    Fixtura para simular la autenticación de Firebase como el usuario indicado.
+    """
+    def authenticate(uid: str) -> None:
+        app.dependency_overrides[get_current_user_uid] = lambda: {"uid": uid, "email": f"{uid}@example.com"}
+    yield authenticate
+    app.dependency_overrides.pop(get_current_user_uid, None)
+
+
+def create_user(client: TestClient, uid: str) -> None:
+    response = client.post("/api/v1/users/", json={"id": uid, "email": f"{uid}@example.com", "username": uid})
+    assert response.status_code == 201
+
+
+@pytest.fixture
+def link_service_with():
+    """
+    Fixtura para sustituir el servicio de enlaces por uno con los repositorios de la aplicación
+    y las opciones indicadas.
+    """
+    def install(**options) -> None:
+        container = get_container()
+        service = LinkService(
+            container.link_repository,
+            container.user_repository,
+            search_service=container.link_search_service,
+            version_service=container.user_version_service,
+            **{"url_repository": container.storage.link_urls, **options},
+        )
+        app.dependency_overrides[get_link_service] = lambda: service
+    yield install
+    app.dependency_overrides.pop(get_link_service, None)
+
+
+def post_link(client: TestClient, uid: str, url: str, key: str = None, title: str = "Example"):
+    headers = {"Idempotency-Key": key} if key else {}
+    return client.post(f"/api/v1/{uid}/links", json={"url": url, "title": title, "description": "desc"}, headers=headers)
+
+
+def test_replay_returns_original_link(client, login):
+    """
+    Prueba que repetir la creación con la misma clave retorna el enlace original sin crear otro.
+    """
+    login("idem_user_1")
+    create_user(client, "idem_user_1")
+
+    first = post_link(client, "idem_user_1", "https://example.com/a", key="clave-1")
+    replay = post_link(client, "idem_user_1", "https://example.com/a", key="clave-1", title="Reintento")
+
+    assert first.status_code == replay.status_code == 201
+    assert replay.json() == first.json()
+    assert len(client.get("/api/v1/idem_user_1/links").json()) == 1
+
+
+def test_reused_key_with_other_url_returns_422(client, login):
+    """
+    Prueba que reutilizar una clave con otra URL se rechaza con 422 y no crea un enlace.
+    """
+    login("idem_user_2")
+    create_user(client, "idem_user_2")
+    post_link(client, "idem_user_2", "https://example.com/a", key="clave-1")
+
+    response = post_link(client, "idem_user_2", "https://example.com/b", key="clave-1")
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "La clave de idempotencia ya se uso para crear un enlace con otra URL."
+    assert [link["url"] for link in client.get("/api/v1/idem_user_2/links").json()] == ["https://example.com/a"]
+
+
+def test_new_key_for_saved_url_returns_409(client, login):
+    """
+    Prueba que una clave nueva para una URL que el usuario ya guardó se rechaza como duplicado.
+    """
+    login("idem_user_3")
+    create_user(client, "idem_user_3")
+    existing = post_link(client, "idem_user_3", "https://example.com/a").json()
+
+    response = post_link(client, "idem_user_3", "https://example.com/a/?utm_source=x", key="clave-1")
+
+    assert response.status_code == 409
+    assert existing["id"] in response.json()["detail"]
+
+
+def test_concurrent_duplicate_is_rejected_by_repository(client, login, link_service_with):
+    """
+    Prueba que, si la lectura del índice de URLs no ve la creación de una petición concurrente,
+    la escritura condicionada del repositorio rechaza el duplicado y la repetición sigue retornando el original.
+    """
+    login("idem_user_4")
+    create_user(client, "idem_user_4")
+    link_service_with(url_repository=StaleUrlRepository())
+
+    first = post_link(client, "idem_user_4", "https://example.com/a", key="clave-1")
+    duplicate = post_link(client, "idem_user_4", "https://example.com/a", key="clave-2")
+    replay = post_link(client, "idem_user_4", "https://example.com/a", key="clave-1")
+
+    assert first.status_code == 201
+    assert duplicate.status_code == 409
+    assert replay.json()["id"] == first.json()["id"]
+    assert len(client.get("/api/v1/idem_user_4/links").json()) == 1
+
+
+def test_url_mode_after_url_change(client, login, link_service_with):
+    """
+    Prueba que en LINK_ID_MODE="url" repetir una creación retorna el enlace existente y que, si
+    el enlace que conserva el id derivado cambió de URL, la URL anterior se puede volver a crear
+    mientras la nueva se rechaza como duplicado.
+    """
+    login("idem_user_5")
+    create_user(client, "idem_user_5")
+    link_service_with(link_id_mode="url")
+
+    original = post_link(client, "idem_user_5", "https://example.com/a").json()
+    assert post_link(client, "idem_user_5", "https://example.com/a").json()["id"] == original["id"]
+
+    moved = client.put(f"/api/v1/idem_user_5/links/{original['id']}", json={"url": "https://example.com/b"})
+    assert moved.status_code == 200
+
+    recreated = post_link(client, "idem_user_5", "https://example.com/a")
+    assert recreated.status_code == 201
+    assert recreated.json()["id"] != original["id"]
+
+    duplicate = post_link(client, "idem_user_5", "https://example.com/b")
+    assert duplicate.status_code == 409
+    assert original["id"] in duplicate.json()["detail"]
@@ -0,0 +1,127 @@
+"""
+Pruebas para las rutas de enlaces (creación en bloque y filtro por tags).
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.interfaces.http.api.v1.dependences import get_current_user_uid
+
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    Fixtura con un cliente de pruebas sobre la aplicación (repositorios en memoria).
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def login():
+    """
+    Fixtura para simular la autenticación de Firebase como el usuario indicado.
+    """
+    def authenticate(uid: str) -> None:
+        app.dependency_overrides[get_current_user_uid] = lambda: {"uid": uid, "email": f"{uid}@example.com"}
+    yield authenticate
+    app.dependency_overrides.pop(get_current_user_uid, None)
+
+
+def create_user(client: TestClient, uid: str) -> None:
+    response = client.post("/api/v1/users/", json={"id": uid, "email": f"{uid}@example.com", "username": uid})
+    assert response.status_code == 201
+
+
+def link_body(url: str, tags=()) -> dict:
+    return {"url": url, "title": "Example", "description": "desc", "tags": list(tags)}
+
+
+def test_batch_reports_each_item(client, login):
+    """
+    Prueba que la creación en bloque crea los elementos válidos y reporta por posición
+    los inválidos, las URLs ya guardadas y las repetidas dentro del mismo lote.
+    """
+    login("routes_batch_1")
+    create_user(client, "routes_batch_1")
+    saved = client.post("/api/v1/routes_batch_1/links", json=link_body("https://example.com/guardado")).json()
+
+    response = client.post("/api/v1/routes_batch_1/links:batch", json=[
+        link_body("https://example.com/a"),
+        {"url": "no es una url", "title": "Example", "description": "desc"},
+        link_body("https://example.com/guardado/?utm_source=x"),
+        link_body("https://EXAMPLE.com/a/"),
+        link_body("https://example.com/b"),
+    ])
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["status"] for item in body["results"]] == ["created", "invalid", "duplicate", "duplicate", "created"]
+    assert [item["index"] for item in body["results"]] == [0, 1, 2, 3, 4]
+    assert (body["succeeded"], body["failed"]) == (2, 3)
+    assert body["results"][1]["error"].startswith("url:")
+    assert body["results"][2]["link_id"] == saved["id"]
+    assert body["results"][3]["error"] == "La URL se repite en el lote."
+    assert body["results"][0]["link"]["url"] == "https://example.com/a"
+    urls = sorted(link["url"] for link in client.get("/api/v1/routes_batch_1/links").json())
+    assert urls == ["https://example.com/a", "https://example.com/b", "https://example.com/guardado"]
+
+
+def test_batch_for_other_user_is_forbidden(client, login):
+    """
+    Prueba que no se pueden crear enlaces en bloque para otro usuario.
+    """
+    login("routes_batch_2")
+    create_user(client, "routes_batch_2")
+
+    response = client.post("/api/v1/other_user/links:batch", json=[link_body("https://example.com/a")])
+
+    assert response.status_code == 403
+
+
+def read_pages(client: TestClient, url: str) -> list:
+    """ Recorre las páginas de una consulta siguiendo `X-Next-Cursor` y retorna las páginas de ids."""
+    pages, cursor = [], None
+    while True:
+        response = client.get(f"{url}&cursor={cursor}" if cursor else url)
+        assert response.status_code == 200
+        pages.append([link["id"] for link in response.json()])
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            return pages
+
+
+def test_tag_filter_pages_with_cursor(client, login):
+    """
+    Prueba que el filtro por tags se pagina con `limit` y `cursor` en orden de creación,
+    sin repetir ni omitir enlaces, con las semánticas any y all.
+    """
+    login("routes_tags_1")
+    create_user(client, "routes_tags_1")
+    tags = [["python"], ["python", "web"], ["web"], ["python", "web"], ["python"], ["rust"]]
+    ids = [
+        client.post("/api/v1/routes_tags_1/links", json=link_body(f"https://example.com/{number}", link_tags)).json()["id"]
+        for number, link_tags in enumerate(tags)
+    ]
+
+    pages = read_pages(client, "/api/v1/routes_tags_1/links?tag=python&limit=2")
+    assert pages == [[ids[0], ids[1]], [ids[3], ids[4]]]
+
+    pages = read_pages(client, "/api/v1/routes_tags_1/links?tag=python&tag=web&tag_match=all&limit=1")
+    assert pages == [[ids[1]], [ids[3]]]
+
+    pages = read_pages(client, "/api/v1/routes_tags_1/links?tag=python&tag=rust&limit=4&fields=title")
+    assert pages == [[ids[0], ids[1], ids[3], ids[4]], [ids[5]]]
+
+
+def test_tag_filter_rejects_invalid_cursor(client, login):
+    """
+    Prueba que un cursor inválido en el filtro por tags se rechaza con 400.
+    """
+    login("routes_tags_2")
+    create_user(client, "routes_tags_2")
+
+    response = client.get("/api/v1/routes_tags_2/links", params={"tag": "python", "cursor": "no-es-un-cursor"})
+
+    assert response.status_code == 400
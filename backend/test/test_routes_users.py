@@ -0,0 +1,79 @@
+"""
+Pruebas para las rutas de usuarios y la caché de usuarios existentes (CachingUserRepository).
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.container import get_container
+from app.infrastructure.cache import CachingUserRepository
+from app.main import app
+from app.interfaces.http.api.v1.dependences import get_current_user_uid
+
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    Fixtura con un cliente de pruebas sobre la aplicación (repositorios en memoria).
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def login():
+    """
+    Fixtura para simular la autenticación de Firebase como el usuario indicado.
+    """
+    def authenticate(uid: str) -> None:
+        app.dependency_overrides[get_current_user_uid] = lambda: {"uid": uid, "email": f"{uid}@example.com"}
+    yield authenticate
+    app.dependency_overrides.pop(get_current_user_uid, None)
+
+
+@pytest.fixture
+def user_cache():
+    """
+    Fixtura con la caché de usuarios de la aplicación.
+    """
+    repository = get_container().user_repository
+    assert isinstance(repository, CachingUserRepository)
+    return repository.cache
+
+
+def create_user(client: TestClient, uid: str) -> None:
+    response = client.post("/api/v1/users/", json={"id": uid, "email": f"{uid}@example.com", "username": uid})
+    assert response.status_code == 201
+
+
+def test_update_replaces_cached_user(client, login, user_cache):
+    """
+    Prueba que actualizar un usuario reemplaza su entrada en la caché y la lectura siguiente la refleja.
+    """
+    login("routes_user_1")
+    create_user(client, "routes_user_1")
+    assert client.get("/api/v1/users/routes_user_1").json()["username"] == "routes_user_1"
+
+    response = client.put("/api/v1/users/routes_user_1", json={"username": "nuevo_nombre"})
+
+    assert response.status_code == 200
+    assert user_cache.peek("routes_user_1").username == "nuevo_nombre"
+    assert client.get("/api/v1/users/routes_user_1").json()["username"] == "nuevo_nombre"
+
+
+def test_delete_evicts_cached_user(client, login, user_cache):
+    """
+    Prueba que eliminar un usuario lo retira de la caché: ni su lectura ni la creación
+    de enlaces lo encuentran después.
+    """
+    login("routes_user_2")
+    create_user(client, "routes_user_2")
+    client.get("/api/v1/users/routes_user_2")
+    assert user_cache.peek("routes_user_2") is not None
+
+    assert client.delete("/api/v1/users/routes_user_2").status_code == 202
+
+    assert user_cache.peek("routes_user_2") is None
+    assert client.get("/api/v1/users/routes_user_2").status_code == 404
+    link = {"url": "https://example.com/a", "title": "Example", "description": "desc"}
+    assert client.post("/api/v1/routes_user_2/links", json=link).status_code == 404
@@ -0,0 +1,153 @@
+"""
+Pruebas para los índices de búsqueda de texto (InvertedIndex) y de autocompletado (PrefixIndex).
+"""
+import pytest
+
+from app.core.search import InvertedIndex, PrefixIndex, fold_text, single_edits, tokenize
+
+
+@pytest.fixture
+def index():
+    """
+    Fixtura con un índice de tres documentos, donde el título pesa más que la descripción.
+    """
+    index = InvertedIndex({"title": 3.0, "description": 1.0})
+    index.add("titulo", {"title": "Tutorial de Python", "description": "Aprende a programar"})
+    index.add("descripcion", {"title": "Curso de programación", "description": "Ejemplos en Python"})
+    index.add("otro", {"title": "Recetas de cocina", "description": None})
+    return index
+
+
+@pytest.fixture
+def prefix_index():
+    """
+    Fixtura con un índice de prefijos de tags y palabras de título.
+    """
+    prefix_index = PrefixIndex(max_results=10)
+    prefix_index.add("link-1", [("tag", "Python"), ("tag", "pytest"), ("title", "python")])
+    prefix_index.add("link-2", [("tag", "Python"), ("tag", "Programación")])
+    prefix_index.add("link-3", [("tag", "Python"), ("tag", "pytest"), ("tag", "rust")])
+    return prefix_index
+
+
+def test_fold_text_and_tokenize():
+    """
+    Prueba que la normalización ignora mayúsculas y acentos y descarta palabras vacías y prefijos de URL.
+    """
+    assert fold_text("Canción ÁRBOL") == "cancion arbol"
+    assert tokenize("La Canción de https://www.example.com") == ["cancion", "example", "com"]
+
+
+def test_search_ranks_title_matches_first(index):
+    """
+    Prueba que un término en el título puntúa más que el mismo término en la descripción.
+    """
+    results = index.search(["python"], limit=10)
+
+    assert [doc_id for _, doc_id in results] == ["titulo", "descripcion"]
+    assert results[0][0] > results[1][0]
+
+
+def test_search_ranks_rare_terms_higher(index):
+    """
+    Prueba que un término raro (mayor IDF) pesa más que uno que aparece en más documentos.
+    """
+    index.add("cuarto", {"title": "Python", "description": "Más python"})
+
+    results = index.search(["cocina", "python"], limit=10)
+
+    assert results[0][1] == "otro"
+
+
+def test_search_accent_insensitive(index):
+    """
+    Prueba que los términos de la consulta se comparan sin acentos.
+    """
+    results = index.search(tokenize("PROGRAMACIÓN"), limit=10)
+
+    assert [doc_id for _, doc_id in results] == ["descripcion"]
+
+
+def test_search_paginates_with_after(index):
+    """
+    Prueba que `after` continúa la búsqueda desde el último resultado entregado.
+    """
+    first_page = index.search(["python"], limit=1)
+    second_page = index.search(["python"], limit=1, after=first_page[-1])
+
+    assert [doc_id for _, doc_id in first_page + second_page] == ["titulo", "descripcion"]
+    assert index.search(["python"], limit=1, after=second_page[-1]) == []
+
+
+def test_remove_and_reindex(index):
+    """
+    Prueba que retirar o reindexar un documento actualiza sus términos.
+    """
+    index.remove("otro")
+    index.add("titulo", {"title": "Guía de Rust", "description": None})
+
+    assert "otro" not in index
+    assert index.search(["cocina"], limit=10) == []
+    assert [doc_id for _, doc_id in index.search(["python"], limit=10)] == ["descripcion"]
+    assert index.document_frequency("rust") == 1
+    assert len(index) == 2
+
+
+def test_complete_ranks_by_document_count(prefix_index):
+    """
+    Prueba que las sugerencias de un prefijo se ordenan por número de documentos.
+    """
+    assert prefix_index.complete("py", limit=10) == [
+        ("tag", "Python", 3),
+        ("tag", "pytest", 2),
+        ("title", "python", 1),
+    ]
+
+
+def test_complete_filters_by_kind_and_limit(prefix_index):
+    """
+    Prueba el filtro por tipo de término y el límite de sugerencias.
+    """
+    assert prefix_index.complete("py", limit=10, kind="title") == [("title", "python", 1)]
+    assert prefix_index.complete("p", limit=2, kind="tag") == [("tag", "Python", 3), ("tag", "pytest", 2)]
+
+
+def test_complete_ignores_case_and_accents(prefix_index):
+    """
+    Prueba que el prefijo se compara sin mayúsculas ni acentos.
+    """
+    assert prefix_index.complete("PROGRAMACIÓ", limit=10) == [("tag", "Programación", 1)]
+
+
+def test_complete_updates_after_remove(prefix_index):
+    """
+    Prueba que retirar un documento actualiza los conteos, incluso de prefijos cuyo ranking estaba guardado.
+    """
+    prefix_index.complete("py", limit=10)
+
+    prefix_index.remove("link-3")
+    prefix_index.remove("link-1")
+
+    assert prefix_index.complete("py", limit=10) == [("tag", "Python", 1)]
+    assert prefix_index.complete("ru", limit=10) == []
+
+
+def test_complete_fuzzy(prefix_index):
+    """
+    Prueba que, con `fuzzy`, un prefijo con un error de escritura completa con términos cercanos.
+    """
+    assert prefix_index.complete("pyhton", limit=10) == []
+    assert prefix_index.complete("pyhton", limit=10, fuzzy=True) == [("tag", "Python", 3), ("title", "python", 1)]
+    assert prefix_index.complete("ru", limit=10, fuzzy=True) == [("tag", "rust", 1)]
+    assert prefix_index.complete("rs", limit=10, fuzzy=True) == []
+
+
+def test_single_edits():
+    """
+    Prueba las variantes a distancia de edición 1 de un texto.
+    """
+    variants = single_edits("abc")
+
+    assert {"bc", "bac", "abd", "abcd", "xabc"} <= variants
+    assert "abc" not in variants
+    assert "cab" not in variants
@@ -0,0 +1,115 @@
+"""
+Pruebas para la inicialización de la base de datos relacional (WAL y relleno de índices).
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import insert, select, text
+
+from app.core.urls import url_key
+from app.domain.models import NewLink
+from app.infrastructure.sql import SqlLinkRepository, create_session_factory, create_sql_engine, init_schema, rebuild_link_urls
+from app.infrastructure.sql.models import Base, LinkModel, LinkTagModel, LinkUrlModel
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """
+    Fixtura que crea un engine sobre un archivo SQLite temporal (WAL no aplica a bases en memoria).
+    """
+    engine = create_sql_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    yield engine
+    engine.dispose()
+
+
+def insert_legacy_links(engine, rows):
+    """ Inserta enlaces directamente en `links`, como en una base anterior a los índices."""
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(LinkModel), rows)
+
+
+def test_engine_enables_wal(engine):
+    """
+    Prueba que cada conexión SQLite se abre en modo WAL con los PRAGMA configurados.
+    """
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert connection.execute(text("PRAGMA foreign_keys")).scalar() == 1
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+
+def test_in_memory_engine_shares_connection():
+    """
+    Prueba que una base en memoria conserva sus tablas entre sesiones (una sola conexión).
+    """
+    engine = create_sql_engine("sqlite://")
+    init_schema(engine)
+    repository = SqlLinkRepository(create_session_factory(engine))
+
+    link = repository.create_link(NewLink(title="Example", url="https://example.com", user_id="test_user"))
+
+    assert repository.get_link_by_id(link.id) == link
+
+
+def test_init_schema_backfills_tags_and_urls(engine):
+    """
+    Prueba que `init_schema` rellena `link_tags` y `link_urls` a partir de los enlaces existentes,
+    registrando el enlace más antiguo de cada URL.
+    """
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    insert_legacy_links(engine, [
+        {"id": "nuevo", "url": "https://Example.com/a/?utm_source=x", "title": "A", "user_id": "test_user",
+         "tags": ["python"], "created_at": created_at + timedelta(days=1)},
+        {"id": "antiguo", "url": "https://example.com/a", "title": "A", "user_id": "test_user",
+         "tags": ["python", "web", "python"], "created_at": created_at},
+        {"id": "otro_usuario", "url": "https://example.com/a", "title": "A", "user_id": "other_user",
+         "tags": [], "created_at": created_at},
+    ])
+
+    init_schema(engine)
+
+    with engine.connect() as connection:
+        tags = connection.execute(select(LinkTagModel.link_id, LinkTagModel.tag)).all()
+        urls = connection.execute(select(LinkUrlModel.user_id, LinkUrlModel.url_key, LinkUrlModel.link_id)).all()
+
+    assert sorted(tags) == [("antiguo", "python"), ("antiguo", "web"), ("nuevo", "python")]
+    key = url_key("https://example.com/a")
+    assert sorted(urls) == [("other_user", key, "otro_usuario"), ("test_user", key, "antiguo")]
+
+
+def test_init_schema_backfill_runs_once(engine):
+    """
+    Prueba que `init_schema` no vuelve a rellenar índices que ya tienen filas.
+    """
+    insert_legacy_links(engine, [
+        {"id": "link-1", "url": "https://example.com/1", "title": "A", "user_id": "test_user", "tags": ["python"]},
+    ])
+    init_schema(engine)
+    repository = SqlLinkRepository(create_session_factory(engine))
+    repository.create_link(NewLink(title="B", url="https://example.com/2", user_id="test_user", tags=["python"]))
+
+    init_schema(engine)
+
+    with engine.connect() as connection:
+        assert len(connection.execute(select(LinkTagModel.link_id)).all()) == 2
+        assert len(connection.execute(select(LinkUrlModel.link_id)).all()) == 2
+    assert len(repository.get_links_by_tags("test_user", ["python"])) == 2
+
+
+def test_rebuild_link_urls_replaces_stale_keys(engine):
+    """
+    Prueba que `rebuild_link_urls` reemplaza las claves que ya no corresponden a la URL canónica del enlace.
+    """
+    insert_legacy_links(engine, [
+        {"id": "link-1", "url": "https://app.example.com/#/a", "title": "A", "user_id": "test_user", "tags": []},
+    ])
+    with engine.begin() as connection:
+        connection.execute(insert(LinkUrlModel), [{"user_id": "test_user", "url_key": "obsoleta", "link_id": "link-1"}])
+
+    rebuild_link_urls(engine)
+
+    with engine.connect() as connection:
+        urls = connection.execute(select(LinkUrlModel.url_key, LinkUrlModel.link_id)).all()
+    assert urls == [(url_key("https://app.example.com/#/a"), "link-1")]
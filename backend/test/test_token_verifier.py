@@ -0,0 +1,248 @@
+"""
+Pruebas para el verificador de ID tokens con caché (FirebaseTokenVerifier).
+"""
+import asyncio
+import base64
+import json
+import time
+
+import pytest
+from firebase_admin.auth import ExpiredIdTokenError, InvalidIdTokenError
+from pydantic import ValidationError
+
+from app.core import cache as cache_module
+from app.core.settings import Settings
+from app.infrastructure.auth import FirebaseTokenVerifier, UnverifiedTokenVerifier
+
+
+class FakeClock:
+    """ Reloj monotónico controlado por la prueba (sustituye a `time` en la caché)."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeVerify:
+    """ Sustituto de `auth.verify_id_token` que cuenta sus llamadas."""
+
+    def __init__(self, error: Exception = None, lifetime: float = 3600):
+        self.calls = 0
+        self.error = error
+        self.lifetime = lifetime
+
+    def __call__(self, token: str) -> dict:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return {"uid": "test_user", "email": "test@example.com", "exp": time.time() + self.lifetime}
+
+
+def make_token(payload: dict, header: dict = None) -> str:
+    """ Construye un token con formato JWT (la firma no se verifica en estas pruebas)."""
+    def segment(value: dict) -> str:
+        raw = json.dumps(value).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+    return f"{segment(header or {'alg': 'RS256'})}.{segment(payload)}.firma"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Fixtura que congela el reloj de las cachés para controlar la expiración de las entradas.
+    """
+    fake_clock = FakeClock()
+    monkeypatch.setattr(cache_module, "time", fake_clock)
+    return fake_clock
+
+
+@pytest.fixture
+def valid_token():
+    """ Token bien formado que expira dentro de una hora."""
+    return make_token({"sub": "test_user", "exp": time.time() + 3600})
+
+
+def test_verify_caches_valid_token(clock, valid_token):
+    """
+    Prueba que un token válido sólo se verifica con el SDK la primera vez.
+    """
+    verify_fn = FakeVerify()
+    verifier = FirebaseTokenVerifier(cache_max_size=10, cache_ttl_seconds=300, verify_fn=verify_fn)
+
+    first = verifier.verify(valid_token)
+    second = verifier.verify(valid_token)
+
+    assert first == second
+    assert first["uid"] == "test_user"
+    assert verify_fn.calls == 1
+    assert verifier.stats()["hits"] == 1
+
+
+def test_verify_async_uses_cache(clock, valid_token):
+    """
+    Prueba que la versión asíncrona comparte la caché con la síncrona.
+    """
+    verify_fn = FakeVerify()
+    verifier = FirebaseTokenVerifier(cache_max_size=10, cache_ttl_seconds=300, verify_fn=verify_fn)
+
+    verifier.verify(valid_token)
+    decoded_token = asyncio.run(verifier.verify_async(valid_token))
+
+    assert decoded_token["uid"] == "test_user"
+    assert verify_fn.calls == 1
+    verifier.shutdown()
+
+
+def test_cached_token_expires_after_ttl(clock, valid_token):
+    """
+    Prueba que, vencido el TTL de la caché, el token se vuelve a verificar.
+    """
+    verify_fn = FakeVerify()
+    verifier = FirebaseTokenVerifier(cache_max_size=10, cache_ttl_seconds=300, verify_fn=verify_fn)
+
+    verifier.verify(valid_token)
+    clock.advance(299)
+    verifier.verify(valid_token)
+    assert verify_fn.calls == 1
+
+    clock.advance(2)
+    verifier.verify(valid_token)
+    assert verify_fn.calls == 2
+
+
+def test_cached_token_expires_with_exp_claim(clock, valid_token):
+    """
+    Prueba que una entrada no sobrevive al claim `exp` del token aunque el TTL sea mayor.
+    """
+    verify_fn = FakeVerify(lifetime=60)
+    verifier = FirebaseTokenVerifier(cache_max_size=10, cache_ttl_seconds=300, verify_fn=verify_fn)
+
+    verifier.verify(valid_token)
+    clock.advance(61)
+    verifier.verify(valid_token)
+
+    assert verify_fn.calls == 2
+
+
+def test_cache_is_keyed_by_token_hash(clock, valid_token):
+    """
+    Prueba que la caché no guarda el token en claro.
+    """
+    verifier = FirebaseTokenVerifier(cache_max_size=10, cache_ttl_seconds=300, verify_fn=FakeVerify())
+
+    verifier.verify(valid_token)
+
+    assert verifier.cache.peek(valid_token) is None
+    assert verifier.cache.peek(FirebaseTokenVerifier._token_key(valid_token)) is not None
+
+
+def test_rejected_token_is_negatively_cached(clock, valid_token):
+    """
+    Prueba que un token rechazado por el SDK no se vuelve a verificar mientras dura la caché negativa.
+    """
+    verify_fn = FakeVerify(error=InvalidIdTokenError("firma inválida"))
+    verifier = FirebaseTokenVerifier(
+        cache_max_size=10, cache_ttl_seconds=300, negative_cache_ttl_seconds=30, verify_fn=verify_fn
+    )
+
+    for _ in range(3):
+        with pytest.raises(InvalidIdTokenError):
+            verifier.verify(valid_token)
+
+    assert verify_fn.calls == 1
+    assert verifier.negative_cache.stats()["hits"] == 2
+
+
+def test_negative_cache_entry_expires(clock, valid_token):
+    """
+    Prueba que, vencido el TTL de la caché negativa, el token se vuelve a verificar.
+    """
+    verify_fn = FakeVerify(error=InvalidIdTokenError("firma inválida"))
+    verifier = FirebaseTokenVerifier(
+        cache_max_size=10, cache_ttl_seconds=300, negative_cache_ttl_seconds=30, verify_fn=verify_fn
+    )
+
+    with pytest.raises(InvalidIdTokenError):
+        verifier.verify(valid_token)
+    clock.advance(31)
+    verify_fn.error = None
+
+    assert verifier.verify(valid_token)["uid"] == "test_user"
+    assert verify_fn.calls == 2
+
+
+def test_negative_cache_keeps_expired_error_type(clock, valid_token):
+    """
+    Prueba que un rechazo por expiración se repite como ExpiredIdTokenError desde la caché negativa.
+    """
+    verify_fn = FakeVerify(error=ExpiredIdTokenError("token expirado", None))
+    verifier = FirebaseTokenVerifier(cache_max_size=10, cache_ttl_seconds=300, verify_fn=verify_fn)
+
+    for _ in range(2):
+        with pytest.raises(ExpiredIdTokenError):
+            verifier.verify(valid_token)
+
+    assert verify_fn.calls == 1
+
+
+@pytest.mark.parametrize("token", [
+    "no-es-un-jwt",
+    make_token({"exp": time.time() + 3600}, header={"alg": "HS256"}),
+    make_token({"sub": "test_user"}),
+    "abc.def.ghi",
+])
+def test_precheck_rejects_malformed_token(clock, token):
+    """
+    Prueba que los tokens mal formados se rechazan sin llamar al SDK y se recuerdan.
+    """
+    verify_fn = FakeVerify()
+    verifier = FirebaseTokenVerifier(cache_max_size=10, cache_ttl_seconds=300, verify_fn=verify_fn)
+
+    with pytest.raises(InvalidIdTokenError):
+        verifier.verify(token)
+
+    assert verify_fn.calls == 0
+    assert len(verifier.negative_cache) == 1
+
+
+def test_precheck_rejects_expired_token(clock):
+    """
+    Prueba que un token con `exp` vencido se rechaza como expirado sin llamar al SDK.
+    """
+    verify_fn = FakeVerify()
+    verifier = FirebaseTokenVerifier(cache_max_size=10, cache_ttl_seconds=300, verify_fn=verify_fn)
+
+    with pytest.raises(ExpiredIdTokenError):
+        verifier.verify(make_token({"sub": "test_user", "exp": time.time() - 60}))
+
+    assert verify_fn.calls == 0
+
+
+def test_unverified_verifier_reads_claims_offline(clock):
+    """
+    Prueba que el modo "insecure" acepta un token sin firma válida y rechaza los expirados o sin `sub`.
+    """
+    verifier = FirebaseTokenVerifier(cache_max_size=10, cache_ttl_seconds=300, verify_fn=UnverifiedTokenVerifier().verify)
+
+    claims = verifier.verify(make_token({"sub": "test_user", "email": "test@example.com", "exp": time.time() + 3600}))
+    assert (claims["uid"], claims["email"]) == ("test_user", "test@example.com")
+
+    with pytest.raises(ExpiredIdTokenError):
+        UnverifiedTokenVerifier().verify(make_token({"sub": "test_user", "exp": time.time() - 60}))
+    with pytest.raises(InvalidIdTokenError):
+        verifier.verify(make_token({"sub": "", "exp": time.time() + 3600}))
+
+
+def test_insecure_mode_is_rejected_in_production():
+    """
+    Prueba que la configuración no admite la verificación "insecure" en producción.
+    """
+    assert Settings(AUTH_VERIFY_MODE="insecure", ENVIRONMENT="development").AUTH_VERIFY_MODE == "insecure"
+
+    with pytest.raises(ValidationError):
+        Settings(AUTH_VERIFY_MODE="insecure", ENVIRONMENT="production")